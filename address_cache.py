@@ -0,0 +1,187 @@
+"""
+(테이블, 주소) 단위 조회 결과 캐시
+
+GUI 탭들이 같은 주소 목록으로 /shop/get_serve_shop_data, /recommend/get_recommend_data 등을
+반복 호출하므로, 주소별 결과 행을 프로세스 메모리에 TTL + LRU로 보관한다.
+
+- 키는 (테이블, 주소 정규화 키 addr_key). 한 요청의 주소 중
+  캐시에 없는 것만 모아 한 번에 조회하고 결과 행을 주소별로 나눠 저장한다.
+  (결과가 없는 주소도 빈 리스트로 저장해 반복 조회를 막는다)
+- 쓰기 엔드포인트는 커밋 후 invalidate(테이블, 주소목록)로 해당 키만 무효화한다.
+- 조회 도중 무효화된 키는 조회 결과를 저장하지 않는다(begin() 토큰 비교) → 오래된 값 재적재 방지.
+- 캐시된 행(dict)은 여러 응답이 공유하므로 호출 측에서 수정하지 않는다.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from address_key import addr_key_from_address, make_addr_key
+
+
+def normalize_address(addr):
+    """주소 → 캐시 키 (addr_key 기준, MySQL 비교처럼 대소문자 무시). None은 호출 측 row.get(..., "")처럼 ""로 본다"""
+    return (addr_key_from_address(addr) or "").lower()
+
+
+def row_address(row):
+    """조회 결과 행 → 캐시 키 (dong/jibun 중 하나라도 NULL이면 addr_key도 NULL이므로 None)"""
+    key = make_addr_key(row.get("dong"), row.get("jibun"))
+    return key.lower() if key is not None else None
+
+
+def nulls_low(value):
+    """정렬 키: MySQL처럼 NULL을 가장 작은 값으로 취급 (ASC면 앞, DESC면 뒤)"""
+    return (value is not None, value if value is not None else 0)
+
+
+class AddressCache:
+    """스레드 안전한 (테이블, 주소) → 결과 행 리스트 캐시"""
+
+    def __init__(self, max_entries=20000, ttl=60.0, max_tombstones=10000, enabled=True):
+        self.enabled = enabled
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = float(ttl)
+        self.max_tombstones = max(1, int(max_tombstones))
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (table, addr) → (expires_at, rows), LRU 순서
+        self._seq = 0                  # 무효화 순번
+        self._invalidated = OrderedDict()  # (table, addr) → 마지막 무효화 순번
+        self._invalidated_floor = 0        # 잘려 나간 무효화 기록 중 최대 순번
+        self._table_invalidated = {}       # table → 테이블 전체 무효화 순번
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.stale_skips = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def begin(self):
+        """조회 시작 시점 토큰. 이후 무효화된 키는 put_many에서 저장되지 않는다."""
+        with self._lock:
+            return self._seq
+
+    def get_many(self, table, addresses):
+        """(hits: 주소키 → 행 리스트, misses: 주소키 리스트) 반환"""
+        now = time.monotonic()
+        hits, misses = {}, []
+        with self._lock:
+            for addr in addresses:
+                key = (table, addr)
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    hits[addr] = entry[1]
+                    continue
+                if entry is not None:
+                    del self._entries[key]
+                    self.expirations += 1
+                misses.append(addr)
+            self.hits += len(hits)
+            self.misses += len(misses)
+        return hits, misses
+
+    def put_many(self, table, rows_by_addr, token):
+        """주소별 행 리스트 저장 (token 이후 무효화된 키는 건너뜀)"""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if token < self._invalidated_floor or token < self._table_invalidated.get(table, 0):
+                self.stale_skips += len(rows_by_addr)
+                return
+            for addr, rows in rows_by_addr.items():
+                key = (table, addr)
+                if self._invalidated.get(key, 0) > token:
+                    self.stale_skips += 1
+                    continue
+                self._entries[key] = (expires_at, rows)
+                self._entries.move_to_end(key)
+                self.stores += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, table, addresses):
+        """해당 테이블의 주소 키들만 무효화"""
+        keys = {(table, normalize_address(a)) for a in addresses if a is not None}
+        if not keys:
+            return
+        with self._lock:
+            self._seq += 1
+            for key in keys:
+                self._entries.pop(key, None)
+                self._invalidated[key] = self._seq
+                self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self.max_tombstones:
+                _, seq = self._invalidated.popitem(last=False)
+                self._invalidated_floor = max(self._invalidated_floor, seq)
+            self.invalidations += len(keys)
+
+    def invalidate_table(self, table):
+        """테이블 전체 무효화 (주소를 특정할 수 없는 쓰기용)"""
+        with self._lock:
+            self._seq += 1
+            self._table_invalidated[table] = self._seq
+            for key in [k for k in self._entries if k[0] == table]:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._seq += 1
+            self._entries.clear()
+            self._invalidated.clear()
+            self._invalidated_floor = self._seq
+
+    def fetch(self, table, address_list, loader, order_rows=None):
+        """
+        주소 목록 조회 (캐시 우선)
+        loader(missing_addresses) → 캐시에 없는 주소들의 행 리스트 (한 번만 호출)
+        order_rows(rows): 여러 주소의 행을 합친 리스트를 원래 SQL ORDER BY 순서로 제자리 정렬
+        """
+        if not self.enabled:
+            return loader(list(address_list))
+
+        requested = {}
+        for addr in address_list:
+            requested.setdefault(normalize_address(addr), addr)
+
+        hits, misses = self.get_many(table, list(requested))
+        if misses:
+            token = self.begin()
+            loaded = loader([requested[a] for a in misses])
+            fresh = {a: [] for a in misses}
+            for row in loaded:
+                addr = row_address(row)
+                if addr in fresh:
+                    fresh[addr].append(row)
+            self.put_many(table, fresh, token)
+            hits.update(fresh)
+
+        rows = [row for addr in requested for row in hits.get(addr, ())]
+        if order_rows is not None and len(requested) > 1:
+            order_rows(rows)
+        return rows
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            by_table = {}
+            for table, _ in self._entries:
+                by_table[table] = by_table.get(table, 0) + 1
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "stores": self.stores,
+                "stale_skips": self.stale_skips,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries_by_table": by_table,
+            }
@@ -0,0 +1,470 @@
+"""
+탭 공용 주소별 매물 캐시 (프로세스 전역)
+
+써브상가/써브원룸/추천/계약완료/매물체크/마이리스트 탭이 각자 {주소: [행, ...]} dict를 들고
+요청마다 setdefault().append / `if row not in list`로 쌓아서, 오래 켜 둘수록 같은 행이 중복으로 늘어나고
+메모리가 계속 커졌다. 이 모듈이 그 캐시들을 하나로 합친다.
+
+- 키는 (소스, 주소 정규화 키). 주소 키는 서버 address_cache와 같은 규칙(공백 제거 + 소문자)이라
+  "가양동 42-3" / "가양동42-3"이 같은 항목이 된다.
+- 한 주소의 행은 기본키(PK_FIELDS) → 행 OrderedDict로 보관: 중복 제거가 O(1)이고,
+  주소가 바뀐 행은 이전 주소 항목에서 빠진다.
+- 행 크기를 대략 계산해 ADDRESS_STORE_MAX_MB를 넘으면 가장 오래 안 쓴 주소 항목부터 버린다(LRU).
+  전체 목록을 한 번에 받는 소스(replace_source: 마이리스트/계약완료 전체 로드)는 고정(pinned)되어 버리지 않는다.
+- ADDRESS_STORE_TTL(초)이 지난 항목은 get()으로는 그대로 보이지만 load()는 다시 받는다.
+- load()는 비어 있는 (소스, 주소)만 모아 /batch/get_all_data_for_addresses 한 번으로 받는다(sources 모드).
+  여러 탭이 같은 주소를 동시에 요청하면 먼저 시작한 요청을 기다린다.
+- 탭 코드는 view(소스)로 기존 dict처럼 읽는다(get/in/keys/items/pop/clear).
+  반환되는 리스트는 복사본이고, 행(dict)은 공유되므로 수정하지 않는다.
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Future
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+ADDRESS_STORE_MAX_MB = float(os.getenv("ADDRESS_STORE_MAX_MB", "64"))
+ADDRESS_STORE_TTL = float(os.getenv("ADDRESS_STORE_TTL", "300"))
+
+# /batch/get_all_data_for_addresses sources 모드로 한 번에 받는 소스
+BATCH_SOURCES = ("serve_shop", "serve_oneroom", "recommend", "completed_deals", "check_confirm")
+
+# 소스별 행 기본키 (없으면 "id")
+PK_FIELDS = {
+    "check_confirm": ("confirm_id", "item_id"),  # 확인매물 × 체크항목 조인 행
+}
+
+
+def address_key(address):
+    """주소 문자열 → 캐시 키 (서버 address_cache.normalize_address와 같은 규칙)"""
+    return "".join(str(address).split()).lower()
+
+
+def row_address(row):
+    """행 → 탭들이 쓰는 표시 주소 "동 지번" """
+    return f"{row.get('dong') or ''} {row.get('jibun') or ''}".strip()
+
+
+def _row_pk(source, row):
+    fields = PK_FIELDS.get(source, ("id",))
+    values = tuple(row.get(f) for f in fields)
+    if all(v is None for v in values):
+        return repr(sorted(row.items(), key=lambda kv: kv[0]))  # 키가 없는 행은 내용 전체로 구분
+    return values[0] if len(values) == 1 else values
+
+
+def _row_size(row):
+    """행 메모리 추정치 (dict + 값 객체, 키 문자열은 행끼리 공유되므로 제외)"""
+    return sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
+
+
+class _Bucket:
+    __slots__ = ("address", "rows", "size", "loaded_at", "pinned")
+
+    def __init__(self, address, pinned=False):
+        self.address = address      # 표시 주소 (keys()로 노출)
+        self.rows = OrderedDict()   # pk → 행 (서버 정렬 순서 유지)
+        self.size = 0
+        self.loaded_at = 0.0        # 이 주소 전체를 받은 시각 (0이면 일부 행만 있음)
+        self.pinned = pinned
+
+
+class AddressDataStore:
+    """스레드 안전한 (소스, 주소) → 행 캐시. 탭 콜백은 작업 스레드에서도 불리므로 모든 접근은 잠금 안에서."""
+
+    def __init__(self, max_mb=None, ttl=None):
+        self.max_bytes = int((ADDRESS_STORE_MAX_MB if max_mb is None else max_mb) * 1024 * 1024)
+        self.ttl = ADDRESS_STORE_TTL if ttl is None else float(ttl)
+
+        self._lock = threading.RLock()
+        self._lru = OrderedDict()   # (source, key) → _Bucket, 오래 안 쓴 순
+        self._pinned = {}           # (source, key) → _Bucket, 전체 목록 소스 (버리지 않음)
+        self._pk_index = {}         # (source, pk) → key
+        self._complete = set()      # replace_source로 전체를 받은 소스: 항목이 없는 주소 = 행 없음
+        self._dropped = set()       # 전체 소스 중 무효화된 (source, key) → 다시 받아야 함
+        self._inflight = {}         # (source, key) → Future (load 중)
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.batch_requests = 0
+
+    # --- 내부 ---
+    def _bucket(self, bkey):
+        bucket = self._pinned.get(bkey)
+        if bucket is None:
+            bucket = self._lru.get(bkey)
+        return bucket
+
+    def _new_bucket(self, source, key, address):
+        pinned = source in self._complete
+        bucket = _Bucket(address, pinned)
+        (self._pinned if pinned else self._lru)[(source, key)] = bucket
+        return bucket
+
+    def _drop_bucket(self, bkey):
+        bucket = self._pinned.pop(bkey, None) or self._lru.pop(bkey, None)
+        if bucket is None:
+            return None
+        source = bkey[0]
+        for pk in bucket.rows:
+            if self._pk_index.get((source, pk)) == bkey[1]:
+                del self._pk_index[(source, pk)]
+        self._bytes -= bucket.size
+        return bucket
+
+    def _remove_row(self, source, pk):
+        key = self._pk_index.pop((source, pk), None)
+        if key is None:
+            return None
+        bucket = self._bucket((source, key))
+        if bucket is not None:
+            row = bucket.rows.pop(pk, None)
+            if row is not None:
+                size = _row_size(row)
+                bucket.size -= size
+                self._bytes -= size
+            return bucket.address
+        return None
+
+    def _add_row(self, source, row, touched):
+        address = row_address(row)
+        if not address:
+            return
+        key = address_key(address)
+        pk = _row_pk(source, row)
+        old_key = self._pk_index.get((source, pk))
+        if old_key is not None and old_key != key:
+            old_address = self._remove_row(source, pk)  # 주소가 바뀐 행
+            if old_address:
+                touched.add(old_address)
+        bucket = self._bucket((source, key)) or self._new_bucket(source, key, address)
+        old = bucket.rows.get(pk)
+        size = _row_size(row) - (_row_size(old) if old is not None else 0)
+        bucket.rows[pk] = row
+        bucket.size += size
+        self._bytes += size
+        self._pk_index[(source, pk)] = key
+        touched.add(bucket.address)
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._lru:
+            bkey = next(iter(self._lru))
+            self._drop_bucket(bkey)
+            self.evictions += 1
+
+    def _fresh(self, source, key, now):
+        bkey = (source, key)
+        if source in self._complete and bkey not in self._dropped:
+            return True
+        bucket = self._bucket(bkey)
+        return bucket is not None and bucket.loaded_at > 0 and (bucket.pinned or now - bucket.loaded_at < self.ttl)
+
+    # --- 쓰기 ---
+    def put(self, source, rows, addresses=()):
+        """
+        행 반영 (PK 기준 덮어쓰기). addresses로 준 주소들은 "전체를 새로 받은 주소"로 보고
+        기존 행을 버린 뒤 채운다(행이 없으면 빈 항목으로 남겨 다시 조회하지 않게 한다).
+        반환: 바뀐 표시 주소 집합
+        """
+        touched = set()
+        now = time.monotonic()
+        with self._lock:
+            for address in addresses:
+                if not address:
+                    continue
+                key = address_key(address)
+                bucket = self._drop_bucket((source, key))
+                bucket = self._new_bucket(source, key, bucket.address if bucket else address)
+                bucket.loaded_at = now
+                self._dropped.discard((source, key))
+            for row in rows:
+                self._add_row(source, row, touched)
+            self._evict()
+        return touched
+
+    def remove(self, source, pks):
+        """기본키 목록에 해당하는 행 삭제 (삭제 알림/델타용). 반환: 바뀐 표시 주소 집합"""
+        touched = set()
+        with self._lock:
+            for pk in pks:
+                address = self._remove_row(source, pk)
+                if address:
+                    touched.add(address)
+        return touched
+
+    def replace_source(self, source, rows):
+        """소스 전체를 새 목록으로 교체하고 고정 (전체 로드 결과). 목록에 없는 주소는 '행 없음'으로 본다."""
+        with self._lock:
+            self.clear(source)
+            self._complete.add(source)
+            now = time.monotonic()
+            touched = set()
+            for row in rows:
+                self._add_row(source, row, touched)
+            for address in touched:
+                self._pinned[(source, address_key(address))].loaded_at = now
+            self._evict()
+        return touched
+
+    def sort(self, source, addresses, key, reverse=False):
+        """주소 항목 안의 행 순서를 key로 다시 정렬 (델타 병합 후 서버 ORDER BY 맞추기)"""
+        with self._lock:
+            for address in addresses:
+                bucket = self._bucket((source, address_key(address)))
+                if bucket is not None:
+                    items = sorted(bucket.rows.items(), key=lambda kv: key(kv[1]), reverse=reverse)
+                    bucket.rows = OrderedDict(items)
+
+    def discard(self, source, addresses):
+        """주소 항목 무효화 (변경 알림). 다음 load()에서 다시 받는다. 반환: 있던 항목 수"""
+        dropped = 0
+        with self._lock:
+            for address in addresses:
+                key = address_key(address)
+                if self._drop_bucket((source, key)) is not None:
+                    dropped += 1
+                if source in self._complete:
+                    self._dropped.add((source, key))
+        return dropped
+
+    def clear(self, source=None):
+        """소스(없으면 전체) 비우기"""
+        with self._lock:
+            for bkey in [k for k in (*self._pinned, *self._lru) if source is None or k[0] == source]:
+                self._drop_bucket(bkey)
+            if source is None:
+                self._complete.clear()
+                self._dropped.clear()
+            else:
+                self._complete.discard(source)
+                self._dropped = {k for k in self._dropped if k[0] != source}
+
+    # --- 읽기 ---
+    def get(self, source, address, default=()):
+        """주소의 행 리스트 복사본 (없으면 list(default))"""
+        if not address:
+            return list(default)
+        with self._lock:
+            bkey = (source, address_key(address))
+            bucket = self._bucket(bkey)
+            if bucket is None:
+                self.misses += 1
+                return list(default)
+            if not bucket.pinned:
+                self._lru.move_to_end(bkey)
+            self.hits += 1
+            return list(bucket.rows.values())
+
+    def rows(self, source, addresses):
+        """여러 주소의 행을 주소 순서대로 이어 붙인 리스트 (같은 주소가 두 번 와도 한 번만)"""
+        out, seen = [], set()
+        for address in addresses:
+            key = address_key(address) if address else None
+            if key and key not in seen:
+                seen.add(key)
+                out.extend(self.get(source, address))
+        return out
+
+    def contains(self, source, address):
+        with self._lock:
+            return bool(address) and self._bucket((source, address_key(address))) is not None
+
+    def addresses(self, source):
+        with self._lock:
+            return [b.address for (s, _), b in (*self._pinned.items(), *self._lru.items()) if s == source]
+
+    def items(self, source):
+        """[(표시 주소, 행 리스트 복사본), ...] 스냅샷 (LRU 순서는 건드리지 않음)"""
+        with self._lock:
+            return [(b.address, list(b.rows.values()))
+                    for (s, _), b in (*self._pinned.items(), *self._lru.items()) if s == source]
+
+    def missing(self, source, addresses):
+        """TTL 안에 전체를 받은 적이 없는 주소들"""
+        now = time.monotonic()
+        with self._lock:
+            return [a for a in addresses if a and not self._fresh(source, address_key(a), now)]
+
+    def view(self, source):
+        """기존 탭 코드용 dict 모양 뷰"""
+        return SourceView(self, source)
+
+    # --- 서버에서 채우기 ---
+    def load(self, server_host, server_port, addresses, sources=BATCH_SOURCES, timeout=20):
+        """
+        (백그라운드 스레드) sources × addresses 중 비었거나 TTL이 지난 것만
+        /batch/get_all_data_for_addresses 한 번으로 받아 채운다. 다른 스레드가 받는 중인 것은 기다린다.
+        반환: {소스: 오류 메시지} (모두 성공이면 빈 dict). 실패한 소스는 채워지지 않아 다음에 다시 시도한다.
+        """
+        now = time.monotonic()
+        wanted = list(dict.fromkeys(a for a in addresses if a))
+        waits, fetch = set(), OrderedDict()  # fetch: source → [주소]
+        mine = Future()
+        with self._lock:
+            for source in sources:
+                for address in wanted:
+                    key = address_key(address)
+                    if self._fresh(source, key, now):
+                        continue
+                    pending = self._inflight.get((source, key))
+                    if pending is not None:
+                        waits.add(pending)
+                        continue
+                    fetch.setdefault(source, []).append(address)
+                    self._inflight[(source, key)] = mine
+
+        errors = {}
+        if fetch:
+            fetch_addresses = list(dict.fromkeys(a for addrs in fetch.values() for a in addrs))
+            url = f"http://{server_host}:{server_port}/batch/get_all_data_for_addresses"
+            try:
+                with self._lock:
+                    self.batch_requests += 1
+                resp = requests.post(url, json={"addresses": fetch_addresses, "sources": list(fetch)}, timeout=timeout)
+                resp.raise_for_status()
+                j = resp.json()
+                if j.get("status") != "ok":
+                    raise RuntimeError(j.get("message") or j.get("detail") or "Unknown server error")
+                errors.update(j.get("errors") or {})
+                data = j.get("data") or {}
+                for source in fetch:
+                    if source not in errors:
+                        # 요청한 주소 전체에 대한 결과이므로 다른 소스 때문에 함께 받은 주소도 채운 것으로 본다
+                        self.put(source, data.get(source) or [], addresses=fetch_addresses)
+            except Exception as ex:
+                logger.error(f"AddressDataStore: 배치 조회 실패 ({list(fetch)}): {ex}")
+                errors.update({source: str(ex) for source in fetch})
+            finally:
+                with self._lock:
+                    for source, source_addresses in fetch.items():
+                        for address in source_addresses:
+                            if self._inflight.get((source, address_key(address))) is mine:
+                                del self._inflight[(source, address_key(address))]
+                mine.set_result(errors)
+
+        for pending in waits:
+            try:
+                for source, message in (pending.result(timeout=timeout) or {}).items():
+                    if source in sources:
+                        errors.setdefault(source, message)
+            except Exception as ex:
+                errors.setdefault("_wait", str(ex))
+        return errors
+
+    def fetch_for_tab(self, server_host, server_port, source, addresses, sources=BATCH_SOURCES):
+        """
+        탭 _bg_load_* 용: load() 후 source 행을 기존 탭 응답 모양
+        {"status", "data", "fetched_addresses"(, "message")}으로 돌려준다.
+        sources 기본값이 배치 소스 전체라, 한 탭이 주소를 고르면 다른 탭 몫도 같은 요청으로 채워진다.
+        """
+        if not addresses:
+            return {"status": "empty", "data": [], "fetched_addresses": []}
+        errors = self.load(server_host, server_port, addresses, sources=sources)
+        if source in errors:
+            return {"status": "error", "data": [], "message": errors[source], "fetched_addresses": []}
+        return {"status": "ok", "data": self.rows(source, addresses), "fetched_addresses": list(addresses)}
+
+    def stats(self):
+        with self._lock:
+            by_source = {}
+            for (source, _), bucket in (*self._pinned.items(), *self._lru.items()):
+                s = by_source.setdefault(source, {"addresses": 0, "rows": 0, "bytes": 0})
+                s["addresses"] += 1
+                s["rows"] += len(bucket.rows)
+                s["bytes"] += bucket.size
+            lookups = self.hits + self.misses
+            return {
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "addresses": len(self._lru) + len(self._pinned),
+                "pinned": len(self._pinned),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "batch_requests": self.batch_requests,
+                "by_source": by_source,
+            }
+
+
+class SourceView(MutableMapping):
+    """
+    store의 한 소스를 기존 {표시 주소: [행, ...]} dict처럼 보이게 하는 뷰.
+    d[주소] = 행들 → 그 주소 교체, del/pop → 무효화, clear() → 소스 비우기.
+    읽기 결과는 복사본이므로 d[주소].append(...)로는 반영되지 않는다(put 사용).
+    """
+
+    def __init__(self, store, source):
+        self.store = store
+        self.source = source
+
+    def __getitem__(self, address):
+        if not self.store.contains(self.source, address):
+            raise KeyError(address)
+        return self.store.get(self.source, address)
+
+    def get(self, address, default=None):
+        if not self.store.contains(self.source, address):
+            return default
+        return self.store.get(self.source, address)
+
+    def __setitem__(self, address, rows):
+        self.store.put(self.source, rows, addresses=[address])
+
+    def __delitem__(self, address):
+        if not self.store.discard(self.source, [address]):
+            raise KeyError(address)
+
+    def pop(self, address, *default):
+        # 항목이 없어도 무효화는 남긴다 (전체 로드 소스에서 "행 없음"으로 알고 있던 주소)
+        rows = self.get(address)
+        self.store.discard(self.source, [address])
+        if rows is None:
+            if default:
+                return default[0]
+            raise KeyError(address)
+        return rows
+
+    def __contains__(self, address):
+        return self.store.contains(self.source, address)
+
+    def __iter__(self):
+        return iter(self.store.addresses(self.source))
+
+    def __len__(self):
+        return len(self.store.addresses(self.source))
+
+    def items(self):
+        # 순회 중 다른 스레드가 항목을 버려도 KeyError가 나지 않도록 한 번에 복사
+        return self.store.items(self.source)
+
+    def values(self):
+        return [rows for _, rows in self.store.items(self.source)]
+
+    def clear(self):
+        self.store.clear(self.source)
+
+    def __repr__(self):
+        return f"<SourceView {self.source}: {len(self)} addresses>"
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_address_store():
+    """프로세스 전역 AddressDataStore"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AddressDataStore()
+        return _store
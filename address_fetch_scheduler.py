@@ -0,0 +1,195 @@
+"""
+주소 선택 변경 시 탭들의 데이터 요청을 모아서 보내는 스케줄러 (앱당 하나)
+
+선택이 바뀔 때마다 써브상가/써브원룸/매물체크/추천/계약완료 탭의 filter_and_populate가
+각자 parent_app.executor에 같은 주소 목록 요청을 넣어서, 고객 목록을 방향키로 빠르게 넘기면
+이미 지나간 선택의 요청이 수십 개씩 쌓이고 늦게 온 응답이 현재 화면을 덮어썼다.
+
+- 탭은 request(탭 이름, 주소, load, callback)로 요청한다. 같은 탭의 새 요청이 오면 세대(generation)가
+  올라가고, 이전 세대 요청은 시작 전이면 버리고 이미 돌고 있으면 결과를 callback에 넘기지 않는다.
+- FETCH_COALESCE_MS 안에 들어온 요청은 한 번에 처리한다. sources를 준 요청(address_data_store 배치 소스)은
+  주소를 합쳐 store.load() 한 번으로 미리 받은 뒤 각 탭의 load를 store에서 바로 돌린다.
+- 동시에 도는 작업은 FETCH_MAX_IN_FLIGHT개까지. 대기 중에는 지금 보이는 탭이 포함된 작업이 먼저 나간다.
+- callback(future)는 기존 future.add_done_callback과 같은 모양으로 작업 스레드에서 불린다.
+"""
+import heapq
+import os
+import threading
+from concurrent.futures import Future
+
+from address_data_store import get_address_store
+
+FETCH_COALESCE_MS = float(os.getenv("FETCH_COALESCE_MS", "40"))
+FETCH_MAX_IN_FLIGHT = int(os.getenv("FETCH_MAX_IN_FLIGHT", "2"))
+
+
+def widget_visible(widget):
+    """탭 위젯이 지금 화면에 보이는지 (없거나 이미 삭제된 위젯이면 False)"""
+    if widget is None:
+        return False
+    try:
+        return widget.isVisible()
+    except RuntimeError:
+        return False
+
+
+class _Request:
+    __slots__ = ("key", "generation", "addresses", "load", "callback", "sources", "visible")
+
+    def __init__(self, key, generation, addresses, load, callback, sources, visible):
+        self.key = key
+        self.generation = generation
+        self.addresses = addresses
+        self.load = load
+        self.callback = callback
+        self.sources = sources
+        self.visible = visible
+
+
+class AddressFetchScheduler:
+    def __init__(self, parent_app, coalesce_ms=None, max_in_flight=None, store=None):
+        self.parent_app = parent_app
+        self.coalesce_ms = FETCH_COALESCE_MS if coalesce_ms is None else coalesce_ms
+        self.max_in_flight = max(1, FETCH_MAX_IN_FLIGHT if max_in_flight is None else max_in_flight)
+        self.store = store or get_address_store()
+        self._lock = threading.Lock()
+        self._generations = {}  # 탭 이름 → 최신 세대
+        self._pending = {}      # 탭 이름 → 모으는 중인 _Request
+        self._timer = None
+        self._queue = []        # (우선순위, 순번, [_Request])
+        self._seq = 0
+        self._in_flight = 0
+        self.requested = 0
+        self.jobs = 0
+        self.superseded = 0
+        self.delivered = 0
+
+    def request(self, key, addresses, load, callback, sources=(), visible=False):
+        """
+        key 탭의 주소 요청을 등록하고 세대 번호를 반환한다.
+        load(addresses) -> 결과 (작업 스레드), callback(future)는 최신 세대일 때만 불린다.
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            self.requested += 1
+            if self._pending.pop(key, None) is not None:
+                self.superseded += 1
+            req = _Request(key, generation, list(addresses), load, callback, tuple(sources), visible)
+            self._pending[key] = req
+            if self.coalesce_ms > 0 and self._timer is None:
+                self._timer = threading.Timer(self.coalesce_ms / 1000, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if self.coalesce_ms <= 0:
+            self._flush()
+        return generation
+
+    def cancel(self, key):
+        """key 탭의 대기/진행 중 요청을 모두 무효로 (예: 선택이 비어 빈 테이블을 그릴 때)"""
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._pending.pop(key, None) is not None:
+                self.superseded += 1
+
+    def is_current(self, key, generation):
+        with self._lock:
+            return self._generations.get(key) == generation
+
+    def _current(self, req):
+        # self._lock 안에서 호출
+        return self._generations.get(req.key) == req.generation
+
+    def _flush(self):
+        with self._lock:
+            self._timer = None
+            batch = list(self._pending.values())
+            self._pending.clear()
+            shared = [req for req in batch if req.sources]
+            groups = ([shared] if shared else []) + [[req] for req in batch if not req.sources]
+            for reqs in groups:
+                self._seq += 1
+                heapq.heappush(self._queue, (0 if any(req.visible for req in reqs) else 1, self._seq, reqs))
+        self._pump()
+
+    def _pump(self):
+        starts = []
+        with self._lock:
+            while self._queue and self._in_flight < self.max_in_flight:
+                _, _, reqs = heapq.heappop(self._queue)
+                live = [req for req in reqs if self._current(req)]
+                self.superseded += len(reqs) - len(live)
+                if not live:
+                    continue
+                self._in_flight += 1
+                self.jobs += 1
+                starts.append(live)
+
+        executor = getattr(self.parent_app, "executor", None)
+        for reqs in starts:
+            try:
+                executor.submit(self._run, reqs)
+            except Exception as e:  # executor가 없거나 이미 shutdown
+                print(f"[WARN] AddressFetchScheduler: 작업을 시작하지 못했습니다 ({[req.key for req in reqs]}): {e}")
+                with self._lock:
+                    self._in_flight -= 1
+
+    def _run(self, reqs):
+        """(작업 스레드) 공용 소스는 한 번에 받아 두고, 보이는 탭부터 load → callback"""
+        try:
+            with self._lock:
+                live = [req for req in reqs if self._current(req)]
+                self.superseded += len(reqs) - len(live)
+            reqs = live  # 스레드가 잡히기 전에 선택이 또 바뀌었으면 받지 않는다
+            sources = list(dict.fromkeys(source for req in reqs for source in req.sources))
+            if sources:
+                ordered = sorted(reqs, key=lambda req: not req.visible)
+                addresses = list(dict.fromkeys(a for req in ordered if req.sources for a in req.addresses))
+                self.store.load(self.parent_app.server_host, self.parent_app.server_port, addresses, sources=sources)
+            for req in sorted(reqs, key=lambda req: not req.visible):
+                if not self.is_current(req.key, req.generation):
+                    with self._lock:
+                        self.superseded += 1
+                    continue
+                future = Future()
+                try:
+                    future.set_result(req.load(req.addresses))
+                except Exception as e:
+                    future.set_exception(e)
+                if not self.is_current(req.key, req.generation):
+                    # 받는 동안 선택이 바뀌었다: 지난 응답으로 화면을 덮지 않는다
+                    with self._lock:
+                        self.superseded += 1
+                    continue
+                with self._lock:
+                    self.delivered += 1
+                try:
+                    req.callback(future)
+                except Exception as e:
+                    print(f"[ERROR] AddressFetchScheduler: {req.key} 콜백 오류: {e}")
+        except Exception as e:
+            print(f"[ERROR] AddressFetchScheduler: 데이터 로드 오류: {e}")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._pump()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requested": self.requested, "jobs": self.jobs, "superseded": self.superseded,
+                "delivered": self.delivered, "queued": len(self._queue), "in_flight": self._in_flight,
+            }
+
+
+_scheduler_lock = threading.Lock()
+
+
+def get_fetch_scheduler(parent_app):
+    """parent_app 하나에 스케줄러 하나 (parent_app.fetch_scheduler)"""
+    with _scheduler_lock:
+        scheduler = getattr(parent_app, "fetch_scheduler", None)
+        if scheduler is None:
+            scheduler = AddressFetchScheduler(parent_app)
+            parent_app.fetch_scheduler = scheduler
+        return scheduler
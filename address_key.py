@@ -0,0 +1,62 @@
+"""
+주소 정규화 키(addr_key)
+
+매물 테이블의 주소 조회가 CONCAT(dong, ' ', jibun) IN (...), CONCAT(REPLACE(...)) LIKE,
+(dong = %s AND jibun = %s) OR ... 등 여러 형태로 흩어져 있어 인덱스를 탈 수 없었다.
+주소를 공백 없는 "동+지번" 문자열 하나로 정규화하고, DB에는 같은 식의 생성 컬럼(addr_key)과
+인덱스를 두어 동등(IN) / 접두(LIKE 'xx%') 조회로 통일한다.
+
+- 키 규칙: CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ',''))  예) "가양동 42-3" → "가양동42-3"
+  dong/jibun 중 하나라도 NULL이면 키도 NULL (기존 CONCAT 비교와 동일하게 매칭 제외)
+- 컬럼 생성: migrate_addr_key.py
+- USE_ADDR_KEY_COLUMN=false(마이그레이션 전)이면 같은 식을 그대로 WHERE에 사용한다.
+  결과는 동일하고 인덱스만 사용하지 못한다.
+"""
+from settings import USE_ADDR_KEY_COLUMN
+
+# 생성 컬럼 / 인덱스를 가진 매물 테이블
+ADDR_KEY_TABLES = (
+    "serve_shop_data",
+    "serve_oneroom_data",
+    "mylist_shop",
+    "recommend_data",
+    "completed_deals",
+    "naver_shop_check_confirm",
+)
+ADDR_KEY_COLUMN = "addr_key"
+ADDR_KEY_INDEX = "idx_addr_key"
+
+
+def make_addr_key(dong, jibun):
+    """dong, jibun → 정규화 키 (DB 생성 컬럼 식과 동일)"""
+    if dong is None or jibun is None:
+        return None
+    return f"{dong}{jibun}".replace(" ", "")
+
+
+def addr_key_from_address(address):
+    """클라이언트 주소 문자열("가양동 42-3") → 정규화 키"""
+    if address is None:
+        return None
+    return str(address).replace(" ", "")
+
+
+def addr_key_expr(alias=""):
+    """WHERE 절에서 쓸 주소 키 식 (컬럼이 있으면 인덱스 컬럼, 없으면 동일한 계산식)"""
+    prefix = f"{alias}." if alias else ""
+    if USE_ADDR_KEY_COLUMN:
+        return f"{prefix}{ADDR_KEY_COLUMN}"
+    return f"CONCAT(REPLACE({prefix}dong,' ',''), REPLACE({prefix}jibun,' ',''))"
+
+
+def addr_key_in_clause(addresses, alias=""):
+    """주소 목록 → ("<키식> IN (%s,...)", 키 파라미터 리스트). 중복 키는 한 번만 넣는다."""
+    keys = list(dict.fromkeys(k for k in (addr_key_from_address(a) for a in addresses) if k))
+    if not keys:
+        return "1=0", []
+    return f"{addr_key_expr(alias)} IN ({','.join(['%s'] * len(keys))})", keys
+
+
+def escape_like(value):
+    """LIKE 패턴용 이스케이프 (%, _, \\)"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
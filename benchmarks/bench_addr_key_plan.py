@@ -0,0 +1,86 @@
+"""
+주소 조회 쿼리 플랜/속도 비교: 기존 CONCAT 식 vs addr_key 인덱스 컬럼
+
+실제 MySQL(settings의 DB 설정)에 접속해 테이블마다 표본 주소를 뽑고
+  before) WHERE CONCAT(dong, ' ', jibun) IN (...)
+  before) WHERE (dong = %s AND jibun = %s) OR ...         (batch.py 방식)
+  after ) WHERE addr_key IN (...)
+  before) WHERE CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ','')) LIKE '%동%'  (통합검색)
+  after ) WHERE addr_key LIKE '동%'
+의 EXPLAIN(type/key/rows)과 평균 실행 시간을 출력한다.
+addr_key 쿼리는 migrate_addr_key.py 실행 후에만 의미가 있다.
+
+실행: python benchmarks/bench_addr_key_plan.py [address_count] [repeat]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector as mysql  # noqa: E402
+
+from address_key import ADDR_KEY_COLUMN, ADDR_KEY_TABLES, addr_key_from_address  # noqa: E402
+from settings import get_db_connection  # noqa: E402
+
+
+def explain(cursor, sql, params):
+    cursor.execute("EXPLAIN " + sql, tuple(params))
+    rows = cursor.fetchall()
+    return ", ".join(f"type={r.get('type')} key={r.get('key')} rows={r.get('rows')}" for r in rows)
+
+
+def timed(cursor, sql, params, repeat):
+    t0 = time.perf_counter()
+    count = 0
+    for _ in range(repeat):
+        cursor.execute(sql, tuple(params))
+        count = len(cursor.fetchall())
+    return (time.perf_counter() - t0) / repeat * 1000, count
+
+
+def main():
+    address_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for table in ADDR_KEY_TABLES:
+            cursor.execute(
+                f"SELECT DISTINCT dong, jibun FROM `{table}` WHERE dong IS NOT NULL AND jibun IS NOT NULL LIMIT %s",
+                (address_count,),
+            )
+            pairs = [(r["dong"], r["jibun"]) for r in cursor.fetchall()]
+            if not pairs:
+                print(f"[{table}] 데이터 없음, 건너뜀")
+                continue
+            addresses = [f"{d} {j}" for d, j in pairs]
+            keys = [addr_key_from_address(a) for a in addresses]
+            marks = ",".join(["%s"] * len(addresses))
+            prefix = addr_key_from_address(pairs[0][0])
+
+            cases = [
+                ("before CONCAT IN", f"SELECT * FROM `{table}` WHERE CONCAT(dong, ' ', jibun) IN ({marks})", addresses),
+                ("before OR chain", f"SELECT * FROM `{table}` WHERE " + " OR ".join(["(dong = %s AND jibun = %s)"] * len(pairs)),
+                 [v for p in pairs for v in p]),
+                ("after  addr_key IN", f"SELECT * FROM `{table}` WHERE {ADDR_KEY_COLUMN} IN ({marks})", keys),
+                ("before LIKE %kw%", f"SELECT * FROM `{table}` WHERE CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ','')) LIKE %s",
+                 [f"%{prefix}%"]),
+                ("after  LIKE kw%", f"SELECT * FROM `{table}` WHERE {ADDR_KEY_COLUMN} LIKE %s", [f"{prefix}%"]),
+            ]
+            print(f"[{table}] addresses={len(addresses)}")
+            for label, sql, params in cases:
+                try:
+                    plan = explain(cursor, sql, params)
+                    ms, count = timed(cursor, sql, params, repeat)
+                    print(f"  {label:<20} {ms:8.3f}ms  rows={count:<6} {plan}")
+                except mysql.Error as e:
+                    print(f"  {label:<20} 실패: {e}")
+    finally:
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
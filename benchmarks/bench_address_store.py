@@ -0,0 +1,131 @@
+"""
+탭별 주소 캐시 비교: 기존(탭마다 dict + setdefault().append / `if row not in list`) vs address_data_store
+
+--addresses 개 주소 풀에서 --selections 번 주소를 고르는 긴 세션을 흉내 낸다(최근 주소를 자주 다시 고름).
+- legacy: 선택마다 5개 탭이 각자 POST 하고 응답 행을 `row not in` 으로 합친다.
+  --reload-every 선택마다 auto_reload가 최근 주소 50개를 다시 받아 setdefault().append 한다(중복이 쌓임).
+- store: 선택마다 store.missing()인 주소만 한 번(5개 소스)에 받아 put(), 나머지는 store에서 읽는다.
+  --max-mb 예산을 넘으면 LRU로 버린다.
+서버 요청 수, 캐시에 남은 행 수, tracemalloc 기준 메모리, 합치기/조회에 쓴 시간을 출력한다.
+
+실행: python benchmarks/bench_address_store.py [--addresses 3000] [--selections 20000] [--max-mb 16]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from address_data_store import AddressDataStore, BATCH_SOURCES  # noqa: E402
+
+
+def response_rows(source, address, rows_per_source):
+    """서버 응답 한 번 = 매번 새로 디코딩된 dict (내용은 같음)"""
+    dong, jibun = address.split()
+    n = rows_per_source + hash((source, address)) % 4
+    return [{
+        "id": hash((source, address, i)) % 10_000_000, "confirm_id": hash((address, i)) % 1_000_000, "item_id": i,
+        "dong": dong, "jibun": jibun, "ho": f"{100 + i}", "deposit": 1000 + i, "monthly": 50 + i,
+        "memo": "주차 가능, 코너 자리" * (1 + i % 3), "manager": f"담당{i % 9}", "photo_path": f"D:/photos/{address}/{i}",
+    } for i in range(n)]
+
+
+def selections(pool, count, seed=7):
+    rnd = random.Random(seed)
+    recent = []
+    for _ in range(count):
+        if recent and rnd.random() < 0.6:
+            address = rnd.choice(recent[-200:])  # 최근 본 주소를 다시
+        else:
+            address = rnd.choice(pool)
+        recent.append(address)
+        yield address
+
+
+def run_legacy(pool, args):
+    caches = {source: {} for source in BATCH_SOURCES}
+    requests_sent = 0
+    work = 0.0
+    history = []
+    for n, address in enumerate(selections(pool, args.selections), 1):
+        history.append(address)
+        for source in BATCH_SOURCES:
+            data = response_rows(source, address, args.rows)
+            requests_sent += 1
+            t0 = time.perf_counter()
+            cache = caches[source]
+            for row in data:
+                cache[address] = cache.get(address, [])
+                if row not in cache[address]:  # 중복 방지
+                    cache[address].append(row)
+            work += time.perf_counter() - t0
+        if n % args.reload_every == 0:
+            for source in BATCH_SOURCES:
+                recent = list(dict.fromkeys(history[-50:]))
+                data = [row for a in recent for row in response_rows(source, a, args.rows)]
+                requests_sent += 1
+                t0 = time.perf_counter()
+                for row in data:
+                    caches[source].setdefault(f"{row['dong']} {row['jibun']}", []).append(row)
+                work += time.perf_counter() - t0
+    rows = sum(len(v) for cache in caches.values() for v in cache.values())
+    return caches, requests_sent, rows, work
+
+
+def run_store(pool, args):
+    store = AddressDataStore(max_mb=args.max_mb, ttl=3600)
+    requests_sent = 0
+    work = 0.0
+    for address in selections(pool, args.selections):
+        t0 = time.perf_counter()
+        missing = {source: store.missing(source, [address]) for source in BATCH_SOURCES}
+        work += time.perf_counter() - t0
+        if any(missing.values()):
+            requests_sent += 1  # /batch sources 모드 한 번
+            for source in BATCH_SOURCES:
+                data = response_rows(source, address, args.rows)
+                t0 = time.perf_counter()
+                store.put(source, data, addresses=[address])
+                work += time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for source in BATCH_SOURCES:
+            store.get(source, address)
+        work += time.perf_counter() - t0
+    stats = store.stats()
+    rows = sum(s["rows"] for s in stats["by_source"].values())
+    return store, requests_sent, rows, work
+
+
+def measure(fn, pool, args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    keep, requests_sent, rows, work = fn(pool, args)
+    elapsed = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return requests_sent, rows, work, elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--addresses", type=int, default=3000)
+    parser.add_argument("--selections", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=3, help="소스별 주소당 기본 행 수 (+0~3)")
+    parser.add_argument("--reload-every", type=int, default=20)
+    parser.add_argument("--max-mb", type=float, default=16.0)
+    args = parser.parse_args()
+
+    pool = [f"둔산동 {i}-{i % 13}" for i in range(args.addresses)]
+    print(f"addresses={args.addresses} selections={args.selections} sources={len(BATCH_SOURCES)} max_mb={args.max_mb}")
+    for label, fn in (("legacy", run_legacy), ("store", run_store)):
+        requests_sent, rows, work, elapsed, current, peak = measure(fn, pool, args)
+        print(f"{label:<7} requests {requests_sent:7d}  cached rows {rows:8d}  memory {current / 1e6:7.1f}MB (peak {peak / 1e6:7.1f}MB)  "
+              f"merge/lookup {work * 1000:8.1f}ms  total {elapsed:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
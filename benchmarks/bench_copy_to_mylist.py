@@ -0,0 +1,200 @@
+"""
+copy_to_mylist Supabase 왕복 비교: 항목별 select/insert vs copy_items_to_mylist 일괄 처리
+
+로컬에 PostgREST 호환 대역 서버(GET /rest/v1/<table>?id=in.(..)|eq.., POST 단건/배열 insert,
+Prefer: return=representation)를 띄우고 요청마다 --rtt-ms 만큼 지연시켜 HTTPS 왕복을 흉내 낸다.
+supabase 패키지가 있으면 create_client로, 없으면 같은 HTTP를 보내는 작은 쿼리 빌더로 접속한다.
+두 방식의 inserted_list/errors(새 id 제외)가 같은지, HTTP 요청 수와 시간을 출력한다.
+
+실행: python benchmarks/bench_copy_to_mylist.py [--items 200] [--rtt-ms 30]
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from models import CopyItem  # noqa: E402
+from routers.mylist import (  # noqa: E402
+    COPY_SOURCE_TABLE_MAP, COPY_TARGET_TABLE_MAP, _mylist_insert_data, copy_items_to_mylist
+)
+
+SOURCES = ("상가", "확인", "네이버", "추천", "원룸")
+
+
+class StandInStore:
+    def __init__(self, rtt_ms):
+        self.rtt = rtt_ms / 1000
+        self.tables = {}
+        self.ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.requests = 0
+
+    def seed(self, table, count):
+        rows = self.tables.setdefault(table, {})
+        for i in range(1, count + 1):
+            rows[i] = {"id": i, "gu": "서구", "dong": "둔산동", "jibun": f"{i}-1", "deposit": 1000,
+                       "monthly": 50, "manage_fee": None, "memo": "원본"}
+
+    def insert(self, table, rows):
+        with self.lock:
+            out = []
+            for row in rows:
+                row = dict(row, id=next(self.ids))
+                self.tables.setdefault(table, {})[row["id"]] = row
+                out.append(row)
+            return out
+
+
+def make_handler(store):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _table(self):
+            url = urlparse(self.path)
+            return url.path.rsplit("/", 1)[-1], parse_qs(url.query)
+
+        def do_GET(self):
+            store.requests += 1
+            time.sleep(store.rtt)
+            table, query = self._table()
+            rows = list(store.tables.get(table, {}).values())
+            cond = (query.get("id") or [""])[0]
+            if cond.startswith("in.("):
+                wanted = {int(v) for v in cond[4:-1].split(",") if v}
+                rows = [r for r in rows if r["id"] in wanted]
+            elif cond.startswith("eq."):
+                rows = [r for r in rows if r["id"] == int(cond[3:])]
+            self._reply(200, rows)
+
+        def do_POST(self):
+            store.requests += 1
+            time.sleep(store.rtt)
+            table, _ = self._table()
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            rows = body if isinstance(body, list) else [body]
+            if isinstance(body, list) and len({tuple(sorted(r)) for r in rows}) > 1:
+                self._reply(400, {"code": "PGRST102", "message": "All object keys must match"})
+                return
+            self._reply(201, store.insert(table, rows))
+
+    return Handler
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Query:
+    """postgrest 쿼리 빌더에서 copy_items_to_mylist가 쓰는 부분만 (supabase 미설치 시)"""
+
+    def __init__(self, http, table):
+        self.http, self.table = http, table
+        self.params, self.body, self.method = {}, None, "GET"
+
+    def select(self, columns):
+        self.params["select"] = columns
+        return self
+
+    def eq(self, column, value):
+        self.params[column] = f"eq.{value}"
+        return self
+
+    def in_(self, column, values):
+        self.params[column] = "in.(" + ",".join(str(v) for v in values) + ")"
+        return self
+
+    def insert(self, data):
+        self.method, self.body = "POST", data
+        return self
+
+    def execute(self):
+        resp = self.http.request(self.method, f"/rest/v1/{self.table}", params=self.params, json=self.body,
+                                 headers={"Prefer": "return=representation"})
+        resp.raise_for_status()
+        return _Result(resp.json())
+
+
+class StandInClient:
+    def __init__(self, base_url):
+        self.http = httpx.Client(base_url=base_url)
+
+    def table(self, name):
+        return _Query(self.http, name)
+
+
+def make_client(base_url):
+    try:
+        from supabase import create_client
+        return create_client(base_url, "stand-in-anon-key")
+    except ImportError:
+        return StandInClient(base_url)
+
+
+def legacy_copy(supabase, items, manager):
+    """기존 copy_to_mylist 루프: 항목마다 select eq + insert 한 번씩"""
+    inserted_list, errors = [], []
+    for obj in items:
+        s_ = obj.source
+        if s_ not in COPY_SOURCE_TABLE_MAP:
+            errors.append(f"ID={obj.id} => 지원하지 않는 출처 '{s_}'")
+            continue
+        result = supabase.table(COPY_SOURCE_TABLE_MAP[s_]).select("*").eq("id", obj.id).execute()
+        if not result.data:
+            errors.append(f"ID={obj.id}, 출처 '{s_}' 원본 없음")
+            continue
+        data = _mylist_insert_data(result.data[0], s_, manager, obj.memo or "")
+        new_id = supabase.table(COPY_TARGET_TABLE_MAP[s_]).insert(data).execute().data[0]["id"]
+        inserted_list.append((obj.id, s_, new_id))
+    return inserted_list, errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    store = StandInStore(args.rtt_ms)
+    for table in set(COPY_SOURCE_TABLE_MAP.values()):
+        store.seed(table, args.items)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(store))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = make_client(f"http://127.0.0.1:{server.server_port}")
+
+    items = [CopyItem(id=i % args.items + 1, source=SOURCES[i % len(SOURCES)], memo=f"m{i}") for i in range(args.items)]
+    items.append(CopyItem(id=args.items + 999, source="상가"))  # 원본 없음
+    items.append(CopyItem(id=1, source="완료"))                 # 지원하지 않는 출처
+
+    results = {}
+    for label, fn in (("legacy", legacy_copy), ("batched", copy_items_to_mylist)):
+        store.requests = 0
+        t0 = time.perf_counter()
+        inserted_list, errors = fn(client, items, "bench")
+        elapsed = time.perf_counter() - t0
+        results[label] = ([(sid, src) for sid, src, _ in inserted_list], errors)
+        print(f"{label:<8} {elapsed * 1000:9.1f}ms  HTTP {store.requests:>4}  inserted={len(inserted_list)} errors={len(errors)}")
+    print(f"same inserted/errors: {results['legacy'] == results['batched']}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
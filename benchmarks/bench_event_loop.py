@@ -0,0 +1,167 @@
+"""
+async 핸들러 블로킹 DB 호출 동시성 벤치마크
+
+동시 클라이언트 수를 늘려가며
+  1) blocking : async def 안에서 블로킹 DB 호출(time.sleep으로 대체)을 직접 실행 (기존 방식)
+  2) executor : 같은 호출을 DBExecutor(공유 고정 크기 스레드 풀)에서 실행
+두 엔드포인트의 응답 지연(p50/p99)과, 그동안 10ms 간격으로 호출한 /ping(이벤트 루프 응답성)의
+p99를 출력한다. blocking은 클라이언트 수에 비례해 /ping까지 느려지고,
+executor는 /ping p99가 평탄하게 유지되어야 한다.
+
+--url을 주면 실행 중인 서버의 POST /shop/get_serve_shop_data를 대상으로,
+GET /stats/db_executor를 응답성 프로브로 사용해 같은 측정을 한다.
+
+실행: python benchmarks/bench_event_loop.py [--db-ms 50] [--workers 10] [--requests 10]
+      python benchmarks/bench_event_loop.py --url http://localhost:8000 --address "둔산동 1234"
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from db_executor import DBExecutor  # noqa: E402
+
+CLIENT_COUNTS = (1, 4, 16, 64)
+
+
+def build_app(db_ms, workers):
+    app = FastAPI()
+    executor = DBExecutor(max_workers=workers, name="bench")
+
+    def fake_query():
+        time.sleep(db_ms / 1000)
+        return {"status": "ok", "data": []}
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.post("/blocking")
+    async def blocking():
+        return fake_query()
+
+    @app.post("/executor")
+    async def via_executor():
+        return await executor.run(fake_query)
+
+    return app
+
+
+def serve(port, db_ms, workers):
+    uvicorn.run(build_app(db_ms, workers), host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_server(db_ms, workers):
+    """벤치마크 클라이언트와 GIL을 나눠 쓰지 않도록 서버는 별도 프로세스로 띄운다"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    proc = multiprocessing.Process(target=serve, args=(port, db_ms, workers), daemon=True)
+    proc.start()
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            httpx.get(f"{base}/ping", timeout=1)
+            return proc, base
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("벤치마크 서버 시작 실패")
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_level(base, path, payload, probe_path, clients, requests_per_client):
+    latencies = []
+    probe_latencies = []
+    done = asyncio.Event()
+    # 클라이언트마다 별도 연결 (httpx 공유 풀은 동시 연결이 많으면 클라이언트 쪽이 병목이 된다)
+    sessions = [httpx.AsyncClient(base_url=base, timeout=60) for _ in range(clients + 1)]
+    probe_client = sessions[-1]
+    try:
+        # 연결 수립 시간이 지연에 섞이지 않도록 keep-alive 연결을 미리 열어 둔다
+        await asyncio.gather(*(c.get(probe_path) for c in sessions))
+
+        async def worker(client):
+            for _ in range(requests_per_client):
+                t0 = time.perf_counter()
+                resp = await client.post(path, json=payload)
+                resp.raise_for_status()
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+        async def probe():
+            while not done.is_set():
+                t0 = time.perf_counter()
+                await probe_client.get(probe_path)
+                probe_latencies.append((time.perf_counter() - t0) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker(c) for c in sessions[:-1]))
+        elapsed = time.perf_counter() - t0
+        done.set()
+        await probe_task
+    finally:
+        for c in sessions:
+            await c.aclose()
+    return {
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "probe_p99": percentile(probe_latencies, 99),
+        "rps": len(latencies) / elapsed,
+    }
+
+
+def report(label, clients, r):
+    print(f"  {label:<9} clients={clients:<3} p50={r['p50']:8.1f}ms  p99={r['p99']:8.1f}ms  "
+          f"rps={r['rps']:7.1f}  probe p99={r['probe_p99']:8.1f}ms")
+
+
+async def main_async(args):
+    if args.url:
+        payload = {"addresses": args.address or []}
+        print(f"target={args.url}/shop/get_serve_shop_data addresses={len(payload['addresses'])}")
+        for clients in CLIENT_COUNTS:
+            r = await run_level(args.url, "/shop/get_serve_shop_data", payload, "/stats/db_executor",
+                                clients, args.requests)
+            report("server", clients, r)
+        return
+
+    proc, base = start_server(args.db_ms, args.workers)
+    print(f"fake DB call={args.db_ms}ms  executor workers={args.workers}  requests/client={args.requests}")
+    try:
+        for clients in CLIENT_COUNTS:
+            for label in ("blocking", "executor"):
+                r = await run_level(base, f"/{label}", {}, "/ping", clients, args.requests)
+                report(label, clients, r)
+    finally:
+        proc.terminate()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--db-ms", type=float, default=50.0)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--url", default="")
+    parser.add_argument("--address", action="append")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
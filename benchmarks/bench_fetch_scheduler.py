@@ -0,0 +1,99 @@
+"""
+주소 선택을 빠르게 넘길 때 비교: 기존(탭마다 executor.submit) vs address_fetch_scheduler
+
+고객 목록을 방향키로 --selections 번, --interval-ms 간격으로 넘기는 동안 5개 탭(BATCH_SOURCES)이
+매번 filter_and_populate로 요청한다. 서버는 requests.post를 --latency-ms 만큼 잡아 두는 가짜로 바꾼다.
+- legacy: 탭마다 parent_app.executor.submit(store.fetch_for_tab) → 완료 콜백에서 테이블 갱신
+- scheduler: get_fetch_scheduler().request(...)
+서버 요청 수, 지난 선택의 응답으로 테이블을 다시 그린 횟수, 마지막 선택이 모든 탭에 그려질 때까지의 시간을 출력한다.
+
+실행: python benchmarks/bench_fetch_scheduler.py [--selections 40] [--interval-ms 30] [--latency-ms 150]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import address_data_store  # noqa: E402
+from address_data_store import AddressDataStore, BATCH_SOURCES  # noqa: E402
+from address_fetch_scheduler import AddressFetchScheduler  # noqa: E402
+
+
+class FakeServer:
+    def __init__(self, latency):
+        self.latency = latency
+        self.posts = 0
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.posts += 1
+        time.sleep(self.latency)
+        data = {source: [{"id": hash((source, a)) % 10_000_000, "confirm_id": hash(a) % 1_000_000, "item_id": 0,
+                          "dong": a.split()[0], "jibun": a.split()[1]} for a in json["addresses"]]
+                for source in json["sources"]}
+        return types.SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"status": "ok", "data": data})
+
+
+def run(mode, args):
+    server = FakeServer(args.latency_ms / 1000)
+    address_data_store.requests.post = server.post
+    store = AddressDataStore(ttl=3600)
+    app = types.SimpleNamespace(executor=ThreadPoolExecutor(max_workers=10), server_host="bench", server_port=0)
+    scheduler = AddressFetchScheduler(app, store=store)
+    state = {"selection": -1, "stale": 0, "shown": {}}
+    done = threading.Event()
+    lock = threading.Lock()
+
+    def on_loaded(source, selection):
+        def callback(future):
+            future.result()
+            with lock:
+                if selection != state["selection"]:
+                    state["stale"] += 1  # 이미 지나간 선택으로 테이블을 다시 그림
+                state["shown"][source] = selection
+                if all(state["shown"].get(s) == args.selections - 1 for s in BATCH_SOURCES):
+                    done.set()
+        return callback
+
+    t0 = time.perf_counter()
+    for i in range(args.selections):
+        addresses = [f"둔산동 {i}-{i % 7}"]
+        with lock:
+            state["selection"] = i
+        for source in BATCH_SOURCES:
+            load = (lambda a, source=source: store.fetch_for_tab("bench", 0, source, a))
+            if mode == "legacy":
+                app.executor.submit(load, addresses).add_done_callback(on_loaded(source, i))
+            else:
+                scheduler.request(source, addresses, load, on_loaded(source, i),
+                                  sources=BATCH_SOURCES, visible=source == "serve_shop")
+        time.sleep(args.interval_ms / 1000)
+    settled = done.wait(60)
+    elapsed = time.perf_counter() - t0 - args.selections * args.interval_ms / 1000
+    app.executor.shutdown(wait=True)
+    return server.posts, state["stale"], elapsed if settled else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--selections", type=int, default=40)
+    parser.add_argument("--interval-ms", type=float, default=30.0)
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    print(f"selections={args.selections} interval={args.interval_ms:.0f}ms latency={args.latency_ms:.0f}ms "
+          f"tabs={len(BATCH_SOURCES)}")
+    for mode in ("legacy", "scheduler"):
+        posts, stale, settle = run(mode, args)
+        print(f"{mode:<10} server posts {posts:4d}  stale redraws {stale:4d}  "
+              f"last selection on all tabs {settle * 1000:8.1f}ms after the last key press")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+매니저 체크 탭 로컬 필터 마이크로벤치마크
+
+search_manager_data 형태의 행(dong, ad_start_date, biz_manager_list)을 만들어
+  1) 기존 방식: dict 행 루프 + 행마다 strptime / biz_manager_list 순회 (_bg_prepare_table_data)
+  2) ManagerColumnStore: 사전 인코딩 동 / 업종 비트셋 / ordinal 날짜 마스크
+로 동/업종/날짜 필터 조합을 바꿔가며 시간을 재고 결과가 같은지 확인한다.
+컬럼 저장소 구성 시간(데이터 로드 시 1회)도 따로 출력한다.
+
+실행: python benchmarks/bench_manager_filter.py [row_count] [repeat]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manager_column_store import ManagerColumnStore  # noqa: E402
+
+DONGS = [f"{name}동" for name in ("둔산", "월평", "갈마", "탄방", "만년", "봉명", "궁동", "관저", "도마", "용문",
+                                 "괴정", "가양", "용전", "은행", "대흥", "문화", "오류", "태평", "유천", "가수원")]
+BIZ = ["카페", "음식점", "미용실", "학원", "편의점", "사무실", "병원", "약국", "헬스장", "주점",
+       "베이커리", "네일샵", "치킨", "분식", "꽃집", "세탁소", "부동산", "휴대폰", "PC방", "노래방"]
+
+
+def make_rows(rnd, count):
+    today = date.today()
+    rows = []
+    for i in range(count):
+        day = today - timedelta(days=rnd.randint(0, 60))
+        ad = day.isoformat() if rnd.random() < 0.7 else f"{day.isoformat()} 12:34:56"
+        if rnd.random() < 0.02:
+            ad = ""
+        rows.append({
+            "shop_id": i + 1,
+            "dong": rnd.choice(DONGS) + (" " if rnd.random() < 0.05 else ""),
+            "jibun": f"{rnd.randint(1, 999)}-{rnd.randint(1, 20)}",
+            "ad_start_date": ad,
+            "biz_manager_list": [{"biz": b, "manager": "m"} for b in rnd.sample(BIZ, rnd.randint(0, 4))],
+        })
+    return rows
+
+
+def legacy_filter(rows, dong_filter_set, biz_filter_set, min_date, max_date):
+    """기존 _bg_prepare_table_data 루프와 동일한 규칙"""
+    filtered_rows = []
+    for row in rows:
+        if dong_filter_set:
+            if row.get("dong", "").strip() not in dong_filter_set:
+                continue
+        if biz_filter_set:
+            if not any(bm.get("biz", "") in biz_filter_set for bm in row.get("biz_manager_list", [])):
+                continue
+        if min_date and max_date:
+            ad_str = row.get("ad_start_date", "").strip()
+            if not ad_str:
+                continue
+            try:
+                ad_date_obj = datetime.strptime(ad_str.split(" ")[0], "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if ad_date_obj < min_date or ad_date_obj > max_date:
+                continue
+        filtered_rows.append(row)
+    return filtered_rows
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    result = None
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) / repeat * 1000, result
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rnd = random.Random(42)
+    rows = make_rows(rnd, row_count)
+    today = date.today()
+
+    t0 = time.perf_counter()
+    store = ManagerColumnStore(rows)
+    build_ms = (time.perf_counter() - t0) * 1000
+    print(f"rows={row_count}  컬럼 저장소 구성 {build_ms:.1f}ms (로드 시 1회)")
+
+    cases = [
+        ("동 3개", set(DONGS[:3]), None, None, None),
+        ("업종 2개", None, {"카페", "학원"}, None, None),
+        ("날짜 7일", None, None, today - timedelta(days=7), today),
+        ("동+업종+날짜", set(DONGS[:5]), {"음식점", "주점", "치킨"}, today - timedelta(days=30), today),
+    ]
+    for label, dongs, biz, min_date, max_date in cases:
+        legacy_ms, expected = timed(lambda: legacy_filter(rows, dongs, biz, min_date, max_date), repeat)
+        store_ms, actual = timed(lambda: store.filter(dongs, biz, min_date, max_date), repeat)
+        same = [r["shop_id"] for r in expected] == [r["shop_id"] for r in actual]
+        print(f"  {label:<14} legacy {legacy_ms:8.2f}ms  columnar {store_ms:7.2f}ms  "
+              f"x{legacy_ms / max(store_ms, 1e-9):5.1f}  rows={len(actual):<6} same={same}")
+
+
+if __name__ == "__main__":
+    main()
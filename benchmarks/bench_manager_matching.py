@@ -0,0 +1,128 @@
+"""
+search_manager_data 매칭 벤치마크: 고객별 루프 vs ListingMatcher
+
+고객 한 명당 naver_shop 전체를 훑던 기존 방식(고객별 쿼리 1회 = 전체 스캔 1회)을
+순수 파이썬 루프로 재현하고, 컬럼형 엔진과 결과 동일성 및 소요 시간을 비교한다.
+(실제 서버에서는 여기에 고객 수만큼의 DB 왕복 비용이 추가된다)
+
+실행: python benchmarks/bench_manager_matching.py [listing_count]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from listing_matcher import ListingMatcher, parse_customer_criteria  # noqa: E402
+
+DONGS = ["가양동", "대동", "용전동", "월평동", "가장동", "둔산동", "탄방동", "괴정동", "갈마동", "만년동"]
+
+
+def make_listings(n, rnd):
+    rows = []
+    for i in range(1, n + 1):
+        total = rnd.randint(1, 15)
+        rows.append({
+            "shop_id": i, "dong": rnd.choice(DONGS), "jibun": str(rnd.randint(1, 999)),
+            "deposit": rnd.randint(0, 10000), "monthly": rnd.randint(0, 500),
+            "area": round(rnd.uniform(10, 400), 2),
+            "curr_floor": rnd.randint(-1, total), "total_floor": total,
+            "lat": rnd.uniform(36.28, 36.40), "lng": rnd.uniform(127.30, 127.45),
+            "check_memo": None, "ad_start_date": "2025-07-01",
+        })
+    return rows
+
+
+def make_customers(n, rnd):
+    custs = []
+    for i in range(n):
+        dmin = rnd.randint(0, 5000)
+        mmin = rnd.randint(0, 200)
+        amin = rnd.randint(0, 60)
+        rects = []
+        for _ in range(rnd.choice([0, 0, 1, 3, 12])):
+            lng, lat = rnd.uniform(127.30, 127.45), rnd.uniform(36.28, 36.40)
+            rects.append([lng, lat, lng + 0.01, lat + 0.008])
+        custs.append({
+            "customer_id": i, "manager": f"담당{i % 7}",
+            "deposit_min": dmin, "deposit_max": dmin + rnd.randint(500, 5000),
+            "monthly_min": mmin, "monthly_max": mmin + rnd.randint(30, 300),
+            "area_min": amin, "area_max": amin + rnd.randint(10, 60),
+            "floor_min": rnd.choice([-1, 1, 2]), "floor_max": rnd.choice([1, 3, 999]),
+            "is_top_floor": 1 if rnd.random() < 0.05 else 0,
+            "dong": ",".join(rnd.sample(DONGS, rnd.choice([0, 1, 2]))),
+            "rectangles": json.dumps(rects), "biz_type": "카페|음식점" if i % 2 else "학원",
+        })
+    return custs
+
+
+def per_customer_loop(listings, customers):
+    """기존 per-customer 방식: 고객마다 전체 매물을 조건으로 스캔"""
+    by_id = {}
+    for cust in customers:
+        crit = parse_customer_criteria(cust)
+        if crit is None:
+            continue
+        dongs = set(crit["dong_list"])
+        for row in listings:
+            if not (crit["deposit_min"] <= row["deposit"] <= crit["deposit_max"]):
+                continue
+            if not (crit["monthly_min"] <= row["monthly"] <= crit["monthly_max"]):
+                continue
+            if not (crit["area_min_m2"] <= row["area"] <= crit["area_max_m2"]):
+                continue
+            if not (crit["floor_min"] <= row["curr_floor"] <= crit["floor_max"]):
+                continue
+            if crit["is_top_floor"] and row["curr_floor"] != row["total_floor"]:
+                continue
+            if dongs or crit["rects"]:
+                in_region = row["dong"] in dongs or any(
+                    sw_lng <= row["lng"] <= ne_lng and sw_lat <= row["lat"] <= ne_lat
+                    for sw_lng, sw_lat, ne_lng, ne_lat in crit["rects"]
+                )
+                if not in_region:
+                    continue
+            entry = by_id.get(row["shop_id"])
+            if entry is None:
+                entry = dict(row)
+                entry["biz_manager_list"] = []
+                by_id[row["shop_id"]] = entry
+            entry["biz_manager_list"].extend(crit["biz_manager_list"])
+    return list(by_id.values())
+
+
+def main():
+    listing_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rnd = random.Random(42)
+    listings = make_listings(listing_count, rnd)
+    print(f"listings={listing_count}")
+
+    for customer_count in (1000, 10000):
+        customers = make_customers(customer_count, rnd)
+
+        t0 = time.perf_counter()
+        matcher = ListingMatcher(listings)
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        fast = matcher.build_manager_results(customers)
+        t_fast = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        slow = per_customer_loop(listings, customers)
+        t_slow = time.perf_counter() - t0
+
+        same = (
+            [r["shop_id"] for r in fast] == [r["shop_id"] for r in slow]
+            and all(a["biz_manager_list"] == b["biz_manager_list"] for a, b in zip(fast, slow))
+        )
+        print(
+            f"customers={customer_count:>6}  per-customer loop={t_slow:8.3f}s  "
+            f"matcher build={t_build:6.3f}s match={t_fast:7.3f}s  "
+            f"speedup={t_slow / max(t_build + t_fast, 1e-9):6.1f}x  matched={len(fast)}  same={same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
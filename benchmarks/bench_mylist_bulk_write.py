@@ -0,0 +1,145 @@
+"""
+마이리스트 저장 쓰기 비교: 행 단위 INSERT/UPDATE vs bulk_write (다중 행 INSERT / CASE UPDATE / DELETE IN)
+
+실제 MySQL(settings의 DB 설정)에 접속해 mylist_shop과 같은 구조의 TEMPORARY 테이블을 만들고
+(운영 테이블은 건드리지 않음) 변경 행 수 10/100/1000마다
+  추가 절반 + 수정 절반(두 가지 컬럼 조합) + 삭제 10%
+를 한 트랜잭션으로 실행해 평균 시간과 SQL 실행 횟수를 출력한다.
+bulk 결과의 temp_id → 새 id 매핑은 memo에 넣어 둔 temp_id와 대조해 확인한다.
+
+실행: python benchmarks/bench_mylist_bulk_write.py [repeat]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_write import delete_rows, insert_rows, manager_guard, update_rows, update_values  # noqa: E402
+from routers.mylist import SHOP_INSERT_COLUMNS, SHOP_UPDATABLE_COLUMNS, _shop_insert_values  # noqa: E402
+from settings import get_db_connection  # noqa: E402
+
+TABLE = "bench_mylist_shop"
+MANAGER = "bench"
+SIZES = (10, 100, 1000)
+
+
+class CountingCursor:
+    """execute 호출 횟수(= DB 왕복)를 세는 커서 래퍼"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.calls = 0
+
+    def execute(self, sql, params=()):
+        self.calls += 1
+        return self._cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def make_payload(size, seed_ids):
+    added_count = size // 2
+    added = [
+        {"temp_id": -(i + 1), "dong": "둔산동", "jibun": f"{i}-1", "deposit": 1000, "monthly": 50,
+         "memo": f"temp:{-(i + 1)}", "approval_date": "", "ad_end_date": "2025-01-01"}
+        for i in range(added_count)
+    ]
+    updated = []
+    for i, rid in enumerate(seed_ids[:size - added_count]):
+        if i % 2:
+            updated.append({"id": rid, "memo": f"upd {i}", "status_cd": "A"})
+        else:
+            updated.append({"id": rid, "deposit": 2000 + i, "monthly": 70, "ad_end_date": ""})
+    deleted = seed_ids[-max(1, size // 10):]
+    return added, updated, deleted
+
+
+def legacy_write(cursor, added, updated, deleted, guard_sql, guard_params):
+    """기존 update_mylist_shop_items 방식: 행마다 한 문장"""
+    col_sql = ", ".join(f"`{c}`" for c in SHOP_INSERT_COLUMNS)
+    marks = ",".join(["%s"] * len(SHOP_INSERT_COLUMNS))
+    inserted_map = {}
+    for row_ in added:
+        cursor.execute(f"INSERT INTO {TABLE} ({col_sql}) VALUES ({marks})", _shop_insert_values(row_, MANAGER))
+        inserted_map[str(row_["temp_id"])] = cursor.lastrowid
+    cursor.execute(
+        f"DELETE FROM {TABLE} WHERE id IN ({','.join(['%s'] * len(deleted))}) AND {guard_sql}",
+        tuple(deleted) + tuple(guard_params),
+    )
+    for row_ in updated:
+        values = update_values(row_, SHOP_UPDATABLE_COLUMNS)
+        sets = ",".join(f"`{c}`=%s" for c in values)
+        cursor.execute(
+            f"UPDATE {TABLE} SET {sets} WHERE id=%s AND {guard_sql}",
+            tuple(values.values()) + (row_["id"],) + tuple(guard_params),
+        )
+    return inserted_map
+
+
+def bulk_write(cursor, added, updated, deleted, guard_sql, guard_params):
+    new_ids = insert_rows(cursor, TABLE, SHOP_INSERT_COLUMNS, [_shop_insert_values(r, MANAGER) for r in added])
+    inserted_map = {str(r["temp_id"]): new_id for r, new_id in zip(added, new_ids)}
+    delete_rows(cursor, TABLE, deleted, guard_sql, guard_params)
+    updates = [(r["id"], update_values(r, SHOP_UPDATABLE_COLUMNS)) for r in updated]
+    update_rows(cursor, TABLE, updates, guard_sql, guard_params)
+    return inserted_map
+
+
+def check_inserted_map(cursor, inserted_map):
+    if not inserted_map:
+        return True
+    ids = list(inserted_map.values())
+    cursor.execute(f"SELECT id, memo FROM {TABLE} WHERE id IN ({','.join(['%s'] * len(ids))})", tuple(ids))
+    memo_by_id = dict(cursor.fetchall())
+    return all(memo_by_id.get(new_id) == f"temp:{temp_id}" for temp_id, new_id in inserted_map.items())
+
+
+def run(conn, write_fn, size, repeat):
+    raw = conn.cursor()
+    guard_sql, guard_params = manager_guard("manager", MANAGER)
+    elapsed = 0.0
+    calls = 0
+    mapping_ok = True
+    for _ in range(repeat):
+        raw.execute(f"SELECT id FROM {TABLE} ORDER BY id")
+        seed_ids = [r[0] for r in raw.fetchall()]
+        added, updated, deleted = make_payload(size, seed_ids)
+        cursor = CountingCursor(raw)
+        t0 = time.perf_counter()
+        inserted_map = write_fn(cursor, added, updated, deleted, guard_sql, guard_params)
+        elapsed += time.perf_counter() - t0
+        calls = cursor.calls
+        mapping_ok = mapping_ok and check_inserted_map(raw, inserted_map)
+        conn.rollback()
+    raw.close()
+    return elapsed / repeat * 1000, calls, mapping_ok
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {TABLE}")
+        cursor.execute(f"CREATE TEMPORARY TABLE {TABLE} LIKE mylist_shop")
+        seed = [_shop_insert_values({"dong": "월평동", "jibun": f"{i}", "memo": "seed"}, MANAGER)
+                for i in range(max(SIZES))]
+        insert_rows(cursor, TABLE, SHOP_INSERT_COLUMNS, seed)
+        conn.commit()
+
+        for size in SIZES:
+            legacy_ms, legacy_calls, legacy_ok = run(conn, legacy_write, size, repeat)
+            bulk_ms, bulk_calls, bulk_ok = run(conn, bulk_write, size, repeat)
+            print(f"changed={size:<5} legacy {legacy_ms:9.1f}ms ({legacy_calls:>4} SQL)  "
+                  f"bulk {bulk_ms:8.1f}ms ({bulk_calls:>2} SQL)  x{legacy_ms / max(bulk_ms, 1e-9):5.1f}  "
+                  f"inserted_map ok={legacy_ok and bulk_ok}")
+    finally:
+        cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {TABLE}")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+목록 응답 인코딩 비교: FastAPI 기본(jsonable_encoder + json.dumps) vs fast_response.dumps
+그리고 전체 컬럼 vs fields 선택(계약완료 표 컬럼 예시) 응답 크기 (원본 / gzip / brotli)
+
+completed_deals 형태의 행(date/datetime/Decimal/float 포함)을 만들어 직렬화 시간과 바이트 수를 출력한다.
+orjson / brotli 가 설치되어 있지 않으면 각각 표준 json 폴백 / gzip만 측정한다.
+
+실행: python benchmarks/bench_response_encoding.py [row_count] [repeat]
+"""
+import gzip
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+import fast_response  # noqa: E402
+from routers.completed import COMPLETED_DEALS_LIST_COLUMNS  # noqa: E402
+
+
+# fields= 예시: 계약완료 표에 그리는 컬럼 + 주소/키
+# (계약완료 탭 전체 로드는 공용 store에 고정되어 다른 탭도 읽으므로 실제로는 전체 컬럼을 받는다)
+SAMPLE_FIELDS = (
+    "id", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly",
+    "manage_fee", "premium", "current_use", "area", "owner_phone", "naver_property_no",
+    "serve_property_no", "memo", "manager", "parking", "building_usage", "approval_date",
+    "rooms", "baths", "ad_end_date", "photo_path", "owner_name", "owner_relation", "status_cd",
+)
+
+
+def make_rows(rnd, count):
+    today = date.today()
+    rows = []
+    for i in range(count):
+        row = {}
+        for col in COMPLETED_DEALS_LIST_COLUMNS:
+            if col == "id":
+                row[col] = i + 1
+            elif col in ("approval_date", "ad_end_date"):
+                row[col] = today - timedelta(days=rnd.randint(0, 3000))
+            elif col == "ad_start_date":
+                row[col] = datetime.now() - timedelta(minutes=rnd.randint(0, 100000))
+            elif col in ("lat", "lng"):
+                row[col] = 36.3 + rnd.random() / 10
+            elif col == "area":
+                row[col] = Decimal(f"{rnd.randint(10, 300)}.{rnd.randint(0, 99):02d}")
+            elif col in ("curr_floor", "total_floor", "deposit", "monthly"):
+                row[col] = rnd.randint(0, 5000)
+            else:
+                row[col] = f"{col}-{rnd.randint(0, 9999)} 메모 텍스트"
+        rows.append(row)
+    return rows
+
+
+def default_render(content):
+    # FastAPI 기본 경로: jsonable_encoder → JSONResponse.render
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    result = None
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) / repeat * 1000, result
+
+
+def sizes(payload):
+    out = [f"raw {len(payload) / 1024:8.1f}KB"]
+    gz_ms, gz = timed(lambda: gzip.compress(payload, 6), 1)
+    out.append(f"gzip {len(gz) / 1024:7.1f}KB ({gz_ms:.0f}ms)")
+    if fast_response.brotli is not None:
+        br_ms, br = timed(lambda: fast_response.brotli.compress(payload, quality=4), 1)
+        out.append(f"br {len(br) / 1024:7.1f}KB ({br_ms:.0f}ms)")
+    return "  ".join(out)
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    rows = make_rows(random.Random(7), row_count)
+    content = {"status": "ok", "data": rows}
+    print(f"rows={row_count}  orjson={'on' if fast_response.orjson else 'off'}  brotli={'on' if fast_response.brotli else 'off'}")
+
+    base_ms, base = timed(lambda: default_render(content), repeat)
+    fast_ms, fast = timed(lambda: fast_response.dumps(content), repeat)
+    same = json.loads(base) == json.loads(fast)
+    print(f"  직렬화  jsonable_encoder {base_ms:8.1f}ms   fast_response {fast_ms:8.1f}ms   x{base_ms / max(fast_ms, 1e-9):4.1f}  same={same}")
+
+    fields = SAMPLE_FIELDS
+    keep = set(fields)
+    projected = fast_response.dumps({"status": "ok", "data": [{k: v for k, v in r.items() if k in keep} for r in rows]})
+    print(f"  전체 컬럼({len(COMPLETED_DEALS_LIST_COLUMNS)})  {sizes(fast)}")
+    print(f"  fields({len(fields)})      {sizes(projected)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+사진 슬라이드 넘김 비교: 기존(클릭마다 원본 QPixmap 로드 + smooth 축소) vs ImageSlideshowWindow(축소 디코딩 + 앞뒤 미리 읽기)
+
+--photos 장의 --width x 3/4 JPEG(기본 4000x3000 = 12MP)를 임시 폴더에 만들고, 800x600 창에서
+--think-ms 간격으로 다음 사진을 넘긴다.
+- legacy: 넘길 때마다 UI 스레드가 막힌 시간 (평균/최대)
+- window: show_next_image 호출 시간과, 이미 그려져 있던(캐시 적중) 비율, 이미지가 뜰 때까지 기다린 시간
+화면 없이 돌도록 QT_QPA_PLATFORM=offscreen.
+
+실행: python benchmarks/bench_slideshow.py [--photos 30] [--width 4000] [--think-ms 300]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+from PyQt5.QtCore import Qt  # noqa: E402
+
+from dialogs.image_slideshow_window import ImageSlideshowWindow  # noqa: E402
+
+
+def make_photos(root, count, width):
+    image = QtGui.QImage(width, width * 3 // 4, QtGui.QImage.Format_RGB32)
+    paths = []
+    for i in range(count):
+        image.fill(QtGui.QColor.fromHsv(i * 23 % 360, 150, 210))
+        path = os.path.join(root, f"{i:03d}.jpg")
+        image.save(path, "JPG", 90)
+        paths.append(path)
+    return paths
+
+
+def pump(app, ms):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        time.sleep(0.001)
+
+
+def run_legacy(paths, size):
+    stalls = []
+    for path in paths:
+        t0 = time.perf_counter()
+        QtGui.QPixmap(path).scaled(size[0], size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        stalls.append(time.perf_counter() - t0)
+    return stalls
+
+
+def run_window(app, paths, think_ms):
+    window = ImageSlideshowWindow(paths)
+    window.show()
+    pump(app, 500)  # 첫 장 + 미리 읽기
+    stalls, waits, hits = [], [], 0
+    for _ in range(len(paths) - 1):
+        t0 = time.perf_counter()
+        window.show_next_image()
+        stalls.append(time.perf_counter() - t0)
+        if window._current_key() not in window._pending:
+            hits += 1  # 미리 읽어 둔 것이 바로 그려졌다
+        else:
+            while window._current_key() in window._pending:
+                app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+            waits.append(time.perf_counter() - t0)
+        pump(app, think_ms)
+    window.close()
+    return stalls, waits, hits
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--photos", type=int, default=30)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--think-ms", type=float, default=300.0)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    root = tempfile.mkdtemp(prefix="bench_slides_")
+    try:
+        paths = make_photos(root, args.photos, args.width)
+        print(f"photos={args.photos} size={args.width}x{args.width * 3 // 4} think={args.think_ms:.0f}ms")
+        stalls = run_legacy(paths, (720, 580))
+        print(f"legacy  UI blocked per flip avg {sum(stalls) / len(stalls) * 1000:7.1f}ms  max {max(stalls) * 1000:7.1f}ms")
+        stalls, waits, hits = run_window(app, paths, args.think_ms)
+        wait = f"{sum(waits) / len(waits) * 1000:.1f}ms" if waits else "-"
+        print(f"window  UI blocked per flip avg {sum(stalls) / len(stalls) * 1000:7.1f}ms  max {max(stalls) * 1000:7.1f}ms  "
+              f"ready on flip {hits}/{len(stalls)}  avg wait when not ready {wait}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+지도 사각형(rectangles) 매칭 마이크로벤치마크
+
+사각형이 수십 개인 고객에 대해
+  1) 기존 방식: 매물마다 모든 사각형을 검사하는 이중 루프 (search_*_supabase)
+  2) numpy: 사각형마다 전체 매물 배열 비교
+  3) GridIndex: 사각형이 걸치는 셀의 매물만 비교
+를 비교하고 결과가 같은지 확인한다.
+
+실행: python benchmarks/bench_spatial_index.py [listing_count]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from spatial_index import GridIndex  # noqa: E402
+
+
+def make_rects(rnd, count):
+    rects = []
+    for _ in range(count):
+        lng, lat = rnd.uniform(127.30, 127.45), rnd.uniform(36.28, 36.40)
+        rects.append((lng, lat, lng + rnd.uniform(0.002, 0.02), lat + rnd.uniform(0.002, 0.015)))
+    return rects
+
+
+def nested_loop(lat, lng, rects):
+    hits = []
+    for i in range(len(lat)):
+        for sw_lng, sw_lat, ne_lng, ne_lat in rects:
+            if sw_lng <= lng[i] <= ne_lng and sw_lat <= lat[i] <= ne_lat:
+                hits.append(i)
+                break
+    return hits
+
+
+def numpy_scan(lat, lng, rects):
+    mask = np.zeros(len(lat), dtype=bool)
+    for sw_lng, sw_lat, ne_lng, ne_lat in rects:
+        mask |= (lng >= sw_lng) & (lng <= ne_lng) & (lat >= sw_lat) & (lat <= ne_lat)
+    return np.flatnonzero(mask)
+
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) / repeat, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rnd = random.Random(7)
+    lat_list = [rnd.uniform(36.28, 36.40) for _ in range(n)]
+    lng_list = [rnd.uniform(127.30, 127.45) for _ in range(n)]
+    lat = np.array(lat_list)
+    lng = np.array(lng_list)
+
+    t0 = time.perf_counter()
+    grid = GridIndex(lat, lng)
+    print(f"listings={n}  grid build={(time.perf_counter() - t0) * 1000:.2f}ms  cells={grid.nx}x{grid.ny}")
+
+    for rect_count in (1, 12, 36, 72):
+        rects = make_rects(rnd, rect_count)
+        t_loop, r_loop = timed(lambda: nested_loop(lat_list, lng_list, rects), 1)
+        t_np, r_np = timed(lambda: numpy_scan(lat, lng, rects), 20)
+        t_grid, r_grid = timed(lambda: grid.query_rects(rects), 20)
+        same = list(r_loop) == r_np.tolist() == r_grid.tolist()
+        print(
+            f"rects={rect_count:>3}  nested loop={t_loop * 1000:9.2f}ms  numpy scan={t_np * 1000:7.3f}ms  "
+            f"grid={t_grid * 1000:7.3f}ms  hits={len(r_grid)}  same={same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Supabase 조회 비교: 기존 .execute() 한 번 vs supabase_fetch.fetch_all (count + range 페이지 병렬)
+
+로컬에 PostgREST 호환 대역 서버(GET /rest/v1/<table>?select=..&id=gt.N&order=id.asc&offset=&limit=,
+Prefer: count=exact → Content-Range)를 띄운다. 응답은 --max-rows 건에서 잘리고(PostgREST max-rows),
+요청마다 --rtt-ms + 행 수 x --row-us 만큼 지연시켜 HTTPS 왕복/전송을 흉내 낸다.
+supabase 패키지가 있으면 create_client로, 없으면 같은 HTTP를 보내는 작은 쿼리 빌더로 접속한다.
+가져온 행 수(잘림 여부), 시간, HTTP 요청 수를 출력한다.
+
+실행: python benchmarks/bench_supabase_fetch.py [--rows 20000] [--max-rows 1000] [--rtt-ms 30] [--concurrency 4]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+import supabase_fetch  # noqa: E402
+
+
+class StandInStore:
+    def __init__(self, rows, max_rows, rtt_ms, row_us):
+        self.rows = [{"id": i, "dong": "둔산동", "jibun": f"{i}-1", "deposit": 1000 + i % 500, "monthly": 50,
+                      "manager": f"m{i % 7}"} for i in range(1, rows + 1)]
+        self.max_rows = max_rows
+        self.rtt = rtt_ms / 1000
+        self.row_delay = row_us / 1_000_000
+        self.lock = threading.Lock()
+        self.requests = 0
+
+
+def make_handler(store):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with store.lock:
+                store.requests += 1
+            query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            rows = store.rows
+            for column, cond in query.items():
+                if column in ("select", "order", "offset", "limit"):
+                    continue
+                op, _, value = cond.partition(".")
+                if op == "gt":
+                    rows = [r for r in rows if r[column] > int(value)]
+                elif op == "eq":
+                    rows = [r for r in rows if str(r[column]) == value]
+            if query.get("order", "id.asc").endswith(".desc"):
+                rows = rows[::-1]
+            total = len(rows)
+            offset = int(query.get("offset", 0))
+            limit = min(int(query.get("limit", store.max_rows)), store.max_rows)
+            page = rows[offset:offset + limit]
+            time.sleep(store.rtt + len(page) * store.row_delay)
+            data = json.dumps(page, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            if "count=" in self.headers.get("Prefer", ""):
+                last = offset + len(page) - 1
+                self.send_header("Content-Range", f"{offset}-{last}/{total}" if page else f"*/{total}")
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+class _Result:
+    def __init__(self, data, count):
+        self.data = data
+        self.count = count
+
+
+class _Query:
+    """postgrest 쿼리 빌더에서 supabase_fetch가 쓰는 부분만 (supabase 미설치 시)"""
+
+    def __init__(self, http, table):
+        self.http, self.table = http, table
+        self.params, self.headers = {}, {}
+
+    def select(self, columns, count=None):
+        self.params["select"] = ",".join(c.strip() for c in columns.split(","))
+        if count:
+            self.headers["Prefer"] = f"count={count}"
+        return self
+
+    def gt(self, column, value):
+        self.params[column] = f"gt.{value}"
+        return self
+
+    def eq(self, column, value):
+        self.params[column] = f"eq.{value}"
+        return self
+
+    def order(self, column, desc=False):
+        self.params["order"] = f"{column}.{'desc' if desc else 'asc'}"
+        return self
+
+    def range(self, start, end):
+        self.params["offset"] = start
+        self.params["limit"] = end - start + 1
+        return self
+
+    def execute(self):
+        resp = self.http.get(f"/rest/v1/{self.table}", params=self.params, headers=self.headers)
+        resp.raise_for_status()
+        content_range = resp.headers.get("Content-Range", "")
+        count = int(content_range.rsplit("/", 1)[1]) if "/" in content_range else None
+        return _Result(resp.json(), count)
+
+
+class StandInClient:
+    def __init__(self, base_url, max_connections):
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.http = httpx.Client(base_url=base_url, limits=limits)
+
+    def table(self, name):
+        return _Query(self.http, name)
+
+
+def make_client(base_url, max_connections):
+    try:
+        from supabase import create_client
+        return create_client(base_url, "stand-in-anon-key")
+    except ImportError:
+        return StandInClient(base_url, max_connections)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--max-rows", type=int, default=1000)
+    parser.add_argument("--rtt-ms", type=float, default=30.0)
+    parser.add_argument("--row-us", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    store = StandInStore(args.rows, args.max_rows, args.rtt_ms, args.row_us)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(store))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = make_client(f"http://127.0.0.1:{server.server_port}", args.concurrency + 2)
+    columns = "id, dong, jibun, deposit, monthly, manager"
+
+    cases = [
+        ("legacy", lambda: client.table("naver_shop").select(columns).order("id").execute().data),
+        ("sequential", lambda: supabase_fetch.fetch_all("naver_shop", columns, concurrency=1, client=client)),
+        ("parallel", lambda: supabase_fetch.fetch_all("naver_shop", columns, concurrency=args.concurrency,
+                                                      client=client)),
+        ("manager", lambda: supabase_fetch.fetch_all("naver_shop", columns, where=lambda q: q.eq("manager", "m3"),
+                                                     concurrency=args.concurrency, client=client)),
+    ]
+    print(f"rows={args.rows} max_rows={args.max_rows} rtt={args.rtt_ms:.0f}ms concurrency={args.concurrency}")
+    for label, fn in cases:
+        store.requests = 0
+        t0 = time.perf_counter()
+        rows = fn()
+        elapsed = time.perf_counter() - t0
+        ids = [r["id"] for r in rows]
+        ordered = ids == sorted(set(ids))
+        print(f"{label:<10} {elapsed * 1000:9.1f}ms  HTTP {store.requests:>4}  rows={len(rows):>6}  ordered/unique={ordered}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
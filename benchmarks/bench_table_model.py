@@ -0,0 +1,153 @@
+"""
+큰 목록 테이블 모델 비교: 기존 QStandardItemModel(칸마다 QStandardItem) vs columnar_table_model.ColumnarTableModel
+
+써브(상가) 탭과 같은 20개 컬럼(주소 칸 UserRole 값 포함)에 --rows 행을 채운다.
+케이스마다 별도 프로세스에서
+- populate: 모델 채우기 시간
+- first paint: 뷰가 처음 그리는 --visible 행 x 전체 컬럼의 data(Display/Background/UserRole) 호출 시간
+- sort: 한 컬럼 정렬 시간 (뷰 정렬 = model.sort)
+- 메모리: RSS 증가분(/proc/self/statm, QStandardItem은 C++ 힙이라 tracemalloc에 안 잡힘) + tracemalloc 증가분
+을 출력한다. 화면 없이 돌도록 QT_QPA_PLATFORM=offscreen.
+
+실행: python benchmarks/bench_table_model.py [--rows 20000] [--visible 40]
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtGui, QtWidgets  # noqa: E402
+from PyQt5.QtCore import Qt  # noqa: E402
+
+from columnar_table_model import ColumnarTableModel, Column, field, pair, address_text, property_numbers  # noqa: E402
+
+HEADERS = [
+    ("주소", address_text), ("호", field("ho")), ("층", pair("curr_floor", "total_floor")),
+    ("보증금/월세", pair("deposit", "monthly")), ("관리비", field("manage_fee")), ("권리금", field("premium")),
+    ("현업종", field("current_use")), ("평수", field("area")), ("연락처", field("owner_phone")),
+    ("매물번호", property_numbers), ("담당자", field("manager")), ("메모", field("memo")),
+    ("주차", field("parking")), ("용도", field("building_usage")), ("사용승인일", field("approval_date")),
+    ("방/화장실", pair("rooms", "baths")), ("광고종료일", field("ad_end_date")), ("사진경로", field("photo_path")),
+    ("소유자명", field("owner_name")), ("관계", field("owner_relation")),
+]
+ADDRESS_ROLES = {
+    Qt.UserRole + 10: lambda r: r.get("photo_path", "") or "",
+    Qt.UserRole + 2: lambda r: "상가",
+    Qt.UserRole + 3: lambda r: r.get("id", 0),
+    Qt.UserRole + 1: lambda r: r.get("status_cd", ""),
+}
+ROW_BG = QtGui.QColor("#E6F5E6")
+
+
+def make_rows(n):
+    return [{
+        "id": i, "dong": "둔산동", "jibun": f"{i % 1500}-{i % 7}", "ho": f"{100 + i % 20}",
+        "curr_floor": i % 15, "total_floor": 15, "deposit": 1000 + i % 5000, "monthly": 50 + i % 300,
+        "manage_fee": i % 30, "premium": i % 7000, "current_use": "음식점", "area": 10 + i % 90,
+        "owner_phone": f"010-{i % 9000:04d}-{i % 7777:04d}", "naver_property_no": str(2_000_000 + i),
+        "serve_property_no": "", "manager": f"담당{i % 9}", "memo": "주차 가능, 코너" if i % 3 else "",
+        "parking": i % 4, "building_usage": "근린생활시설", "approval_date": "2008-05-01", "rooms": i % 3,
+        "baths": 1, "ad_end_date": "2026-12-31", "photo_path": "", "owner_name": "홍길동",
+        "owner_relation": "본인", "status_cd": "",
+    } for i in range(n)]
+
+
+def populate_legacy(rows):
+    """기존 populate_serve_shop_table 방식"""
+    m = QtGui.QStandardItemModel()
+    m.setColumnCount(len(HEADERS))
+    m.setHorizontalHeaderLabels([h for h, _ in HEADERS])
+    m.setRowCount(len(rows))
+    for i, r in enumerate(rows):
+        for c, (_, text) in enumerate(HEADERS):
+            item = QtGui.QStandardItem(text(r))
+            if c == 0:
+                for role, fn in ADDRESS_ROLES.items():
+                    item.setData(fn(r), role)
+            item.setBackground(ROW_BG)
+            m.setItem(i, c, item)
+    return m
+
+
+def populate_columnar(rows):
+    columns = [Column(h, text, roles=ADDRESS_ROLES if h == "주소" else None) for h, text in HEADERS]
+    m = ColumnarTableModel(columns, row_roles={Qt.BackgroundRole: lambda r: ROW_BG})
+    m.set_rows(rows)
+    return m
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def run_case(case, n, visible):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])  # noqa: F841
+    rows = make_rows(n)
+    gc.collect()
+    rss0 = rss_bytes()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    model = populate_legacy(rows) if case == "legacy" else populate_columnar(rows)
+    populate = time.perf_counter() - t0
+    py_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    rss = rss_bytes() - rss0
+
+    t0 = time.perf_counter()
+    for r in range(min(visible, n)):
+        for c in range(model.columnCount()):
+            index = model.index(r, c)
+            model.data(index, Qt.DisplayRole)
+            model.data(index, Qt.BackgroundRole)
+            model.data(index, Qt.UserRole + 3)
+    first_paint = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    model.sort(3, Qt.DescendingOrder)
+    sort = time.perf_counter() - t0
+    top = model.index(0, 0)
+    return {
+        "case": case, "populate": populate, "first_paint": first_paint, "sort": sort,
+        "rss": rss, "py_mem": py_mem, "top_id": model.data(top, Qt.UserRole + 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--visible", type=int, default=40)
+    parser.add_argument("--case", choices=["legacy", "columnar"])
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.rows, args.visible)))
+        return
+
+    print(f"rows={args.rows} cols={len(HEADERS)} visible={args.visible}")
+    results = {}
+    for case in ("legacy", "columnar"):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", case, "--rows", str(args.rows),
+                              "--visible", str(args.visible)], capture_output=True, text=True, check=True)
+        res = results[case] = json.loads(out.stdout.strip().splitlines()[-1])
+        print(f"{case:<9} populate {res['populate'] * 1000:9.1f}ms  first paint {res['first_paint'] * 1000:7.2f}ms  "
+              f"sort {res['sort'] * 1000:8.1f}ms  RSS +{res['rss'] / 2**20:7.1f}MB  "
+              f"python +{res['py_mem'] / 2**20:7.1f}MB  top id={res['top_id']}")
+    legacy, columnar = results["legacy"], results["columnar"]
+    print(f"populate x{legacy['populate'] / max(columnar['populate'], 1e-9):.0f} faster, "
+          f"RSS {legacy['rss'] / max(columnar['rss'], 1):.1f}x smaller, same order after sort={legacy['top_id'] == columnar['top_id']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+주소 칸 사진 아이콘 비교: 기존(행마다 UI 스레드에서 listdir + 원본 QPixmap 디코딩 후 24px 축소) vs thumbnail_service
+
+--folders 개 사진 폴더(폴더마다 --width x 3/4 JPEG --per-folder 장)를 임시 폴더에 만들고
+- legacy: 기존 populate 루프처럼 모든 행의 아이콘/툴팁을 만드는 동안 UI 스레드가 막힌 시간
+- service cold / warm(디스크 캐시): ColumnarTableModel.set_rows 후 보이는 --visible 행의 data(DecorationRole)를
+  부르고 이벤트 루프를 돌리며 아이콘이 모두 준비될 때까지의 시간과, 그동안 UI 스레드가 가장 오래 막힌 시간
+을 출력한다. 네트워크 공유를 흉내 내려면 --latency-ms로 listdir마다 지연을 준다. QT_QPA_PLATFORM=offscreen.
+
+실행: python benchmarks/bench_thumbnails.py [--folders 300] [--visible 40] [--width 3000] [--latency-ms 0]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtGui, QtWidgets  # noqa: E402
+from PyQt5.QtCore import Qt  # noqa: E402
+
+import thumbnail_service  # noqa: E402
+from columnar_table_model import ColumnarTableModel, Column, address_text  # noqa: E402
+
+
+def make_photos(root, folders, per_folder, width):
+    image = QtGui.QImage(width, width * 3 // 4, QtGui.QImage.Format_RGB32)
+    paths = []
+    for i in range(folders):
+        folder = os.path.join(root, f"{i:05d}")
+        os.makedirs(folder)
+        image.fill(QtGui.QColor.fromHsv(i * 37 % 360, 160, 220))
+        for j in range(per_folder):
+            image.save(os.path.join(folder, f"{j:02d}.jpg"), "JPG", 90)
+        paths.append(folder)
+    return paths
+
+
+def slow_listdir(latency):
+    listdir = os.listdir
+
+    def wrapped(path):
+        time.sleep(latency)
+        return listdir(path)
+    return wrapped
+
+
+def run_legacy(folders):
+    """기존 populate_serve_shop_table/populate_recommend_tab_view의 사진 처리"""
+    t0 = time.perf_counter()
+    for folder in folders:
+        files = [f for f in os.listdir(folder) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
+        if files:
+            rep = os.path.join(folder, files[0])
+            QtGui.QIcon(QtGui.QPixmap(rep).scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            QtCore.QUrl.fromLocalFile(rep).toString()
+    return time.perf_counter() - t0
+
+
+def run_service(app, folders, visible, cache_dir):
+    service = thumbnail_service.ThumbnailService(cache_dir=cache_dir)
+    model = ColumnarTableModel([Column("주소", address_text, roles=service.photo_roles(lambda r: r["photo_path"]))])
+    service.attach(model, 0)
+    rows = [{"dong": "둔산동", "jibun": str(i), "photo_path": f} for i, f in enumerate(folders)]
+
+    t0 = time.perf_counter()
+    model.set_rows(rows)
+    longest = 0.0
+    while True:
+        t = time.perf_counter()
+        ready = sum(model.data(model.index(r, 0), Qt.DecorationRole) is not None for r in range(min(visible, len(rows))))
+        app.processEvents(QtCore.QEventLoop.AllEvents, 10)
+        longest = max(longest, time.perf_counter() - t)
+        if ready >= min(visible, len(rows)) or time.perf_counter() - t0 > 60:
+            break
+        time.sleep(0.002)
+    elapsed = time.perf_counter() - t0
+    service.shutdown()
+    return elapsed, longest, dict(service.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--folders", type=int, default=300)
+    parser.add_argument("--per-folder", type=int, default=3)
+    parser.add_argument("--visible", type=int, default=40)
+    parser.add_argument("--width", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    root = tempfile.mkdtemp(prefix="bench_thumbs_")
+    try:
+        folders = make_photos(os.path.join(root, "photos"), args.folders, args.per_folder, args.width)
+        if args.latency_ms:
+            os.listdir = slow_listdir(args.latency_ms / 1000)  # ui_utils.representative_image_path도 같은 os 모듈
+        cache_dir = os.path.join(root, "cache")
+        print(f"folders={args.folders} photo={args.width}x{args.width * 3 // 4} visible={args.visible} "
+              f"listdir latency={args.latency_ms:.0f}ms")
+        legacy = run_legacy(folders)
+        print(f"legacy         UI blocked {legacy * 1000:9.1f}ms (all rows, before the table shows)")
+        for label in ("service cold", "service warm"):
+            elapsed, longest, stats = run_service(app, folders, args.visible, cache_dir)
+            print(f"{label:<14} visible icons {elapsed * 1000:8.1f}ms  longest UI stall {longest * 1000:6.1f}ms  "
+                  f"decoded={stats['decoded']} disk hits={stats['disk_hits']}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
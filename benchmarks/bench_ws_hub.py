@@ -0,0 +1,175 @@
+"""
+/ws 변경 알림 팬아웃 비교: 기존 순차 broadcast(연결 목록을 돌며 send_text await) vs ws_hub.BroadcastHub
+
+로컬 WebSocket 클라이언트 수백 개를 ASGI 수준에서 흉내 낸다 (websockets/wsproto 없이 실행되도록
+앱에 websocket scope와 receive/send를 직접 넘김). 일부는 느린 연결(프레임마다 --slow-ms 지연),
+일부는 반쯤 끊긴 연결(send가 끝나지 않음)이다.
+이벤트를 --events 개 발행하고 정상 클라이언트 기준 전달 완료 시간, 이벤트 지연 p50/p99,
+--timeout 안에 전달된 비율, 허브 통계(버린 메시지 / 끊은 연결)를 출력한다.
+
+실행: python benchmarks/bench_ws_hub.py [--clients 500] [--events 100] [--slow 10] [--slow-ms 20] [--dead 2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect  # noqa: E402
+
+import routers.websocket as ws_router  # noqa: E402
+from ws_hub import BroadcastHub  # noqa: E402
+
+
+def legacy_app():
+    """기존 routers/websocket.py 방식 (연결 리스트 + 순차 await)"""
+    app = FastAPI()
+    clients = []
+
+    async def endpoint(websocket: WebSocket):
+        await websocket.accept()
+        clients.append(websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            clients.remove(websocket)
+
+    async def broadcast(message):
+        for client in list(clients):
+            try:
+                await client.send_text(message)
+            except Exception:
+                clients.remove(client)
+
+    app.add_api_websocket_route("/ws", endpoint)
+    return app, broadcast
+
+
+def hub_app(send_timeout):
+    ws_router.hub = BroadcastHub(send_timeout=send_timeout, heartbeat_interval=0)
+    app = FastAPI()
+    app.include_router(ws_router.router)
+
+    async def broadcast(message):
+        ws_router.hub.publish(message, "bench")
+
+    return app, broadcast
+
+
+class SimClient:
+    def __init__(self, kind, slow_delay, published):
+        self.kind = kind
+        self.slow_delay = slow_delay
+        self.published = published
+        self.inbox = asyncio.Queue()
+        self.accepted = asyncio.Event()
+        self.latencies = []
+        self.inbox.put_nowait({"type": "websocket.connect"})
+
+    async def receive(self):
+        return await self.inbox.get()
+
+    async def send(self, message):
+        if message["type"] == "websocket.accept":
+            self.accepted.set()
+            return
+        if message["type"] != "websocket.send":
+            return
+        if self.kind == "dead":
+            await asyncio.Event().wait()  # 응답 없는 연결: 전송이 끝나지 않음
+        if self.kind == "slow":
+            await asyncio.sleep(self.slow_delay)
+        if self.kind != "normal":
+            return
+        now = time.perf_counter()
+        frame = json.loads(message["text"])
+        events = frame["events"] if frame.get("type") == "batch" else [frame]
+        for event in events:
+            if event.get("type") == "change":
+                self.latencies.append(now - self.published[event["version"]])
+
+    def disconnect(self):
+        self.inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+
+def scope():
+    return {
+        "type": "websocket", "asgi": {"version": "3.0"}, "scheme": "ws", "path": "/ws", "raw_path": b"/ws",
+        "query_string": b"", "root_path": "", "headers": [], "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000), "subprotocols": [],
+    }
+
+
+async def run(label, app, broadcast, args):
+    published = {}
+    kinds = ["dead"] * args.dead + ["slow"] * args.slow
+    kinds += ["normal"] * (args.clients - len(kinds))
+    random.Random(7).shuffle(kinds)
+    clients = [SimClient(kind, args.slow_ms / 1000, published) for kind in kinds]
+    tasks = [asyncio.create_task(app(scope(), c.receive, c.send)) for c in clients]
+    await asyncio.gather(*(c.accepted.wait() for c in clients))
+    await asyncio.sleep(0.05)
+
+    normal = [c for c in clients if c.kind == "normal"]
+    expected = len(normal) * args.events
+
+    async def publish_all():
+        for version in range(1, args.events + 1):
+            published[version] = time.perf_counter()
+            event = {"type": "change", "table": "bench", "action": "update", "ids": [version],
+                     "addresses": [], "manager": None, "version": version}
+            await broadcast(json.dumps(event))
+            await asyncio.sleep(0)
+
+    async def wait_delivered():
+        while sum(len(c.latencies) for c in normal) < expected:
+            await asyncio.sleep(0.005)
+
+    t0 = time.perf_counter()
+    publisher = asyncio.create_task(publish_all())
+    try:
+        await asyncio.wait_for(asyncio.gather(publisher, wait_delivered()), args.timeout)
+        status = "ok"
+    except asyncio.TimeoutError:
+        status = f"timeout {args.timeout:.0f}s"
+    elapsed = time.perf_counter() - t0
+
+    delivered = sum(len(c.latencies) for c in normal)
+    lat = sorted(x for c in normal for x in c.latencies)
+    p50 = statistics.median(lat) * 1000 if lat else float("nan")
+    p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))] * 1000 if lat else float("nan")
+    print(f"{label:<7} {status:<12} {elapsed * 1000:9.1f}ms  delivered {delivered}/{expected} "
+          f"({delivered / max(expected, 1):6.1%})  p50 {p50:8.1f}ms  p99 {p99:8.1f}ms")
+
+    for c in clients:
+        c.disconnect()
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--slow", type=int, default=10)
+    parser.add_argument("--slow-ms", type=float, default=20.0)
+    parser.add_argument("--dead", type=int, default=2)
+    parser.add_argument("--send-timeout", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+    print(f"clients={args.clients} (slow {args.slow} x {args.slow_ms:.0f}ms, dead {args.dead})  events={args.events}")
+
+    await run("legacy", *legacy_app(), args)
+    await run("hub", *hub_app(args.send_timeout), args)
+    print(f"hub stats: {ws_router.hub.snapshot()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+"""
+일괄 쓰기 헬퍼 - 마이리스트 저장(update_mylist_shop_items / update_mylist_oneroom_items),
+확인 매물 일괄 저장(batch_update_naver_shop_extra)
+
+기존에는 추가 행마다 INSERT 한 번, 수정 행마다 UPDATE 한 번을 실행해서
+MyListSaveHandler의 큰 자동 저장 한 번이 트랜잭션 안에서 수백 번의 왕복이 되었다.
+
+- 추가: 다중 행 INSERT ... VALUES (...),(...) (BULK_WRITE_CHUNK_SIZE 행 단위)
+  InnoDB는 행 수가 정해진 INSERT("simple insert")에 auto-increment 값을 한 번에 연속으로 배정하므로
+  lastrowid(첫 행 id) + i * auto_increment_increment 로 각 행의 새 id(temp_id 매핑)를 계산한다.
+- 수정: 같은 컬럼 조합끼리 묶어 UPDATE ... SET col = CASE id WHEN .. THEN .. END ... WHERE id IN (...)
+  같은 id가 여러 번 오면 순서대로 합쳐 마지막 값이 남는다 (기존 순차 UPDATE와 같은 결과).
+- 삭제: DELETE ... WHERE id IN (...) 한 번
+- 역할 검사(관리자가 아니면 manager = %s)는 guard 조건으로 모든 UPDATE/DELETE에 붙는다.
+- upsert_rows: 다중 행 INSERT ... ON DUPLICATE KEY UPDATE (update_columns가 없으면 일반 다중 INSERT)
+"""
+from settings import BULK_WRITE_CHUNK_SIZE
+
+DATE_COLUMNS = ("approval_date", "ad_end_date")
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def manager_guard(role, manager):
+    """관리자가 아니면 본인(manager) 행만 수정/삭제하도록 붙는 조건"""
+    if role != 'admin':
+        return "manager = %s", [manager]
+    return None, []
+
+
+def auto_increment_step(cursor):
+    cursor.execute("SELECT @@auto_increment_increment")
+    row = cursor.fetchone()
+    return int(row[0]) if row and row[0] else 1
+
+
+def _multi_insert_sql(table, columns, row_count, suffix=""):
+    col_sql = ", ".join(f"`{c}`" for c in columns)
+    row_marks = "(" + ",".join(["%s"] * len(columns)) + ")"
+    return f"INSERT INTO `{table}` ({col_sql}) VALUES " + ",".join([row_marks] * row_count) + suffix
+
+
+def insert_rows(cursor, table, columns, rows, chunk_size=None):
+    """
+    rows(컬럼 순서의 값 튜플 목록)를 다중 행 INSERT로 넣고 새 id 목록을 같은 순서로 반환
+    """
+    if not rows:
+        return []
+    chunk_size = chunk_size or BULK_WRITE_CHUNK_SIZE
+    step = auto_increment_step(cursor)
+
+    new_ids = []
+    for chunk in _chunks(rows, chunk_size):
+        sql = _multi_insert_sql(table, columns, len(chunk))
+        cursor.execute(sql, tuple(v for row in chunk for v in row))
+        if cursor.rowcount != len(chunk):
+            raise RuntimeError(f"{table} 다중 INSERT 행 수 불일치: {cursor.rowcount} != {len(chunk)}")
+        first_id = cursor.lastrowid
+        new_ids.extend(first_id + i * step for i in range(len(chunk)))
+    return new_ids
+
+
+def upsert_rows(cursor, table, columns, rows, update_columns=(), chunk_size=None):
+    """
+    다중 행 INSERT ... ON DUPLICATE KEY UPDATE col=VALUES(col), 영향 받은 행 수 합계 반환
+    (새 id가 필요 없을 때 사용. update_columns가 비어 있으면 일반 INSERT)
+    """
+    if not rows:
+        return 0
+    chunk_size = chunk_size or BULK_WRITE_CHUNK_SIZE
+    suffix = ""
+    if update_columns:
+        suffix = " ON DUPLICATE KEY UPDATE " + ", ".join(f"`{c}`=VALUES(`{c}`)" for c in update_columns)
+    affected = 0
+    for chunk in _chunks(rows, chunk_size):
+        cursor.execute(_multi_insert_sql(table, columns, len(chunk), suffix), tuple(v for row in chunk for v in row))
+        affected += cursor.rowcount
+    return affected
+
+
+def update_values(row, updatable_cols):
+    """수정 요청 한 행 → {컬럼: 값} (날짜 컬럼은 strip, 빈 문자열은 NULL)"""
+    values = {}
+    for col in updatable_cols:
+        if col in row:
+            val = row[col]
+            if col in DATE_COLUMNS:
+                val = str(val).strip() if val is not None else None
+                val = val or None
+            values[col] = val
+    return values
+
+
+def update_rows(cursor, table, updates, guard_sql=None, guard_params=(), chunk_size=None):
+    """
+    updates: [(id, {컬럼: 값}), ...] → 컬럼 조합별 CASE UPDATE. 실제로 바뀐 행 수 반환
+    """
+    merged = {}
+    for row_id, values in updates:
+        if values:
+            merged.setdefault(row_id, {}).update(values)
+    if not merged:
+        return 0
+
+    groups = {}
+    for row_id, values in merged.items():
+        groups.setdefault(tuple(sorted(values)), []).append(row_id)
+
+    chunk_size = chunk_size or BULK_WRITE_CHUNK_SIZE
+    changed = 0
+    for cols, ids in groups.items():
+        for chunk in _chunks(ids, chunk_size):
+            set_parts = []
+            params = []
+            for col in cols:
+                set_parts.append(f"`{col}` = CASE id " + "WHEN %s THEN %s " * len(chunk) + "END")
+                for row_id in chunk:
+                    params.extend((row_id, merged[row_id][col]))
+            sql = (
+                f"UPDATE `{table}` SET {', '.join(set_parts)} "
+                f"WHERE id IN ({','.join(['%s'] * len(chunk))})"
+            )
+            params.extend(chunk)
+            if guard_sql:
+                sql += f" AND {guard_sql}"
+                params.extend(guard_params)
+            cursor.execute(sql, tuple(params))
+            changed += cursor.rowcount
+    return changed
+
+
+def delete_rows(cursor, table, ids, guard_sql=None, guard_params=(), chunk_size=None, column="id"):
+    """column(기본 id) 값 목록으로 DELETE ... IN, 삭제된 행 수 반환"""
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        return 0
+    chunk_size = chunk_size or BULK_WRITE_CHUNK_SIZE
+    deleted = 0
+    for chunk in _chunks(ids, chunk_size):
+        sql = f"DELETE FROM `{table}` WHERE `{column}` IN ({','.join(['%s'] * len(chunk))})"
+        params = list(chunk)
+        if guard_sql:
+            sql += f" AND {guard_sql}"
+            params.extend(guard_params)
+        cursor.execute(sql, tuple(params))
+        deleted += cursor.rowcount
+    return deleted
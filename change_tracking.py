@@ -0,0 +1,94 @@
+"""
+행 변경 추적 / 델타 동기화 (since 토큰)
+
+마이리스트(상가/원룸), 고객, 계약완료 탭은 주기적으로 새로고침할 때마다 테이블 전체를 다시 받았다.
+migrate_change_tracking.py가 추적 테이블에 다음을 추가한다.
+  updated_at    TIMESTAMP(6) INVISIBLE (INSERT/UPDATE 시 자동 갱신) + 인덱스
+  row_tombstones(table_name, row_id, manager, deleted_at)
+                DELETE 트리거가 삭제 행을, UPDATE 트리거가 manager가 바뀐 행(이전 담당자 기준)을 기록
+
+조회 엔드포인트는 since=<token>을 받으면 updated_at >= token 인 행과 그 이후의 삭제 id만 돌려준다.
+- 토큰은 데이터 조회 직전의 DB 시각(NOW(6)) ISO 문자열. 클라이언트는 받은 값을 그대로 다음 요청에 넘긴다.
+- updated_at은 문장 실행 시각이라 토큰 이후에 커밋된 긴 트랜잭션의 행을 놓칠 수 있으므로
+  DELTA_SYNC_OVERLAP 초만큼 겹쳐서 조회한다. 클라이언트 병합은 id 기준이라 중복 수신은 무해하다.
+- 토큰이 tombstone 보관 기간(DELTA_TOMBSTONE_RETENTION_DAYS)보다 오래되었거나 USE_CHANGE_TRACKING이
+  꺼져 있으면 전체 응답(delta: false)을 돌려준다. 클라이언트는 이때 모델을 새로 채운다.
+
+응답: {"status": "ok", "data": [...], "delta": bool, "deleted": [id, ...], "token": str | None}
+"""
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+
+from settings import DELTA_SYNC_OVERLAP, DELTA_TOMBSTONE_RETENTION_DAYS, USE_CHANGE_TRACKING
+
+# naver_shop은 탭 조회용이 아니라 customer_listing_match 증분 동기화(listing_match_store)용
+TRACKED_TABLES = ("mylist_shop", "mylist_oneroom", "customer", "completed_deals", "naver_shop")
+UPDATED_AT_COLUMN = "updated_at"
+TOMBSTONE_TABLE = "row_tombstones"
+
+
+def parse_since(since):
+    """since 파라미터 → datetime 또는 None(전체). 형식이 틀리면 400"""
+    if not since:
+        return None
+    try:
+        return datetime.fromisoformat(since.strip())
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"잘못된 since 토큰: {since}")
+
+
+def begin_sync(cursor, since_dt):
+    """
+    데이터 조회 직전에 호출. (token, since_dt) 반환
+    변경 추적이 꺼져 있으면 (None, None), 토큰이 보관 기간보다 오래되었으면 since_dt=None(전체 조회)
+    """
+    if not USE_CHANGE_TRACKING:
+        return None, None
+    cursor.execute("SELECT NOW(6) AS now")
+    row = cursor.fetchone()
+    now = row["now"] if isinstance(row, dict) else row[0]
+    if since_dt is not None and since_dt < now - timedelta(days=DELTA_TOMBSTONE_RETENTION_DAYS):
+        since_dt = None
+    return now.isoformat(), since_dt
+
+
+def delta_condition(since_dt, alias=None):
+    """델타 조회 WHERE 조건 (겹침 구간 포함)"""
+    prefix = f"{alias}." if alias else ""
+    return f"{prefix}`{UPDATED_AT_COLUMN}` >= %s", [since_dt - timedelta(seconds=DELTA_SYNC_OVERLAP)]
+
+
+def deleted_ids(cursor, table, since_dt, manager=None, live_rows=()):
+    """since 이후 삭제(또는 manager 변경으로 범위를 벗어난) 행 id. 이번 응답에 살아 있는 id는 제외"""
+    sql = (
+        f"SELECT DISTINCT row_id FROM `{TOMBSTONE_TABLE}` "
+        "WHERE table_name = %s AND deleted_at >= %s"
+    )
+    params = [table, since_dt - timedelta(seconds=DELTA_SYNC_OVERLAP)]
+    if manager is not None:
+        sql += " AND manager = %s"
+        params.append(manager)
+    cursor.execute(sql, tuple(params))
+    live = {r["id"] for r in live_rows}
+    ids = (r["row_id"] if isinstance(r, dict) else r[0] for r in cursor.fetchall())
+    return sorted(i for i in ids if i not in live)
+
+
+def sync_payload(rows, token, since_dt, deleted=()):
+    return {
+        "status": "ok",
+        "data": rows,
+        "delta": since_dt is not None,
+        "deleted": list(deleted),
+        "token": token,
+    }
+
+
+def purge_tombstones(cursor):
+    """보관 기간이 지난 tombstone 삭제, 삭제 건수 반환"""
+    cursor.execute(
+        f"DELETE FROM `{TOMBSTONE_TABLE}` WHERE deleted_at < NOW(6) - INTERVAL %s DAY",
+        (DELTA_TOMBSTONE_RETENTION_DAYS,),
+    )
+    return cursor.rowcount
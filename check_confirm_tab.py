@@ -5,6 +5,9 @@ from PyQt5.QtWidgets import QTableView, QAbstractItemView, QHeaderView, QMenu
 from PyQt5.QtCore import Qt
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
 from dialogs import EditConfirmMemoDialog, StatusChangeDialog, MultiRowMemoDialog
+from websocket_manager import apply_address_change, subscribe_changes
+from address_data_store import get_address_store, BATCH_SOURCES
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
 # Add pyqtSignal import and QObject
 from PyQt5.QtCore import pyqtSignal, QObject
 
@@ -21,7 +24,7 @@ class CheckConfirmTab(QObject):
 
         self.check_confirm_model = None
         self.check_confirm_view = None
-        self.check_confirm_dict = {} # Cache for confirm data by address
+        self.check_confirm_dict = get_address_store().view("check_confirm") # 탭 공용 주소 캐시(address_data_store)의 매물체크 뷰
         self.confirm_timer = None
 
     def init_tab(self, main_tabs_widget):
@@ -78,6 +81,15 @@ class CheckConfirmTab(QObject):
         # self._auto_reload_confirm_data() # 비활성화
         # self.confirm_timer.start()
 
+        # 서버 변경 알림(/ws)이 오면 바뀐 주소의 캐시만 버리고, 보고 있는 주소면 다시 로드
+        subscribe_changes(self.parent_app, "naver_shop_check_confirm", self._on_confirm_changed)
+
+    def _on_confirm_changed(self, change):
+        """ (Main Thread) naver_shop_check_confirm 변경 알림 처리 """
+        if getattr(self.parent_app, 'terminating', False):
+            return
+        apply_address_change(self.parent_app, self.check_confirm_dict, change, self.filter_and_populate)
+
     def _auto_reload_confirm_data(self):
         """
         Triggered by the timer to reload all confirm data.
@@ -174,14 +186,8 @@ class CheckConfirmTab(QObject):
             print("[INFO] CheckConfirmTab: Model no longer exists, skipping update")
             return
 
-        # (A) Update cache (self.check_confirm_dict)
-        self.check_confirm_dict.clear()
-        loaded_addresses = set()
-        for row in new_rows:
-            addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-            if addr_str:
-                self.check_confirm_dict.setdefault(addr_str, []).append(row)
-                loaded_addresses.add(addr_str)
+        # (A) Update the shared store (confirm_id/item_id 기준으로 덮어쓰기)
+        loaded_addresses = get_address_store().put("check_confirm", new_rows)
         
         # Emit signal for each loaded address
         for addr in loaded_addresses:
@@ -213,6 +219,7 @@ class CheckConfirmTab(QObject):
             target_addresses = [self.parent_app.last_selected_address]
         
         if not target_addresses:
+            get_fetch_scheduler(self.parent_app).cancel("check_confirm")
             # No address selected, show empty table
             print("[INFO] CheckConfirmTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
             self.populate_check_confirm_view([])
@@ -223,43 +230,24 @@ class CheckConfirmTab(QObject):
         
         # 백그라운드에서 API 호출
         if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-            future = self.parent_app.executor.submit(
-                self._bg_load_confirm_data_for_addresses,
-                target_addresses
-            )
-            future.add_done_callback(self._on_filter_data_loaded)
+            get_fetch_scheduler(self.parent_app).request(
+                "check_confirm", target_addresses, self._bg_load_confirm_data_for_addresses, self._on_filter_data_loaded,
+                sources=BATCH_SOURCES, visible=widget_visible(self.check_confirm_view))
         else:
             print("[ERROR] CheckConfirmTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_confirm_data_for_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 확인 데이터를 실시간 로드합니다. """
+        """ (Background Thread) 지정된 주소들의 확인 데이터를 공용 store에서 읽고, 없는 주소만 배치 API로 받습니다. """
         if not addresses_to_fetch:
             print("[WARN] CheckConfirmTab _bg_load_confirm_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/shop/get_all_confirm_with_items"
-        payload = {"addresses": addresses_to_fetch}
-        
-        try:
-            print(f"[DEBUG] CheckConfirmTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}")
-            resp = requests.post(url, json=payload, timeout=20)
-            resp.raise_for_status()
-            j = resp.json()
-            
-            if j.get("status") == "ok":
-                data = j.get("data", [])
-                print(f"[INFO] CheckConfirmTab: API 응답 성공 - {len(data)}개 항목")
-                return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] CheckConfirmTab API 응답 오류: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-                
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] CheckConfirmTab API 요청 실패: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] CheckConfirmTab 예상치 못한 오류: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "check_confirm", addresses_to_fetch)
+        if result["status"] == "ok":
+            print(f"[INFO] CheckConfirmTab: 데이터 준비 완료 - {len(result['data'])}개 항목")
+        else:
+            print(f"[ERROR] CheckConfirmTab 데이터 로드 실패: {result.get('message')}")
+        return result
 
     def _on_filter_data_loaded(self, future):
         """ (Main Thread) API 쿼리 결과를 처리하고 테이블을 업데이트합니다. """
@@ -286,15 +274,7 @@ class CheckConfirmTab(QObject):
         
         if status == "ok":
             print(f"[INFO] CheckConfirmTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
-            # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-            for row in data:
-                addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                if addr_str:
-                    # 기존 데이터를 새 데이터로 교체
-                    self.check_confirm_dict[addr_str] = self.check_confirm_dict.get(addr_str, [])
-                    if row not in self.check_confirm_dict[addr_str]:  # 중복 방지
-                        self.check_confirm_dict[addr_str].append(row)
-            
+            # 행은 공용 store에 이미 있으므로 AllTab도 get_data_for_address로 같은 데이터를 본다
             self.populate_check_confirm_view(data)
             # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
             for addr in fetched_addresses:
@@ -412,7 +392,7 @@ class CheckConfirmTab(QObject):
         self.populate_check_confirm_view(filtered)
 
     def get_data_for_address(self, addr_str: str) -> list:
-        """ Returns the list of confirm items for the given address from the local cache. """
+        """ Returns the list of confirm items for the given address from the shared address store. """
         return self.check_confirm_dict.get(addr_str, [])
 
     def _get_headers(self):
@@ -0,0 +1,597 @@
+"""
+큰 목록 탭용 가상화 테이블 모델 (QStandardItemModel 대체)
+
+QStandardItemModel은 칸마다 QStandardItem을 만들어 두므로 2만 행 x 20열이면 40만 개 객체를 채우는 데만
+수 초가 걸리고 메모리도 그만큼 잡는다. ColumnarTableModel은
+- 원본 행(dict) 목록만 보관하고, 칸 표시 문자열은 컬럼별 배열(column array)에 처음 그려질 때 계산해 채운다
+  (뷰가 보이는 행의 data()만 부르므로 스크롤하지 않은 행은 계산하지 않는다)
+- UserRole 값/아이콘/툴팁은 Column.roles의 함수로 필요할 때 계산해 캐시한다
+- setData/setText/setBackground 등으로 바뀐 값만 칸별 덮어쓰기(overrides)로 따로 들고 있다
+- 원본과 달라진 표시값은 편집 추적(edited_cells/is_edited/clear_edits)에 남긴다
+- 정렬은 행 순서 배열(_order)만 바꾼다. 뷰 행 번호 = 모델 행 번호를 유지하므로 (QStandardItemModel과 같이)
+  index.row()를 그대로 model.item(row, col)에 쓰는 기존 코드/메인 앱 콜백이 바뀌지 않는다.
+
+기존 탭 코드가 쓰는 QStandardItemModel API(item/itemFromIndex/setItem/horizontalHeaderItem/setRowCount/
+removeRow(s)/insertRow(s)/appendRow/setHorizontalHeaderLabels/itemChanged)는 ColumnarItem을 통해 그대로 동작한다.
+item()은 가벼운 칸 참조라 만들 때마다 새 객체지만, 같은 칸이면 == 로 같다.
+
+    model = ColumnarTableModel([
+        Column("주소", lambda r: f"{r.get('dong', '')} {r.get('jibun', '')}".strip(),
+               roles={Qt.UserRole + 3: lambda r: r.get("id")}),
+        Column("층", lambda r: f"{r.get('curr_floor', 0)}/{r.get('total_floor', 0)}"),
+    ])
+    model.set_rows(rows)      # 전체 교체 (reset)
+    model.append_rows(more)   # 뒤에 추가 (rowsInserted)
+"""
+import logging
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtCore import Qt
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+_FLAGS = -1  # overrides 안에서 칸 플래그를 보관하는 키
+
+# setItem(row, col, QStandardItem)으로 넘어온 항목에서 옮겨 담을 역할
+_COPY_ROLES = (
+    Qt.ToolTipRole, Qt.DecorationRole, Qt.BackgroundRole, Qt.ForegroundRole, Qt.FontRole,
+    Qt.TextAlignmentRole, Qt.CheckStateRole,
+) + tuple(Qt.UserRole + i for i in range(0, 21))
+
+DEFAULT_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
+
+
+class Column:
+    """
+    컬럼 정의. text(record) -> 표시 문자열 (None이면 빈 칸: item()이 None),
+    roles {role: fn(record)} -> UserRole 값/아이콘/툴팁 등, editable: 편집 가능 여부
+    """
+    __slots__ = ("header", "text", "roles", "editable")
+
+    def __init__(self, header, text=None, roles=None, editable=True):
+        self.header = header
+        self.text = text
+        self.roles = roles or {}
+        self.editable = editable
+
+
+def field(key):
+    """record[key]를 문자열로 (None/없음 → 빈 문자열)"""
+    def text(record):
+        value = record.get(key)
+        return "" if value is None else str(value)
+    return text
+
+
+def pair(first, second, default=0):
+    """"first/second" 형식 (층, 보증금/월세, 방/화장실)"""
+    return lambda record: f"{record.get(first, default)}/{record.get(second, default)}"
+
+
+def address_text(record):
+    return f"{record.get('dong') or ''} {record.get('jibun') or ''}".strip()
+
+
+def property_numbers(record):
+    """"네이버번호/써브번호" (둘 다 없으면 빈 문자열)"""
+    naver, serve = record.get("naver_property_no", ""), record.get("serve_property_no", "")
+    return f"{naver}/{serve}" if (naver or serve) else ""
+
+
+class _HeaderItem:
+    """horizontalHeaderItem(col).text() 호환"""
+    __slots__ = ("_text",)
+
+    def __init__(self, text):
+        self._text = text
+
+    def text(self):
+        return self._text
+
+
+class ColumnarItem:
+    """model.item(row, col)이 돌려주는 칸 참조 (QStandardItem에서 탭 코드가 쓰는 메서드만)"""
+    __slots__ = ("_model", "_slot", "_col")
+
+    def __init__(self, model, slot, col):
+        self._model = model
+        self._slot = slot
+        self._col = col
+
+    def __eq__(self, other):
+        return (isinstance(other, ColumnarItem) and other._model is self._model
+                and other._slot == self._slot and other._col == self._col)
+
+    def __hash__(self):
+        return hash((id(self._model), self._slot, self._col))
+
+    def model(self):
+        return self._model
+
+    def row(self):
+        return self._model._row_of(self._slot)
+
+    def column(self):
+        return self._col
+
+    def index(self):
+        row = self.row()
+        return self._model.index(row, self._col) if row >= 0 else QtCore.QModelIndex()
+
+    def text(self):
+        value = self._model._display(self._slot, self._col)
+        return "" if value is None else str(value)
+
+    def setText(self, text):
+        self._model._set_cell(self._slot, self._col, Qt.DisplayRole, text)
+
+    def data(self, role=Qt.UserRole + 1):
+        return self._model._cell_data(self._slot, self._col, role)
+
+    def setData(self, value, role=Qt.UserRole + 1):
+        self._model._set_cell(self._slot, self._col, role, value)
+
+    def toolTip(self):
+        return self.data(Qt.ToolTipRole) or ""
+
+    def setToolTip(self, text):
+        self.setData(text, Qt.ToolTipRole)
+
+    def icon(self):
+        return self.data(Qt.DecorationRole) or QtGui.QIcon()
+
+    def setIcon(self, icon):
+        self.setData(icon, Qt.DecorationRole)
+
+    def background(self):
+        return _brush(self.data(Qt.BackgroundRole))
+
+    def setBackground(self, brush):
+        self.setData(_brush(brush), Qt.BackgroundRole)
+
+    def foreground(self):
+        return _brush(self.data(Qt.ForegroundRole))
+
+    def setForeground(self, brush):
+        self.setData(_brush(brush), Qt.ForegroundRole)
+
+    def font(self):
+        return self.data(Qt.FontRole) or QtGui.QFont()
+
+    def setFont(self, font):
+        self.setData(font, Qt.FontRole)
+
+    def setTextAlignment(self, alignment):
+        self.setData(int(alignment), Qt.TextAlignmentRole)
+
+    def flags(self):
+        return self._model._cell_flags(self._slot, self._col)
+
+    def setFlags(self, flags):
+        self._model._set_cell(self._slot, self._col, _FLAGS, flags)
+
+    def isEditable(self):
+        return bool(self.flags() & Qt.ItemIsEditable)
+
+    def setEditable(self, editable):
+        flags = self.flags()
+        self.setFlags(flags | Qt.ItemIsEditable if editable else flags & ~Qt.ItemIsEditable)
+
+
+def _brush(value):
+    if value is None:
+        return QtGui.QBrush()
+    if isinstance(value, QtGui.QBrush):
+        return value
+    return QtGui.QBrush(value)
+
+
+class ColumnarTableModel(QtCore.QAbstractTableModel):
+    """
+    columns: Column 목록, row_roles: {role: fn(record)} 모든 칸에 공통으로 적용할 역할 (예: 행 배경색)
+    저장소는 slot(원본 행 번호) 기준이고 _order[view_row] = slot. 행을 지우면 _order에서만 빠지고
+    slot 자리는 다음 set_rows/setRowCount(0)/clear 때 비운다.
+    """
+    itemChanged = QtCore.pyqtSignal(object)
+
+    def __init__(self, columns=(), row_roles=None, parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._headers = [c.header for c in self._columns]
+        self._row_roles = dict(row_roles or {})
+        self._sort_role = Qt.DisplayRole
+        self._reset_storage()
+
+    def _reset_storage(self):
+        self._records = []    # slot -> 원본 행
+        self._order = []      # view row -> slot
+        self._text = {}       # col -> [표시값 | _UNSET] (slot 순서, 처음 접근할 때 만든다)
+        self._cache = {}      # (col | None, role) -> {slot: 값}
+        self._overrides = {}  # (slot, col) -> {role: 값}
+        self._edited = set()  # 원본과 표시값이 달라진 (slot, col)
+        self._slot_rows = None
+
+    # ---- 컬럼 / 헤더 ----
+    def set_columns(self, columns, row_roles=None):
+        """컬럼 정의 교체 (행은 유지하고 계산 캐시/덮어쓰기는 비운다)"""
+        self.beginResetModel()
+        self._columns = list(columns)
+        self._headers = [c.header for c in self._columns]
+        if row_roles is not None:
+            self._row_roles = dict(row_roles)
+        self._text, self._cache, self._overrides, self._edited = {}, {}, {}, set()
+        self.endResetModel()
+
+    def horizontalHeaderItem(self, col):
+        if 0 <= col < len(self._headers) and self._headers[col] is not None:
+            return _HeaderItem(self._headers[col])
+        return None
+
+    def setHorizontalHeaderLabels(self, labels):
+        labels = list(labels)
+        if len(labels) > self.columnCount():
+            self.setColumnCount(len(labels))
+        for col, label in enumerate(labels):
+            self._headers[col] = label
+            self._columns[col].header = label
+        if labels:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(labels) - 1)
+
+    def setColumnCount(self, count):
+        current = self.columnCount()
+        if count > current:
+            self.beginInsertColumns(QtCore.QModelIndex(), current, count - 1)
+            for _ in range(current, count):
+                self._columns.append(Column(None))
+                self._headers.append(None)
+            self.endInsertColumns()
+        elif count < current:
+            self.beginRemoveColumns(QtCore.QModelIndex(), count, current - 1)
+            del self._columns[count:]
+            del self._headers[count:]
+            self._text = {c: v for c, v in self._text.items() if c < count}
+            self._cache = {k: v for k, v in self._cache.items() if k[0] is None or k[0] < count}
+            self._overrides = {k: v for k, v in self._overrides.items() if k[1] < count}
+            self._edited = {k for k in self._edited if k[1] < count}
+            self.endRemoveColumns()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            header = self._headers[section]
+            return str(section + 1) if header is None else header
+        return str(section + 1)
+
+    def setHeaderData(self, section, orientation, value, role=Qt.EditRole):
+        if orientation != Qt.Horizontal or role not in (Qt.DisplayRole, Qt.EditRole):
+            return False
+        if not 0 <= section < len(self._headers):
+            return False
+        self._headers[section] = value
+        self._columns[section].header = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    # ---- 행 일괄 적재 ----
+    def set_rows(self, records):
+        """모든 행을 records로 교체 (QStandardItem을 만들지 않는다)"""
+        self.beginResetModel()
+        self._reset_storage()
+        self._records = list(records)
+        self._order = list(range(len(self._records)))
+        self.endResetModel()
+
+    def append_rows(self, records):
+        records = list(records)
+        if not records:
+            return
+        first = len(self._order)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(records) - 1)
+        self._order.extend(self._add_slots(records))
+        self._slot_rows = None
+        self.endInsertRows()
+
+    def _add_slots(self, records):
+        start = len(self._records)
+        self._records.extend(records)
+        pad = [_UNSET] * len(records)
+        for values in self._text.values():
+            values.extend(pad)
+        return range(start, len(self._records))
+
+    def record(self, row):
+        """view row의 원본 행 dict (insertRows로 만든 빈 행은 None)"""
+        return self._records[self._order[row]]
+
+    def records(self):
+        """현재 표시 순서대로 원본 행 목록 (빈 행 제외)"""
+        return [self._records[slot] for slot in self._order if self._records[slot] is not None]
+
+    def replace_row(self, row, record):
+        """row의 원본을 record로 바꾸고 그 행의 계산값/덮어쓰기/편집 표시를 비운다 (setItem으로 행을 다시 채우던 것과 같음)"""
+        slot = self._order[row]
+        self._records[slot] = record
+        self._forget_slot(slot)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, max(0, self.columnCount() - 1)))
+
+    def refresh_roles(self, col, roles):
+        """col 컬럼의 roles 계산 캐시를 비우고 다시 그리게 한다 (뷰는 보이는 행만 data()를 다시 부른다)"""
+        if not 0 <= col < self.columnCount() or not self._order:
+            return
+        for role in roles:
+            self._cache.pop((col, role), None)
+        self.dataChanged.emit(self.index(0, col), self.index(len(self._order) - 1, col), list(roles))
+
+    def _forget_slot(self, slot):
+        for values in self._text.values():
+            values[slot] = _UNSET
+        for cache in self._cache.values():
+            cache.pop(slot, None)
+        for col in range(self.columnCount()):
+            self._overrides.pop((slot, col), None)
+            self._edited.discard((slot, col))
+
+    # ---- QStandardItemModel 호환: 행 조작 ----
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()):
+        if count <= 0 or parent.isValid() or not 0 <= row <= len(self._order):
+            return False
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + count - 1)
+        self._order[row:row] = self._add_slots([None] * count)  # 원본 없는 행: setItem/replace_row로 채운다
+        self._slot_rows = None
+        self.endInsertRows()
+        return True
+
+    def insertRow(self, row, items=None):
+        if not self.insertRows(row, 1):
+            return False
+        for col, item in enumerate(items or []):
+            self.setItem(row, col, item)
+        return True
+
+    def appendRow(self, items):
+        self.insertRow(self.rowCount(), items)
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        if count <= 0 or parent.isValid() or row < 0 or row + count > len(self._order):
+            return False
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row + count - 1)
+        removed = self._order[row:row + count]
+        del self._order[row:row + count]
+        for slot in removed:
+            self._forget_slot(slot)
+        self._slot_rows = None
+        self.endRemoveRows()
+        return True
+
+    def removeRow(self, row, parent=QtCore.QModelIndex()):
+        return self.removeRows(row, 1, parent)
+
+    def setRowCount(self, count):
+        current = len(self._order)
+        if count <= 0:
+            if current or self._records:
+                self.beginResetModel()
+                self._reset_storage()
+                self.endResetModel()
+        elif count < current:
+            self.removeRows(count, current - count)
+        elif count > current:
+            self.insertRows(current, count - current)
+
+    def clear(self):
+        """행과 컬럼/헤더를 모두 지운다 (QStandardItemModel.clear와 같음)"""
+        self.beginResetModel()
+        self._columns, self._headers = [], []
+        self._reset_storage()
+        self.endResetModel()
+
+    # ---- QStandardItemModel 호환: 칸 ----
+    def _row_of(self, slot):
+        if self._slot_rows is None:
+            self._slot_rows = {s: r for r, s in enumerate(self._order)}
+        return self._slot_rows.get(slot, -1)
+
+    def _has_cell(self, slot, col):
+        if (slot, col) in self._overrides:
+            return True
+        if self._records[slot] is None:
+            return False
+        return bool(self._columns[col].roles or self._row_roles) or self._original(slot, col) is not None
+
+    def item(self, row, col=0):
+        if not (0 <= row < len(self._order) and 0 <= col < len(self._headers)):
+            return None
+        slot = self._order[row]
+        return ColumnarItem(self, slot, col) if self._has_cell(slot, col) else None
+
+    def itemFromIndex(self, index):
+        if not index.isValid() or index.model() is not self:
+            return None
+        return self.item(index.row(), index.column())
+
+    def setItem(self, row, col, item):
+        """QStandardItem(또는 text()/data()가 있는 객체)의 표시값과 역할 값을 그 칸에 옮겨 담는다"""
+        if row >= self.rowCount():
+            self.setRowCount(row + 1)
+        if col >= self.columnCount():
+            self.setColumnCount(col + 1)
+        slot = self._order[row]
+        values = {Qt.DisplayRole: None}
+        if item is not None:
+            values[Qt.DisplayRole] = item.text()
+            for role in _COPY_ROLES:
+                value = item.data(role)
+                if value is not None:
+                    values[role] = value
+            values[_FLAGS] = item.flags()
+        self._overrides[(slot, col)] = values
+        self._track_edit(slot, col)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+
+    def _original(self, slot, col):
+        values = self._text.get(col)
+        if values is None:
+            values = self._text[col] = [_UNSET] * len(self._records)
+        value = values[slot]
+        if value is _UNSET:
+            fn = self._columns[col].text
+            value = None
+            if fn is not None and self._records[slot] is not None:
+                try:
+                    value = fn(self._records[slot])
+                except Exception as e:
+                    logger.warning(f"ColumnarTableModel: '{self._headers[col]}' 표시값 계산 실패 (slot={slot}): {e}")
+            values[slot] = value
+        return value
+
+    def _display(self, slot, col):
+        values = self._overrides.get((slot, col))
+        if values is not None and Qt.DisplayRole in values:
+            return values[Qt.DisplayRole]
+        return self._original(slot, col)
+
+    def _role(self, slot, col, role):
+        values = self._overrides.get((slot, col))
+        if values is not None and role in values:
+            return values[role]
+        if self._records[slot] is None:
+            return None
+        fn = self._columns[col].roles.get(role)
+        key = (col, role)
+        if fn is None:
+            fn = self._row_roles.get(role)
+            key = (None, role)
+            if fn is None:
+                return None
+        cache = self._cache.get(key)
+        if cache is None:
+            cache = self._cache[key] = {}
+        if slot in cache:
+            return cache[slot]
+        try:
+            value = fn(self._records[slot])
+        except Exception as e:
+            logger.warning(f"ColumnarTableModel: '{self._headers[col]}' 역할 {role} 계산 실패 (slot={slot}): {e}")
+            value = None
+        cache[slot] = value
+        return value
+
+    def _cell_data(self, slot, col, role):
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._display(slot, col)
+        return self._role(slot, col, role)
+
+    def _cell_flags(self, slot, col):
+        values = self._overrides.get((slot, col))
+        if values is not None and _FLAGS in values:
+            return values[_FLAGS]
+        return DEFAULT_FLAGS | Qt.ItemIsEditable if self._columns[col].editable else DEFAULT_FLAGS
+
+    def _set_cell(self, slot, col, role, value):
+        """칸 값 변경 + dataChanged/itemChanged (값이 같으면 QStandardItem처럼 아무 것도 안 함)"""
+        if role == Qt.EditRole:
+            role = Qt.DisplayRole
+        if role == _FLAGS:
+            current = self._cell_flags(slot, col)
+        else:
+            current = self._cell_data(slot, col, role)
+        if current is value or (type(current) is type(value) and current == value):
+            return
+        self._overrides.setdefault((slot, col), {})[role] = value
+        if role == Qt.DisplayRole:
+            self._track_edit(slot, col)
+        row = self._row_of(slot)
+        if row < 0:
+            return
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [] if role == _FLAGS else [role])
+        self.itemChanged.emit(ColumnarItem(self, slot, col))
+
+    def _track_edit(self, slot, col):
+        values = self._overrides.get((slot, col), {})
+        if Qt.DisplayRole in values and values[Qt.DisplayRole] != self._original(slot, col):
+            self._edited.add((slot, col))
+        else:
+            self._edited.discard((slot, col))
+
+    # ---- QAbstractItemModel ----
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self._cell_data(self._order[index.row()], index.column(), role)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        self._set_cell(self._order[index.row()], index.column(), role, value)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return self._cell_flags(self._order[index.row()], index.column())
+
+    # ---- 편집 추적 ----
+    def is_edited(self, row, col):
+        return (self._order[row], col) in self._edited
+
+    def edited_cells(self):
+        """원본 행과 표시값이 달라진 칸 [(row, col)] (현재 표시 순서)"""
+        return sorted((self._row_of(slot), col) for slot, col in self._edited if self._row_of(slot) >= 0)
+
+    def original_text(self, row, col):
+        value = self._original(self._order[row], col)
+        return "" if value is None else str(value)
+
+    def clear_edits(self, rows=None):
+        """편집 표시만 지운다 (표시값은 그대로). rows를 주면 그 행들만"""
+        if rows is None:
+            self._edited.clear()
+            return
+        slots = {self._order[r] for r in rows if 0 <= r < len(self._order)}
+        self._edited = {k for k in self._edited if k[0] not in slots}
+
+    # ---- 정렬 ----
+    def sortRole(self):
+        return self._sort_role
+
+    def setSortRole(self, role):
+        self._sort_role = role
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """
+        _order만 다시 배열한다 (안정 정렬, 빈 칸은 방향과 무관하게 맨 뒤 - QStandardItemModel과 같음).
+        선택/현재 칸 같은 persistent index는 새 위치로 옮긴다.
+        """
+        if not 0 <= column < self.columnCount() or len(self._order) < 2:
+            return
+        self.layoutAboutToBeChanged.emit()
+        role = self._sort_role
+        keyed, empty = [], []
+        for slot in self._order:
+            value = self._cell_data(slot, column, role)
+            if value is None:
+                empty.append(slot)
+            else:
+                keyed.append((value, slot))
+        reverse = order == Qt.DescendingOrder
+        try:
+            keyed.sort(key=lambda kv: kv[0], reverse=reverse)
+        except TypeError:  # 역할 값 타입이 섞여 있으면 문자열로 비교
+            keyed.sort(key=lambda kv: str(kv[0]), reverse=reverse)
+        old_order = self._order
+        self._order = [slot for _, slot in keyed] + empty
+        self._slot_rows = None
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(self._row_of(old_order[i.row()]), i.column()) for i in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
@@ -1,9 +1,13 @@
 # completed_deals_tab.py
 import requests
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import pyqtSignal, QObject
 from PyQt5.QtWidgets import QMessageBox, QTableView, QHeaderView
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from columnar_table_model import ColumnarTableModel, Column, field, pair, address_text, property_numbers
+from websocket_manager import apply_address_change, subscribe_changes
+from address_data_store import get_address_store, BATCH_SOURCES
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
 
 class CompletedDealsTab(QObject):
     data_loaded_for_address = pyqtSignal(str)
@@ -16,7 +20,8 @@ class CompletedDealsTab(QObject):
 
         self.completed_deals_model = None
         self.completed_deals_view = None
-        self.completed_deals_dict = {} # Cache for completed deals data by address
+        self.completed_deals_dict = get_address_store().view("completed_deals") # 탭 공용 주소 캐시(address_data_store)의 계약완료 뷰
+        self.completed_deals_sync_token = None # 마지막 전체/델타 응답의 since 토큰
         self.completed_deals_timer = None
         self.is_shutting_down = False  # 종료 상태 플래그 추가
 
@@ -27,10 +32,7 @@ class CompletedDealsTab(QObject):
         container = QtWidgets.QWidget()
         vlay = QtWidgets.QVBoxLayout(container)
 
-        self.completed_deals_model = QtGui.QStandardItemModel()
-        headers = self._get_headers()
-        self.completed_deals_model.setColumnCount(len(headers))
-        self.completed_deals_model.setHorizontalHeaderLabels(headers)
+        self.completed_deals_model = ColumnarTableModel(self._build_columns())
 
         self.completed_deals_view = QTableView()
         self.completed_deals_view.setModel(self.completed_deals_model)
@@ -87,11 +89,27 @@ class CompletedDealsTab(QObject):
             # # 타이머 시작
             # self.completed_deals_timer.start()
             # print("[INFO] CompletedDealsTab: 타이머 시작 완료 (30초 간격)")
+
+            # 타이머 대신 서버 변경 알림(/ws)으로 바뀐 주소/행만 갱신
+            subscribe_changes(self.parent_app, "completed_deals", self._on_completed_deals_changed)
         except Exception as e:
             print(f"[ERROR] CompletedDealsTab: 타이머 초기화 중 오류 발생: {e}")
             import traceback
             print(traceback.format_exc())
 
+    def _on_completed_deals_changed(self, change):
+        """
+        (Main Thread) completed_deals 변경 알림 처리.
+        전체 캐시를 받은 적이 있으면(since 토큰) 변경분만 다시 받아 병합하고,
+        아니면 바뀐 주소의 캐시를 버리고 보고 있는 주소일 때만 다시 조회한다.
+        """
+        if self.is_shutting_down:
+            return
+        if self.completed_deals_sync_token:
+            self.auto_reload_completed_deals_data()
+            return
+        apply_address_change(self.parent_app, self.completed_deals_dict, change, self.filter_and_populate)
+
     def auto_reload_completed_deals_data(self):
         """
         Triggered by the timer to reload completed deals data.
@@ -120,7 +138,7 @@ class CompletedDealsTab(QObject):
             return
             
         try:
-            future = self.parent_app.executor.submit(self._bg_load_completed_deals_data)
+            future = self.parent_app.executor.submit(self._bg_load_completed_deals_data, self.completed_deals_sync_token)
             future.add_done_callback(self._on_completed_deals_data_fetched)
         except RuntimeError as e:
             print(f"[WARN] CompletedDealsTab: RuntimeError during executor submit: {e}")
@@ -129,17 +147,28 @@ class CompletedDealsTab(QObject):
             import traceback
             print(traceback.format_exc())
 
-    def _bg_load_completed_deals_data(self):
+    def _bg_load_completed_deals_data(self, since=None):
         """
         (Background Thread) Fetches completed deals data from the server.
+        since가 있으면 서버가 그 이후 변경분만(delta) 돌려줄 수 있다.
         """
         url = f"http://{self.server_host}:{self.server_port}/completed/get_completed_deals"
+        # 컬럼을 줄이지 않는다: 이 행은 공용 store에 전체 로드로 고정되어 전체탭(_unify_completed_deal) 등도 그대로 읽는다
+        params = {}
+        if since:
+            params["since"] = since
         try:
-            resp = requests.get(url, timeout=10) # Increased timeout
+            resp = requests.get(url, params=params, timeout=10) # Increased timeout
             resp.raise_for_status()
             j = resp.json()
             if j.get("status") == "ok":
-                return {"status": "ok", "data": j.get("data", [])}
+                return {
+                    "status": "ok",
+                    "data": j.get("data", []),
+                    "delta": bool(j.get("delta")),
+                    "deleted": j.get("deleted", []),
+                    "token": j.get("token"),
+                }
             else:
                 print(f"[ERROR] CompletedDealsTab _bg_load: Server error: {j}")
                 return {"status": "error", "data": [], "message": j.get("message", "Unknown server error")}
@@ -181,7 +210,8 @@ class CompletedDealsTab(QObject):
             return
 
         rows = result.get("data", [])
-        print(f"[INFO] CompletedDealsTab: Auto-refresh loaded {len(rows)} items.")
+        is_delta = result.get("delta", False)
+        print(f"[INFO] CompletedDealsTab: Auto-refresh loaded {len(rows)} items (delta={is_delta}, deleted={len(result.get('deleted', []))}).")
 
         # 종료 중인지 다시 확인
         if self.is_shutting_down:
@@ -194,13 +224,14 @@ class CompletedDealsTab(QObject):
             return
 
         # Update cache
-        self.completed_deals_dict.clear()
-        loaded_addresses = set()
-        for r in rows:
-            addr_ = (r.get("dong", "") + " " + r.get("jibun", "")).strip()
-            if addr_:
-                self.completed_deals_dict.setdefault(addr_, []).append(r)
-                loaded_addresses.add(addr_)
+        if is_delta:
+            loaded_addresses = self._merge_completed_deals_delta(rows, result.get("deleted", []))
+            self.completed_deals_sync_token = result.get("token")
+            if not loaded_addresses:
+                return  # 변경 없음 - 표를 다시 그릴 필요 없음
+        else:
+            loaded_addresses = get_address_store().replace_source("completed_deals", rows)
+            self.completed_deals_sync_token = result.get("token")
 
         # 종료 중이 아닐 때만 시그널 발생
         if not self.is_shutting_down:
@@ -227,6 +258,18 @@ class CompletedDealsTab(QObject):
             print(f"[ERROR] CompletedDealsTab: filter_and_populate 중 오류 발생: {e}")
             return
 
+    def _merge_completed_deals_delta(self, rows, deleted_ids):
+        """
+        델타 응답을 공용 store의 계약완료 소스에 id 기준으로 반영하고 영향 받은 주소 집합을 반환.
+        수정된 행은 주소가 바뀌었을 수 있으므로 store가 기존 주소 항목에서 빼고 새 주소에 넣는다.
+        """
+        store = get_address_store()
+        affected = store.remove("completed_deals", deleted_ids)
+        affected |= store.put("completed_deals", rows)
+        # 전체 조회와 같은 순서 (ad_end_date DESC, id DESC)
+        store.sort("completed_deals", affected, key=lambda r: (r.get("ad_end_date") or "", r.get("id") or 0), reverse=True)
+        return affected
+
     def filter_and_populate(self):
         """ [변경됨] API 쿼리 기반으로 선택된 주소의 계약완료 데이터를 실시간 로드합니다. """
         # 종료 상태 확인
@@ -259,6 +302,7 @@ class CompletedDealsTab(QObject):
             target_addresses = [self.parent_app.last_selected_address]
         
         if not target_addresses:
+            get_fetch_scheduler(self.parent_app).cancel("completed_deals")
             # No address selected, show empty table
             print("[INFO] CompletedDealsTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
             if not self.is_shutting_down:
@@ -270,43 +314,24 @@ class CompletedDealsTab(QObject):
         
         # 백그라운드에서 API 호출
         if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-            future = self.parent_app.executor.submit(
-                self._bg_load_completed_data_for_addresses,
-                target_addresses
-            )
-            future.add_done_callback(self._on_filter_data_loaded)
+            get_fetch_scheduler(self.parent_app).request(
+                "completed_deals", target_addresses, self._bg_load_completed_data_for_addresses, self._on_filter_data_loaded,
+                sources=BATCH_SOURCES, visible=widget_visible(self.completed_deals_view))
         else:
             print("[ERROR] CompletedDealsTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_completed_data_for_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 계약완료 데이터를 실시간 로드합니다. """
+        """ (Background Thread) 지정된 주소들의 계약완료 데이터를 공용 store에서 읽고, 없는 주소만 배치 API로 받습니다. """
         if not addresses_to_fetch:
             print("[WARN] CompletedDealsTab _bg_load_completed_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/completed/get_completed_deals"
-        payload = {"addresses": addresses_to_fetch}
-        
-        try:
-            print(f"[DEBUG] CompletedDealsTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}")
-            resp = requests.post(url, json=payload, timeout=20)
-            resp.raise_for_status()
-            j = resp.json()
-            
-            if j.get("status") == "ok":
-                data = j.get("data", [])
-                print(f"[INFO] CompletedDealsTab: API 응답 성공 - {len(data)}개 항목")
-                return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] CompletedDealsTab API 응답 오류: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-                
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] CompletedDealsTab API 요청 실패: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] CompletedDealsTab 예상치 못한 오류: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "completed_deals", addresses_to_fetch)
+        if result["status"] == "ok":
+            print(f"[INFO] CompletedDealsTab: 데이터 준비 완료 - {len(result['data'])}개 항목")
+        else:
+            print(f"[ERROR] CompletedDealsTab 데이터 로드 실패: {result.get('message')}")
+        return result
 
     def _on_filter_data_loaded(self, future):
         """ (Main Thread) API 쿼리 결과를 처리하고 테이블을 업데이트합니다. """
@@ -335,15 +360,7 @@ class CompletedDealsTab(QObject):
         if status == "ok":
             print(f"[INFO] CompletedDealsTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
             if not self.is_shutting_down:
-                # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-                for row in data:
-                    addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                    if addr_str:
-                        # 기존 데이터를 새 데이터로 교체
-                        self.completed_deals_dict[addr_str] = self.completed_deals_dict.get(addr_str, [])
-                        if row not in self.completed_deals_dict[addr_str]:  # 중복 방지
-                            self.completed_deals_dict[addr_str].append(row)
-                
+                # 행은 공용 store에 이미 있으므로 AllTab도 get_data_for_address로 같은 데이터를 본다
                 self.populate_completed_deals_table(data)
                 # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
                 for addr in fetched_addresses:
@@ -376,88 +393,12 @@ class CompletedDealsTab(QObject):
             print("[INFO] CompletedDealsTab: Model not available, skipping populate_completed_deals_table")
             return
             
-        m = self.completed_deals_model
-        
         try:
-            m.setRowCount(0)
-            if not rows: return
-            
-            headers = self._get_headers()
-            m.setColumnCount(len(headers))
-            m.setHorizontalHeaderLabels(headers)
-            m.setRowCount(len(rows))
+            self.completed_deals_model.set_rows(rows or [])
         except RuntimeError as e:
             print(f"[WARN] CompletedDealsTab: Model access error in populate_completed_deals_table: {e}")
-            return
-        except Exception as e:
-            print(f"[ERROR] CompletedDealsTab: 테이블 초기화 중 오류 발생: {e}")
-            return
-
-        try:
-            # 행 데이터 채우기 전에 종료 상태 재확인
-            if self.is_shutting_down:
-                print("[INFO] CompletedDealsTab: 종료 중이므로 행 데이터 채우기를 건너뜁니다.")
-                return
-                
-            for i, r in enumerate(rows):
-                # 주기적으로 종료 상태 확인 (30행마다)
-                if i % 30 == 0 and self.is_shutting_down:
-                    print(f"[INFO] CompletedDealsTab: 종료 중이므로 {i}행까지만 처리하고 중단합니다.")
-                    break
-                
-                # 0) 주소 + UserData
-                addr_ = (r.get("dong", "") + " " + r.get("jibun", "")).strip()
-                item = QtGui.QStandardItem(addr_)
-                item.setData("계약완료", QtCore.Qt.UserRole + 2) # Source identifier
-                item.setData(r.get("id", 0), QtCore.Qt.UserRole + 3) # Primary Key
-                m.setItem(i, 0, item)
-
-                # Populate other columns based on headers
-                m.setItem(i, 1, QtGui.QStandardItem(r.get("ho", ""))) # 호
-                cf = r.get("curr_floor", 0)
-                tf = r.get("total_floor", 0)
-                m.setItem(i, 2, QtGui.QStandardItem(f"{cf}/{tf}")) # 층
-                dp = r.get("deposit", 0)
-                mn = r.get("monthly", 0)
-                m.setItem(i, 3, QtGui.QStandardItem(f"{dp}/{mn}")) # 보증금/월세
-                m.setItem(i, 4, QtGui.QStandardItem(str(r.get("manage_fee", "")))) # 관리비
-                m.setItem(i, 5, QtGui.QStandardItem(str(r.get("premium", "")))) # 권리금
-                m.setItem(i, 6, QtGui.QStandardItem(r.get("current_use", ""))) # 현업종
-                m.setItem(i, 7, QtGui.QStandardItem(str(r.get("area", "")))) # 평수
-                m.setItem(i, 8, QtGui.QStandardItem(r.get("owner_phone", ""))) # 연락처
-                nav = r.get("naver_property_no", "")
-                srv = r.get("serve_property_no", "")
-                mm_ = f"{nav}/{srv}" if (nav or srv) else ""
-                m.setItem(i, 9, QtGui.QStandardItem(mm_)) # 매물번호
-                m.setItem(i, 10, QtGui.QStandardItem(r.get("memo", ""))) # 메모
-                m.setItem(i, 11, QtGui.QStandardItem(r.get("manager", ""))) # 담당자
-                m.setItem(i, 12, QtGui.QStandardItem(str(r.get("parking", "")))) # 주차대수
-                m.setItem(i, 13, QtGui.QStandardItem(r.get("building_usage", ""))) # 용도
-                m.setItem(i, 14, QtGui.QStandardItem(str(r.get("approval_date", "")))) # 사용승인일
-                ro_ = r.get("rooms", "")
-                bt_ = r.get("baths", "")
-                m.setItem(i, 15, QtGui.QStandardItem(f"{ro_}/{bt_}")) # 방/화장실
-                m.setItem(i, 16, QtGui.QStandardItem(str(r.get("ad_end_date", "")))) # 광고종료일
-                m.setItem(i, 17, QtGui.QStandardItem(r.get("photo_path", ""))) # 사진경로
-                m.setItem(i, 18, QtGui.QStandardItem(r.get("owner_name", ""))) # 소유자명
-                m.setItem(i, 19, QtGui.QStandardItem(r.get("owner_relation", ""))) # 관계
-                m.setItem(i, 20, QtGui.QStandardItem(str(r.get("status_cd", "")))) # 상태코드
-                
-                # 주기적으로 이벤트 처리 - 더 자주 UI 업데이트와 이벤트 처리 (10행마다)
-                if i % 10 == 0:
-                    QtWidgets.QApplication.processEvents()
-                    
-                    # UI 처리 중 앱 종료 상태 확인
-                    if self.is_shutting_down:
-                        print(f"[INFO] CompletedDealsTab: 이벤트 처리 중 종료 상태 감지, {i}행까지만 처리하고 중단합니다.")
-                        break
-                        
-        except RuntimeError as e:
-            print(f"[INFO] CompletedDealsTab: 테이블 행 채우는 중 런타임 오류 (종료 중일 수 있음): {e}")
         except Exception as e:
-            print(f"[ERROR] CompletedDealsTab: 테이블 행 채우는 중 예상치 못한 오류: {e}")
-            import traceback
-            print(traceback.format_exc())
+            print(f"[ERROR] CompletedDealsTab: 테이블 채우기 중 오류 발생: {e}")
 
     def filter_completed_deals_by_address(self, address_str: str):
         """ Filters the table to show only rows matching the address_str. """
@@ -480,17 +421,31 @@ class CompletedDealsTab(QObject):
             self.populate_completed_deals_table(filtered)
 
     def get_data_for_address(self, addr_str: str) -> list:
-        """ Returns the list of completed deals for the given address from the local cache. """
+        """ Returns the list of completed deals for the given address from the shared address store. """
         # 종료 상태 또는 주소가 없으면 빈 리스트 반환
         if self.is_shutting_down or not addr_str:
             return []
             
-        # 딕셔너리가 없으면 빈 리스트 반환
-        if not hasattr(self, 'completed_deals_dict') or not self.completed_deals_dict:
-            return []
-            
         return self.completed_deals_dict.get(addr_str, [])
 
+    def _build_columns(self):
+        """ _get_headers() 순서의 컬럼 정의 """
+        texts = {
+            "호": field("ho"), "층": pair("curr_floor", "total_floor"),
+            "보증금/월세": pair("deposit", "monthly"), "관리비": field("manage_fee"),
+            "권리금": field("premium"), "현업종": field("current_use"), "평수": field("area"),
+            "연락처": field("owner_phone"), "매물번호": property_numbers, "메모": field("memo"),
+            "담당자": field("manager"), "주차대수": field("parking"), "용도": field("building_usage"),
+            "사용승인일": field("approval_date"), "방/화장실": pair("rooms", "baths", default=""),
+            "광고종료일": field("ad_end_date"), "사진경로": field("photo_path"),
+            "소유자명": field("owner_name"), "관계": field("owner_relation"), "상태코드": field("status_cd"),
+        }
+        address = Column("주소", address_text, roles={
+            QtCore.Qt.UserRole + 2: lambda r: "계약완료", # Source identifier
+            QtCore.Qt.UserRole + 3: lambda r: r.get("id", 0), # Primary Key
+        })
+        return [address if h == "주소" else Column(h, texts[h]) for h in self._get_headers()]
+
     def _get_headers(self):
         """ Returns the list of headers for the completed deals tab. """
         return [
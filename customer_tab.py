@@ -4,8 +4,10 @@ from dialogs import CustomerRowEditDialog
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtGui import QStandardItem
 import json
+from collections.abc import Mapping
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QTableView, QHeaderView
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from websocket_manager import subscribe_changes
 
 
 
@@ -25,6 +27,11 @@ class CustomerTab:
         self.customer_view = None
         self.customer_model = None
         self.customer_tabs = None
+        # 마지막 응답의 since 토큰과 그 토큰으로 채운 담당자 (다시 부르면 변경분만 받아 병합)
+        self.customer_sync_token = None
+        self.customer_sync_manager = None
+        # 서버 변경 알림(/ws) - 보고 있는 담당자의 고객이 바뀌면 변경분만 다시 받음
+        subscribe_changes(parent_app, "customer", self._on_customer_changed)
         
 
         
@@ -91,8 +98,8 @@ class CustomerTab:
     def on_customer_view_current_changed(self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex):
         """ Handles selection changes. Filters local recommend_dict based on '업종' and '담당자' to find matching addresses. """
         # --- ADDED: Log recommend_dict state at the beginning --- 
-        recommend_dict_state = "Not found or not dict"
-        if hasattr(self.parent_app, 'recommend_dict') and isinstance(self.parent_app.recommend_dict, dict):
+        recommend_dict_state = "Not found or not a mapping"
+        if hasattr(self.parent_app, 'recommend_dict') and isinstance(self.parent_app.recommend_dict, Mapping):
              recommend_dict_state = f"Exists, size: {len(self.parent_app.recommend_dict)}, Sample keys: {list(self.parent_app.recommend_dict.keys())[:5]}"
         # --- END ADDED ---
 
@@ -134,8 +141,8 @@ class CustomerTab:
 
         # --- 2. Filter local recommend_dict to find matching addresses --- 
         matched_addresses = []
-        if hasattr(self.parent_app, 'recommend_dict') and isinstance(self.parent_app.recommend_dict, dict):
-            # recommend_dict is { "address_string": [row_dict, row_dict, ...], ... }
+        if hasattr(self.parent_app, 'recommend_dict') and isinstance(self.parent_app.recommend_dict, Mapping):
+            # recommend_dict is { "address_string": [row_dict, row_dict, ...], ... } (address_data_store 뷰)
             for addr_str, row_list in self.parent_app.recommend_dict.items():
                 # Check if any row in the list for this address matches the criteria
                 for r_ in row_list:
@@ -146,7 +153,7 @@ class CustomerTab:
                         matched_addresses.append(addr_str)
                         break # Found a match for this address, no need to check other rows for the same address
         else:
-            print("[WARN] CustomerTab: parent_app.recommend_dict not found or not a dict.")
+            print("[WARN] CustomerTab: parent_app.recommend_dict not found or not a mapping.")
 
         if not matched_addresses:
             print("[INFO] No matching addresses found in recommend_dict. Clearing related tabs.")
@@ -738,11 +745,23 @@ class CustomerTab:
         tooltip_text = "\n".join(tooltip_lines)
         return short_text, tooltip_text
     
+    def _on_customer_changed(self, change):
+        """customer 변경 알림 처리 (아직 로드하지 않았거나 다른 담당자의 변경이면 무시)"""
+        manager_name = self.customer_sync_manager
+        if manager_name is None or self.customer_model is None:
+            return
+        managers = change.get("managers")
+        if not change.get("resync") and self.current_role != "admin" and managers and manager_name not in managers:
+            return
+        self.load_customer_data_for_manager(manager_name)
+
     def load_customer_data_for_manager(self, manager_name: str):
         params = {
         "manager": manager_name,
         "role": self.current_role
         }
+        if self.customer_sync_token and self.customer_sync_manager == manager_name:
+            params["since"] = self.customer_sync_token
         url = f"http://{self.server_host}:{self.server_port}/customer/get_customer_data"
         resp = requests.get(url,params=params)
         if resp.status_code != 200:
@@ -756,7 +775,15 @@ class CustomerTab:
 
         rows = json_data["data"]
         model = self.customer_model
+
+        if json_data.get("delta"):
+            self._merge_customer_delta(rows, json_data.get("deleted", []), manager_name)
+            self.customer_sync_token = json_data.get("token")
+            return
+
         model.clear()
+        self.customer_sync_token = json_data.get("token")
+        self.customer_sync_manager = manager_name
 
         self.customer_headers = [
             "지역","보증금","월세","평수","층",
@@ -771,44 +798,81 @@ class CustomerTab:
         model.setRowCount(len(rows))
 
         for i, row_data in enumerate(rows):
-            row_id = row_data.get("id", None)
-            for j, col_name in enumerate(self.customer_headers):
-                if col_name == "담당자":
-                    cell_val = row_data.get("manager", "")
-                else:
-                    cell_val = row_data.get(col_name, "")
+            self._set_customer_row(i, row_data, manager_name)
 
-                if col_name == "지역":
-                    try:
-                        region_obj = json.loads(cell_val) if cell_val else {}
-                        dongs_list = region_obj.get("dong_list", [])
-                        rects_list = region_obj.get("rectangles", [])
-                        
-                        short_txt, tip_txt = self.build_region_short_text(dongs_list, rects_list)
+        print("[INFO] load_customer_data_for_manager =>", len(rows), "rows loaded.")
+
+    def _merge_customer_delta(self, rows, deleted_ids, manager_name):
+        """델타 응답을 id 기준으로 현재 모델에 반영 (삭제 → 수정 → 추가)"""
+        model = self.customer_model
+        deleted = set(deleted_ids)
+        for r in range(model.rowCount() - 1, -1, -1):
+            item0 = model.item(r, 0)
+            info = item0.data(QtCore.Qt.UserRole) if item0 else None
+            if isinstance(info, dict) and info.get("id") in deleted:
+                model.removeRow(r)
+
+        row_of_id = {}
+        for r in range(model.rowCount()):
+            item0 = model.item(r, 0)
+            info = item0.data(QtCore.Qt.UserRole) if item0 else None
+            if isinstance(info, dict) and info.get("id") is not None:
+                row_of_id[info["id"]] = r
+
+        new_rows = []
+        for row_data in rows:
+            row_idx = row_of_id.get(row_data.get("id"))
+            if row_idx is None:
+                new_rows.append(row_data)
+            else:
+                self._set_customer_row(row_idx, row_data, manager_name)
+
+        if new_rows:
+            start = model.rowCount()
+            model.setRowCount(start + len(new_rows))
+            for i, row_data in enumerate(new_rows):
+                self._set_customer_row(start + i, row_data, manager_name)
+
+        print(f"[INFO] load_customer_data_for_manager (delta) => changed {len(rows)}, deleted {len(deleted)}")
 
-                        item = QStandardItem(short_txt)
-                        item.setToolTip(tip_txt)
-                        item.setData(cell_val, QtCore.Qt.UserRole+1)
+    def _set_customer_row(self, i, row_data, manager_name):
+        row_id = row_data.get("id", None)
+        model = self.customer_model
+        for j, col_name in enumerate(self.customer_headers):
+            if col_name == "담당자":
+                cell_val = row_data.get("manager", "")
+            else:
+                cell_val = row_data.get(col_name, "")
+
+            if col_name == "지역":
+                try:
+                    region_obj = json.loads(cell_val) if cell_val else {}
+                    dongs_list = region_obj.get("dong_list", [])
+                    rects_list = region_obj.get("rectangles", [])
+                    
+                    short_txt, tip_txt = self.build_region_short_text(dongs_list, rects_list)
 
-                    except (json.JSONDecodeError, TypeError):
-                        item = QStandardItem(str(cell_val))
-                elif col_name == "메모":
-                    short_txt, tip_txt = self.build_memo_display_text(cell_val)
                     item = QStandardItem(short_txt)
                     item.setToolTip(tip_txt)
                     item.setData(cell_val, QtCore.Qt.UserRole+1)
-                else:
-                    item = QStandardItem(str(cell_val))
 
-                item.setData({
-                    "id": row_id,
-                    "manager": manager_name,
-                    "column": col_name
-                }, QtCore.Qt.UserRole)
+                except (json.JSONDecodeError, TypeError):
+                    item = QStandardItem(str(cell_val))
+            elif col_name == "메모":
+                short_txt, tip_txt = self.build_memo_display_text(cell_val)
+                item = QStandardItem(short_txt)
+                item.setToolTip(tip_txt)
+                item.setData(cell_val, QtCore.Qt.UserRole+1)
+            else:
+                item = QStandardItem(str(cell_val))
 
-                model.setItem(i, j, item)
+            item.setData({
+                "id": row_id,
+                "manager": manager_name,
+                "column": col_name
+            }, QtCore.Qt.UserRole)
 
-        print("[INFO] load_customer_data_for_manager =>", len(rows), "rows loaded.")
+            model.setItem(i, j, item)
         
     def build_memo_display_text(self, memo_json_str: str):
         """
@@ -0,0 +1,102 @@
+"""
+async 엔드포인트용 공유 DB 실행기
+
+mysql.connector는 블로킹 드라이버라 async 핸들러에서 직접 호출하면 이벤트 루프가 멈춘다.
+요청마다 ThreadPoolExecutor를 새로 만들지 않고, 프로세스 전역의 고정 크기 스레드 풀 하나에서
+DB 작업을 실행한다.
+
+- 워커 수는 커넥션 풀 크기 이하로 잡아 동시 DB 작업(=대여 커넥션) 수를 전역으로 제한한다.
+- 초과 요청은 풀 큐에서 대기하며, 대기/실행 시간 통계를 stats()로 노출한다.
+- async 라우터는 요청 본문만 await로 읽고, 나머지 DB(또는 Supabase) 작업은 `_<핸들러명>` 동기 함수로
+  분리해 `await get_db_executor().run(_handler, body)`로 넘긴다. (동기 def 라우터는 FastAPI 스레드풀에서 실행됨)
+- _handler에 @single_flight가 붙어 있으면 같은 키로 실행 중인 작업의 결과를 함께 받는다 (single_flight.py).
+"""
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class DBExecutor:
+    """고정 크기 스레드 풀 + 통계"""
+
+    def __init__(self, max_workers=10, name="db"):
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{name}-worker")
+        self._lock = threading.Lock()
+
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._run_time_total = 0.0
+        self._run_time_max = 0.0
+
+    def _wrap(self, fn, submitted_at):
+        started = time.monotonic()
+        wait = started - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._wait_time_total += wait
+            if wait > self._wait_time_max:
+                self._wait_time_max = wait
+        ok = False
+        try:
+            result = fn()
+            ok = True
+            return result
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                if not ok:
+                    self._failed += 1
+                self._run_time_total += elapsed
+                if elapsed > self._run_time_max:
+                    self._run_time_max = elapsed
+
+    def submit(self, fn, *args, **kwargs):
+        """concurrent.futures.Future 반환 (동기 코드에서 사용)"""
+        call = functools.partial(fn, *args, **kwargs)
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+        return self._executor.submit(self._wrap, call, time.monotonic())
+
+    async def run(self, fn, *args, **kwargs):
+        """공유 스레드 풀에서 fn(*args, **kwargs)를 실행하고 결과를 await"""
+        flight = getattr(fn, "single_flight", None)
+        if flight is not None:
+            return await flight.run(self, fn.flight_key(*args, **kwargs), fn.__wrapped__, *args, **kwargs)
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def stats(self):
+        with self._lock:
+            done = self._completed or 1
+            started = self._completed + self._active
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "wait_ms_avg": round(self._wait_time_total / (started or 1) * 1000, 3),
+                "wait_ms_max": round(self._wait_time_max * 1000, 3),
+                "run_ms_avg": round(self._run_time_total / done * 1000, 3),
+                "run_ms_max": round(self._run_time_max * 1000, 3),
+            }
@@ -0,0 +1,219 @@
+"""
+프로세스 전역 MySQL 커넥션 풀
+
+- 요청마다 TCP + 인증 핸드셰이크를 반복하지 않도록 커넥션을 재사용한다.
+- 풀 크기, 최대 수명(max_lifetime), 유휴 커넥션 헬스체크, 획득 타임아웃을 지원한다.
+- acquire()가 돌려주는 PooledConnection은 기존 mysql.connector 커넥션처럼 사용하면 되고,
+  close() 또는 with 블록 종료 시 실제로 끊지 않고 풀에 반납된다.
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+import mysql.connector as mysql
+from mysql.connector.errors import PoolError
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """풀에서 대여한 커넥션 래퍼. close() 시 풀에 반납한다."""
+
+    def __init__(self, pool, raw_conn, created_at):
+        self._pool = pool
+        self._raw = raw_conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        raw = self.__dict__.get("_raw")
+        if raw is None:
+            raise PoolError("이미 풀에 반납된 커넥션입니다.")
+        return getattr(raw, name)
+
+    def is_connected(self):
+        return self._raw is not None and self._raw.is_connected()
+
+    def close(self):
+        """실제 연결을 끊지 않고 풀에 반납 (여러 번 호출해도 안전)"""
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw, self._created_at)
+
+    def __del__(self):
+        # close() 없이 버려진 래퍼도 슬롯을 돌려준다 (반납하지 않으면 풀 크기가 영구히 줄어든다)
+        raw = self.__dict__.get("_raw")
+        if raw is not None:
+            logger.warning(f"[DBPool:{self._pool.name}] close()되지 않은 커넥션을 GC 시점에 반납합니다.")
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 커밋되지 않은 작업은 반납 시 rollback 된다
+        self.close()
+        return False
+
+
+class MySQLConnectionPool:
+    """스레드 안전한 MySQL 커넥션 풀 (커넥션은 필요할 때 pool_size까지 생성)"""
+
+    def __init__(self, connect_kwargs, pool_size=10, max_lifetime=1800.0,
+                 acquire_timeout=10.0, health_check_interval=30.0, name="default"):
+        self.name = name
+        self.pool_size = max(1, int(pool_size))
+        self.max_lifetime = float(max_lifetime)
+        self.acquire_timeout = float(acquire_timeout)
+        self.health_check_interval = float(health_check_interval)
+        self._connect_kwargs = dict(connect_kwargs)
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (raw_conn, created_at, last_used_at)
+        self._total = 0       # 생성되어 살아있는 커넥션 수 (idle + in_use)
+        self._in_use = 0
+
+        # 통계
+        self._acquire_count = 0
+        self._wait_count = 0
+        self._timeout_count = 0
+        self._created_count = 0
+        self._discarded_count = 0
+        self._acquire_time_total = 0.0
+        self._acquire_time_max = 0.0
+
+    # ---------- 대여 / 반납 ----------
+    def acquire(self, timeout=None):
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+        entry = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()  # LIFO: 최근에 쓴(살아있을 확률이 높은) 커넥션 우선
+                    break
+                if self._total < self.pool_size:
+                    self._total += 1  # 새 커넥션 자리 예약 (생성은 락 밖에서)
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeout_count += 1
+                    raise PoolError(
+                        f"DB 커넥션 풀 '{self.name}' 획득 타임아웃 ({timeout:.1f}s, size={self.pool_size})"
+                    )
+                if not waited:
+                    self._wait_count += 1
+                    waited = True
+                self._cond.wait(remaining)
+            self._in_use += 1
+
+        try:
+            raw, created_at = self._checkout(entry)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+        elapsed = time.monotonic() - start
+        with self._cond:
+            self._acquire_count += 1
+            self._acquire_time_total += elapsed
+            if elapsed > self._acquire_time_max:
+                self._acquire_time_max = elapsed
+        return PooledConnection(self, raw, created_at)
+
+    def release(self, raw, created_at):
+        keep = True
+        try:
+            # 열린 트랜잭션/스냅샷을 정리해야 다음 사용자가 최신 데이터를 본다
+            raw.rollback()
+        except Exception as e:
+            logger.warning(f"[DBPool:{self.name}] 반납 중 rollback 실패, 커넥션 폐기: {e}")
+            keep = False
+        if keep and time.monotonic() - created_at > self.max_lifetime:
+            keep = False
+        if not keep:
+            self._close_quietly(raw)
+
+        with self._cond:
+            self._in_use -= 1
+            if keep:
+                self._idle.append((raw, created_at, time.monotonic()))
+            else:
+                self._total -= 1
+                self._discarded_count += 1
+            self._cond.notify()
+
+    def _checkout(self, entry):
+        """유휴 커넥션 검증(수명/헬스체크). 쓸 수 없으면 새로 연결한다."""
+        now = time.monotonic()
+        if entry is not None:
+            raw, created_at, last_used = entry
+            if now - created_at > self.max_lifetime:
+                self._discard(raw)
+            elif now - last_used > self.health_check_interval and not self._ping(raw):
+                self._discard(raw)
+            else:
+                return raw, created_at
+
+        raw = mysql.connect(**self._connect_kwargs)
+        with self._cond:
+            self._created_count += 1
+        return raw, time.monotonic()
+
+    def _ping(self, raw):
+        try:
+            raw.ping(reconnect=False, attempts=1)
+            return True
+        except Exception as e:
+            logger.info(f"[DBPool:{self.name}] 유휴 커넥션 헬스체크 실패, 재연결: {e}")
+            return False
+
+    def _discard(self, raw):
+        self._close_quietly(raw)
+        with self._cond:
+            self._discarded_count += 1
+
+    @staticmethod
+    def _close_quietly(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    # ---------- 관리 ----------
+    def close_all(self):
+        """유휴 커넥션을 모두 닫는다 (서버 종료 시). 대여 중인 커넥션은 반납 시 유휴로 돌아온다."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._total -= len(idle)
+        for raw, _, _ in idle:
+            self._close_quietly(raw)
+
+    def stats(self):
+        with self._cond:
+            avg = self._acquire_time_total / self._acquire_count if self._acquire_count else 0.0
+            return {
+                "name": self.name,
+                "pool_size": self.pool_size,
+                "total": self._total,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "acquire_count": self._acquire_count,
+                "wait_count": self._wait_count,
+                "timeout_count": self._timeout_count,
+                "created_count": self._created_count,
+                "discarded_count": self._discarded_count,
+                "acquire_ms_avg": round(avg * 1000, 3),
+                "acquire_ms_max": round(self._acquire_time_max * 1000, 3),
+                "max_lifetime": self.max_lifetime,
+                "acquire_timeout": self.acquire_timeout,
+            }
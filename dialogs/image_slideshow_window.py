@@ -1,10 +1,67 @@
 import os
+import concurrent.futures
+from collections import OrderedDict
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtCore import Qt
 
 # ClickableLabel 가져오기
 from .clickable_label import ClickableLabel
 
+# 슬라이드 이미지 디코딩용 공유 스레드 풀 (창마다 만들지 않는다)
+_DECODE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="slideshow-decode")
+
+# (경로, 폭, 높이) -> 라벨 크기로 줄인 QPixmap. 창을 닫았다 같은 매물을 다시 열어도 재사용 (UI 스레드 전용)
+_PIXMAP_CACHE = OrderedDict()
+_PIXMAP_CACHE_BYTES = 96 * 1024 * 1024
+_pixmap_cache_used = 0
+
+
+def _cache_get(key):
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is not None:
+        _PIXMAP_CACHE.move_to_end(key)
+    return pixmap
+
+
+def _cache_put(key, pixmap):
+    global _pixmap_cache_used
+    old = _PIXMAP_CACHE.pop(key, None)
+    if old is not None:
+        _pixmap_cache_used -= old.width() * old.height() * 4
+    _PIXMAP_CACHE[key] = pixmap
+    _pixmap_cache_used += pixmap.width() * pixmap.height() * 4
+    while _pixmap_cache_used > _PIXMAP_CACHE_BYTES and len(_PIXMAP_CACHE) > 1:
+        _, dropped = _PIXMAP_CACHE.popitem(last=False)
+        _pixmap_cache_used -= dropped.width() * dropped.height() * 4
+
+
+def decode_scaled(path, width, height):
+    """
+    path 이미지를 (width, height) 안에 비율 유지로 맞춘 QImage (작업 스레드에서 호출 가능).
+    큰 사진은 QImageReader.setScaledSize로 디코딩 단계에서 줄여 읽어 원본 크기 버퍼를 만들지 않는다.
+    읽지 못하면 null QImage.
+    """
+    if not os.path.isfile(path):
+        return QtGui.QImage()
+    reader = QtGui.QImageReader(path)
+    reader.setAutoTransform(True)  # EXIF 회전
+    size = reader.size()
+    if size.isValid() and (size.width() > width or size.height() > height):
+        reader.setScaledSize(size.scaled(width, height, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if image.width() != width and image.height() != height:
+        # 작은 사진은 기존처럼 라벨 크기까지 키운다
+        image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+class _DecodeSignals(QtCore.QObject):
+    """작업 스레드 → UI 스레드 전달용 (다른 스레드에서 emit하면 QueuedConnection)"""
+    decoded = QtCore.pyqtSignal(object, object)  # (경로, 폭, 높이), QImage
+
+
 class ImageSlideshowWindow(QtWidgets.QDialog):
     """
     - 스크롤 없이, 창 크기에 맞춰 이미지를 축소/확대 (KeepAspectRatio)
@@ -12,12 +69,18 @@ class ImageSlideshowWindow(QtWidgets.QDialog):
     - 이미지 클릭 => 다음
     - 방향키(←/→) => 이전/다음
     - Non-Modal(메인창 조작 가능)
+    - 이미지는 작업 스레드에서 라벨 크기로 줄여 디코딩하고, 앞뒤 PREFETCH장씩 미리 읽어 둔다.
+      창 크기 변경은 RESIZE_DEBOUNCE_MS 동안 멈췄을 때 한 번만 다시 그린다.
     """
+    PREFETCH = 2
+    RESIZE_DEBOUNCE_MS = 150
+
     def __init__(self, image_paths, parent=None):
         super().__init__(parent)
 
         self.image_paths = image_paths[:]  # 리스트 복사
         self.current_index = 0
+        self._pending = {}  # (경로, 폭, 높이) -> Future
 
         # 창 설정: Non-Modal
         self.setWindowTitle("이미지 슬라이드")
@@ -51,11 +114,26 @@ class ImageSlideshowWindow(QtWidgets.QDialog):
 
         self.setLayout(h_layout)
 
+        self._signals = _DecodeSignals(self)
+        self._signals.decoded.connect(self._on_decoded)
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self.update_image)
+
         # 첫 이미지를 표시
         self.update_image()
 
+    def _target_size(self):
+        lab_w = self.image_label.width()
+        lab_h = self.image_label.height()
+        if lab_w < 10 or lab_h < 10:
+            # 아직 레이아웃이 완성안된 경우 등 -> 임시로 가로폭 600
+            lab_w, lab_h = 600, 600
+        return lab_w, lab_h
+
     def update_image(self):
-        """self.current_index에 해당하는 이미지를 label 크기에 맞춰 scaled 표시"""
+        """self.current_index에 해당하는 이미지를 label 크기에 맞춰 표시 (캐시에 없으면 백그라운드 디코딩 후 표시)"""
         if not self.image_paths:
             self.image_label.clear()
             return
@@ -66,25 +144,68 @@ class ImageSlideshowWindow(QtWidgets.QDialog):
         elif self.current_index >= len(self.image_paths):
             self.current_index = 0
 
-        img_path = self.image_paths[self.current_index]
-        if not os.path.isfile(img_path):
-            self.image_label.clear()
-            return
+        width, height = self._target_size()
+        key = (self.image_paths[self.current_index], width, height)
+        pixmap = _cache_get(key)
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+        else:
+            placeholder = self._any_cached(key[0])
+            if placeholder is not None:
+                # 다른 크기로 이미 읽은 것이 있으면 빠르게 늘려 보여 주고 디코딩이 끝나면 바꾼다
+                self.image_label.setPixmap(placeholder.scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation))
+            else:
+                self.image_label.setText("불러오는 중...")
+        self._schedule(key, width, height)
 
-        pixmap = QtGui.QPixmap(img_path)
-        if pixmap.isNull():
-            self.image_label.clear()
-            return
+    def _any_cached(self, path):
+        for (cached_path, _, _), pixmap in reversed(_PIXMAP_CACHE.items()):
+            if cached_path == path:
+                return pixmap
+        return None
 
-        # (1) QLabel 크기에 맞춰서 비율유지 축소/확대
-        lab_w = self.image_label.width()
-        lab_h = self.image_label.height()
-        if lab_w < 10 or lab_h < 10:
-            # 아직 레이아웃이 완성안된 경우 등 -> 임시로 가로폭 600
-            lab_w, lab_h = 600, 600
+    def _schedule(self, current_key, width, height):
+        """현재 이미지 → 다음/이전 순으로 디코딩 요청, 범위를 벗어난 대기 작업은 취소"""
+        count = len(self.image_paths)
+        offsets = [0]
+        for step in range(1, self.PREFETCH + 1):
+            offsets += [step, -step]
+        wanted = []
+        for offset in offsets:
+            key = (self.image_paths[(self.current_index + offset) % count], width, height)
+            if key not in wanted:
+                wanted.append(key)
+
+        for key, future in list(self._pending.items()):
+            if key not in wanted and future.cancel():
+                del self._pending[key]
+        for key in wanted:
+            if key in self._pending or _cache_get(key) is not None:
+                continue
+            self._pending[key] = _DECODE_POOL.submit(self._decode, key)
 
-        scaled_pix = pixmap.scaled(lab_w, lab_h, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        self.image_label.setPixmap(scaled_pix)
+    def _decode(self, key):
+        """(작업 스레드)"""
+        image = decode_scaled(*key)
+        try:
+            self._signals.decoded.emit(key, image)
+        except RuntimeError:
+            pass  # 창이 이미 닫혀 삭제됨
+
+    def _on_decoded(self, key, image):
+        self._pending.pop(key, None)
+        if image.isNull():
+            if self._current_key() == key:
+                self.image_label.clear()
+            return
+        _cache_put(key, QtGui.QPixmap.fromImage(image))
+        if self._current_key() == key:
+            self.image_label.setPixmap(_cache_get(key))
+
+    def _current_key(self):
+        if not self.image_paths or not 0 <= self.current_index < len(self.image_paths):
+            return None
+        return (self.image_paths[self.current_index],) + self._target_size()
 
     def show_prev_image(self):
         self.current_index -= 1
@@ -112,11 +233,18 @@ class ImageSlideshowWindow(QtWidgets.QDialog):
 
     def resizeEvent(self, event: QtGui.QResizeEvent):
         """
-        창 크기가 바뀔 때마다 update_image()를 다시 불러
-        이미지가 새 사이즈에 맞춰 다시 scaled되도록
+        창 크기가 바뀌면 잠시 뒤(RESIZE_DEBOUNCE_MS) 새 크기로 한 번만 다시 그린다
+        (드래그로 크기를 바꾸는 동안 매번 다시 디코딩하지 않도록)
         """
         super().resizeEvent(event)
-        self.update_image()
+        self._resize_timer.start()
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        self._resize_timer.stop()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        super().closeEvent(event)
 
     def set_image_list(self, new_paths):
         """
@@ -125,4 +253,4 @@ class ImageSlideshowWindow(QtWidgets.QDialog):
         """
         self.image_paths = new_paths[:]
         self.current_index = 0
-        self.update_image() 
\ No newline at end of file
+        self.update_image()
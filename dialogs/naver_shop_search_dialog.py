@@ -19,6 +19,10 @@ from PyQt5.QtCore import pyqtSignal # 시그널 임포트
 SERVER_HOST_CONNECT = os.environ.get("SERVER_HOST_CONNECT", "localhost")
 SERVER_PORT_DEFAULT = int(os.environ.get("SERVER_PORT_DEFAULT", "8000"))
 
+# 스트리밍 검색: 한 번에 요청할 행 수 / 테이블에 한 번에 붙일 행 수
+SEARCH_PAGE_SIZE = 100
+SEARCH_APPEND_CHUNK = 25
+
 # 로거 설정 (모듈 레벨)
 logger = logging.getLogger(__name__)
 
@@ -56,6 +60,12 @@ class NaverShopSearchDialog(QDialog):
         # (A) 백그라운드 스레드 풀(또는 parent_app.executor 사용)
         self.executor = ThreadPoolExecutor(max_workers=2)
 
+        # 스트리밍 검색 상태 (검색마다 seq 증가 → 이전 검색의 늦은 응답은 무시)
+        self._search_seq = 0
+        self._search_params = None
+        self._next_cursor = None
+        self._total_count = None
+
         self.init_ui()
         self.init_signals()
 
@@ -109,6 +119,16 @@ class NaverShopSearchDialog(QDialog):
         # 위쪽 레이아웃에 추가
         top_container_layout.addLayout(h_top_table_layout)
 
+        # 검색 결과 건수 + "더 보기"(다음 페이지)
+        h_more_layout = QHBoxLayout()
+        self.lbl_result_count = QLabel("")
+        self.btn_more = QPushButton("더 보기")
+        self.btn_more.setEnabled(False)
+        h_more_layout.addWidget(self.lbl_result_count)
+        h_more_layout.addStretch()
+        h_more_layout.addWidget(self.btn_more)
+        top_container_layout.addLayout(h_more_layout)
+
         # splitter에 이 top_container 붙임
         splitter.addWidget(top_container)
 
@@ -175,6 +195,7 @@ class NaverShopSearchDialog(QDialog):
         # (1) 검색버튼 => 비동기로 검색
         self.btn_search.clicked.connect(self.on_search_clicked)
         self.edit_search.returnPressed.connect(self.on_search_clicked)
+        self.btn_more.clicked.connect(self.on_more_clicked)
 
         # (2) 추가버튼 => 상단 테이블의 선택행 → 하단테이블
         self.btn_add_to_bottom.clicked.connect(self.on_add_to_bottom_clicked)
@@ -208,9 +229,113 @@ class NaverShopSearchDialog(QDialog):
 
         # 공백 제거
         keyword = keyword_raw.replace(" ","")
-        # (비동기로)
-        future = self.executor.submit(self._bg_search, search_type, keyword, within_1month)
-        future.add_done_callback(self._on_search_finished)
+
+        # 새 검색: 테이블을 비우고 첫 페이지부터 스트리밍으로 받는다
+        self._search_seq += 1
+        self._search_params = {
+            "search_type": search_type,
+            "keyword": keyword,
+            "within_1month": within_1month,
+        }
+        self._next_cursor = None
+        self._total_count = None
+        self.top_table.setRowCount(0)
+        self._start_stream_search("")
+
+    def on_more_clicked(self):
+        """다음 페이지(next_cursor) 이어서 받기"""
+        if self._search_params is None or not self._next_cursor:
+            return
+        self._start_stream_search(self._next_cursor)
+
+    def _start_stream_search(self, cursor):
+        self.btn_more.setEnabled(False)
+        self.lbl_result_count.setText("검색 중...")
+        future = self.executor.submit(self._bg_search_stream, self._search_seq, dict(self._search_params), cursor)
+        future.add_done_callback(self._on_stream_search_finished)
+
+    def _bg_search_stream(self, seq, params, cursor):
+        """
+        /shop/search_naver_shop_simple_stream (NDJSON) 를 줄 단위로 읽으면서
+        SEARCH_APPEND_CHUNK 행마다 메인 스레드로 넘겨 테이블에 바로 붙인다.
+        """
+        url = f"http://{self.server_host}:{self.server_port}/shop/search_naver_shop_simple_stream"
+        params = dict(params, cursor=cursor, limit=SEARCH_PAGE_SIZE)
+        chunk = []
+        try:
+            with requests.get(url, params=params, stream=True, timeout=(5, 30)) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    msg = json.loads(line)
+                    kind = msg.get("type")
+                    if kind == "row":
+                        chunk.append(msg.get("data") or {})
+                        if len(chunk) >= SEARCH_APPEND_CHUNK:
+                            self._post_stream_rows(seq, chunk)
+                            chunk = []
+                    elif kind == "meta":
+                        QtCore.QMetaObject.invokeMethod(self, "_on_stream_meta", Qt.QueuedConnection,
+                                                        Q_ARG(dict, {"seq": seq, "total_count": msg.get("total_count")}))
+                    elif kind == "end":
+                        if chunk:
+                            self._post_stream_rows(seq, chunk)
+                        return {"status": "ok", "seq": seq, "next_cursor": msg.get("next_cursor")}
+                    elif kind == "error":
+                        if chunk:
+                            self._post_stream_rows(seq, chunk)
+                        return {"status": "error", "seq": seq, "message": msg.get("message", "unknown error")}
+            # end 줄 없이 끊긴 경우: 받은 데까지만 표시
+            if chunk:
+                self._post_stream_rows(seq, chunk)
+            return {"status": "error", "seq": seq, "message": "검색 응답이 중간에 끊겼습니다."}
+        except Exception as ex:
+            return {"status": "error", "seq": seq, "message": str(ex)}
+
+    def _post_stream_rows(self, seq, rows):
+        QtCore.QMetaObject.invokeMethod(self, "_on_stream_rows", Qt.QueuedConnection,
+                                        Q_ARG(dict, {"seq": seq, "rows": rows}))
+
+    @pyqtSlot(dict)
+    def _on_stream_meta(self, meta):
+        if meta.get("seq") != self._search_seq:
+            return
+        if meta.get("total_count") is not None:
+            self._total_count = meta.get("total_count")
+
+    @pyqtSlot(dict)
+    def _on_stream_rows(self, payload):
+        if payload.get("seq") != self._search_seq:
+            return
+        self.append_top_rows(payload.get("rows", []))
+        self._update_result_count_label()
+
+    def _on_stream_search_finished(self, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"status": "error", "seq": None, "message": str(e)}
+        QtCore.QMetaObject.invokeMethod(self, "_finalize_stream_search", Qt.QueuedConnection, Q_ARG(dict, result))
+
+    @pyqtSlot(dict)
+    def _finalize_stream_search(self, result):
+        if result.get("seq") != self._search_seq:
+            return
+        if result.get("status") != "ok":
+            self._update_result_count_label()
+            QMessageBox.warning(self, "검색 오류", result.get("message", "unknown error"))
+            return
+        self._next_cursor = result.get("next_cursor")
+        self.btn_more.setEnabled(bool(self._next_cursor))
+        self._update_result_count_label()
+
+    def _update_result_count_label(self):
+        shown = self.top_table.rowCount()
+        if self._total_count is not None:
+            self.lbl_result_count.setText(f"검색 결과 {shown} / {self._total_count}건")
+        else:
+            self.lbl_result_count.setText(f"검색 결과 {shown}건")
 
     def _bg_search(self, search_type, keyword, within_1month):
         """
@@ -262,11 +387,19 @@ class NaverShopSearchDialog(QDialog):
     def populate_top_table(self, rows):
         tbl = self.top_table
         tbl.setRowCount(0)
+        if not rows:
+            return
+        self.append_top_rows(rows)
+
+    def append_top_rows(self, rows):
+        """상단 테이블 끝에 행 추가 (스트리밍 검색은 청크 단위로 호출)"""
+        tbl = self.top_table
         if not rows:
             return
 
-        for i, r in enumerate(rows):
-            tbl.insertRow(i)
+        start = tbl.rowCount()
+        tbl.setRowCount(start + len(rows))
+        for i, r in enumerate(rows, start):
             # 0) 주소
             addr_ = (r.get("dong","") + " " + r.get("jibun","")).strip()
             tbl.setItem(i, 0, QTableWidgetItem(addr_))
@@ -335,6 +468,12 @@ class NaverShopSearchDialog(QDialog):
                 return
 
             logger.info(f"on_url_search_clicked: Starting search for {len(article_nos)} article numbers.")
+            # 진행 중인 스트리밍 검색 결과가 섞이지 않도록 검색 상태 초기화
+            self._search_seq += 1
+            self._search_params = None
+            self._next_cursor = None
+            self.btn_more.setEnabled(False)
+            self.lbl_result_count.setText("")
             # 백그라운드에서 다중 검색 실행
             # 각 번호에 대해 _bg_search를 호출하고 결과를 모읍니다.
             # 'within_1month'는 URL 검색 시 의미가 없을 수 있으므로 '0'으로 고정합니다.
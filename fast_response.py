@@ -0,0 +1,214 @@
+"""
+목록 응답 공통 계층: fields= 컬럼 선택 / 빠른 JSON 직렬화 / gzip·brotli 압축
+
+- 컬럼 선택: 엔드포인트가 fields("id,dong,jibun" 또는 리스트)를 받으면 SELECT 목록을 그 컬럼으로 줄인다.
+  허용 컬럼(명시 목록 또는 SHOW COLUMNS 결과)에 없는 이름은 무시하므로 여러 테이블에 같은 fields를 넘겨도 된다.
+- 직렬화: dict 반환 시 FastAPI가 행마다 jsonable_encoder를 돌리므로, 목록 응답은 FastJSONResponse로 바로 직렬화한다.
+  orjson이 있으면 사용하고(date/datetime 기본 지원), 없으면 표준 json + default 변환.
+  출력 형식은 jsonable_encoder와 같다 (date → "YYYY-MM-DD", datetime → ISO, Decimal → int/float).
+- 압축: CompressionMiddleware가 Accept-Encoding을 보고 br(brotli 설치 시) > gzip 순으로 압축한다.
+  스트리밍 응답(NDJSON)은 청크마다 flush해서 줄 단위 전달이 늦어지지 않는다.
+"""
+import json
+import re
+import threading
+import zlib
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_table_columns = {}
+_table_columns_lock = threading.Lock()
+
+
+def _default(obj):
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj).__name__}")
+
+
+def dumps(content):
+    """content → UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content):
+        return dumps(content)
+
+
+def parse_fields(fields):
+    """fields 파라미터("a,b" / ["a","b"] / None) → 컬럼명 리스트 또는 None(전체)"""
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    names = [str(f).strip() for f in fields if str(f).strip()]
+    if not names:
+        return None
+    invalid = [n for n in names if not _IDENTIFIER_RE.match(n)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"잘못된 fields 값: {invalid}")
+    return list(dict.fromkeys(names))
+
+
+def table_columns(cursor, table):
+    """테이블 컬럼명 튜플 (SHOW COLUMNS, 프로세스당 한 번 조회)"""
+    with _table_columns_lock:
+        cached = _table_columns.get(table)
+    if cached is not None:
+        return cached
+    cursor.execute(f"SHOW COLUMNS FROM `{table}`")
+    columns = tuple(r["Field"] if isinstance(r, dict) else r[0] for r in cursor.fetchall())
+    with _table_columns_lock:
+        _table_columns[table] = columns
+    return columns
+
+
+def select_list(fields, allowed, always=("id",), alias=None):
+    """
+    SELECT 목록 문자열. fields가 None이면 allowed 전체.
+    allowed에 없는 이름은 무시하고, always 컬럼(id 등)은 항상 포함한다.
+    """
+    names = parse_fields(fields)
+    if names is None:
+        columns = list(allowed)
+    else:
+        allowed_set = set(allowed)
+        columns = [c for c in dict.fromkeys(list(always) + names) if c in allowed_set]
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(f"{prefix}`{c}`" for c in columns)
+
+
+def negotiate_encoding(accept_encoding):
+    """Accept-Encoding → "br" / "gzip" / None (q=0은 거부로 처리)"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token.strip().lower()] = q
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0 or accepted.get("*", 0) > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding, gzip_level, brotli_quality):
+        if encoding == "br":
+            c = brotli.Compressor(quality=brotli_quality)
+            self.compress, self.flush, self.finish = c.process, c.flush, c.finish
+        else:
+            c = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)  # wbits 31: gzip 헤더
+            self.compress, self.finish = c.compress, c.flush
+            self.flush = lambda: c.flush(zlib.Z_SYNC_FLUSH)
+
+
+class _CompressResponder:
+    def __init__(self, app, encoding, minimum_size, gzip_level, brotli_quality):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.send = None
+        self.start_message = None
+        self.started = False
+        self.compressor = None
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            skip = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+                or (not more_body and len(body) < self.minimum_size)
+            )
+            if skip:
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            self.compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+            data = self.compressor.compress(body) + (self.compressor.flush() if more_body else self.compressor.finish())
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(data))
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+            return
+
+        if self.compressor is None:
+            await self.send(message)
+            return
+        data = self.compressor.compress(body) + (self.compressor.flush() if more_body else self.compressor.finish())
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상 gzip/brotli 압축 (minimum_size 미만 단건 응답은 그대로)"""
+
+    def __init__(self, app, minimum_size=1024, gzip_level=6, brotli_quality=4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressResponder(self.app, encoding, self.minimum_size, self.gzip_level, self.brotli_quality)
+        await responder(scope, receive, send)
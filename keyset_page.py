@@ -0,0 +1,165 @@
+"""
+(ad_start_date DESC, id DESC) 키셋 페이지네이션 / NDJSON 스트리밍 / 총 건수 캐시
+
+search_naver_shop은 LIMIT/OFFSET이라 뒤쪽 페이지일수록 앞 페이지 행을 모두 읽고 버렸고,
+페이지마다 COUNT(*) 서브쿼리를 따로 실행했다. 스트리밍 엔드포인트(/shop/search_naver_shop_stream,
+/shop/search_naver_shop_simple_stream)는 마지막 행의 (ad_start_date, id)를 커서로 받아
+"그보다 뒤" 조건으로 다음 페이지를 바로 찾고, 총 건수는 첫 페이지에서만 계산해 TTL 캐시에 둔다.
+
+- 커서 토큰: "YYYY-MM-DD|id" (DATETIME이면 "YYYY-MM-DD HH:MM:SS|id", ad_start_date가 NULL이면 "|id")
+- 정렬 순서(MySQL DESC): 날짜 큰 순 → 같은 날짜는 id 큰 순 → NULL 날짜는 맨 뒤
+- NDJSON 한 줄씩: {"type":"meta",...} → {"type":"row","data":{...}} × n → {"type":"end","next_cursor":...}
+  오류 시 {"type":"error","message":...} 후 종료 (응답 헤더는 이미 나간 뒤라 상태코드로 알릴 수 없다)
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from settings import logger
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_FETCH_SIZE = 200  # fetchmany 단위
+
+
+def encode_cursor(ad_start_date, row_id):
+    """마지막 행 → 다음 페이지 커서 토큰"""
+    if isinstance(ad_start_date, datetime):
+        day = ad_start_date.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(ad_start_date, date):
+        day = ad_start_date.isoformat()
+    else:
+        day = str(ad_start_date or "")
+    return f"{day}|{int(row_id)}"
+
+
+def decode_cursor(token):
+    """커서 토큰 → (날짜 문자열 또는 None, id). 형식이 틀리면 ValueError"""
+    day, sep, row_id = (token or "").partition("|")
+    if not sep:
+        raise ValueError(f"잘못된 커서: {token!r}")
+    day = day.strip()
+    if day:
+        datetime.fromisoformat(day)  # 형식 검증 (SQL에는 파라미터로만 들어간다)
+    return (day or None), int(row_id)
+
+
+def keyset_clause(token, alias="n"):
+    """커서 토큰 → ("(...)", params). 토큰이 없으면 (None, [])"""
+    if not token:
+        return None, []
+    day, row_id = decode_cursor(token)
+    date_col = f"{alias}.ad_start_date" if alias else "ad_start_date"
+    id_col = f"{alias}.id" if alias else "id"
+    if day is None:
+        # NULL 날짜 구간(맨 뒤)에서는 id만 비교
+        return f"({date_col} IS NULL AND {id_col} < %s)", [row_id]
+    return (
+        f"({date_col} < %s OR ({date_col} = %s AND {id_col} < %s) OR {date_col} IS NULL)",
+        [day, day, row_id],
+    )
+
+
+def ndjson_line(obj):
+    return (json.dumps(jsonable_encoder(obj), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class CountCache:
+    """
+    검색 조건별 총 건수 TTL 캐시 (LRU, 스레드 안전)
+    키는 (쿼리 종류, WHERE 절, 파라미터) - 같은 조건으로 다시 검색하면 COUNT(*)를 다시 돌리지 않는다.
+    """
+
+    def __init__(self, ttl=60.0, max_entries=512):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (expires_at, count)
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(kind, where_sql, params):
+        return (kind, where_sql, tuple(str(p) for p in params))
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key, count):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "ttl": self.ttl,
+            }
+
+
+def stream_keyset_page(get_connection, page_sql, page_params, limit, count_fn=None, meta=None):
+    """
+    키셋 한 페이지를 NDJSON 줄 단위로 내보내는 동기 제너레이터 (StreamingResponse가 스레드풀에서 순회)
+    - page_sql은 (ad_start_date DESC, id DESC) 순서로 정렬되고 LIMIT이 걸린 쿼리
+    - count_fn(cursor) -> 총 건수 또는 None (캐시/첫 페이지에서만 계산)
+    - 한 행(id)이 JOIN으로 여러 줄이 되어도 커서는 id 기준으로 계산한다
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = get_connection()
+        cursor = conn.cursor(dictionary=True)
+        total_count = count_fn(cursor) if count_fn else None
+        yield ndjson_line(dict(meta or {}, type="meta", total_count=total_count, limit=limit))
+
+        cursor.execute(page_sql, tuple(page_params))
+        emitted = 0
+        seen_ids = set()
+        last = None
+        while True:
+            batch = cursor.fetchmany(STREAM_FETCH_SIZE)
+            if not batch:
+                break
+            for row in batch:
+                seen_ids.add(row.get("id"))
+                last = row
+                emitted += 1
+                yield ndjson_line({"type": "row", "data": row})
+
+        next_cursor = None
+        if last is not None and len(seen_ids) >= limit:
+            next_cursor = encode_cursor(last.get("ad_start_date"), last.get("id"))
+        yield ndjson_line({"type": "end", "count": emitted, "next_cursor": next_cursor})
+    except Exception as e:
+        logger.error(f"NDJSON keyset stream error: {e}")
+        yield ndjson_line({"type": "error", "message": "데이터베이스 오류 발생"})
+    finally:
+        # 클라이언트가 중간에 끊으면 읽지 않은 결과가 남아 close가 실패할 수 있다 (커넥션은 반납 시 정리)
+        if cursor:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        if conn: conn.close()
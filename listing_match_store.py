@@ -0,0 +1,372 @@
+"""
+customer_listing_match 물리화(materialized) 테이블 관리
+
+search_manager_data 결과(고객 ↔ 네이버 매물 매칭)를 매번 처음부터 계산하지 않고
+(customer_id, shop_id) 쌍으로 저장해 두고 변경분만 갱신한다.
+
+- 고객 추가/수정/삭제: routers/customer.py 에서 rematch_customers / remove_customer_matches 호출
+  (고객 한 명을 전체 매물과 INSERT ... SELECT 한 문장으로 재매칭)
+- naver_shop 신규/변경/삭제: 외부 수집기가 직접 쓰는 테이블이라 서버에 쓰기 경로가 없다.
+  sync_listing_matches()가 바뀐 매물만 ListingMatcher로 전체 고객과 다시 매칭한다.
+  · 변경 추적(USE_CHANGE_TRACKING, migrate_change_tracking.py)이 켜져 있으면 지난 동기화 이후
+    updated_at / row_tombstones 인덱스 범위만 읽는다.
+  · 아니면 매칭 관련 컬럼의 MD5 시그니처(naver_shop_match_state)를 전체 비교한다. 이 스캔은 조회마다 하지 않고
+    수집기가 POST /shop/refresh_listing_matches(쓰기 훅)를 부른 뒤나 LISTING_MATCH_SYNC_INTERVAL이 지났을 때만 한다.
+  조회(search_manager_data)는 sync_listing_matches_if_changed()로 다른 요청이 동기화 중이면 기다리지 않는다.
+- 조회: load_materialized_results()가 매칭 테이블을 shop_id(last_id) 기준으로 읽어
+  기존 search_manager_data와 같은 구조(biz_manager_list 포함)로 조립한다.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+
+import mysql.connector as mysql
+
+from change_tracking import begin_sync, deleted_ids, delta_condition
+from listing_matcher import ListingMatcher, build_biz_manager_list, parse_customer_criteria
+from settings import LISTING_MATCH_SYNC_INTERVAL, USE_MATERIALIZED_MATCH
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 5000
+
+# 매칭 결과에 영향을 주는 naver_shop 컬럼 시그니처 (NULL도 구분되도록 IFNULL 처리)
+LISTING_SIG_EXPR = (
+    "MD5(CONCAT_WS('|', IFNULL(n.deposit,'~'), IFNULL(n.monthly,'~'), IFNULL(n.area,'~'), "
+    "IFNULL(n.curr_floor,'~'), IFNULL(n.total_floor,'~'), IFNULL(n.dong,'~'), "
+    "IFNULL(n.lat,'~'), IFNULL(n.lng,'~')))"
+)
+
+CUSTOMER_MATCH_COLUMNS = """
+    id AS customer_id, manager,
+    deposit_min, deposit_max, monthly_min, monthly_max,
+    area_min, area_max, floor_min, floor_max, is_top_floor,
+    dong, rectangles, biz_type
+"""
+
+_tables_ready = False
+_tables_lock = threading.Lock()
+_sync_lock = threading.Lock()
+
+# 마지막 동기화 상태 (_sync_lock 안에서만 변경)
+_sync_state = {
+    "since": None,        # 변경 추적 경로: 마지막 동기화 시작 시각(DB NOW)
+    "tracked": True,      # naver_shop에 변경 추적 컬럼이 없어 조회가 실패하면 False
+    "scanned_at": None,   # 시그니처 전체 스캔 경로: 마지막 스캔 시각(monotonic)
+    "dirty": True,        # 시작/reset 이후 아직 스캔하지 않음
+}
+
+
+def ensure_match_tables(cursor):
+    """
+    매칭 테이블 생성 (프로세스당 1회). 호출 측 커서로 실행해 풀에서 커넥션을 더 빌리지 않는다.
+    DDL은 암묵적 커밋을 일으키므로 서버 시작 시(server_test startup) 먼저 한 번 불러 둔다.
+    """
+    global _tables_ready
+    if _tables_ready:
+        return
+    with _tables_lock:
+        if _tables_ready:
+            return
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS customer_listing_match (
+          customer_id INT NOT NULL,
+          shop_id INT NOT NULL,
+          PRIMARY KEY (customer_id, shop_id),
+          KEY idx_clm_shop_id (shop_id)
+        )
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS naver_shop_match_state (
+          shop_id INT NOT NULL PRIMARY KEY,
+          sig CHAR(32) NOT NULL
+        )
+        """)
+        _tables_ready = True
+
+
+def _customer_match_where(crit):
+    """고객 조건 → naver_shop WHERE 절 (기존 고객별 쿼리와 동일한 규칙)"""
+    wheres = [
+        "n.deposit BETWEEN %s AND %s",
+        "n.monthly BETWEEN %s AND %s",
+        "n.area BETWEEN %s AND %s",
+        "(n.curr_floor BETWEEN %s AND %s)",
+    ]
+    params = [
+        crit["deposit_min"], crit["deposit_max"],
+        crit["monthly_min"], crit["monthly_max"],
+        crit["area_min_m2"], crit["area_max_m2"],
+        crit["floor_min"], crit["floor_max"],
+    ]
+    if crit["is_top_floor"]:
+        wheres.append("n.curr_floor = n.total_floor")
+
+    or_clauses = []
+    if crit["dong_list"]:
+        or_clauses.append(f"n.dong IN ({','.join(['%s'] * len(crit['dong_list']))})")
+        params.extend(crit["dong_list"])
+    for sw_lng, sw_lat, ne_lng, ne_lat in crit["rects"]:
+        or_clauses.append("(n.lng BETWEEN %s AND %s AND n.lat BETWEEN %s AND %s)")
+        params.extend([sw_lng, ne_lng, sw_lat, ne_lat])
+    if or_clauses:
+        wheres.append("( " + " OR ".join(or_clauses) + " )")
+    return " AND ".join(wheres), params
+
+
+def rematch_customers(cursor, customer_ids):
+    """
+    고객들의 매칭을 전체 매물 기준으로 다시 계산 (호출 측 트랜잭션 안에서 실행, 커밋은 호출 측)
+    """
+    if not USE_MATERIALIZED_MATCH:
+        return
+    ids = [int(i) for i in customer_ids if i]
+    if not ids:
+        return
+    ensure_match_tables(cursor)
+    placeholders = ",".join(["%s"] * len(ids))
+    cursor.execute(f"DELETE FROM customer_listing_match WHERE customer_id IN ({placeholders})", tuple(ids))
+    cursor.execute(f"SELECT {CUSTOMER_MATCH_COLUMNS} FROM customer WHERE id IN ({placeholders})", tuple(ids))
+    columns = [d[0] for d in cursor.description]
+    customers = [dict(zip(columns, r)) if not isinstance(r, dict) else r for r in cursor.fetchall()]
+
+    for cust in customers:
+        crit = parse_customer_criteria(cust)
+        if crit is None:
+            continue
+        where_sql, params = _customer_match_where(crit)
+        cursor.execute(
+            f"INSERT IGNORE INTO customer_listing_match (customer_id, shop_id) "
+            f"SELECT %s, n.id FROM naver_shop n WHERE {where_sql}",
+            tuple([cust["customer_id"]] + params)
+        )
+    logger.debug(f"Rematched {len(customers)} customer(s) against all listings: {ids}")
+
+
+def remove_customer_matches(cursor, customer_ids):
+    """삭제된 고객의 매칭 제거 (권한 조건으로 실제 삭제되지 않은 고객은 유지)"""
+    if not USE_MATERIALIZED_MATCH:
+        return
+    ids = [int(i) for i in customer_ids if i]
+    if not ids:
+        return
+    ensure_match_tables(cursor)
+    placeholders = ",".join(["%s"] * len(ids))
+    cursor.execute(f"""
+        DELETE m FROM customer_listing_match m
+        LEFT JOIN customer c ON c.id = m.customer_id
+        WHERE m.customer_id IN ({placeholders}) AND c.id IS NULL
+    """, tuple(ids))
+
+
+def _load_all_customers(cursor):
+    cursor.execute(f"SELECT {CUSTOMER_MATCH_COLUMNS} FROM customer ORDER BY id ASC")
+    return cursor.fetchall()
+
+
+def _rematch_listing_batch(cursor, customers, shop_ids):
+    placeholders = ",".join(["%s"] * len(shop_ids))
+    cursor.execute(f"""
+        SELECT n.id AS shop_id, n.deposit, n.monthly, n.area, n.curr_floor, n.total_floor,
+               n.dong, n.lat, n.lng, {LISTING_SIG_EXPR} AS match_sig
+        FROM naver_shop n WHERE n.id IN ({placeholders}) ORDER BY n.id ASC
+    """, tuple(shop_ids))
+    rows = cursor.fetchall()
+    matcher = ListingMatcher(rows, id_key="shop_id")
+
+    pairs = []
+    for cust in customers:
+        crit = parse_customer_criteria(cust)
+        if crit is None:
+            continue
+        cid = cust["customer_id"]
+        pairs.extend((cid, int(sid)) for sid in matcher.ids[matcher.match(crit)].tolist())
+
+    cursor.execute(f"DELETE FROM customer_listing_match WHERE shop_id IN ({placeholders})", tuple(shop_ids))
+    if pairs:
+        cursor.executemany("INSERT IGNORE INTO customer_listing_match (customer_id, shop_id) VALUES (%s, %s)", pairs)
+    if rows:
+        cursor.executemany(
+            "INSERT INTO naver_shop_match_state (shop_id, sig) VALUES (%s, %s) "
+            "ON DUPLICATE KEY UPDATE sig=VALUES(sig)",
+            [(r["shop_id"], r["match_sig"]) for r in rows]
+        )
+    return len(pairs)
+
+
+def refresh_listing_matches(conn, shop_ids):
+    """지정 매물들을 전체 고객과 다시 매칭 (배치마다 커밋)"""
+    shop_ids = sorted({int(i) for i in shop_ids})
+    if not shop_ids:
+        return 0
+    cursor = conn.cursor(dictionary=True)
+    try:
+        ensure_match_tables(cursor)
+        customers = _load_all_customers(cursor)
+        pair_count = 0
+        for i in range(0, len(shop_ids), SYNC_BATCH_SIZE):
+            pair_count += _rematch_listing_batch(cursor, customers, shop_ids[i:i + SYNC_BATCH_SIZE])
+            conn.commit()
+        return pair_count
+    finally:
+        cursor.close()
+
+
+def reset_listing_matches(conn):
+    """매칭 테이블과 시그니처를 비운다 (다음 sync에서 전체 매물 × 전체 고객으로 재구축)"""
+    with _sync_lock:
+        cursor = conn.cursor()
+        try:
+            ensure_match_tables(cursor)
+            cursor.execute("DELETE FROM customer_listing_match")
+            cursor.execute("DELETE FROM naver_shop_match_state")
+            conn.commit()
+        finally:
+            cursor.close()
+        _sync_state["since"] = None
+        _sync_state["dirty"] = True
+
+
+def _tracked_changes(cursor, since):
+    """변경 추적 경로: since 이후 바뀐 매물 id / 삭제된 매물 id (updated_at, row_tombstones 인덱스 범위)"""
+    where_sql, params = delta_condition(since)
+    cursor.execute(f"SELECT id FROM naver_shop WHERE {where_sql}", tuple(params))
+    changed_ids = [r["id"] for r in cursor.fetchall()]
+    removed_ids = deleted_ids(cursor, "naver_shop", since, live_rows=[{"id": i} for i in changed_ids])
+    return changed_ids, removed_ids
+
+
+def _signature_changes(cursor):
+    """시그니처 경로: 시그니처가 없거나 달라진 매물 id / state에만 남은(삭제된) 매물 id (naver_shop 전체 스캔)"""
+    cursor.execute(f"""
+        SELECT n.id FROM naver_shop n
+        LEFT JOIN naver_shop_match_state s ON s.shop_id = n.id
+        WHERE s.shop_id IS NULL OR s.sig <> {LISTING_SIG_EXPR}
+    """)
+    changed_ids = [r["id"] for r in cursor.fetchall()]
+    cursor.execute("""
+        SELECT s.shop_id FROM naver_shop_match_state s
+        LEFT JOIN naver_shop n ON n.id = s.shop_id
+        WHERE n.id IS NULL
+    """)
+    removed_ids = [r["shop_id"] for r in cursor.fetchall()]
+    return changed_ids, removed_ids
+
+
+def _sync_locked(conn, force):
+    """_sync_lock 안에서 실행. 바뀐 것이 없거나 스캔 주기가 아니면 None"""
+    cursor = conn.cursor(dictionary=True)
+    try:
+        ensure_match_tables(cursor)
+        token, since = begin_sync(cursor, _sync_state["since"])
+        changes = None
+        if token is not None and since is not None and _sync_state["tracked"]:
+            try:
+                changes = _tracked_changes(cursor, since)
+            except mysql.Error as e:
+                # naver_shop에 migrate_change_tracking.py가 적용되지 않음 → 시그니처 경로로
+                logger.warning(f"Listing match sync: naver_shop 변경 추적 조회 실패, 시그니처 비교로 전환: {e}")
+                _sync_state["tracked"] = False
+                _sync_state["dirty"] = True
+        if changes is None:
+            scanned_at = _sync_state["scanned_at"]
+            due = scanned_at is None or time.monotonic() - scanned_at >= LISTING_MATCH_SYNC_INTERVAL
+            if not (force or _sync_state["dirty"] or due or (token is not None and _sync_state["tracked"])):
+                return None
+            _sync_state["dirty"] = False
+            _sync_state["scanned_at"] = time.monotonic()
+            changes = _signature_changes(cursor)
+        changed_ids, removed_ids = changes
+
+        for i in range(0, len(removed_ids), SYNC_BATCH_SIZE):
+            chunk = removed_ids[i:i + SYNC_BATCH_SIZE]
+            placeholders = ",".join(["%s"] * len(chunk))
+            cursor.execute(f"DELETE FROM customer_listing_match WHERE shop_id IN ({placeholders})", tuple(chunk))
+            cursor.execute(f"DELETE FROM naver_shop_match_state WHERE shop_id IN ({placeholders})", tuple(chunk))
+        conn.commit()
+    finally:
+        cursor.close()
+
+    pair_count = refresh_listing_matches(conn, changed_ids) if changed_ids else 0
+    if token is not None and _sync_state["tracked"]:
+        _sync_state["since"] = datetime.fromisoformat(token)
+    if changed_ids or removed_ids:
+        logger.info(f"Listing match sync: changed={len(changed_ids)}, removed={len(removed_ids)}, pairs={pair_count}")
+    return {"changed": len(changed_ids), "removed": len(removed_ids), "pairs": pair_count}
+
+
+def sync_listing_matches(conn, force=True):
+    """
+    naver_shop 변경분 반영: 바뀐 매물만 재매칭하고 삭제된 매물의 매칭은 제거
+    force=False면 변경 추적이 없을 때 시그니처 스캔을 LISTING_MATCH_SYNC_INTERVAL마다로 제한한다.
+    (쓰기 훅 POST /shop/refresh_listing_matches는 force=True)
+    """
+    with _sync_lock:
+        result = _sync_locked(conn, force)
+    return result or {"changed": 0, "removed": 0, "pairs": 0}
+
+
+def sync_listing_matches_if_changed(conn):
+    """조회 경로용: 다른 요청이 동기화 중이면 기다리지 않고 현재 매칭 테이블로 응답한다"""
+    if not _sync_lock.acquire(blocking=False):
+        return None
+    try:
+        return _sync_locked(conn, force=False)
+    finally:
+        _sync_lock.release()
+
+
+def load_materialized_results(cursor, listing_sql, last_id=0):
+    """
+    매칭 테이블 → search_manager_data 결과 리스트 (정렬/날짜 필터 전)
+    listing_sql: shop_id / check_memo 를 포함하는 naver_shop 조회 SQL (WHERE 1=1 로 끝남)
+    cursor: dictionary=True 커서
+    """
+    ensure_match_tables(cursor)
+    cursor.execute("""
+        SELECT m.customer_id, m.shop_id, cu.manager, cu.biz_type
+        FROM customer_listing_match m
+        JOIN customer cu ON cu.id = m.customer_id
+        WHERE m.shop_id > %s
+        ORDER BY m.customer_id ASC, m.shop_id ASC
+    """, (last_id,))
+    pairs = cursor.fetchall()
+    if not pairs:
+        return []
+
+    cursor.execute(
+        listing_sql
+        + " AND n.id IN (SELECT shop_id FROM customer_listing_match WHERE shop_id > %s) ORDER BY n.id ASC",
+        (last_id,)
+    )
+    listing_rows = {}
+    join_count = {}
+    for row in cursor.fetchall():
+        sid = row["shop_id"]
+        if sid in listing_rows:
+            join_count[sid] += 1
+        else:
+            listing_rows[sid] = row
+            join_count[sid] = 1
+
+    biz_cache = {}
+    by_naver_id = {}
+    for pair in pairs:
+        sid = pair["shop_id"]
+        row = listing_rows.get(sid)
+        if row is None:
+            continue
+        cid = pair["customer_id"]
+        biz_manager_list = biz_cache.get(cid)
+        if biz_manager_list is None:
+            biz_manager_list = build_biz_manager_list(pair.get("manager", ""), pair.get("biz_type"))
+            biz_cache[cid] = biz_manager_list
+        entry = by_naver_id.get(sid)
+        if entry is None:
+            entry = dict(row)
+            entry["biz_manager_list"] = []
+            by_naver_id[sid] = entry
+        if biz_manager_list:
+            entry["biz_manager_list"].extend(biz_manager_list * join_count[sid])
+    return list(by_naver_id.values())
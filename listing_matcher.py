@@ -0,0 +1,205 @@
+"""
+고객 조건 → 네이버 상가 매물 매칭 엔진 (search_manager_data 용)
+
+기존에는 고객 한 명마다 naver_shop 전체를 조회하는 쿼리를 반복했지만,
+여기서는 매물을 한 번만 읽어 컬럼(numpy 배열) 형태로 들고 있고
+고객별 보증금/월세/면적/층/동/지도범위 조건을 배열 마스크 연산으로 평가한다.
+
+- 보증금 기준으로 정렬된 인덱스를 만들어 두고 searchsorted로 후보 구간을 먼저 좁힌다.
+- NULL 값은 NaN으로 저장되어 BETWEEN 비교에서 SQL과 동일하게 탈락한다.
+- 지도 사각형(rectangles) 조건은 spatial_index.GridIndex로 후보 셀만 검사한다.
+- 결과(biz_manager_list 포함)는 기존 per-customer 루프와 동일한 구조/순서로 만든다.
+"""
+import json
+
+import numpy as np
+
+from spatial_index import GridIndex
+
+PYEONG_TO_M2 = 3.3058
+
+
+def _to_float(val):
+    if val is None or val == "":
+        return np.nan
+    try:
+        return float(val)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_rectangles(rect_value):
+    """rectangles JSON([[swLng, swLat, neLng, neLat], ...]) → float 4-튜플 리스트 (잘못된 항목은 제외)"""
+    if not rect_value:
+        return []
+    if isinstance(rect_value, str):
+        try:
+            rect_value = json.loads(rect_value)
+        except (TypeError, ValueError):
+            return []
+    rects = []
+    if not isinstance(rect_value, list):
+        return rects
+    for rect in rect_value:
+        if isinstance(rect, (list, tuple)) and len(rect) == 4:
+            try:
+                rects.append(tuple(float(v) for v in rect))
+            except (TypeError, ValueError):
+                continue
+    return rects
+
+
+def build_biz_manager_list(manager_name, biz_type):
+    """고객 biz_type("카페|음식점", 구분자는 파이프) → [{"biz":..., "manager":...}, ...]"""
+    return [
+        {"biz": b.strip(), "manager": manager_name}
+        for b in (biz_type or "").split("|") if b.strip()
+    ]
+
+
+def parse_customer_criteria(cust):
+    """
+    customer 행 → 매칭 조건 dict
+    범위 값이 NULL이면 SQL BETWEEN처럼 어떤 매물과도 매칭되지 않으므로 None 반환
+    """
+    bounds = []
+    for key, default in (
+        ("deposit_min", 0), ("deposit_max", 99999999),
+        ("monthly_min", 0), ("monthly_max", 99999999),
+        ("area_min", 0.0), ("area_max", 99999999.0),
+        ("floor_min", -999), ("floor_max", 9999),
+    ):
+        val = _to_float(cust.get(key, default))
+        if np.isnan(val):
+            return None
+        bounds.append(val)
+    deposit_min, deposit_max, monthly_min, monthly_max, area_min, area_max, floor_min, floor_max = bounds
+
+    dong_str = cust.get("dong", "") or ""
+
+    return {
+        "deposit_min": deposit_min, "deposit_max": deposit_max,
+        "monthly_min": monthly_min, "monthly_max": monthly_max,
+        "area_min_m2": area_min * PYEONG_TO_M2, "area_max_m2": area_max * PYEONG_TO_M2,
+        "floor_min": floor_min, "floor_max": floor_max,
+        "is_top_floor": cust.get("is_top_floor", 0) == 1,
+        "dong_list": [x.strip() for x in dong_str.split(",") if x.strip()],
+        "rects": parse_rectangles(cust.get("rectangles", "[]")),
+        "biz_manager_list": build_biz_manager_list(cust.get("manager", ""), cust.get("biz_type", "")),
+    }
+
+
+class ListingMatcher:
+    """naver_shop 매물의 컬럼형 인메모리 표현 + 고객 조건 매칭"""
+
+    def __init__(self, rows, id_key="shop_id"):
+        """
+        rows: id 오름차순으로 정렬된 매물 행(dict). LEFT JOIN으로 같은 id가 연속해서
+              여러 번 나올 수 있으며, 첫 행을 대표로 쓰고 중복 횟수(join_count)를 기록한다.
+        """
+        self.id_key = id_key
+        self.rows = []
+        join_count = []
+        ids, deposit, monthly, area = [], [], [], []
+        curr_floor, total_floor, lat, lng, dong_codes = [], [], [], [], []
+        self.dong_index = {}  # 동 이름 → 정수 코드 (딕셔너리 인코딩)
+
+        last_id = None
+        for row in rows:
+            rid = row[id_key]
+            if rid == last_id:
+                join_count[-1] += 1
+                continue
+            last_id = rid
+            self.rows.append(row)
+            join_count.append(1)
+            ids.append(rid)
+            deposit.append(_to_float(row.get("deposit")))
+            monthly.append(_to_float(row.get("monthly")))
+            area.append(_to_float(row.get("area")))
+            curr_floor.append(_to_float(row.get("curr_floor")))
+            total_floor.append(_to_float(row.get("total_floor")))
+            lat.append(_to_float(row.get("lat")))
+            lng.append(_to_float(row.get("lng")))
+            dong = row.get("dong")
+            dong_codes.append(-1 if dong is None else self.dong_index.setdefault(dong, len(self.dong_index)))
+
+        self.join_count = np.array(join_count, dtype=np.int32)
+        self.ids = np.array(ids, dtype=np.int64)
+        self.deposit = np.array(deposit, dtype=np.float64)
+        self.monthly = np.array(monthly, dtype=np.float64)
+        self.area = np.array(area, dtype=np.float64)
+        self.curr_floor = np.array(curr_floor, dtype=np.float64)
+        self.total_floor = np.array(total_floor, dtype=np.float64)
+        self.lat = np.array(lat, dtype=np.float64)
+        self.lng = np.array(lng, dtype=np.float64)
+        self.dong = np.array(dong_codes, dtype=np.int32)
+
+        # 보증금 정렬 인덱스 (NaN은 맨 뒤로 정렬되어 searchsorted 구간에서 빠진다)
+        self._deposit_order = np.argsort(self.deposit, kind="stable")
+        self._deposit_sorted = self.deposit[self._deposit_order]
+        self._grid = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def grid(self):
+        """위경도 격자 인덱스 (rectangles 조건이 처음 필요할 때 생성)"""
+        if self._grid is None:
+            self._grid = GridIndex(self.lat, self.lng)
+        return self._grid
+
+    def match(self, crit, last_id=0):
+        """조건에 맞는 매물 인덱스 배열(id 오름차순) 반환"""
+        lo = np.searchsorted(self._deposit_sorted, crit["deposit_min"], side="left")
+        hi = np.searchsorted(self._deposit_sorted, crit["deposit_max"], side="right")
+        if lo >= hi:
+            return np.empty(0, dtype=np.int64)
+        idx = self._deposit_order[lo:hi]
+
+        monthly = self.monthly[idx]
+        area = self.area[idx]
+        curr_floor = self.curr_floor[idx]
+        mask = (monthly >= crit["monthly_min"]) & (monthly <= crit["monthly_max"])
+        mask &= (area >= crit["area_min_m2"]) & (area <= crit["area_max_m2"])
+        mask &= (curr_floor >= crit["floor_min"]) & (curr_floor <= crit["floor_max"])
+        if crit["is_top_floor"]:
+            mask &= curr_floor == self.total_floor[idx]
+        if last_id > 0:
+            mask &= self.ids[idx] > last_id
+
+        # 지역 조건: (동 IN ...) OR (사각형 범위 중 하나라도 포함)
+        dong_codes = [self.dong_index[d] for d in crit["dong_list"] if d in self.dong_index]
+        if crit["dong_list"] or crit["rects"]:
+            region = np.isin(self.dong[idx], dong_codes) if dong_codes else np.zeros(len(idx), dtype=bool)
+            if crit["rects"]:
+                # 격자 인덱스로 사각형이 걸치는 셀의 매물만 검사
+                region |= self.grid.mask_rects(crit["rects"])[idx]
+            mask &= region
+
+        return np.sort(idx[mask])
+
+    def build_manager_results(self, customers, last_id=0):
+        """
+        전체 고객에 대해 매칭하여 매물별 biz_manager_list를 채운 결과 리스트 반환
+        (기존 루프와 동일하게 고객 순서 → 매물 id 순서로 처음 매칭된 순서를 유지)
+        """
+        by_index = {}
+        for cust in customers:
+            if not cust:
+                continue
+            crit = parse_customer_criteria(cust)
+            if crit is None:
+                continue
+            biz_manager_list = crit["biz_manager_list"]
+            for i in self.match(crit, last_id).tolist():
+                entry = by_index.get(i)
+                if entry is None:
+                    entry = dict(self.rows[i])
+                    entry["biz_manager_list"] = []
+                    by_index[i] = entry
+                if biz_manager_list:
+                    # LEFT JOIN 중복 행마다 추가되던 기존 동작 유지
+                    entry["biz_manager_list"].extend(biz_manager_list * int(self.join_count[i]))
+        return list(by_index.values())
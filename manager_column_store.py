@@ -0,0 +1,119 @@
+"""
+매니저 체크 탭 로컬 필터용 컬럼 저장소 (manager_tabs/data.py)
+
+기존에는 필터를 바꿀 때마다 dict 행을 하나씩 돌며 ad_start_date를 strptime으로 다시 파싱하고
+biz_manager_list를 순회했다. 데이터를 받을 때 한 번만 컬럼 형태로 바꿔 두고
+동/업종/광고일 필터를 numpy 마스크 연산으로 평가한다.
+
+- 동: 사전 인코딩(dong → 코드), 선택 동은 코드별 bool 조회표로 비교
+- 업종: 업종 사전 → 비트 번호, 행마다 uint64 비트셋 (업종이 64개를 넘으면 워드를 늘림)
+- 광고일: "YYYY-MM-DD[ HH:MM:SS]" → date.toordinal() (없거나 형식 오류면 NO_DATE, 날짜 필터에서 탈락)
+- 비교 규칙은 기존 루프와 같다 (동은 strip 후 비교, 업종은 biz 값 그대로 비교)
+"""
+from datetime import datetime
+
+import numpy as np
+
+NO_DATE = -1
+WORD_MASK = (1 << 64) - 1
+
+
+def _date_ordinal(value, parsed):
+    """광고일 문자열 → ordinal (같은 문자열은 parsed 사전으로 한 번만 파싱)"""
+    ad_str = str(value or "").strip()
+    if not ad_str:
+        return NO_DATE
+    day = ad_str.split(" ")[0]
+    ordinal = parsed.get(day)
+    if ordinal is None:
+        try:
+            ordinal = datetime.strptime(day, "%Y-%m-%d").toordinal()
+        except ValueError:
+            ordinal = NO_DATE
+        parsed[day] = ordinal
+    return ordinal
+
+
+class ManagerColumnStore:
+    """search_manager_data 행 목록의 필터용 컬럼 뷰 (원본 행 리스트는 그대로 참조)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        n = len(rows)
+
+        self.dong_index = {}
+        dong_codes = np.empty(n, dtype=np.int32)
+        ordinals = np.empty(n, dtype=np.int32)
+        self.biz_index = {}
+        biz_rows = []
+        parsed_dates = {}
+
+        for i, row in enumerate(rows):
+            dong = (row.get("dong") or "").strip()
+            code = self.dong_index.get(dong)
+            if code is None:
+                code = self.dong_index[dong] = len(self.dong_index)
+            dong_codes[i] = code
+
+            ordinals[i] = _date_ordinal(row.get("ad_start_date"), parsed_dates)
+
+            bits = 0
+            for bm in row.get("biz_manager_list") or ():
+                biz = bm.get("biz", "")
+                bit = self.biz_index.get(biz)
+                if bit is None:
+                    bit = self.biz_index[biz] = len(self.biz_index)
+                bits |= 1 << bit
+            biz_rows.append(bits)
+
+        self.dong_codes = dong_codes
+        self.ad_ordinals = ordinals
+
+        # 행별 파이썬 정수 비트셋 → 64비트 워드 단위 uint64 열
+        words = max(1, (len(self.biz_index) + 63) // 64)
+        biz_bits = np.empty((n, words), dtype=np.uint64)
+        for w in range(words):
+            shift = 64 * w
+            biz_bits[:, w] = [(bits >> shift) & WORD_MASK for bits in biz_rows]
+        self.biz_bits = biz_bits
+
+    def __len__(self):
+        return len(self.rows)
+
+    def dong_mask(self, dongs):
+        lut = np.zeros(len(self.dong_index), dtype=bool)
+        for dong in dongs:
+            code = self.dong_index.get(dong)
+            if code is not None:
+                lut[code] = True
+        return lut[self.dong_codes]
+
+    def biz_mask(self, biz_types):
+        query = np.zeros(self.biz_bits.shape[1], dtype=np.uint64)
+        for biz in biz_types:
+            bit = self.biz_index.get(biz)
+            if bit is not None:
+                query[bit >> 6] |= np.uint64(1 << (bit & 63))
+        if not query.any():
+            return np.zeros(len(self.rows), dtype=bool)
+        return ((self.biz_bits & query) != 0).any(axis=1)
+
+    def date_mask(self, min_date, max_date):
+        lo, hi = min_date.toordinal(), max_date.toordinal()
+        return (self.ad_ordinals >= lo) & (self.ad_ordinals <= hi)
+
+    def mask(self, dongs=None, biz_types=None, min_date=None, max_date=None):
+        """선택된 조건만 AND로 묶은 bool 마스크 (조건이 없으면 전부 True)"""
+        mask = np.ones(len(self.rows), dtype=bool)
+        if dongs:
+            mask &= self.dong_mask(dongs)
+        if biz_types:
+            mask &= self.biz_mask(biz_types)
+        if min_date and max_date:
+            mask &= self.date_mask(min_date, max_date)
+        return mask
+
+    def filter(self, dongs=None, biz_types=None, min_date=None, max_date=None):
+        """조건을 통과한 원본 행 리스트 (원래 순서 유지)"""
+        rows = self.rows
+        return [rows[i] for i in np.flatnonzero(self.mask(dongs, biz_types, min_date, max_date)).tolist()]
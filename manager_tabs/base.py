@@ -9,6 +9,7 @@ from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QDialog, QTableWidgetItem, QMessageBox, QAbstractItemView, QTableView, QMenu, QAction, QWidget, QVBoxLayout, QComboBox, QPushButton, QLineEdit, QHBoxLayout, QHeaderView, QApplication, QShortcut, QStackedWidget
 
 from ui_utils import format_biz_list, MyTabStyle, update_combo_style, show_context_menu, save_qtableview_column_widths, restore_qtableview_column_widths
+from columnar_table_model import ColumnarTableModel
 from dialogs import StatusChangeDialog, BizSelectDialog, CalendarPopup, MultiGuDongDialog, SearchDialogForShop, RecommendDialog, NaverShopSearchDialog
 
 # 로컬 모듈 임포트
@@ -152,7 +153,6 @@ class ManagerCheckTab(QObject, ManagerDataMixin, ManagerUIMixin, ManagerTableMix
         main_vlayout.addLayout(combo_layout)
 
         # 3) 테이블(Model + View) - UI 간소화: 필요없는 필드 제거
-        self.manager_source_model = QtGui.QStandardItemModel()
         # 타입 컬럼 추가하여 헤더 일치
         headers = [
             "타입", "주소", "호", "층", "보증금/월세", "관리비",
@@ -161,8 +161,7 @@ class ManagerCheckTab(QObject, ManagerDataMixin, ManagerUIMixin, ManagerTableMix
             "주차대수", "용도", "사용승인일", "방/화장실",
             "사진경로", "소유자명", "관계"
         ]
-        self.manager_source_model.setColumnCount(len(headers))
-        self.manager_source_model.setHorizontalHeaderLabels(headers)
+        self.manager_source_model = ColumnarTableModel(self.build_manager_columns(headers))
 
         self.check_manager_view = QtWidgets.QTableView()
         self.check_manager_view.setModel(self.manager_source_model)
@@ -5,6 +5,8 @@ from datetime import datetime
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import Qt
 
+from manager_column_store import ManagerColumnStore
+
 logger = logging.getLogger(__name__)
 
 class ManagerDataMixin:
@@ -324,6 +326,9 @@ class ManagerDataMixin:
                 real_biz_set = self.build_real_biz_set(rows)
                 real_dong_map = self.build_real_dong_map(rows)
                 
+            # 필터용 컬럼 저장소를 미리 구성 (이후 필터 변경은 마스크 연산만 수행)
+            self._get_manager_column_store(rows)
+
             # 주소 집합 구성 (항상 새로 구성)
             unique_addresses = set()
             for row in rows:
@@ -380,71 +385,20 @@ class ManagerDataMixin:
                      f"업종 필터={has_biz_filter}({len(self.selected_biz_types) if self.selected_biz_types else 0}개), " +
                      f"날짜 필터={has_date_filter}({min_date}~{max_date if has_date_filter else ''})")
             
-            # D. 필터링 수행 - 최적화된 방식
-            filtered_rows = []
-            
+            # D. 필터링 수행 - 컬럼 저장소의 마스크 연산 (동/업종/날짜)
             # 필터 조건이 없으면 전체 데이터 반환
             if not has_dong_filter and not has_biz_filter and not has_date_filter:
                 self.logger.info("필터 조건이 없어 전체 데이터를 반환합니다.")
                 return rows
-                
-            # 필터링 수행
-            for row in rows:
-                # 기본적으로 행을 포함
-                include_row = True
-                
-                # (1) 동 필터 - 집합 이용하여 O(1) 탐색 - 필터가 있는 경우에만 적용
-                if has_dong_filter and dong_filter_set:
-                    row_dong = row.get("dong", "").strip()
-                    if row_dong not in dong_filter_set:
-                        include_row = False
-                        continue
-                    
-                # (2) 업종 필터 - biz_manager_list 미리 캐싱 - 필터가 있는 경우에만 적용
-                if has_biz_filter and biz_filter_set:
-                    bm_list = row.get("biz_manager_list", [])
-                    # 빠른 탐색을 위해 any() 최적화
-                    found_any = False
-                    for bm in bm_list:
-                        if bm.get("biz", "") in biz_filter_set:
-                            found_any = True
-                            break
-                    if not found_any:
-                        include_row = False
-                        continue
-                        
-                # (3) 날짜 필터 - 최적화 및 오류 처리 개선
-                if has_date_filter and min_date and max_date:
-                    ad_str = row.get("ad_start_date", "").strip()
-                    if not ad_str:
-                        include_row = False
-                        continue
-                        
-                    # 날짜 파싱 최적화
-                    try: 
-                        # 날짜 형식 확인 및 일관성 유지
-                        if " " in ad_str:  # 날짜에 시간이 포함된 경우 (예: "2025-05-04 12:34:56")
-                            ad_date_str = ad_str.split(" ")[0]  # 날짜 부분만 추출
-                        else:
-                            ad_date_str = ad_str
-                            
-                        ad_date_obj = datetime.strptime(ad_date_str, "%Y-%m-%d").date()
-                        
-                        # 날짜 범위 검사
-                        if ad_date_obj < min_date or ad_date_obj > max_date:
-                            include_row = False
-                            continue
-                    except (ValueError, AttributeError, IndexError) as e: 
-                        # 날짜 형식 오류 발생 시 로그 기록
-                        if isinstance(e, ValueError):
-                            self.logger.debug(f"날짜 파싱 오류 (무시): '{ad_str}' - {e}")
-                        include_row = False
-                        continue
-                        
-                # 모든 필터 통과하면 결과에 추가
-                if include_row:
-                    filtered_rows.append(row)
-            
+
+            store = self._get_manager_column_store(rows)
+            filtered_rows = store.filter(
+                dongs=dong_filter_set,
+                biz_types=biz_filter_set,
+                min_date=min_date if has_date_filter else None,
+                max_date=max_date if has_date_filter else None,
+            )
+
             # 처리 시간 측정 및 로깅
             end_time = datetime.now()
             elapsed_ms = (end_time - start_time).total_seconds() * 1000
@@ -473,6 +427,17 @@ class ManagerDataMixin:
             if len(rows) > 1000:
                 return rows[:1000]  # 데이터가 너무 많은 경우를 대비해 최대 1000개 항목으로 제한
 
+    def _get_manager_column_store(self, rows):
+        """rows(매니저 체크 캐시)의 컬럼 저장소. 같은 리스트 객체면 재사용, 바뀌었으면 새로 구성"""
+        store = getattr(self, '_manager_column_store', None)
+        if store is None or store.rows is not rows:
+            start_time = datetime.now()
+            store = ManagerColumnStore(rows)
+            self._manager_column_store = store
+            elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+            self.logger.info(f"필터용 컬럼 저장소 구성: {len(rows)}건, 동 {len(store.dong_index)}개, 업종 {len(store.biz_index)}개 ({elapsed_ms:.1f}ms)")
+        return store
+
     def build_real_dong_map(self, big_rows):
         """Builds a map of available dongs from data, filtered by parent's district data."""
         # Logic from main_app_part7/build_real_dong_map
@@ -545,31 +510,14 @@ class ManagerDataMixin:
                      self.logger.warning(f"필터에서 잘못된 날짜 형식: {self.filter_ad_date_value}")
                      min_date, max_date = None, None # Invalidate date filter on parse error
 
-        # D. 로컬 캐시에서 조건 검사
-        filtered = []
-        for row in self.cached_manager_data_1month:
-            # (1) 동 필터
-            if all_selected_dongs:
-                row_dong = row.get("dong","").strip()
-                if row_dong not in all_selected_dongs: continue
-            # (2) 업종 필터 (리스트 직접 사용)
-            # if splitted_biz: # 삭제
-            if self.selected_biz_types:
-                bm_list = row.get("biz_manager_list", [])
-                # found_any = any((bm.get("biz","") in splitted_biz) for bm in bm_list) # 삭제
-                found_any = any((bm.get("biz","") in self.selected_biz_types) for bm in bm_list)
-                if not found_any: continue
-            # (3) 날짜 필터 (ad_start_date)
-            if min_date and max_date:
-                ad_str = row.get("ad_start_date","").strip()
-                if not ad_str: continue
-                try: 
-                     ad_date_obj = datetime.strptime(ad_str.split(" ")[0], "%Y-%m-%d").date()
-                except ValueError: 
-                     # print(f" [FILTER] Excluding parse error ad_start_date='{ad_str}'") # Too verbose
-                     continue
-                if ad_date_obj < min_date or ad_date_obj > max_date: continue
-            filtered.append(row)
+        # D. 로컬 캐시에서 조건 검사 (컬럼 저장소 마스크 연산)
+        store = self._get_manager_column_store(self.cached_manager_data_1month)
+        filtered = store.filter(
+            dongs=all_selected_dongs,
+            biz_types=self.selected_biz_types,
+            min_date=min_date,
+            max_date=max_date,
+        )
 
         # E. 테이블(모델) 갱신 - Sorting handled in populate method
         self.populate_check_manager_table(filtered, append=False) # Populate with filtered data
@@ -1,6 +1,7 @@
 import logging
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import Qt
+from columnar_table_model import Column, field, pair, address_text
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,50 @@ class ManagerTableMixin:
         else:
             return type_value
     
+    def build_manager_columns(self, headers):
+        """헤더 순서대로 ColumnarTableModel 컬럼 정의 (표시값은 행이 그려질 때 계산)"""
+        def matched_biz(row):
+            biz_manager_list = row.get("biz_manager_list") or []
+            return "; ".join(bm.get("biz", "") for bm in biz_manager_list if bm.get("biz", ""))
+
+        def rooms_baths(row):
+            rooms = row.get("rooms", 0) or 0
+            baths = row.get("baths", 0) or 0
+            return f"{rooms}/{baths}" if rooms or baths else None  # 둘 다 없으면 빈 칸
+
+        texts = {
+            "타입": lambda row: self.format_type_string(row.get("type", ""), row.get("verification_method", "")),
+            "주소": address_text,
+            "호": field("ho"),
+            "층": pair("curr_floor", "total_floor"),
+            "보증금/월세": pair("deposit", "monthly"),
+            "관리비": field("manage_fee"),
+            "권리금": field("premium"),
+            "현업종": field("current_use"),
+            "평수": field("area"),
+            "연락처": field("owner_phone"),
+            "매물번호": field("naver_property_no"),
+            "제목": field("memo"), # title 대신 memo를 사용합니다
+            "매칭업종": matched_biz,
+            "확인메모": field("check_memo"),
+            "광고등록일": field("ad_start_date"),
+            "주차대수": field("parking"),
+            "용도": field("building_usage"),
+            "사용승인일": field("approval_date"),
+            "방/화장실": rooms_baths,
+            "사진경로": field("photo_path"),
+            "소유자명": field("owner_name"),
+            "관계": field("owner_relation"),
+        }
+        address_roles = {
+            QtCore.Qt.UserRole + 2: lambda row: "네이버", # Source indication
+            QtCore.Qt.UserRole + 3: lambda row: row.get("shop_id"), # PK
+            QtCore.Qt.UserRole + 8: lambda row: (row.get("lat", ""), row.get("lng", "")), # Geo
+            QtCore.Qt.UserRole + 9: lambda row: {"naver": row.get("naver_property_no", ""),
+                                                 "serve": row.get("serve_property_no", "")}, # Prop Nos
+        }
+        return [Column(h, texts.get(h), roles=address_roles if h == "주소" else None) for h in headers]
+
     def populate_check_manager_table(self, rows, append=False):
         """Populates the QTableView with data."""
         # Logic from main_app_part5/populate_check_manager_table
@@ -54,188 +99,16 @@ class ManagerTableMixin:
         self.loading_data_flag = True
         
         try:
-            if not append:
-                model.setRowCount(0)
-                
-            old_count = model.rowCount() if append else 0
-            model.setRowCount(old_count + len(rows))
-             
-            # 헤더 확인
-            headers = []
-            try:
-                headers = [model.horizontalHeaderItem(j).text() if model.horizontalHeaderItem(j) else f"col_{j}" 
-                        for j in range(model.columnCount())]
-                self.logger.debug(f"테이블 헤더: {headers}")
-            except AttributeError as e:
-                self.logger.warning(f"헤더 가져오기 실패: {e}")
-                # 기본 헤더 설정 (타입 컬럼 추가)
-                headers = ["타입","주소","호","층","보증금/월세","관리비",
-                    "권리금","현업종","평수","연락처",
-                    "매물번호","제목","매칭업종","확인메모","광고등록일",
-                    "주차대수","용도","사용승인일","방/화장실",
-                    "사진경로","소유자명","관계"]
-                model.setColumnCount(len(headers))
-                model.setHorizontalHeaderLabels(headers)
-                self.logger.info(f"기본 헤더로 재설정: {len(headers)}개 컬럼")
-                 
-            # 열 인덱스 확인
-            header_map = {text: idx for idx, text in enumerate(headers)} 
-            col_type_idx = header_map.get("타입", -1)
-            col_addr_idx = header_map.get("주소", 1)
-            col_ho_idx = header_map.get("호", -1)
-            col_floor_idx = header_map.get("층", -1)
-            col_price_idx = header_map.get("보증금/월세", -1)
-            col_manage_fee_idx = header_map.get("관리비", -1)
-            col_premium_idx = header_map.get("권리금", -1)
-            col_current_use_idx = header_map.get("현업종", -1)
-            col_area_idx = header_map.get("평수", -1)
-            col_contact_idx = header_map.get("연락처", -1)
-            col_prop_no_idx = header_map.get("매물번호", -1)
-            col_title_idx = header_map.get("제목", -1)
-            col_biz_idx = header_map.get("매칭업종", -1)
-            col_check_memo_idx = header_map.get("확인메모", -1)
-            col_ad_start_idx = header_map.get("광고등록일", -1)
-            col_parking_idx = header_map.get("주차대수", -1)
-            col_usage_idx = header_map.get("용도", -1)
-            col_approval_date_idx = header_map.get("사용승인일", -1)
-            col_rooms_idx = header_map.get("방/화장실", -1)
-            col_photo_path_idx = header_map.get("사진경로", -1)
-            col_owner_name_idx = header_map.get("소유자명", -1)
-            col_relation_idx = header_map.get("관계", -1)
-
-            # 배치 크기 설정 (한 번에 처리할 행 수)
-            BATCH_SIZE = 300
-            total_rows = len(rows)
-            batch_count = (total_rows + BATCH_SIZE - 1) // BATCH_SIZE  # 총 배치 수 계산
-            
-            # 상태바에 진행 상황 표시
-            self.parent_app.statusBar().showMessage(f"데이터 처리 중... (0/{total_rows}건)", 0)
-            QtWidgets.QApplication.processEvents()  # UI 업데이트
-            
-            # 배치 단위로 데이터 처리
-            for batch_idx in range(batch_count):
-                start_idx = batch_idx * BATCH_SIZE
-                end_idx = min((batch_idx + 1) * BATCH_SIZE, total_rows)
-                
-                # 현재 배치의 행 범위
-                batch_rows = rows[start_idx:end_idx]
-                
-                # 상태바 업데이트
-                self.parent_app.statusBar().showMessage(f"데이터 처리 중... ({end_idx}/{total_rows}건)", 0)
-                
-                # 현재 배치의 데이터 처리
-                for i, row in enumerate(batch_rows):
-                    try:
-                        idx = old_count + start_idx + i
-                        shop_id = row.get("shop_id", None)
-                        lat_ = row.get("lat", "")
-                        lng_ = row.get("lng", "")
-                        naver_no = row.get("naver_property_no","")
-                        serve_no = row.get("serve_property_no","")
-                        addr_str = (row.get("dong","") + " " + row.get("jibun","")).strip()
-                        
-                        # 첫번째와 마지막 행은 디버그 로깅
-                        if i == 0 or i == len(batch_rows) - 1:
-                            self.logger.debug(f"행 {idx} 데이터: addr={addr_str}, shop_id={shop_id}")
-                        
-                        # 타입 컬럼 먼저 설정
-                        if col_type_idx != -1:
-                            type_value = row.get("type", "")
-                            verification_method = row.get("verification_method", "")
-                            type_string = self.format_type_string(type_value, verification_method)
-                            item_type = QtGui.QStandardItem(type_string)
-                            model.setItem(idx, col_type_idx, item_type)
-                        
-                        # 주소 컬럼 설정
-                        if col_addr_idx != -1:
-                            item_addr = QtGui.QStandardItem(addr_str)
-                            item_addr.setData("네이버", QtCore.Qt.UserRole + 2) # Source indication
-                            if shop_id is not None: item_addr.setData(shop_id, QtCore.Qt.UserRole + 3) # PK
-                            item_addr.setData((lat_, lng_), QtCore.Qt.UserRole + 8) # Geo
-                            item_addr.setData({"naver": naver_no, "serve": serve_no}, QtCore.Qt.UserRole + 9) # Prop Nos
-                            model.setItem(idx, col_addr_idx, item_addr)
-                             
-                        # 나머지 열도 있으면 채우기
-                        if col_ho_idx != -1: model.setItem(idx, col_ho_idx, QtGui.QStandardItem(row.get("ho", "")))
-                        if col_floor_idx != -1: 
-                            cf = row.get("curr_floor", 0); tf = row.get("total_floor", 0)
-                            model.setItem(idx, col_floor_idx, QtGui.QStandardItem(f"{cf}/{tf}"))
-                        if col_price_idx != -1:
-                            dep = row.get("deposit", 0); mon = row.get("monthly", 0)
-                            model.setItem(idx, col_price_idx, QtGui.QStandardItem(f"{dep}/{mon}"))
-                        if col_manage_fee_idx != -1: 
-                            manage_fee = row.get("manage_fee", "")
-                            manage_fee_str = "" if manage_fee is None else str(manage_fee)
-                            model.setItem(idx, col_manage_fee_idx, QtGui.QStandardItem(manage_fee_str))
-                        if col_premium_idx != -1: 
-                            premium = row.get("premium", "")
-                            premium_str = "" if premium is None else str(premium)
-                            model.setItem(idx, col_premium_idx, QtGui.QStandardItem(premium_str))
-                        if col_current_use_idx != -1: model.setItem(idx, col_current_use_idx, QtGui.QStandardItem(row.get("current_use", "")))
-                        if col_area_idx != -1: 
-                            area = row.get("area", "")
-                            area_str = "" if area is None else str(area)
-                            model.setItem(idx, col_area_idx, QtGui.QStandardItem(area_str))
-                        if col_contact_idx != -1: model.setItem(idx, col_contact_idx, QtGui.QStandardItem(row.get("owner_phone", "")))
-                        
-                        # 추가적인 필드 처리
-                        if col_prop_no_idx != -1: 
-                            prop_no = row.get("naver_property_no", "")
-                            prop_no_str = "" if prop_no is None else str(prop_no)
-                            model.setItem(idx, col_prop_no_idx, QtGui.QStandardItem(prop_no_str))
-                        if col_title_idx != -1: 
-                            # title 대신 memo를 사용합니다
-                            memo = row.get("memo", "")
-                            # None 값 처리
-                            memo_str = "" if memo is None else memo
-                            model.setItem(idx, col_title_idx, QtGui.QStandardItem(memo_str))
-                        
-                        # 매칭업종 처리 (리스트에서 변환)
-                        if col_biz_idx != -1:
-                            biz_manager_list = row.get("biz_manager_list", [])
-                            biz_list = [bm.get("biz", "") for bm in biz_manager_list if bm.get("biz", "")]
-                            model.setItem(idx, col_biz_idx, QtGui.QStandardItem("; ".join(biz_list)))
-                        
-                        if col_check_memo_idx != -1: model.setItem(idx, col_check_memo_idx, QtGui.QStandardItem(row.get("check_memo", "")))
-                        if col_ad_start_idx != -1: model.setItem(idx, col_ad_start_idx, QtGui.QStandardItem(row.get("ad_start_date", "")))
-                        
-                        # 추가 데이터 필드들
-                        if col_parking_idx != -1: 
-                            parking = row.get("parking", "")
-                            # 주차대수 None 값을 빈 문자열로 변환
-                            parking_str = "" if parking is None else str(parking)
-                            model.setItem(idx, col_parking_idx, QtGui.QStandardItem(parking_str))
-                            
-                        if col_usage_idx != -1: model.setItem(idx, col_usage_idx, QtGui.QStandardItem(row.get("building_usage", "")))
-                        if col_approval_date_idx != -1: model.setItem(idx, col_approval_date_idx, QtGui.QStandardItem(row.get("approval_date", "")))
-                        
-                        # 방/화장실 조합
-                        if col_rooms_idx != -1:
-                            rooms = row.get("rooms", 0)
-                            baths = row.get("baths", 0)
-                            # None 값 처리
-                            rooms = 0 if rooms is None else rooms
-                            baths = 0 if baths is None else baths
-                            
-                            if rooms or baths:
-                                room_bath_str = f"{rooms}/{baths}"
-                                model.setItem(idx, col_rooms_idx, QtGui.QStandardItem(room_bath_str))
-                        
-                        if col_photo_path_idx != -1: model.setItem(idx, col_photo_path_idx, QtGui.QStandardItem(row.get("photo_path", "")))
-                        if col_owner_name_idx != -1: model.setItem(idx, col_owner_name_idx, QtGui.QStandardItem(row.get("owner_name", "")))
-                        if col_relation_idx != -1: model.setItem(idx, col_relation_idx, QtGui.QStandardItem(row.get("owner_relation", "")))
-                    except Exception as e:
-                        self.logger.error(f"행 {start_idx + i} 데이터 설정 중 오류: {e}", exc_info=True)
-                        # 오류가 발생해도 다음 행 계속 처리
-                
-                # 각 배치 처리 후 UI 이벤트 처리 허용
-                QtWidgets.QApplication.processEvents()
+            # 칸별 QStandardItem을 만들지 않고 원본 행만 모델에 넘긴다 (보이는 행만 그릴 때 계산)
+            if append:
+                model.append_rows(rows)
+            else:
+                model.set_rows(rows)
 
             self.logger.info(f"populate_check_manager_table 완료: {len(rows)}개 행 로드됨")
             
             # 완료 메시지
             self.parent_app.statusBar().showMessage(f"데이터 처리 완료: {len(rows)}건", 3000)
-            QtWidgets.QApplication.processEvents()
             
             # 정렬 상태 복원 - 테이블 데이터 채운 후 복원
             if hasattr(self, 'saved_sort_state') and self.check_manager_view:
@@ -252,138 +125,7 @@ class ManagerTableMixin:
     def append_rows_to_manager_table(self, new_rows: list):
         """Appends new rows to the manager table view."""
         # Logic moved from main_app_part8/append_rows_to_manager_table
-        model = self.manager_source_model
-        old_count = model.rowCount()
-        add_cnt = len(new_rows)
-        model.setRowCount(old_count + add_cnt)
-        
-        headers = []
-        try:
-            headers = [model.horizontalHeaderItem(j).text() if model.horizontalHeaderItem(j) else f"col_{j}" 
-                       for j in range(model.columnCount())]
-        except AttributeError:
-            print("[WARN] ManagerCheckTab: Could not get headers during append.")
-            headers = []
-            
-        header_map = {text: idx for idx, text in enumerate(headers)} 
-        col_type_idx = header_map.get("타입", -1)
-        col_addr_idx = header_map.get("주소", 1)
-        # 다른 열 인덱스 가져오기
-        col_ho_idx = header_map.get("호", -1)
-        col_floor_idx = header_map.get("층", -1)
-        col_price_idx = header_map.get("보증금/월세", -1)
-        col_manage_fee_idx = header_map.get("관리비", -1)
-        col_premium_idx = header_map.get("권리금", -1)
-        col_current_use_idx = header_map.get("현업종", -1)
-        col_area_idx = header_map.get("평수", -1)
-        col_contact_idx = header_map.get("연락처", -1)
-        col_prop_no_idx = header_map.get("매물번호", -1)
-        col_title_idx = header_map.get("제목", -1)
-        col_biz_idx = header_map.get("매칭업종", -1)
-        col_check_memo_idx = header_map.get("확인메모", -1)
-        col_ad_start_idx = header_map.get("광고등록일", -1)
-        col_parking_idx = header_map.get("주차대수", -1)
-        col_usage_idx = header_map.get("용도", -1)
-        col_approval_date_idx = header_map.get("사용승인일", -1)
-        col_rooms_idx = header_map.get("방/화장실", -1)
-        col_photo_path_idx = header_map.get("사진경로", -1)
-        col_owner_name_idx = header_map.get("소유자명", -1)
-        col_relation_idx = header_map.get("관계", -1)
-
-        for i, row in enumerate(new_rows):
-            idx = old_count + i
-            shop_id = row.get("shop_id", None)
-            lat_ = row.get("lat", "")
-            lng_ = row.get("lng", "")
-            naver_no = row.get("naver_property_no","")
-            serve_no = row.get("serve_property_no","")
-            addr_str = (row.get("dong","") + " " + row.get("jibun","")).strip()
-            
-            # 타입 컬럼 먼저 설정
-            if col_type_idx != -1:
-                type_value = row.get("type", "")
-                verification_method = row.get("verification_method", "")
-                type_string = self.format_type_string(type_value, verification_method)
-                item_type = QtGui.QStandardItem(type_string)
-                model.setItem(idx, col_type_idx, item_type)
-            
-            # 주소 컬럼 설정
-            if col_addr_idx != -1:
-                item_addr = QtGui.QStandardItem(addr_str)
-                item_addr.setData("네이버", QtCore.Qt.UserRole + 2) # Source indication
-                if shop_id is not None: item_addr.setData(shop_id, QtCore.Qt.UserRole + 3) # PK
-                item_addr.setData((lat_, lng_), QtCore.Qt.UserRole + 8) # Geo
-                item_addr.setData({"naver": naver_no, "serve": serve_no}, QtCore.Qt.UserRole + 9) # Prop Nos
-                model.setItem(idx, col_addr_idx, item_addr)
-            
-            if col_ho_idx != -1: model.setItem(idx, col_ho_idx, QtGui.QStandardItem(row.get("ho", "")))
-            if col_floor_idx != -1: 
-                cf = row.get("curr_floor", 0); tf = row.get("total_floor", 0)
-                model.setItem(idx, col_floor_idx, QtGui.QStandardItem(f"{cf}/{tf}"))
-            if col_price_idx != -1:
-                dep = row.get("deposit", 0); mon = row.get("monthly", 0)
-                model.setItem(idx, col_price_idx, QtGui.QStandardItem(f"{dep}/{mon}"))
-            if col_manage_fee_idx != -1: 
-                manage_fee = row.get("manage_fee", "")
-                manage_fee_str = "" if manage_fee is None else str(manage_fee)
-                model.setItem(idx, col_manage_fee_idx, QtGui.QStandardItem(manage_fee_str))
-            if col_premium_idx != -1: 
-                premium = row.get("premium", "")
-                premium_str = "" if premium is None else str(premium)
-                model.setItem(idx, col_premium_idx, QtGui.QStandardItem(premium_str))
-            if col_current_use_idx != -1: model.setItem(idx, col_current_use_idx, QtGui.QStandardItem(row.get("current_use", "")))
-            if col_area_idx != -1: 
-                area = row.get("area", "")
-                area_str = "" if area is None else str(area)
-                model.setItem(idx, col_area_idx, QtGui.QStandardItem(area_str))
-            if col_contact_idx != -1: model.setItem(idx, col_contact_idx, QtGui.QStandardItem(row.get("owner_phone", "")))
-            
-            # 추가적인 필드 처리
-            if col_prop_no_idx != -1: 
-                prop_no = row.get("naver_property_no", "")
-                prop_no_str = "" if prop_no is None else str(prop_no)
-                model.setItem(idx, col_prop_no_idx, QtGui.QStandardItem(prop_no_str))
-            if col_title_idx != -1: 
-                # title 대신 memo를 사용합니다
-                memo = row.get("memo", "")
-                # None 값 처리
-                memo_str = "" if memo is None else memo
-                model.setItem(idx, col_title_idx, QtGui.QStandardItem(memo_str))
-            
-            # 매칭업종 처리 (리스트에서 변환)
-            if col_biz_idx != -1:
-                biz_manager_list = row.get("biz_manager_list", [])
-                biz_list = [bm.get("biz", "") for bm in biz_manager_list if bm.get("biz", "")]
-                model.setItem(idx, col_biz_idx, QtGui.QStandardItem("; ".join(biz_list)))
-            
-            if col_check_memo_idx != -1: model.setItem(idx, col_check_memo_idx, QtGui.QStandardItem(row.get("check_memo", "")))
-            if col_ad_start_idx != -1: model.setItem(idx, col_ad_start_idx, QtGui.QStandardItem(row.get("ad_start_date", "")))
-            
-            # 추가 데이터 필드들
-            if col_parking_idx != -1: 
-                parking = row.get("parking", "")
-                # 주차대수 None 값을 빈 문자열로 변환
-                parking_str = "" if parking is None else str(parking)
-                model.setItem(idx, col_parking_idx, QtGui.QStandardItem(parking_str))
-                
-            if col_usage_idx != -1: model.setItem(idx, col_usage_idx, QtGui.QStandardItem(row.get("building_usage", "")))
-            if col_approval_date_idx != -1: model.setItem(idx, col_approval_date_idx, QtGui.QStandardItem(row.get("approval_date", "")))
-            
-            # 방/화장실 조합
-            if col_rooms_idx != -1:
-                rooms = row.get("rooms", 0)
-                baths = row.get("baths", 0)
-                # None 값 처리
-                rooms = 0 if rooms is None else rooms
-                baths = 0 if baths is None else baths
-                
-                if rooms or baths:
-                    room_bath_str = f"{rooms}/{baths}"
-                    model.setItem(idx, col_rooms_idx, QtGui.QStandardItem(room_bath_str))
-            
-            if col_photo_path_idx != -1: model.setItem(idx, col_photo_path_idx, QtGui.QStandardItem(row.get("photo_path", "")))
-            if col_owner_name_idx != -1: model.setItem(idx, col_owner_name_idx, QtGui.QStandardItem(row.get("owner_name", "")))
-            if col_relation_idx != -1: model.setItem(idx, col_relation_idx, QtGui.QStandardItem(row.get("owner_relation", "")))
+        self.manager_source_model.append_rows(new_rows)
 
     def find_row_by_id(self, pk_id):
          """Finds the row index for a given primary key."""
@@ -0,0 +1,126 @@
+"""
+매물 테이블에 주소 정규화 키 생성 컬럼(addr_key)과 인덱스를 추가하는 마이그레이션
+
+  addr_key = CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ',''))  STORED, INVISIBLE
+  INDEX idx_addr_key (addr_key)
+
+- INVISIBLE 컬럼은 SELECT * / 컬럼 목록 없는 INSERT에서 제외되므로 기존 코드와 GUI 응답에 영향이 없다.
+  (MySQL 8.0.23 미만은 INVISIBLE을 지원하지 않아 일반 컬럼으로 추가한다)
+- 이미 컬럼/인덱스가 있으면 건너뛴다. 완료 후 서버 환경변수 USE_ADDR_KEY_COLUMN=true 설정.
+
+실행: python migrate_addr_key.py          (추가)
+      python migrate_addr_key.py --drop   (되돌리기)
+"""
+import sys
+
+import mysql.connector as mysql
+
+from address_key import ADDR_KEY_COLUMN, ADDR_KEY_INDEX, ADDR_KEY_TABLES
+from settings import DB_NAME, get_db_connection
+
+ADDR_KEY_SQL_EXPR = "CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ',''))"
+MAX_INDEX_CHARS = 768  # InnoDB 인덱스 키 최대 3072 bytes / utf8mb4 4 bytes
+
+
+def column_exists(cursor, table, column):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND COLUMN_NAME=%s",
+        (DB_NAME, table, column),
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def index_exists(cursor, table, index):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.STATISTICS WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND INDEX_NAME=%s",
+        (DB_NAME, table, index),
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def key_length(cursor, table):
+    """dong + jibun 최대 길이 (생성 컬럼 VARCHAR 길이)"""
+    cursor.execute(
+        "SELECT COLUMN_NAME, CHARACTER_MAXIMUM_LENGTH FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s AND COLUMN_NAME IN ('dong', 'jibun')",
+        (DB_NAME, table),
+    )
+    lengths = {name: length or 0 for name, length in cursor.fetchall()}
+    if len(lengths) < 2:
+        return None
+    return sum(lengths.values())
+
+
+def add_addr_key(cursor, table):
+    if not column_exists(cursor, table, ADDR_KEY_COLUMN):
+        length = key_length(cursor, table)
+        if length is None:
+            print(f"⚠️ {table}: dong/jibun 컬럼이 없어 건너뜀")
+            return
+        column_def = f"`{ADDR_KEY_COLUMN}` VARCHAR({length}) GENERATED ALWAYS AS ({ADDR_KEY_SQL_EXPR}) STORED"
+        try:
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def} INVISIBLE")
+            print(f"✅ {table}: {ADDR_KEY_COLUMN} 컬럼 추가 (VARCHAR({length}), INVISIBLE)")
+        except mysql.Error as e:
+            if e.errno != 1064:  # INVISIBLE 미지원(구문 오류) 외에는 그대로 실패
+                raise
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def}")
+            print(f"✅ {table}: {ADDR_KEY_COLUMN} 컬럼 추가 (VARCHAR({length}), INVISIBLE 미지원 → 일반 컬럼)")
+    else:
+        print(f"➖ {table}: {ADDR_KEY_COLUMN} 컬럼 이미 존재")
+
+    if not index_exists(cursor, table, ADDR_KEY_INDEX):
+        length = key_length(cursor, table) or 0
+        prefix = f"({MAX_INDEX_CHARS})" if length > MAX_INDEX_CHARS else ""
+        cursor.execute(f"ALTER TABLE `{table}` ADD INDEX `{ADDR_KEY_INDEX}` (`{ADDR_KEY_COLUMN}`{prefix})")
+        print(f"✅ {table}: {ADDR_KEY_INDEX} 인덱스 추가")
+    else:
+        print(f"➖ {table}: {ADDR_KEY_INDEX} 인덱스 이미 존재")
+
+
+def drop_addr_key(cursor, table):
+    if index_exists(cursor, table, ADDR_KEY_INDEX):
+        cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{ADDR_KEY_INDEX}`")
+        print(f"🗑️ {table}: {ADDR_KEY_INDEX} 인덱스 삭제")
+    if column_exists(cursor, table, ADDR_KEY_COLUMN):
+        cursor.execute(f"ALTER TABLE `{table}` DROP COLUMN `{ADDR_KEY_COLUMN}`")
+        print(f"🗑️ {table}: {ADDR_KEY_COLUMN} 컬럼 삭제")
+
+
+def main():
+    drop = "--drop" in sys.argv[1:]
+    print(f"🚀 addr_key 마이그레이션 {'되돌리기' if drop else '시작'} (DB: {DB_NAME})")
+    print("-" * 50)
+
+    conn = None
+    cursor = None
+    failed = []
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        for table in ADDR_KEY_TABLES:
+            try:
+                if drop:
+                    drop_addr_key(cursor, table)
+                else:
+                    add_addr_key(cursor, table)
+            except mysql.Error as e:
+                failed.append(table)
+                print(f"❌ {table}: {e}")
+    finally:
+        if cursor: cursor.close()
+        if conn: conn.close()
+
+    print("-" * 50)
+    if failed:
+        print(f"❌ 실패한 테이블: {failed}")
+        return 1
+    if not drop:
+        print("🎉 완료 - 서버 환경변수 USE_ADDR_KEY_COLUMN=true 로 설정 후 재시작하세요.")
+    else:
+        print("🎉 되돌리기 완료 - USE_ADDR_KEY_COLUMN=false 로 설정하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+델타 동기화(since 토큰)용 변경 추적 마이그레이션
+
+추적 테이블(change_tracking.TRACKED_TABLES)마다 다음을 추가한다.
+  updated_at  TIMESTAMP(6) INVISIBLE DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)
+  INDEX idx_updated_at (updated_at)
+  trg_<table>_tombstone_del  AFTER DELETE  → row_tombstones에 삭제 행 기록
+  trg_<table>_tombstone_mgr  AFTER UPDATE  → manager가 바뀌면 이전 담당자 기준으로 기록
+그리고 row_tombstones 테이블을 만든다.
+
+- updated_at 추가 시 InnoDB가 테이블을 재구성할 수 있으므로 한가한 시간에 실행한다.
+  기존 행의 updated_at은 마이그레이션 시각이 된다.
+- 트리거 생성에는 TRIGGER 권한(바이너리 로그 사용 시 log_bin_trust_function_creators)이 필요하다.
+- 완료 후 서버 환경변수 USE_CHANGE_TRACKING=true 설정.
+- 보관 기간이 지난 tombstone은 --purge로 정리한다 (매일 cron 등록 권장).
+
+실행: python migrate_change_tracking.py          (추가)
+      python migrate_change_tracking.py --purge  (오래된 tombstone 정리)
+      python migrate_change_tracking.py --drop   (되돌리기)
+"""
+import sys
+
+import mysql.connector as mysql
+
+from change_tracking import TOMBSTONE_TABLE, TRACKED_TABLES, UPDATED_AT_COLUMN, purge_tombstones
+from migrate_addr_key import column_exists, index_exists
+from settings import DB_NAME, DELTA_TOMBSTONE_RETENTION_DAYS, get_db_connection
+
+UPDATED_AT_INDEX = "idx_updated_at"
+
+
+def trigger_names(table):
+    return f"trg_{table}_tombstone_del", f"trg_{table}_tombstone_mgr"
+
+
+def trigger_exists(cursor, name):
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA=%s AND TRIGGER_NAME=%s",
+        (DB_NAME, name),
+    )
+    return cursor.fetchone()[0] > 0
+
+
+def create_tombstone_table(cursor):
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS `{TOMBSTONE_TABLE}` (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            table_name VARCHAR(64) NOT NULL,
+            row_id BIGINT NOT NULL,
+            manager VARCHAR(100) NULL,
+            deleted_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+            KEY idx_tombstone_table_time (table_name, deleted_at)
+        )
+    """)
+    print(f"✅ {TOMBSTONE_TABLE} 테이블 준비")
+
+
+def add_change_tracking(cursor, table):
+    if not column_exists(cursor, table, UPDATED_AT_COLUMN):
+        column_def = (
+            f"`{UPDATED_AT_COLUMN}` TIMESTAMP(6) NOT NULL "
+            "DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)"
+        )
+        try:
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def} INVISIBLE")
+        except mysql.Error as e:
+            if e.errno != 1064:  # INVISIBLE 미지원(구문 오류) 외에는 그대로 실패
+                raise
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def}")
+        print(f"✅ {table}: {UPDATED_AT_COLUMN} 컬럼 추가")
+    else:
+        print(f"➖ {table}: {UPDATED_AT_COLUMN} 컬럼 이미 존재")
+
+    if not index_exists(cursor, table, UPDATED_AT_INDEX):
+        cursor.execute(f"ALTER TABLE `{table}` ADD INDEX `{UPDATED_AT_INDEX}` (`{UPDATED_AT_COLUMN}`)")
+        print(f"✅ {table}: {UPDATED_AT_INDEX} 인덱스 추가")
+    else:
+        print(f"➖ {table}: {UPDATED_AT_INDEX} 인덱스 이미 존재")
+
+    del_trigger, mgr_trigger = trigger_names(table)
+    if not trigger_exists(cursor, del_trigger):
+        cursor.execute(f"""
+            CREATE TRIGGER `{del_trigger}` AFTER DELETE ON `{table}` FOR EACH ROW
+            INSERT INTO `{TOMBSTONE_TABLE}` (table_name, row_id, manager) VALUES ('{table}', OLD.id, OLD.manager)
+        """)
+        print(f"✅ {table}: {del_trigger} 트리거 추가")
+    else:
+        print(f"➖ {table}: {del_trigger} 트리거 이미 존재")
+
+    if not trigger_exists(cursor, mgr_trigger):
+        cursor.execute(f"""
+            CREATE TRIGGER `{mgr_trigger}` AFTER UPDATE ON `{table}` FOR EACH ROW
+            BEGIN
+                IF NOT (OLD.manager <=> NEW.manager) THEN
+                    INSERT INTO `{TOMBSTONE_TABLE}` (table_name, row_id, manager) VALUES ('{table}', OLD.id, OLD.manager);
+                END IF;
+            END
+        """)
+        print(f"✅ {table}: {mgr_trigger} 트리거 추가")
+    else:
+        print(f"➖ {table}: {mgr_trigger} 트리거 이미 존재")
+
+
+def drop_change_tracking(cursor, table):
+    for name in trigger_names(table):
+        if trigger_exists(cursor, name):
+            cursor.execute(f"DROP TRIGGER `{name}`")
+            print(f"🗑️ {table}: {name} 트리거 삭제")
+    if index_exists(cursor, table, UPDATED_AT_INDEX):
+        cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{UPDATED_AT_INDEX}`")
+        print(f"🗑️ {table}: {UPDATED_AT_INDEX} 인덱스 삭제")
+    if column_exists(cursor, table, UPDATED_AT_COLUMN):
+        cursor.execute(f"ALTER TABLE `{table}` DROP COLUMN `{UPDATED_AT_COLUMN}`")
+        print(f"🗑️ {table}: {UPDATED_AT_COLUMN} 컬럼 삭제")
+
+
+def main():
+    args = sys.argv[1:]
+    drop = "--drop" in args
+
+    conn = None
+    cursor = None
+    if "--purge" in args:
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor()
+            deleted = purge_tombstones(cursor)
+            conn.commit()
+            print(f"🧹 {TOMBSTONE_TABLE}: {DELTA_TOMBSTONE_RETENTION_DAYS}일 지난 {deleted}건 삭제")
+            return 0
+        except mysql.Error as e:
+            print(f"❌ tombstone 정리 실패: {e}")
+            return 1
+        finally:
+            if cursor: cursor.close()
+            if conn: conn.close()
+
+    print(f"🚀 변경 추적 마이그레이션 {'되돌리기' if drop else '시작'} (DB: {DB_NAME})")
+    print("-" * 50)
+
+    failed = []
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        if not drop:
+            create_tombstone_table(cursor)
+        for table in TRACKED_TABLES:
+            try:
+                if drop:
+                    drop_change_tracking(cursor, table)
+                else:
+                    add_change_tracking(cursor, table)
+            except mysql.Error as e:
+                failed.append(table)
+                print(f"❌ {table}: {e}")
+        if drop and not failed:
+            cursor.execute(f"DROP TABLE IF EXISTS `{TOMBSTONE_TABLE}`")
+            print(f"🗑️ {TOMBSTONE_TABLE} 테이블 삭제")
+    finally:
+        if cursor: cursor.close()
+        if conn: conn.close()
+
+    print("-" * 50)
+    if failed:
+        print(f"❌ 실패한 테이블: {failed}")
+        return 1
+    if not drop:
+        print("🎉 완료 - 서버 환경변수 USE_CHANGE_TRACKING=true 로 설정 후 재시작하세요.")
+    else:
+        print("🎉 되돌리기 완료 - USE_CHANGE_TRACKING=false 로 설정하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
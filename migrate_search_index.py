@@ -0,0 +1,99 @@
+"""
+통합검색용 ngram FULLTEXT 인덱스 마이그레이션
+
+테이블마다 다음을 추가한다 (addr_key는 migrate_addr_key.py가 먼저 실행되어 있어야 한다).
+  phone_digits  STORED INVISIBLE 생성 컬럼 (owner_phone/lessee_phone에서 '-', ' ', '.' 제거)
+  FULLTEXT ft_search_addr  (addr_key)     WITH PARSER ngram
+  FULLTEXT ft_search_phone (phone_digits) WITH PARSER ngram
+  FULLTEXT ft_search_owner (owner_name)   WITH PARSER ngram
+
+- 첫 FULLTEXT 인덱스 추가 시 InnoDB가 테이블을 재구성하므로 한가한 시간에 실행한다.
+- 서버의 ngram_token_size(기본 2)와 환경변수 NGRAM_TOKEN_SIZE를 맞춘다.
+- 완료 후 서버 환경변수 USE_SEARCH_FULLTEXT=true 설정.
+
+실행: python migrate_search_index.py          (추가)
+      python migrate_search_index.py --drop   (되돌리기, addr_key는 유지)
+"""
+import sys
+
+import mysql.connector as mysql
+
+from address_key import ADDR_KEY_COLUMN
+from migrate_addr_key import column_exists, index_exists
+from search_index import FULLTEXT_INDEXES, PHONE_DIGITS_COLUMN, SEARCH_TABLE_PHONE_COLUMNS, phone_digits_sql
+from settings import DB_NAME, get_db_connection
+
+
+def add_search_index(cursor, table):
+    if not column_exists(cursor, table, ADDR_KEY_COLUMN):
+        raise RuntimeError(f"{ADDR_KEY_COLUMN} 컬럼이 없습니다. migrate_addr_key.py를 먼저 실행하세요.")
+
+    if not column_exists(cursor, table, PHONE_DIGITS_COLUMN):
+        column_def = (
+            f"`{PHONE_DIGITS_COLUMN}` VARCHAR(255) GENERATED ALWAYS AS ({phone_digits_sql(table)}) STORED"
+        )
+        try:
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def} INVISIBLE")
+        except mysql.Error as e:
+            if e.errno != 1064:  # INVISIBLE 미지원(구문 오류) 외에는 그대로 실패
+                raise
+            cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN {column_def}")
+        print(f"✅ {table}: {PHONE_DIGITS_COLUMN} 컬럼 추가")
+    else:
+        print(f"➖ {table}: {PHONE_DIGITS_COLUMN} 컬럼 이미 존재")
+
+    for index_name, column in FULLTEXT_INDEXES.items():
+        if index_exists(cursor, table, index_name):
+            print(f"➖ {table}: {index_name} 인덱스 이미 존재")
+            continue
+        cursor.execute(f"ALTER TABLE `{table}` ADD FULLTEXT INDEX `{index_name}` (`{column}`) WITH PARSER ngram")
+        print(f"✅ {table}: {index_name} ({column}) FULLTEXT 인덱스 추가")
+
+
+def drop_search_index(cursor, table):
+    for index_name in FULLTEXT_INDEXES:
+        if index_exists(cursor, table, index_name):
+            cursor.execute(f"ALTER TABLE `{table}` DROP INDEX `{index_name}`")
+            print(f"🗑️ {table}: {index_name} 인덱스 삭제")
+    if column_exists(cursor, table, PHONE_DIGITS_COLUMN):
+        cursor.execute(f"ALTER TABLE `{table}` DROP COLUMN `{PHONE_DIGITS_COLUMN}`")
+        print(f"🗑️ {table}: {PHONE_DIGITS_COLUMN} 컬럼 삭제")
+
+
+def main():
+    drop = "--drop" in sys.argv[1:]
+    print(f"🚀 통합검색 FULLTEXT 마이그레이션 {'되돌리기' if drop else '시작'} (DB: {DB_NAME})")
+    print("-" * 50)
+
+    conn = None
+    cursor = None
+    failed = []
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        for table in SEARCH_TABLE_PHONE_COLUMNS:
+            try:
+                if drop:
+                    drop_search_index(cursor, table)
+                else:
+                    add_search_index(cursor, table)
+            except (mysql.Error, RuntimeError) as e:
+                failed.append(table)
+                print(f"❌ {table}: {e}")
+    finally:
+        if cursor: cursor.close()
+        if conn: conn.close()
+
+    print("-" * 50)
+    if failed:
+        print(f"❌ 실패한 테이블: {failed}")
+        return 1
+    if not drop:
+        print("🎉 완료 - 서버 환경변수 USE_SEARCH_FULLTEXT=true 로 설정 후 재시작하세요.")
+    else:
+        print("🎉 되돌리기 완료 - USE_SEARCH_FULLTEXT=false 로 설정하세요.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,8 @@ from PyQt5.QtWidgets import (
 )
 
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from websocket_manager import subscribe_changes
+from address_data_store import get_address_store
 
 class MyListCompletedLogic(QObject): # QObject 상속 추가
     dataFetched = pyqtSignal(dict) # 데이터를 전달할 사용자 정의 시그널
@@ -31,11 +33,12 @@ class MyListCompletedLogic(QObject): # QObject 상속 추가
         self.mylist_completed_view = None
         self.mylist_completed_model = None
 
-        # Data Cache (Potentially move to container if shared access needed)
-        self.mylist_completed_dict = {} # Cache: address -> [row_dict, ...]
+        # Data Cache: 계약완료 탭과 같은 공용 주소 캐시(address_data_store) 소스를 본다 (address -> [row_dict, ...])
+        self.mylist_completed_dict = get_address_store().view("completed_deals")
 
         # Timer
         self.mylist_completed_timer = None
+        self.mylist_completed_subscribed = False  # /ws 변경 알림 구독 중이면 주기 타이머 대신 사용
 
         # Tab Widget container
         self.tab_widget = None
@@ -105,6 +108,15 @@ class MyListCompletedLogic(QObject): # QObject 상속 추가
             QtCore.QMetaObject.invokeMethod(self, "start_timer", QtCore.Qt.QueuedConnection)
             return
             
+        # 변경 알림(/ws)을 받을 수 있으면 30초 폴링 대신 completed_deals 변경 시에만 다시 로드
+        if self.mylist_completed_subscribed:
+            return
+        if subscribe_changes(self.parent_app, "completed_deals", self._on_completed_deals_changed):
+            self.mylist_completed_subscribed = True
+            self.logger.debug("Subscribed to completed_deals change notifications instead of 30s timer.")
+            self._auto_reload_mylist_completed_deals_data()
+            return
+
         if not self.mylist_completed_timer:
             self.mylist_completed_timer = QTimer(self.parent_app) # Parent timer to main app
             self.mylist_completed_timer.setInterval(30_000) # 30 seconds
@@ -117,6 +129,10 @@ class MyListCompletedLogic(QObject): # QObject 상속 추가
              # Initial load on start
              self._auto_reload_mylist_completed_deals_data()
 
+    def _on_completed_deals_changed(self, change):
+        """(Main Thread) completed_deals 변경 알림 → 목록 다시 로드"""
+        self._auto_reload_mylist_completed_deals_data()
+
     def load_data(self):
         """데이터 로딩 메서드 - base_container와의 호환성을 위해 추가"""
         self.logger.info("load_data: 계약완료 데이터 로딩 시작")
@@ -254,12 +270,9 @@ class MyListCompletedLogic(QObject): # QObject 상속 추가
             self.logger.info(f"[_process_fetched_data_slot] Successfully received {len(rows)} completed deals rows via signal.")
 
             # --- Update Cache ---
-            self.logger.debug("[_process_fetched_data_slot] Updating internal cache (mylist_completed_dict).")
-            self.mylist_completed_dict = {} # Reset cache
-            for r in rows:
-                addr = f"{r.get('dong','')} {r.get('jibun','')}".strip()
-                self.mylist_completed_dict.setdefault(addr, []).append(r)
-            self.logger.debug(f"[_process_fetched_data_slot] Cache updated with {len(self.mylist_completed_dict)} addresses.")
+            self.logger.debug("[_process_fetched_data_slot] Updating shared cache (completed_deals).")
+            addresses = get_address_store().replace_source("completed_deals", rows)
+            self.logger.debug(f"[_process_fetched_data_slot] Cache updated with {len(addresses)} addresses.")
 
             # --- Update Table Model ---
             self.logger.debug("[_process_fetched_data_slot] Checking for new rows to add to the table model.")
@@ -20,6 +20,7 @@ from PyQt5.QtWidgets import (
 
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
 from dialogs import ImageSlideshowWindow, StatusChangeDialog # Assuming these exist
+from websocket_manager import subscribe_changes
 
 class MyListOneroomLogic:
     def __init__(self, parent_app, container):
@@ -39,6 +40,8 @@ class MyListOneroomLogic:
 
         # State
         self.mylist_oneroom_loading = False
+        self.mylist_oneroom_sync_token = None  # 마지막 응답의 since 토큰 (델타 새로고침용)
+        subscribe_changes(parent_app, "mylist_oneroom", self._on_mylist_oneroom_changed)
 
         # Tab Widget container
         self.tab_widget = None
@@ -155,21 +158,42 @@ class MyListOneroomLogic:
         future = self.parent_app.executor.submit(
             self._bg_load_mylist_oneroom_data,
             self.current_manager,
-            self.current_role
+            self.current_role,
+            self.mylist_oneroom_sync_token
         )
         future.add_done_callback(self._on_mylist_oneroom_data_fetched)
 
-    def _bg_load_mylist_oneroom_data(self, manager, role):
-        """ (Background Thread) Fetches mylist_oneroom data. """
+    def _on_mylist_oneroom_changed(self, change):
+        """ (Main Thread) mylist_oneroom 변경 알림 → since 토큰으로 변경분만 다시 받음 """
+        if not self.mylist_oneroom_sync_token:
+            return  # 변경 추적이 꺼져 있으면 전체 재조회로 편집 중인 모델을 덮지 않는다
+        managers = change.get("managers")
+        if not change.get("resync") and self.current_role != "admin" and managers and self.current_manager not in managers:
+            return
+        if self.mylist_oneroom_loading:
+            QtCore.QTimer.singleShot(1000, lambda: self._on_mylist_oneroom_changed(change))
+            return
+        self.load_data()
+
+    def _bg_load_mylist_oneroom_data(self, manager, role, since=None):
+        """ (Background Thread) Fetches mylist_oneroom data (since 토큰이 있으면 변경분만). """
         url = f"http://{self.server_host}:{self.server_port}/mylist/get_mylist_oneroom_data"
         params = {"manager": manager, "role": role}
+        if since:
+            params["since"] = since
         try:
             resp = requests.get(url, params=params, timeout=10)
             resp.raise_for_status()
             j = resp.json()
             if j.get("status") != "ok":
                 return {"status": "error", "data": [], "message": j.get("message")}
-            return {"status": "ok", "data": j.get("data", [])}
+            return {
+                "status": "ok",
+                "data": j.get("data", []),
+                "delta": bool(j.get("delta")),
+                "deleted": j.get("deleted", []),
+                "token": j.get("token"),
+            }
         except requests.Timeout:
              return {"status": "exception", "message": "Request timed out", "data": []}
         except requests.RequestException as ex:
@@ -222,9 +246,12 @@ class MyListOneroomLogic:
                 else:
                     rows_to_update_map[pk_id] = row
 
-            # Identify rows to remove
-            fetched_ids = set(r.get("id") for r in filtered_rows if r.get("id") is not None)
-            ids_to_remove = current_known_ids - fetched_ids
+            # Identify rows to remove (델타 응답이면 서버가 알려준 삭제 id만)
+            if result.get("delta"):
+                ids_to_remove = current_known_ids & set(result.get("deleted", []))
+            else:
+                fetched_ids = set(r.get("id") for r in filtered_rows if r.get("id") is not None)
+                ids_to_remove = current_known_ids - fetched_ids
             pending_temp_ids = set(p_add.get("temp_id") for p_add in self.container.pending_manager.oneroom_pending.get("added", []))
             ids_currently_in_model_marked_as_pending_add = set()
             for r in range(model.rowCount()):
@@ -277,7 +304,10 @@ class MyListOneroomLogic:
                             print(f"[WARN] MyListOneroomLogic Fetch Callback: Could not find rows to update for IDs: {not_found}")
                     else:
                         print("[WARN] MyListOneroomLogic Fetch Callback: Cannot update, model headers missing.")
+                self.mylist_oneroom_sync_token = result.get("token")
             except Exception as update_err:
+                 # 모델이 서버와 어긋났을 수 있으므로 다음 로드는 전체 조회
+                 self.mylist_oneroom_sync_token = None
                  print(f"[ERROR] MyListOneroomLogic Fetch Callback: Error during model update: {update_err}")
                  QMessageBox.critical(self.parent_app, "UI 업데이트 오류", f"원룸 테이블 업데이트 중 오류 발생:\n{update_err}")
             finally:
@@ -2,12 +2,14 @@
 import time
 import requests
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QStandardItem, QPixmap, QIcon, QColor, QStandardItemModel
+from PyQt5.QtGui import QStandardItem, QPixmap, QIcon, QColor
 from PyQt5.QtWidgets import QMessageBox, QApplication
 import os
 from PyQt5.QtCore import QUrl
 import logging # 로깅 임포트
 from mylist_constants import PENDING_COLOR, RE_AD_BG_COLOR, NEW_AD_BG_COLOR
+from columnar_table_model import ColumnarTableModel, Column
+from thumbnail_service import get_thumbnail_service
 
 logger = logging.getLogger(__name__) # 모듈 레벨 로거
 
@@ -15,12 +17,17 @@ def get_api_endpoint(server_host, server_port):
     """Return the API endpoint for fetching mylist_shop data."""
     return f"http://{server_host}:{server_port}/mylist/get_all_mylist_shop_data"
 
-def bg_load_mylist_shop_data(server_host, server_port, manager, role):
-    """(Background Thread) Fetches mylist_shop data via GET request."""
+def bg_load_mylist_shop_data(server_host, server_port, manager, role, since=None):
+    """
+    (Background Thread) Fetches mylist_shop data via GET request.
+    since: 이전 응답의 token. 주면 서버가 변경분만(delta: true) 돌려줄 수 있다.
+    """
     # print(f"[DEBUG] MyListSangaData: Fetching data for manager={manager}, role={role}")
-    logger.info(f"bg_load_mylist_shop_data: Fetching for manager='{manager}', role='{role}'") # 로그 수정
+    logger.info(f"bg_load_mylist_shop_data: Fetching for manager='{manager}', role='{role}', since='{since}'") # 로그 수정
     url = get_api_endpoint(server_host, server_port)
     params = {"manager": manager, "role": role}
+    if since:
+        params["since"] = since
     try:
         logger.debug(f"bg_load_mylist_shop_data: Sending GET request to {url} with params: {params}") # 로그 추가
         resp = requests.get(url, params=params, timeout=10)
@@ -35,8 +42,14 @@ def bg_load_mylist_shop_data(server_host, server_port, manager, role):
             return {"status": "error", "data": [], "message": j.get('message')}
         # print(f"[DEBUG] MyListSangaData Fetch: Received {len(j.get('data',[]))} rows.")
         data_len = len(j.get('data', []))
-        logger.info(f"bg_load_mylist_shop_data: Successfully fetched {data_len} rows.") # 로그 수정
-        return {"status": "ok", "data": j.get("data", [])}
+        logger.info(f"bg_load_mylist_shop_data: Successfully fetched {data_len} rows (delta={j.get('delta', False)}, deleted={len(j.get('deleted', []))}).") # 로그 수정
+        return {
+            "status": "ok",
+            "data": j.get("data", []),
+            "delta": bool(j.get("delta")),
+            "deleted": j.get("deleted", []),
+            "token": j.get("token"),
+        }
     except requests.Timeout:
         # print("[ERROR] MyListSangaData Fetch Error: Request timed out.")
         logger.error("bg_load_mylist_shop_data: Request timed out.", exc_info=True) # 로그 수정
@@ -127,50 +140,72 @@ def create_shop_item(header_name, cell_value, db_row_data):
 
     return item
 
+def shop_cell_text(header_name, db_row_data, column_map):
+    """Display text of one shop table cell (header name -> DB key via column_map, with combined fields)."""
+    # Map the header (display) name to the expected DB key
+    db_key = column_map.get(header_name, None)
+    raw_value = db_row_data.get(db_key) if db_key else None
+
+    # Special handling for combined fields or specific formatting
+    if header_name == "주소":
+        return f"{db_row_data.get('dong', '')} {db_row_data.get('jibun', '')}".strip()
+    if header_name == "층":
+        return f"{db_row_data.get('curr_floor', 0)}/{db_row_data.get('total_floor', 0)}"
+    if header_name == "보증금/월세":
+        return f"{db_row_data.get('deposit', 0)}/{db_row_data.get('monthly', 0)}"
+    if header_name == "매물번호":
+        return f"{db_row_data.get('naver_property_no', '')}/{db_row_data.get('serve_property_no', '')}"
+    if header_name == "방/화장실":
+        r, b = db_row_data.get("rooms", ""), db_row_data.get("baths", "")
+        return f"방{r}/{b}" if r or b else "" # Changed format slightly
+    if header_name == "재광고":
+        return "재광고" if db_row_data.get("re_ad_yn", "N") == "Y" else "새광고"
+    # Default: use the raw value directly (convert None to empty string)
+    return str(raw_value) if raw_value is not None else ""
+
+def shop_row_background(db_row_data):
+    """Row background based on '재광고' status."""
+    return RE_AD_BG_COLOR if db_row_data.get("re_ad_yn", "N") == "Y" else NEW_AD_BG_COLOR
+
+def build_mylist_shop_model(headers, column_map):
+    """
+    ColumnarTableModel for the shop table: cell text/icon/tooltip are computed when a row is painted,
+    '주소' carries the same UserRole payloads and every cell the row background create_shop_item/update_model_row set.
+    Photo icon/tooltip come from the shared thumbnail service (folder scan + decode off the UI thread).
+    """
+    def folder_path(db_row_data):
+        return db_row_data.get("photo_path", "") or ""
+
+    thumbs = get_thumbnail_service()
+    address_roles = {
+        **thumbs.photo_roles(folder_path, tooltip_fallback=lambda r: shop_cell_text("주소", r, column_map)),
+        Qt.UserRole + 10: folder_path,
+        Qt.UserRole + 1: lambda r: r.get("status_cd", ""), # Status code
+        Qt.UserRole + 3: lambda r: r.get("id"), # DB Primary Key
+    }
+    columns = [
+        Column(h, lambda r, h=h: shop_cell_text(h, r, column_map), roles=address_roles if h == "주소" else None)
+        for h in headers
+    ]
+    model = ColumnarTableModel(columns, row_roles={Qt.BackgroundRole: shop_row_background})
+    if "주소" in headers:
+        thumbs.attach(model, list(headers).index("주소"))
+    return model
+
 def update_model_row(model, row_idx, headers, db_row_data, column_map):
     """Helper function to set items for a single row in the shop model based on DB data."""
-    item0 = None # Keep track of the first item for setting ID etc.
-    for col_idx, header_name in enumerate(headers):
-        # Map the header (display) name to the expected DB key
-        db_key = column_map.get(header_name, None)
-        raw_value = db_row_data.get(db_key) if db_key else None
-
-        # Special handling for combined fields or specific formatting
-        if header_name == "주소":
-            cell_val = f"{db_row_data.get('dong', '')} {db_row_data.get('jibun', '')}".strip()
-        elif header_name == "층":
-            cell_val = f"{db_row_data.get('curr_floor', 0)}/{db_row_data.get('total_floor', 0)}"
-        elif header_name == "보증금/월세":
-            cell_val = f"{db_row_data.get('deposit', 0)}/{db_row_data.get('monthly', 0)}"
-        elif header_name == "매물번호":
-            cell_val = f"{db_row_data.get('naver_property_no', '')}/{db_row_data.get('serve_property_no', '')}"
-        elif header_name == "방/화장실":
-            r, b = db_row_data.get("rooms", ""), db_row_data.get("baths", "")
-            cell_val = f"방{r}/{b}" if r or b else "" # Changed format slightly
-        elif header_name == "재광고":
-            cell_val = "재광고" if db_row_data.get("re_ad_yn", "N") == "Y" else "새광고"
-        elif header_name == "관리비":
-            cell_val = str(raw_value) if raw_value is not None else ""
-        elif header_name == "평수":
-            cell_val = str(raw_value) if raw_value is not None else ""
-        elif header_name == "주차대수":
-            cell_val = str(raw_value) if raw_value is not None else ""
-        elif header_name == "사용승인일":
-            cell_val = str(raw_value) if raw_value is not None else ""
-        elif header_name == "광고종료일":
-            cell_val = str(raw_value) if raw_value is not None else ""
-        else:
-            # Default: use the raw value directly (convert None to empty string)
-            cell_val = str(raw_value) if raw_value is not None else ""
+    if isinstance(model, ColumnarTableModel):
+        # 행 원본만 교체 (이전 칸 값/배경 덮어쓰기는 setItem으로 다시 채우던 것처럼 비워진다)
+        model.replace_row(row_idx, db_row_data)
+        return
 
+    for col_idx, header_name in enumerate(headers):
+        cell_val = shop_cell_text(header_name, db_row_data, column_map)
         item = create_shop_item(header_name, cell_val, db_row_data) # Use helper
         model.setItem(row_idx, col_idx, item)
-        if col_idx == 0:
-            item0 = item # Store the first item (address item)
 
     # Set background color based on '재광고' status AFTER all items are set
-    re_ad_yn = db_row_data.get("re_ad_yn", "N") == "Y"
-    row_bg = RE_AD_BG_COLOR if re_ad_yn else NEW_AD_BG_COLOR
+    row_bg = shop_row_background(db_row_data)
     for c in range(model.columnCount()):
         cell = model.item(row_idx, c)
         if cell:
@@ -187,6 +222,12 @@ def append_mylist_shop_rows(model, headers, row_list, column_map, parent_app=Non
     append_start_time = time.time()
     rows_to_add = len(row_list)
     start_row = model.rowCount()
+
+    if isinstance(model, ColumnarTableModel):
+        # 칸별 아이템 없이 원본 행만 추가 (뷰에 붙은 모델이어도 rowsInserted가 나가도록 시그널은 막지 않는다)
+        model.append_rows(row_list)
+        logger.info(f"append_mylist_shop_rows: Appended {rows_to_add} rows in {time.time() - append_start_time:.3f} seconds.")
+        return
     
     logger.debug(f"append_mylist_shop_rows: Appending {rows_to_add} rows to model starting at row {start_row}.")
 
@@ -248,14 +289,12 @@ def populate_mylist_shop_table(logic_instance, rows):
     view.setSortingEnabled(False)
 
     # 새 모델 생성
-    new_model = QStandardItemModel()
     headers = logic_instance._get_horizontal_headers()
     column_map = getattr(logic_instance.parent_app, 'COLUMN_MAP_MYLIST_SHOP_DISPLAY_TO_DB', {}) 
     parent_app = logic_instance.parent_app
+    new_model = build_mylist_shop_model(headers or [], column_map)
 
-    if headers:
-        new_model.setHorizontalHeaderLabels(headers)
-    else:
+    if not headers:
         logger.warning("populate_mylist_shop_table: Could not get headers for new model.")
 
     try:
@@ -337,6 +376,83 @@ def populate_mylist_shop_table(logic_instance, rows):
             
         logger.info("populate_mylist_shop_table: Finished.")
 
+def merge_mylist_shop_delta(logic_instance, rows, deleted_ids):
+    """
+    델타 응답(추가/수정된 행 + 삭제 id)을 현재 모델에 id 기준으로 반영한다.
+    모델을 새로 만들지 않으므로 갱신 비용이 테이블 크기가 아니라 변경 건수에 비례한다.
+    저장 대기 중인 삭제 행은 다시 살리거나 덮어쓰지 않는다.
+    반영에 실패하면 False (호출 측은 토큰을 버리고 다음에 전체 조회)
+    """
+    model = logic_instance.mylist_shop_model
+    view = logic_instance.mylist_shop_view
+    if not model or not view:
+        logger.error("merge_mylist_shop_delta: Model or view is None.")
+        logic_instance.mylist_shop_loading = False
+        return False
+
+    headers = logic_instance._get_horizontal_headers()
+    column_map = getattr(logic_instance.parent_app, 'COLUMN_MAP_MYLIST_SHOP_DISPLAY_TO_DB', {})
+    pending_deleted = set(logic_instance.container.pending_manager.get_pending_shop_changes().get("deleted", []))
+
+    row_of_id = {}
+    for r in range(model.rowCount()):
+        item0 = model.item(r, 0)
+        record_id = item0.data(Qt.UserRole + 3) if item0 else None
+        if isinstance(record_id, int) and record_id > 0:
+            row_of_id[record_id] = r
+
+    # 모델 갱신으로 생기는 itemChanged는 사용자 편집이 아니므로 on_mylist_shop_item_changed에서 무시
+    logic_instance.mylist_shop_merging = True
+    view.setUpdatesEnabled(False)
+    view_sorting_was_enabled = view.isSortingEnabled()
+    view.setSortingEnabled(False)
+    added, updated, removed = 0, 0, 0
+    try:
+        for r in sorted((row_of_id[i] for i in deleted_ids if i in row_of_id and i not in pending_deleted), reverse=True):
+            model.removeRow(r)
+            removed += 1
+        if removed:
+            row_of_id = {}
+            for r in range(model.rowCount()):
+                item0 = model.item(r, 0)
+                record_id = item0.data(Qt.UserRole + 3) if item0 else None
+                if isinstance(record_id, int) and record_id > 0:
+                    row_of_id[record_id] = r
+
+        new_rows = []
+        for db_row_data in rows:
+            pk_id = db_row_data.get("id")
+            if pk_id is None or pk_id in pending_deleted:
+                continue
+            if pk_id in row_of_id:
+                update_model_row(model, row_of_id[pk_id], headers, db_row_data, column_map)
+                updated += 1
+            else:
+                new_rows.append(db_row_data)
+
+        if new_rows:
+            start_row = model.rowCount()
+            model.insertRows(start_row, len(new_rows))
+            for i, db_row_data in enumerate(new_rows):
+                update_model_row(model, start_row + i, headers, db_row_data, column_map)
+            added = len(new_rows)
+    except Exception as e:
+        logger.error(f"merge_mylist_shop_delta: Error during merge: {e}", exc_info=True)
+        return False
+    finally:
+        logic_instance.mylist_shop_merging = False
+        view.setUpdatesEnabled(True)
+        view.setSortingEnabled(view_sorting_was_enabled)
+        logic_instance.mylist_shop_loading = False
+
+    logger.info(f"merge_mylist_shop_delta: added={added}, updated={updated}, removed={removed}")
+    if (added or updated or removed) and hasattr(logic_instance.container, '_recalculate_manager_summary'):
+        try:
+            logic_instance.container._recalculate_manager_summary()
+        except Exception as summary_e:
+            logger.error(f"merge_mylist_shop_delta: Error during summary recalculation: {summary_e}")
+    return True
+
 def parse_mylist_shop_row(logic_instance, row_idx):
     """Parses a single row from the shop model into a dictionary for DB saving."""
     model = logic_instance.mylist_shop_model
@@ -7,6 +7,7 @@ import logging
 
 from dialogs import ImageSlideshowWindow, SearchDialogForShop, StatusChangeDialog
 from mylist_constants import PENDING_COLOR, RE_AD_BG_COLOR, NEW_AD_BG_COLOR
+from columnar_table_model import ColumnarItem
 
 def on_mylist_shop_item_changed(logic_instance, item: QStandardItem):
     """
@@ -14,12 +15,14 @@ def on_mylist_shop_item_changed(logic_instance, item: QStandardItem):
     Registers pending changes and applies background colors.
     Also updates pending additions for new rows.
     """
+    if getattr(logic_instance, "mylist_shop_merging", False):
+        return  # 서버 델타 반영 중 (사용자 편집 아님)
     # <<< 로그: 함수 진입 확인 >>>
     logic_instance.logger.critical(f"********** ENTERED on_mylist_shop_item_changed **********")
     logger = logic_instance.logger
     try:
         # <<< 로그: 초기 객체 유효성 검사 >>>
-        if not item or not isinstance(item, QStandardItem) or not item.model():
+        if not item or not isinstance(item, (QStandardItem, ColumnarItem)) or not item.model():
             logger.warning(f"[itemChanged] Invalid item or model. Exiting.")
             return
         row = item.row()
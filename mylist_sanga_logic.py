@@ -20,7 +20,7 @@ from mylist_sanga_ui import init_sanga_ui
 # 데이터 관련 임포트
 from mylist_sanga_data import (
     bg_load_mylist_shop_data, get_mylist_shop_known_ids, 
-    populate_mylist_shop_table, append_mylist_shop_rows,
+    populate_mylist_shop_table, append_mylist_shop_rows, merge_mylist_shop_delta,
     update_model_row, parse_mylist_shop_row, build_mylist_shop_rows_for_changes,
     update_mylist_shop_row_id, find_mylist_shop_row_by_id, 
     get_summary_by_manager
@@ -46,6 +46,7 @@ from mylist_sanga_actions import (
 )
 
 from mylist_constants import PENDING_COLOR, RE_AD_BG_COLOR, NEW_AD_BG_COLOR
+from websocket_manager import subscribe_changes
 
 class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 사용 위해)
     model_populated = pyqtSignal() # <<< 모델 업데이트 완료 시그널 추가
@@ -71,6 +72,9 @@ class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 
         # State / Data (Managed by container)
         # self.mylist_shop_pending = container.mylist_shop_pending
         self.mylist_shop_loading = False  # Local loading flag for this tab
+        self.mylist_shop_merging = False  # 델타 반영 중 (itemChanged 무시)
+        self.mylist_shop_sync_token = None  # 마지막 응답의 since 토큰 (델타 새로고침용)
+        subscribe_changes(parent_app, "mylist_shop", self._on_mylist_shop_changed)
 
         # Keep track of the container widget created by this logic class
         self.tab_widget = None
@@ -128,7 +132,8 @@ class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 
             future = self.parent_app.executor.submit(
                 self._bg_load_mylist_shop_data,
                 self.current_manager,
-                self.current_role
+                self.current_role,
+                self.mylist_shop_sync_token
             )
 
             # 결과를 GUI 스레드에서 처리하도록 래핑
@@ -154,9 +159,21 @@ class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 
             self.mylist_shop_loading = False # 에러 발생 시 로딩 플래그 해제
             QMessageBox.warning(self.parent_app, "오류", f"데이터 로딩 작업 시작 중 오류 발생:\n{e}")
 
-    def _bg_load_mylist_shop_data(self, manager, role):
+    def _on_mylist_shop_changed(self, change):
+        """(Main Thread) mylist_shop 변경 알림 → since 토큰으로 변경분만 다시 받아 병합"""
+        if not self.mylist_shop_sync_token:
+            return  # 변경 추적이 꺼져 있으면 전체 재조회로 편집 중인 모델을 덮지 않는다
+        managers = change.get("managers")
+        if not change.get("resync") and self.current_role != "admin" and managers and self.current_manager not in managers:
+            return
+        if self.mylist_shop_loading:
+            QtCore.QTimer.singleShot(1000, lambda: self._on_mylist_shop_changed(change))
+            return
+        self.load_data()
+
+    def _bg_load_mylist_shop_data(self, manager, role, since=None):
         """(Background Thread) Fetches mylist_shop data via GET request."""
-        return bg_load_mylist_shop_data(self.server_host, self.server_port, manager, role)
+        return bg_load_mylist_shop_data(self.server_host, self.server_port, manager, role, since)
 
     def _get_mylist_shop_known_ids(self):
         """Returns a set of all real database IDs currently in the shop model."""
@@ -176,7 +193,13 @@ class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 
             return
 
         try:
-            if result and result.get("status") == "ok":
+            if result and result.get("status") == "ok" and result.get("delta"):
+                fetched_rows = result.get("data", [])
+                deleted_ids = result.get("deleted", [])
+                self.logger.info(f"_process_fetched_data_slot: Received delta ({len(fetched_rows)} changed, {len(deleted_ids)} deleted). Merging.")
+                merged = merge_mylist_shop_delta(self, fetched_rows, deleted_ids)
+                self.mylist_shop_sync_token = result.get("token") if merged else None
+            elif result and result.get("status") == "ok":
                 fetched_rows = result.get("data", [])
                 self.logger.info(f"_process_fetched_data_slot: Received {len(fetched_rows)} rows. Populating table.")
                 
@@ -186,6 +209,7 @@ class MyListSangaLogic(QtCore.QObject): # <<< QObject 상속 추가 (시그널 
                 
                 try:
                     populate_mylist_shop_table(self, fetched_rows)
+                    self.mylist_shop_sync_token = result.get("token")
                     self.logger.info("_process_fetched_data_slot: Table populated.")
                     
                     # 최종 모델 행 수 확인 (populate 후)
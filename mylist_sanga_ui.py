@@ -3,7 +3,6 @@
 import os
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QStandardItemModel
 from PyQt5.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QMenu,
     QMessageBox, QTableView, QAbstractItemView, QHeaderView, QShortcut, QLabel
@@ -12,6 +11,7 @@ from PyQt5.QtWidgets import (
 # Import necessary components from the main logic or other modules if needed
 # Example: from .dialogs import SearchDialogForShop (adjust path as necessary)
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from mylist_sanga_data import build_mylist_shop_model
 
 # 🔥 CRITICAL IMPORT: SangaViewEvents for bottom table update
 from mylist.sanga.events.view_events import SangaViewEvents
@@ -60,12 +60,11 @@ def create_sanga_top_layout(logic_instance):
     return h_layout
 
 def setup_sanga_model_and_view(logic_instance):
-    """Sets up the QStandardItemModel and QTableView for the Sanga tab."""
+    """Sets up the table model (ColumnarTableModel) and QTableView for the Sanga tab."""
     # (A) 모델
-    logic_instance.mylist_shop_model = QStandardItemModel()
     headers_shop = logic_instance._get_horizontal_headers() # Get headers from logic instance
-    logic_instance.mylist_shop_model.setColumnCount(len(headers_shop))
-    logic_instance.mylist_shop_model.setHorizontalHeaderLabels(headers_shop)
+    column_map = getattr(logic_instance.parent_app, 'COLUMN_MAP_MYLIST_SHOP_DISPLAY_TO_DB', {})
+    logic_instance.mylist_shop_model = build_mylist_shop_model(headers_shop, column_map)
     # logic_instance.mylist_shop_model.itemChanged.connect(logic_instance.on_mylist_shop_item_changed)
 
     # (B) 뷰
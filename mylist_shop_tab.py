@@ -13,6 +13,9 @@ from dialogs import ImageSlideshowWindow, EditConfirmMemoDialog, StatusChangeDia
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
 import logging # Add logging import at the top if not present
 from mylist_constants import RE_AD_BG_COLOR, NEW_AD_BG_COLOR # 상수 임포트
+from address_data_store import get_address_store
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
+from websocket_manager import apply_address_change, subscribe_changes
 
 # Inherit from QObject
 class MyListShopTab(QObject):
@@ -28,10 +31,18 @@ class MyListShopTab(QObject):
 
         self.mylist_shop_model = None
         self.mylist_shop_view = None
-        self.mylist_shop_dict = {} # Cache for mylist_shop data by address
+        self.mylist_shop_dict = get_address_store().view("mylist_shop") # 탭 공용 주소 캐시(address_data_store)의 마이리스트 뷰
         self.mylist_shop_timer = None
         self.slider_window = None
         self.is_shutting_down = False  # 종료 상태 플래그 추가
+        # 서버 변경 알림(/ws)이 오면 바뀐 주소의 캐시만 버리고, 보고 있는 주소면 다시 로드
+        subscribe_changes(parent_app, "mylist_shop", self._on_mylist_shop_changed)
+
+    def _on_mylist_shop_changed(self, change):
+        """ (Main Thread) mylist_shop 변경 알림 처리 """
+        if self.is_shutting_down:
+            return
+        apply_address_change(self.parent_app, self.mylist_shop_dict, change, self.filter_and_populate)
 
     def init_tab(self, main_tabs_widget):
         """
@@ -361,18 +372,14 @@ class MyListShopTab(QObject):
         new_rows = result.get("data", [])
         print(f"[INFO] MyListShopTab: Auto-refresh loaded {len(new_rows)} items.")
 
-        # Update cache
-        self.mylist_shop_dict.clear() # Clear before populating cache
-        loaded_addresses_in_batch = set()
-        for row in new_rows:
-            addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-            if addr_str:
-                self.mylist_shop_dict.setdefault(addr_str, []).append(row)
-                loaded_addresses_in_batch.add(addr_str) # Track loaded addresses
-                # --- Add address to parent's set for preloading other tabs --- 
-                if hasattr(self.parent_app, 'new_addresses'):
-                     self.parent_app.new_addresses.add(addr_str)
-                # ---------------------------------------------------------------
+        # Update cache (담당자 목록이라 주소 전체 행은 아니다 - 주소를 고르면 그 주소만 다시 받는다)
+        store = get_address_store()
+        store.clear("mylist_shop") # Clear before populating cache
+        loaded_addresses_in_batch = store.put("mylist_shop", new_rows)
+        # --- Add addresses to parent's set for preloading other tabs --- 
+        if hasattr(self.parent_app, 'new_addresses'):
+            self.parent_app.new_addresses.update(loaded_addresses_in_batch)
+        # ---------------------------------------------------------------
 
         # Log cache status
         cached_addr_count = len(self.mylist_shop_dict)
@@ -425,6 +432,7 @@ class MyListShopTab(QObject):
             target_addresses = [self.parent_app.last_selected_address]
         
         if not target_addresses:
+            get_fetch_scheduler(self.parent_app).cancel("mylist_shop")
             # No address selected, show empty table
             self.logger.info("MyListShopTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
             if not self.is_shutting_down:
@@ -436,43 +444,47 @@ class MyListShopTab(QObject):
         
         # 백그라운드에서 API 호출
         if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-            future = self.parent_app.executor.submit(
-                self._bg_load_mylist_data_for_addresses,
-                target_addresses
-            )
-            future.add_done_callback(self._on_filter_data_loaded)
+            get_fetch_scheduler(self.parent_app).request(
+                "mylist_shop", target_addresses, self._bg_load_mylist_data_for_addresses, self._on_filter_data_loaded,
+                visible=widget_visible(self.mylist_shop_view))
         else:
             self.logger.error("MyListShopTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_mylist_data_for_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 마이리스트 데이터를 실시간 로드합니다. """
+        """
+        (Background Thread) 지정된 주소들의 마이리스트 데이터를 공용 store에서 읽습니다.
+        store에 없거나 TTL이 지난 주소만 API로 받아 채웁니다 (마이리스트는 배치 sources에 없어 전용 API 사용).
+        """
         if not addresses_to_fetch:
             print("[WARN] MyListShopTab _bg_load_mylist_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/mylist/get_mylist_shop_data"
-        payload = {"addresses": addresses_to_fetch}
-        
-        try:
-            print(f"[DEBUG] MyListShopTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}")
-            resp = requests.post(url, json=payload, timeout=20)
-            resp.raise_for_status()
-            j = resp.json()
-            
-            if j.get("status") == "ok":
-                data = j.get("data", [])
-                print(f"[INFO] MyListShopTab: API 응답 성공 - {len(data)}개 항목")
-                return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] MyListShopTab API 응답 오류: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-                
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] MyListShopTab API 요청 실패: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] MyListShopTab 예상치 못한 오류: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        store = get_address_store()
+        missing = store.missing("mylist_shop", addresses_to_fetch)
+        if missing:
+            url = f"http://{self.server_host}:{self.server_port}/mylist/get_mylist_shop_data"
+            payload = {"addresses": missing}
+            try:
+                print(f"[DEBUG] MyListShopTab: API 요청 시작 - {url}, 주소: {missing}")
+                resp = requests.post(url, json=payload, timeout=20)
+                resp.raise_for_status()
+                j = resp.json()
+
+                if j.get("status") != "ok":
+                    print(f"[ERROR] MyListShopTab API 응답 오류: {j}")
+                    return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
+                store.put("mylist_shop", j.get("data", []), addresses=missing)
+
+            except requests.exceptions.RequestException as ex:
+                print(f"[ERROR] MyListShopTab API 요청 실패: {ex}")
+                return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+            except Exception as ex:
+                print(f"[ERROR] MyListShopTab 예상치 못한 오류: {ex}")
+                return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+
+        data = store.rows("mylist_shop", addresses_to_fetch)
+        print(f"[INFO] MyListShopTab: 데이터 준비 완료 - {len(data)}개 항목 (API 조회 주소 {len(missing)}개)")
+        return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
 
     def _on_filter_data_loaded(self, future):
         """ (Main Thread) API 쿼리 결과를 처리하고 테이블을 업데이트합니다. """
@@ -501,15 +513,7 @@ class MyListShopTab(QObject):
         if status == "ok":
             self.logger.info(f"MyListShopTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
             if not self.is_shutting_down:
-                # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-                for row in data:
-                    addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                    if addr_str:
-                        # 기존 데이터를 새 데이터로 교체
-                        self.mylist_shop_dict[addr_str] = self.mylist_shop_dict.get(addr_str, [])
-                        if row not in self.mylist_shop_dict[addr_str]:  # 중복 방지
-                            self.mylist_shop_dict[addr_str].append(row)
-                
+                # 행은 공용 store에 이미 있으므로 AllTab도 get_data_for_address로 같은 데이터를 본다
                 self.populate_mylist_shop_table(data)
                 # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
                 for addr in fetched_addresses:
@@ -626,7 +630,7 @@ class MyListShopTab(QObject):
             self.logger.warning("MyListShopTab.on_mylist_current_changed: Model column count is 0.")
 
     def get_data_for_address(self, addr_str: str) -> list:
-        """ Returns the list of mylist shop items for the given address from the local cache. """
+        """ Returns the list of mylist shop items for the given address from the shared address store. """
         # 종료 상태 확인
         if self.is_shutting_down:
             self.logger.info(f"MyListShopTab: 종료 중이므로 주소 '{addr_str}'에 대한 데이터 요청을 건너뜁니다.")
@@ -2,7 +2,7 @@ import sys
 import os
 import glob
 import requests
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5 import sip  # PyQt5 패키지에 포함된 sip 모듈 사용
 from PyQt5.QtWidgets import (
     QTableView, QAbstractItemView, QHeaderView, QMenu, 
@@ -12,7 +12,12 @@ import concurrent.futures
 import traceback
 from PyQt5.QtCore import pyqtSignal, QObject
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from thumbnail_service import get_thumbnail_service
+from columnar_table_model import ColumnarTableModel, Column, field, pair, address_text, property_numbers
 from dialogs import RecommendDialog, StatusChangeDialog
+from websocket_manager import apply_address_change, subscribe_changes
+from address_data_store import get_address_store, BATCH_SOURCES
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
 
 class RecommendTab(QObject):
     data_loaded_for_address = pyqtSignal(str)
@@ -28,7 +33,10 @@ class RecommendTab(QObject):
         self.recommend_tab_timer = None
         self.loading_data_flag = False
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
-        self.recommend_dict = {} # 추천 매물 캐시
+        # 추천 매물 캐시: 탭 공용 주소 캐시(address_data_store)의 추천 뷰. 고객탭/전체탭이 읽는 parent_app.recommend_dict도 같은 뷰
+        self.recommend_dict = get_address_store().view("recommend")
+        if parent_app is not None:
+            parent_app.recommend_dict = self.recommend_dict
         self.is_shutting_down = False  # 종료 중 플래그
 
     def init_tab(self, main_tabs_widget):
@@ -38,10 +46,9 @@ class RecommendTab(QObject):
         container = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(container)
 
-        self.recommend_tab_model = QtGui.QStandardItemModel()
         headers = self._get_headers() # 헤더 가져오기
-        self.recommend_tab_model.setColumnCount(len(headers))
-        self.recommend_tab_model.setHorizontalHeaderLabels(headers)
+        self.recommend_tab_model = ColumnarTableModel(self._build_columns())
+        get_thumbnail_service().attach(self.recommend_tab_model, 0)
 
         self.recommend_tab_view = QtWidgets.QTableView()
         self.recommend_tab_view.setModel(self.recommend_tab_model)
@@ -82,6 +89,9 @@ class RecommendTab(QObject):
             )
         )
 
+        # 서버 변경 알림(/ws) 구독 - 추천 등록 시 바뀐 주소만 다시 로드
+        subscribe_changes(self.parent_app, "recommend_data", self._on_recommend_changed)
+
         # 타이머 설정 및 시작
         try:
             # 이미 종료 상태인지 확인
@@ -118,6 +128,17 @@ class RecommendTab(QObject):
             import traceback
             print(traceback.format_exc())
 
+    def _on_recommend_changed(self, change):
+        """ (Main Thread) recommend_data 변경 알림 처리 """
+        if self.is_shutting_down:
+            return
+        app_dict = getattr(self.parent_app, 'recommend_dict', None)
+        if isinstance(app_dict, dict) and app_dict is not self.recommend_dict:
+            # AllTab이 읽는 parent_app 쪽 캐시도 같은 주소를 버린다
+            for addr in (change.get("addresses") or ()):
+                app_dict.pop(addr, None)
+        apply_address_change(self.parent_app, self.recommend_dict, change, self.filter_and_populate)
+
     def auto_reload_recommend_tab_data(self):
         """
         타이머에 의해 호출되어 현재 사용자의 모든 추천 매물 데이터를 백그라운드에서 로드.
@@ -225,17 +246,9 @@ class RecommendTab(QObject):
             print("[INFO] RecommendTab: Application is terminating, skipping cache update")
             return
             
-        # Update cache (self.recommend_dict)
-        if not hasattr(self.parent_app, 'recommend_dict') or not isinstance(self.parent_app.recommend_dict, dict):
-            self.parent_app.recommend_dict = {} # Initialize if not exists or wrong type
-        self.parent_app.recommend_dict.clear() 
-        
-        loaded_addresses = set()
-        for row in new_rows:
-            addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-            if addr_str:
-                self.parent_app.recommend_dict.setdefault(addr_str, []).append(row)
-                loaded_addresses.add(addr_str)
+        # Update cache: 전체 목록으로 공용 store의 추천 소스를 교체 (parent_app.recommend_dict는 그 뷰)
+        self.parent_app.recommend_dict = self.recommend_dict
+        loaded_addresses = get_address_store().replace_source("recommend", new_rows)
 
         # Emit signal for each loaded address
         if not self.is_shutting_down:
@@ -299,6 +312,7 @@ class RecommendTab(QObject):
          
          if not target_addresses:
              # No address selected, show empty table
+             get_fetch_scheduler(self.parent_app).cancel("recommend")
              print("[INFO] RecommendTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
              try:
                  self.populate_recommend_tab_view([])
@@ -311,27 +325,35 @@ class RecommendTab(QObject):
          
          # 백그라운드에서 API 호출
          if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-             future = self.parent_app.executor.submit(
-                 self._bg_load_recommend_data_for_addresses,
-                 target_addresses,
-                 filter_params
-             )
-             future.add_done_callback(self._on_filter_data_loaded)
+             # 고객 필터가 있으면 store를 거치지 않으므로(_bg_load_recommend_data_for_addresses) 공용 배치에 넣지 않는다
+             get_fetch_scheduler(self.parent_app).request(
+                 "recommend", target_addresses,
+                 lambda addresses: self._bg_load_recommend_data_for_addresses(addresses, filter_params),
+                 self._on_filter_data_loaded,
+                 sources=() if filter_params else BATCH_SOURCES, visible=widget_visible(self.recommend_tab_view))
          else:
              print("[ERROR] RecommendTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_recommend_data_for_addresses(self, addresses_to_fetch: list, filter_params: dict = None):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 추천 데이터를 실시간 로드합니다. """
+        """
+        (Background Thread) 지정된 주소들의 추천 데이터를 로드합니다.
+        주소만으로 조회하면 공용 store(없는 주소만 배치 API), 고객 필터(matching_biz/manager)가 있으면 추천 API를 직접 호출합니다.
+        """
         if not addresses_to_fetch:
             print("[WARN] RecommendTab _bg_load_recommend_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
+        if not filter_params:
+            result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "recommend", addresses_to_fetch)
+            if result["status"] == "ok":
+                print(f"[INFO] RecommendTab: 데이터 준비 완료 - {len(result['data'])}개 항목")
+            else:
+                print(f"[ERROR] RecommendTab 데이터 로드 실패: {result.get('message')}")
+            return result
+
         url = f"http://{self.server_host}:{self.server_port}/recommend/get_recommend_data"
         payload = {"addresses": addresses_to_fetch}
-        
-        # 필터 파라미터가 있으면 추가
-        if filter_params:
-            payload.update(filter_params)
+        payload.update(filter_params) # 고객 필터
         
         try:
             print(f"[DEBUG] RecommendTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}, 필터: {filter_params}")
@@ -388,15 +410,7 @@ class RecommendTab(QObject):
         if status == "ok":
             print(f"[INFO] RecommendTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
             try:
-                # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-                for row in data:
-                    addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                    if addr_str:
-                        # 기존 데이터를 새 데이터로 교체
-                        self.recommend_dict[addr_str] = self.recommend_dict.get(addr_str, [])
-                        if row not in self.recommend_dict[addr_str]:  # 중복 방지
-                            self.recommend_dict[addr_str].append(row)
-                
+                # 주소만으로 받은 행은 공용 store에 이미 있다 (고객 필터 결과는 부분 집합이라 저장하지 않음)
                 self.populate_recommend_tab_view(data)
                 # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
                 for addr in fetched_addresses:
@@ -431,120 +445,12 @@ class RecommendTab(QObject):
             return
             
         try:
-            m = self.recommend_tab_model
-            m.setRowCount(0)
-            if not rows: return
-
-            headers = self._get_headers()
-            m.setColumnCount(len(headers))
-            m.setHorizontalHeaderLabels(headers)
-            m.setRowCount(len(rows))
+            # 칸은 그려질 때 계산되고, 주소 칸 사진 아이콘/툴팁은 썸네일 서비스가 백그라운드로 준비한다
+            self.recommend_tab_model.set_rows(rows or [])
         except RuntimeError as e:
-            print(f"[INFO] RecommendTab: Could not set up model, likely during shutdown: {e}")
-            return
+            print(f"[INFO] RecommendTab: 테이블 채우는 중 런타임 오류 (종료 중일 수 있음): {e}")
         except Exception as e:
-            print(f"[ERROR] RecommendTab: 테이블 설정 중 오류 발생: {e}")
-            return
-
-        try:
-            # 한 번 더 종료 상태 확인
-            if self.is_shutting_down:
-                print("[INFO] RecommendTab: 종료 중이므로 행 데이터 채우기를 건너뜁니다.")
-                return
-                
-            for i, r in enumerate(rows):
-                # 주기적으로 종료 상태 재확인 (50행마다)
-                if i % 50 == 0 and self.is_shutting_down:
-                    print(f"[INFO] RecommendTab: 종료 중이므로 {i}행까지만 처리하고 중단합니다.")
-                    break
-                
-                # 0) 주소 + 아이콘 + 툴팁 + UserData
-                addr_ = (r.get("dong", "") + " " + r.get("jibun", "")).strip()
-                folder_path = r.get("photo_path", "") or ""
-                rep_img_path = ""
-                if folder_path and os.path.isdir(folder_path): # Check if path is a directory
-                    files = [f for f in os.listdir(folder_path)
-                             if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
-                    if files:
-                        rep_img_path = os.path.join(folder_path, files[0])
-
-                item = QtGui.QStandardItem(addr_)
-                if rep_img_path and os.path.isfile(rep_img_path): # Check if image file exists
-                    pixmap = QtGui.QPixmap(rep_img_path).scaled(
-                        24, 24, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-                    )
-                    icon = QtGui.QIcon(pixmap)
-                    item.setIcon(icon)
-                    file_url = QtCore.QUrl.fromLocalFile(rep_img_path).toString()
-                    html_tooltip = f'<img src="{file_url}" width="200">'
-                    item.setToolTip(html_tooltip)
-                else:
-                    item.setToolTip("")
-
-                # Store data in UserRole
-                item.setData(folder_path, QtCore.Qt.UserRole + 10)
-                item.setData(rep_img_path, QtCore.Qt.UserRole + 11)
-                item.setData("추천", QtCore.Qt.UserRole + 2) # Source identifier
-                item.setData(r.get("id", 0), QtCore.Qt.UserRole + 3) # Primary Key (recommend_id)
-
-                m.setItem(i, 0, item)
-
-                # Populate other columns based on headers
-                m.setItem(i, 1, QtGui.QStandardItem(str(r.get("ho", "")))) # 호
-                cf = r.get("curr_floor", 0)
-                tf = r.get("total_floor", 0)
-                m.setItem(i, 2, QtGui.QStandardItem(f"{cf}/{tf}")) # 층
-                dp = r.get("deposit", 0)
-                mn = r.get("monthly", 0)
-                m.setItem(i, 3, QtGui.QStandardItem(f"{dp}/{mn}")) # 보증금/월세
-                m.setItem(i, 4, QtGui.QStandardItem(str(r.get("manage_fee", "")))) # 관리비
-                m.setItem(i, 5, QtGui.QStandardItem(str(r.get("premium", "")))) # 권리금
-                m.setItem(i, 6, QtGui.QStandardItem(r.get("current_use", ""))) # 현업종
-                m.setItem(i, 7, QtGui.QStandardItem(str(r.get("area", "")))) # 평수
-                m.setItem(i, 8, QtGui.QStandardItem(r.get("owner_phone", ""))) # 연락처
-
-                nav = r.get("naver_property_no", "")
-                srv = r.get("serve_property_no", "")
-                mm_ = f"{nav}/{srv}" if (nav or srv) else ""
-                m.setItem(i, 9, QtGui.QStandardItem(mm_)) # 매물번호
-
-                m.setItem(i, 10, QtGui.QStandardItem(r.get("title", ""))) # 제목
-
-                matching_biz = r.get("matching_biz", "")
-                manager_ = r.get("manager", "")
-                biz_str = f"{matching_biz}({manager_})" if matching_biz and manager_ else matching_biz
-                m.setItem(i, 11, QtGui.QStandardItem(biz_str)) # 매칭업종
-
-                m.setItem(i, 12, QtGui.QStandardItem(r.get("check_memo", ""))) # 확인메모
-
-                # Use recommend_date for the 13th column (광고종료일 in main header, but recommend_date here)
-                m.setItem(i, 13, QtGui.QStandardItem(str(r.get("recommend_date", ""))))
-
-                m.setItem(i, 14, QtGui.QStandardItem(str(r.get("parking", "")))) # 주차대수
-                m.setItem(i, 15, QtGui.QStandardItem(r.get("building_usage", ""))) # 용도
-                m.setItem(i, 16, QtGui.QStandardItem(str(r.get("approval_date", "")))) # 사용승인일
-                rm_ = r.get("rooms", "")
-                bt_ = r.get("baths", "")
-                m.setItem(i, 17, QtGui.QStandardItem(f"{rm_}/{bt_}" if rm_ or bt_ else "")) # 방/화장실
-                m.setItem(i, 18, QtGui.QStandardItem(str(r.get("ad_start_date", "")))) # 광고등록일
-                m.setItem(i, 19, QtGui.QStandardItem(r.get("photo_path", ""))) # 사진경로
-                m.setItem(i, 20, QtGui.QStandardItem(r.get("owner_name", ""))) # 소유자명
-                m.setItem(i, 21, QtGui.QStandardItem(r.get("owner_relation", ""))) # 관계
-                
-                # 주기적으로 이벤트 처리 - 더 자주 UI 업데이트와 이벤트 처리 (10행마다)
-                if i % 10 == 0:
-                    QtWidgets.QApplication.processEvents()
-                    
-                    # UI 처리 중 앱 종료 상태 확인
-                    if self.is_shutting_down:
-                        print(f"[INFO] RecommendTab: 이벤트 처리 중 종료 상태 감지, {i}행까지만 처리하고 중단합니다.")
-                        break
-                        
-        except RuntimeError as e:
-            print(f"[INFO] RecommendTab: 테이블 행 채우는 중 런타임 오류 (종료 중일 수 있음): {e}")
-        except Exception as e:
-            print(f"[ERROR] RecommendTab: 테이블 행 채우는 중 예상치 못한 오류: {e}")
-            import traceback
+            print(f"[ERROR] RecommendTab: 테이블 채우는 중 예상치 못한 오류: {e}")
             print(traceback.format_exc())
 
     def filter_recommend_by_address(self, address_str: str):
@@ -564,11 +470,38 @@ class RecommendTab(QObject):
         # based on self.parent_app.customer_tab.last_selected_biz/manager 
         # if called from a context where that's relevant.
         # For simple unification by address in AllTab, returning all is usually correct.
-        if hasattr(self.parent_app, 'recommend_dict') and isinstance(self.parent_app.recommend_dict, dict):
-             return self.parent_app.recommend_dict.get(addr_str, [])
-        else:
-             print(f"[WARN][RecommendTab] get_data_for_address: parent_app.recommend_dict not found or not a dict.")
-             return []
+        return self.recommend_dict.get(addr_str, [])
+
+    def _build_columns(self):
+        """ _get_headers() 순서의 컬럼 정의 (주소 칸: 사진 아이콘/툴팁 + UserRole 값) """
+        def folder_path(r):
+            return r.get("photo_path", "") or ""
+
+        def matching_biz(r):
+            biz, manager = r.get("matching_biz", ""), r.get("manager", "")
+            return f"{biz}({manager})" if biz and manager else (biz or "")
+
+        def rooms_baths(r):
+            rooms, baths = r.get("rooms", ""), r.get("baths", "")
+            return f"{rooms}/{baths}" if rooms or baths else ""
+
+        address = Column("주소", address_text, roles={
+            **get_thumbnail_service().photo_roles(folder_path),
+            QtCore.Qt.UserRole + 10: folder_path, # Folder path
+            QtCore.Qt.UserRole + 2: lambda r: "추천", # Source identifier
+            QtCore.Qt.UserRole + 3: lambda r: r.get("id", 0), # Primary Key (recommend_id)
+        })
+        texts = {
+            "주소": None, "호": field("ho"), "층": pair("curr_floor", "total_floor"),
+            "보증금/월세": pair("deposit", "monthly"), "관리비": field("manage_fee"),
+            "권리금": field("premium"), "현업종": field("current_use"), "평수": field("area"),
+            "연락처": field("owner_phone"), "매물번호": property_numbers, "제목": field("title"),
+            "매칭업종": matching_biz, "확인메모": field("check_memo"), "추천일": field("recommend_date"),
+            "주차대수": field("parking"), "용도": field("building_usage"), "사용승인일": field("approval_date"),
+            "방/화장실": rooms_baths, "광고등록일": field("ad_start_date"), "사진경로": field("photo_path"),
+            "소유자명": field("owner_name"), "관계": field("owner_relation"),
+        }
+        return [address if h == "주소" else Column(h, texts[h]) for h in self._get_headers()]
 
     def _get_headers(self):
         """ Returns the list of headers for the recommend tab. """
@@ -6,9 +6,10 @@ from .mylist import router as mylist_router
 from .completed import router as completed_router
 from .manager import router as manager_router
 from .websocket import router as websocket_router
+from .stats import router as stats_router
 
 __all__ = [
     "auth_router", "customer_router", "shop_router", 
     "recommend_router", "mylist_router", "completed_router", 
-    "manager_router", "websocket_router"
+    "manager_router", "websocket_router", "stats_router"
 ] 
\ No newline at end of file
@@ -1,13 +1,103 @@
-from fastapi import APIRouter, Request
-from settings import get_db_connection
-import logging
+from fastapi import APIRouter, HTTPException, Request
+from settings import get_db_connection, get_db_executor
+from address_key import addr_key_in_clause
+from fast_response import FastJSONResponse, parse_fields, select_list, table_columns
+from single_flight import single_flight
 import asyncio
-import concurrent.futures
+import logging
 import time
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# 조회할 테이블 정의 (테이블명, 응답 별칭)
+BATCH_TABLES = [
+    ("serve_shop_data", "serve_shop"),
+    ("mylist_shop", "mylist_shop"),
+    ("serve_oneroom_data", "serve_oneroom"),
+    ("recommend_data", "recommend"),
+    ("completed_deals", "completed_deals"),
+    ("naver_shop_check_confirm", "check_confirm")
+]
+
+def _query_table(cursor, table_name, table_alias, condition, params, requested):
+    try:
+        # ⏱️ 1. 쿼리 준비 및 실행 시간 측정
+        query_start = time.time()
+        
+        # 🚀 fields가 없으면 전체 컬럼(SELECT *), 있으면 이 테이블에 있는 요청 컬럼만
+        columns = select_list(requested, table_columns(cursor, table_name)) if requested else "*"
+        sql = f"SELECT {columns} FROM {table_name} WHERE {condition}"
+        print(f"[⏱️ QUERY] {table_alias}: {sql}")
+        cursor.execute(sql, tuple(params))
+        query_exec_time = time.time() - query_start
+        
+        # ⏱️ 2. 데이터 페치 시간 측정
+        fetch_start = time.time()
+        results = cursor.fetchall()
+        fetch_time = time.time() - fetch_start
+        
+        print(f"[⏱️ TIME] {table_alias}: query={query_exec_time:.3f}s, fetch={fetch_time:.3f}s, total={query_exec_time + fetch_time:.3f}s")
+        print(f"[DEBUG] BatchAPI: {table_alias} 쿼리 완료: {len(results)}개")
+        return results
+        
+    except Exception as e:
+        print(f"[DEBUG] BatchAPI: {table_alias} 쿼리 오류: {e}")
+        logger.error(f"배치 API - {table_alias} 오류: {e}")
+        return []
+
+# 같은 주소 조건 + fields로 동시에 들어온 배치 요청은 한 번만 조회 (파라미터는 호출 측에서 정렬)
+@single_flight("get_all_data_for_addresses")
+def _query_all_tables(address_condition, address_params, requested_fields):
+    # ⏱️ 커넥션 획득 시간 측정 (풀에서 대여, with 종료 시 반납)
+    conn_start = time.time()
+    with get_db_connection() as local_conn:
+        print(f"[⏱️ TIME] 커넥션 획득: {time.time() - conn_start:.3f}s")
+        cursor = local_conn.cursor(dictionary=True)
+        try:
+            return {
+                table_alias: _query_table(cursor, table_name, table_alias, address_condition,
+                                          address_params, requested_fields.get(table_alias))
+                for table_name, table_alias in BATCH_TABLES
+            }
+        finally:
+            cursor.close()
+
+def _tab_loaders():
+    """sources 모드: 별칭 → 탭 전용 엔드포인트와 같은 조회 함수 (같은 행 모양/정렬, 서버 주소 캐시/single-flight 공유)"""
+    from routers.shop import serve_shop_rows, serve_oneroom_rows, _get_all_confirm_with_items
+    from routers.recommend import _get_recommend_data
+    from routers.completed import _get_completed_deals
+    return {
+        "serve_shop": serve_shop_rows,
+        "serve_oneroom": serve_oneroom_rows,
+        "recommend": _get_recommend_data,
+        "completed_deals": _get_completed_deals,
+        "check_confirm": _get_all_confirm_with_items,
+    }
+
+async def _get_tab_sources(addresses, sources):
+    """요청한 탭 소스들을 공유 DB 실행기에서 동시에 조회. 실패한 소스는 빈 목록 + errors[소스]"""
+    loaders = _tab_loaders()
+    unknown = [s for s in sources if s not in loaders]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 sources: {unknown} (가능: {list(loaders)})")
+    body = {"addresses": addresses}
+    executor = get_db_executor()
+    results = await asyncio.gather(*(executor.run(loaders[s], body) for s in sources), return_exceptions=True)
+    data, errors = {}, {}
+    for source, result in zip(sources, results):
+        if isinstance(result, Exception):
+            logger.error(f"배치 API - {source} 오류: {result}")
+            errors[source] = str(getattr(result, "detail", "") or result)
+            data[source] = []
+        else:
+            data[source] = result.get("data", [])
+    response = {"status": "ok", "data": data, "addresses": addresses}
+    if errors:
+        response["errors"] = errors
+    return FastJSONResponse(response)
+
 @router.post("/get_all_data_for_addresses")
 async def get_all_data_for_addresses(request: Request):
     """
@@ -15,7 +105,11 @@ async def get_all_data_for_addresses(request: Request):
     
     Request body:
     {
-        "addresses": ["서구 가장동 42-3", "월평동 294", ...]
+        "addresses": ["서구 가장동 42-3", "월평동 294", ...],
+        "fields": ["id", "dong", "jibun", ...]          (선택: 모든 테이블에 적용, 없는 컬럼은 무시)
+              또는 {"serve_shop": [...], "recommend": [...]}  (선택: 테이블 별칭별)
+        "sources": ["serve_shop", "check_confirm", ...]  (선택: 주면 원본 테이블 대신 각 탭 엔드포인트와
+              같은 행을 돌려준다 - serve_shop/serve_oneroom/recommend/completed_deals/check_confirm, fields 무시)
     }
     
     Response:
@@ -35,6 +129,7 @@ async def get_all_data_for_addresses(request: Request):
     try:
         body = await request.json()
         addresses = body.get("addresses", [])
+        fields = body.get("fields")
         
         print(f"[DEBUG] BatchAPI: 요청 받음")
         print(f"[DEBUG] BatchAPI: 요청 body: {body}")
@@ -46,6 +141,10 @@ async def get_all_data_for_addresses(request: Request):
         if isinstance(addresses, str):
             print(f"[WARNING] BatchAPI: addresses가 문자열입니다. 리스트로 변환합니다.")
             addresses = [addresses]
+
+        # 탭 캐시(클라이언트 AddressDataStore)용: 탭별 엔드포인트 여러 번 대신 한 번에
+        if body.get("sources") is not None:
+            return await _get_tab_sources(addresses, list(body["sources"]))
         
         print(f"[DEBUG] BatchAPI: 최종 주소 목록 ({len(addresses)}개):")
         for i, addr in enumerate(addresses):
@@ -88,17 +187,20 @@ async def get_all_data_for_addresses(request: Request):
         for i, (dong, jibun) in enumerate(parsed_addresses):
             print(f"[DEBUG] BatchAPI:   [{i+1}] '{addresses[i]}' → dong='{dong}', jibun='{jibun}'")
         
-        # 개별 필드 매칭으로 더 정확한 조건 생성
+        # 주소 정규화 키(addr_key) IN 조건 하나로 묶어 인덱스 조회 (주소별 OR 체인 대신)
         address_conditions = []
         address_params = []
         
-        for dong, jibun in parsed_addresses:
-            if jibun:  # jibun이 있는 경우
-                address_conditions.append("(dong = %s AND jibun = %s)")
-                address_params.extend([dong, jibun])
-            else:  # jibun이 없는 경우 (dong만 있는 경우)
-                address_conditions.append("(dong = %s)")
-                address_params.append(dong)
+        # 주소 순서/중복과 무관하게 같은 조건이 되도록 파라미터를 정렬 (single-flight 키가 같아지도록)
+        full_addresses = [f"{dong} {jibun}" for dong, jibun in parsed_addresses if jibun]
+        dong_only = sorted({dong for dong, jibun in parsed_addresses if not jibun and dong})
+        if full_addresses:  # jibun이 있는 경우
+            key_where, key_params = addr_key_in_clause(full_addresses)
+            address_conditions.append(key_where)
+            address_params.extend(sorted(key_params))
+        if dong_only:  # jibun이 없는 경우 (dong만 있는 경우)
+            address_conditions.append(f"dong IN ({','.join(['%s'] * len(dong_only))})")
+            address_params.extend(dong_only)
         
         address_condition = " OR ".join(address_conditions)
         
@@ -122,85 +224,29 @@ async def get_all_data_for_addresses(request: Request):
         parse_time = time.time() - parse_start_time
         print(f"[⏱️ API] 주소 파싱 완료: {parse_time:.3f}초")
         
-        # ⏱️ 병렬 쿼리 시작 시간 측정
+        # ⏱️ 테이블 쿼리 시작 시간 측정
         parallel_start_time = time.time()
-        print(f"[⏱️ API] 병렬 쿼리 시작...")
+        print(f"[⏱️ API] 테이블 쿼리 시작...")
         
-        # 🚀 병렬 처리로 6개 테이블 동시 쿼리
-        print("[DEBUG] BatchAPI: 6개 테이블 병렬 쿼리 시작...")
+        # 🚀 6개 테이블을 풀 커넥션 1개로 연속 조회
+        # - 요청마다 스레드 풀/커넥션 6개를 만들지 않고, 공유 DB 실행기(워커 수 = 전역 동시 DB 작업 상한)에서 실행
+        # - 테이블마다 컬럼 구성이 달라(SELECT *) UNION ALL로 합칠 수 없으므로 같은 커넥션에서 순서대로 실행
+        print("[DEBUG] BatchAPI: 6개 테이블 쿼리 시작 (커넥션 1개)...")
         
         # 테이블별 쿼리 함수 정의 (상세 시간 측정)
-        def query_table(table_name, table_alias, condition, params):
-            local_conn = None
-            try:
-                # ⏱️ 1. 커넥션 생성 시간 측정
-                conn_start = time.time()
-                local_conn = get_db_connection()
-                conn_time = time.time() - conn_start
-                
-                cursor = local_conn.cursor(dictionary=True)
-                
-                # ⏱️ 2. 쿼리 준비 및 실행 시간 측정
-                query_start = time.time()
-                
-                # 🚀 단순화: 모든 테이블에서 전체 컬럼 조회 (SELECT *)
-                sql = f"SELECT * FROM {table_name} WHERE {condition}"
-                print(f"[⏱️ QUERY] {table_alias}: {sql}")
-                cursor.execute(sql, tuple(params))
-                query_exec_time = time.time() - query_start
-                
-                # ⏱️ 3. 데이터 페치 시간 측정
-                fetch_start = time.time()
-                results = cursor.fetchall()
-                fetch_time = time.time() - fetch_start
-                
-                # ⏱️ 전체 시간 계산
-                total_time = conn_time + query_exec_time + fetch_time
-                
-                print(f"[⏱️ TIME] {table_alias}: conn={conn_time:.3f}s, query={query_exec_time:.3f}s, fetch={fetch_time:.3f}s, total={total_time:.3f}s")
-                print(f"[DEBUG] BatchAPI: {table_alias} 쿼리 완료: {len(results)}개")
-                
-                # 🔍 매치된 결과 간단 로깅 (성능 최적화)
-                if results and len(results) > 0:
-                    print(f"[DEBUG] BatchAPI: {table_alias} → {len(results)}개 매치")
-                
-                return table_alias, results
-                
-            except Exception as e:
-                print(f"[DEBUG] BatchAPI: {table_alias} 쿼리 오류: {e}")
-                logger.error(f"배치 API - {table_alias} 오류: {e}")
-                return table_alias, []
-            finally:
-                if local_conn:
-                    local_conn.close()
-        
-        # 병렬 실행을 위한 테이블 정의
-        tables = [
-            ("serve_shop_data", "serve_shop"),
-            ("mylist_shop", "mylist_shop"),
-            ("serve_oneroom_data", "serve_oneroom"),
-            ("recommend_data", "recommend"),
-            ("completed_deals", "completed_deals"),
-            ("naver_shop_check_confirm", "check_confirm")
-        ]
-        
-        # ThreadPoolExecutor로 병렬 처리 (워커 수 최적화)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            # 모든 테이블을 병렬로 쿼리
-            futures = {
-                executor.submit(query_table, table_name, table_alias, address_condition, address_params): table_alias
-                for table_name, table_alias in tables
-            }
-            
-            # 결과 수집
-            result_data = {}
-            for future in concurrent.futures.as_completed(futures):
-                table_alias, data = future.result()
-                result_data[table_alias] = data
+        def table_fields(table_alias):
+            if isinstance(fields, dict):
+                return parse_fields(fields.get(table_alias))
+            return parse_fields(fields)
+
+        # fields 검증은 쿼리 전에 (잘못된 컬럼명이면 400)
+        requested_fields = {table_alias: table_fields(table_alias) for _, table_alias in BATCH_TABLES}
+        
+        result_data = await get_db_executor().run(_query_all_tables, address_condition, address_params, requested_fields)
         
-        # ⏱️ 병렬 쿼리 완료 시간 측정
+        # ⏱️ 테이블 쿼리 완료 시간 측정
         parallel_time = time.time() - parallel_start_time
-        print(f"[⏱️ API] 병렬 쿼리 완료: {parallel_time:.3f}초")
+        print(f"[⏱️ API] 테이블 쿼리 완료: {parallel_time:.3f}초")
         
         # ⏱️ 응답 데이터 생성 시간 측정 시작
         response_start_time = time.time()
@@ -237,8 +283,10 @@ async def get_all_data_for_addresses(request: Request):
         print(f"[⏱️ API] 전체 API 완료: {total_api_time:.3f}초")
         print(f"[⏱️ API] 시간 분석 - 파싱:{parse_time:.3f}s + 쿼리:{parallel_time:.3f}s + 응답:{response_time:.3f}s = 총:{total_api_time:.3f}s")
         
-        return response_data
+        return FastJSONResponse(response_data)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"배치 API 전체 오류: {e}")
         return {
@@ -255,7 +303,7 @@ async def get_all_data_for_addresses(request: Request):
         }
         
     finally:
-        # 병렬 처리에서는 각 스레드가 자체 커넥션을 관리하므로 여기서 추가 정리 불필요
+        # 커넥션은 _query_all_tables의 with 블록에서 풀에 반납되므로 추가 정리 불필요
         pass 
 
 
@@ -1,34 +1,56 @@
 from fastapi import APIRouter, HTTPException, Query, Body, Request
 import mysql.connector as mysql
-from settings import get_db_connection, logger
+from settings import get_db_connection, get_address_cache, get_db_executor, logger
+from address_cache import nulls_low
+from address_key import addr_key_in_clause
+from fast_response import FastJSONResponse, select_list
+from change_tracking import begin_sync, deleted_ids, delta_condition, parse_since, sync_payload
 from models import CompletedDealsPayload # models.py에서 관련 모델 임포트
+from routers.websocket import publish_change
 from datetime import date
 
 router = APIRouter()
 
+# GET /get_completed_deals 조회 컬럼 (fields= 로 일부만 요청 가능)
+COMPLETED_DEALS_LIST_COLUMNS = (
+    "id", "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly",
+    "manage_fee", "premium", "current_use", "area", "rooms", "baths", "building_usage",
+    "parking", "naver_property_no", "serve_property_no", "approval_date", "memo",
+    "manager", "photo_path", "owner_name", "owner_relation", "owner_phone",
+    "lessee_phone", "ad_start_date", "ad_end_date", "lat", "lng", "status_cd",
+)
+
 @router.get("/get_completed_deals")
-async def get_completed_deals_get():
+async def get_completed_deals_get(
+    fields: str = Query("", description="반환할 컬럼 (쉼표 구분, 비우면 전체)"),
+    since: str = Query("", description="이전 응답의 token (주면 그 이후 변경분만 반환)")
+):
     """GET 방식으로 모든 계약완료 데이터 조회 (405 에러 해결)"""
+    columns = select_list(fields, COMPLETED_DEALS_LIST_COLUMNS)
+    since_dt = parse_since(since)
+    return FastJSONResponse(await get_db_executor().run(_get_completed_deals_get, columns, since_dt))
+
+def _get_completed_deals_get(columns, since_dt=None):
     conn = None
+    cursor = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
+        token, since_dt = begin_sync(cursor, since_dt)
+        delta_sql, delta_params = delta_condition(since_dt) if since_dt else ("1=1", [])
         
-        # 모든 계약완료 데이터 조회
-        sql = """
-        SELECT
-          id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
-          manage_fee, premium, current_use, area, rooms, baths, building_usage,
-          parking, naver_property_no, serve_property_no, approval_date, memo,
-          manager, photo_path, owner_name, owner_relation, owner_phone,
-          lessee_phone, ad_start_date, ad_end_date, lat, lng, status_cd
+        # 모든 계약완료 데이터 조회 (since가 있으면 변경분만)
+        sql = f"""
+        SELECT {columns}
         FROM completed_deals
+        WHERE {delta_sql}
         ORDER BY ad_end_date DESC, id DESC
         """
-        cursor.execute(sql)
+        cursor.execute(sql, tuple(delta_params))
         rows = cursor.fetchall()
-        logger.debug(f"GET: Fetched {len(rows)} completed deals.")
-        return {"status": "ok", "data": rows}
+        deleted = deleted_ids(cursor, "completed_deals", since_dt, live_rows=rows) if since_dt else []
+        logger.debug(f"GET: Fetched {len(rows)} completed deals (deleted {len(deleted)}, delta={since_dt is not None}).")
+        return sync_payload(rows, token, since_dt, deleted)
 
     except mysql.Error as e:
         logger.error(f"GET completed deals DB error: {e}")
@@ -42,41 +64,46 @@ async def get_completed_deals_get():
 
 # completed_deals 테이블의 실제 컬럼 목록 (get_completed_deals 쿼리 참고)
 # 'id'는 자동 증가이므로 INSERT 시 명시적으로 포함하지 않음.
-COMPLETED_DEALS_COLUMNS = {
-    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly",
-    "manage_fee", "premium", "current_use", "area", "rooms", "baths", "building_usage",
-    "parking", "naver_property_no", "serve_property_no", "approval_date", "memo",
-    "manager", "photo_path", "owner_name", "owner_relation", "owner_phone",
-    "lessee_phone", "ad_start_date", "ad_end_date", "lat", "lng", "status_cd"
-}
+COMPLETED_DEALS_COLUMNS = set(COMPLETED_DEALS_LIST_COLUMNS) - {"id"}
 
 @router.post("/get_completed_deals")
 async def get_completed_deals(request: Request):
     body = await request.json()
+    return await get_db_executor().run(_get_completed_deals, body)
+
+def _get_completed_deals(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok", "data": []}
         
     conn = None
+    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        placeholders = ",".join(["%s"] * len(address_list))
-        # 컬럼 목록 명시적 지정 및 정렬 순서 확인
-        sql = f"""
-        SELECT
-          id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
-          manage_fee, premium, current_use, area, rooms, baths, building_usage,
-          parking, naver_property_no, serve_property_no, approval_date, memo,
-          manager, photo_path, owner_name, owner_relation, owner_phone,
-          lessee_phone, ad_start_date, ad_end_date, lat, lng, status_cd
-        FROM completed_deals
-        WHERE CONCAT(dong, ' ', jibun) IN ({placeholders})
-        ORDER BY ad_end_date DESC, id DESC # 계약 완료일(ad_end_date) 기준 내림차순 정렬
-        """
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            addr_where, addr_keys = addr_key_in_clause(addresses)
+            # 컬럼 목록 명시적 지정 및 정렬 순서 확인
+            sql = f"""
+            SELECT
+              id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
+              manage_fee, premium, current_use, area, rooms, baths, building_usage,
+              parking, naver_property_no, serve_property_no, approval_date, memo,
+              manager, photo_path, owner_name, owner_relation, owner_phone,
+              lessee_phone, ad_start_date, ad_end_date, lat, lng, status_cd
+            FROM completed_deals
+            WHERE {addr_where}
+            ORDER BY ad_end_date DESC, id DESC # 계약 완료일(ad_end_date) 기준 내림차순 정렬
+            """
+            cursor.execute(sql, tuple(addr_keys))
+            return cursor.fetchall()
+
+        rows = get_address_cache().fetch(
+            "completed_deals", address_list, load,
+            order_rows=lambda rs: rs.sort(key=lambda r: (nulls_low(r["ad_end_date"]), r["id"]), reverse=True),
+        )
         logger.debug(f"Fetched {len(rows)} completed deals.")
         return {"status": "ok", "data": rows}
 
@@ -108,6 +135,7 @@ def add_completed_deals(payload: CompletedDealsPayload):
     conn = None
     cursor = None
     inserted_list = []
+    inserted_addresses = []
     errors = []
 
     try:
@@ -188,6 +216,7 @@ def add_completed_deals(payload: CompletedDealsPayload):
 
                 new_id = cursor.lastrowid
                 inserted_list.append((sid, src, new_id))
+                inserted_addresses.append(f"{completed_data.get('dong')} {completed_data.get('jibun')}")
                 logger.debug(f"Added completed deal from {src}(ID:{sid}) -> completed_deals(ID:{new_id}). Status: '{st_}', Manager: '{manager}'")
 
             except mysql.Error as db_err:
@@ -205,6 +234,10 @@ def add_completed_deals(payload: CompletedDealsPayload):
         else:
              conn.commit()
              logger.info(f"Add completed deals finished successfully. Processed: {len(items)}, Inserted: {len(inserted_list)}")
+        get_address_cache().invalidate("completed_deals", inserted_addresses)
+        if inserted_list:
+            publish_change("completed_deals", ids=[new_id for _, _, new_id in inserted_list],
+                           addresses=inserted_addresses, action="insert", manager=manager)
 
         return {
             "status": "ok",
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException, Request, Query
 import json
 import mysql.connector as mysql
-from settings import get_db_connection, logger # settings.py에서 임포트
+from settings import get_db_connection, get_db_executor, logger # settings.py에서 임포트
+from listing_match_store import rematch_customers, remove_customer_matches
+from change_tracking import begin_sync, deleted_ids, delta_condition, parse_since, sync_payload
+from routers.websocket import publish_change
 # models.py가 필요하면 임포트 (현재 이 파일의 엔드포인트는 사용하지 않음)
 
 router = APIRouter()
@@ -9,12 +12,17 @@ router = APIRouter()
 @router.get("/get_customer_data")
 def get_customer_data(
     manager: str,
-    role: str = Query("manager", description="admin 또는 manager") # Query로 변경
+    role: str = Query("manager", description="admin 또는 manager"), # Query로 변경
+    since: str = Query("", description="이전 응답의 token (주면 그 이후 변경분만 반환)")
 ):
+    since_dt = parse_since(since)
     conn = None
+    cur = None
     try:
         conn = get_db_connection()
         cur = conn.cursor(dictionary=True)
+        token, since_dt = begin_sync(cur, since_dt)
+        delta_sql, delta_params = delta_condition(since_dt) if since_dt else ("1=1", [])
         
         if role.lower() == "admin":
             sql = """
@@ -30,9 +38,10 @@ def get_customer_data(
               real_deposit_monthly, last_contact_date,
               memo_json
             FROM `customer`
+            WHERE {delta_sql}
             ORDER BY id ASC
             """
-            cur.execute(sql)
+            cur.execute(sql.format(delta_sql=delta_sql), tuple(delta_params))
         else:
             sql = """
             SELECT
@@ -59,11 +68,14 @@ def get_customer_data(
             last_contact_date,
             memo_json
             FROM `customer`
-            WHERE manager=%s
+            WHERE manager=%s AND {delta_sql}
             ORDER BY id ASC
             """
-            cur.execute(sql, (manager,))
+            cur.execute(sql.format(delta_sql=delta_sql), (manager, *delta_params))
         rows = cur.fetchall()
+        deleted = []
+        if since_dt:
+            deleted = deleted_ids(cur, "customer", since_dt, None if role.lower() == "admin" else manager, rows)
         
         # 변환 로직 (기존과 동일)
         data = []
@@ -141,7 +153,7 @@ def get_customer_data(
             }
             data.append(row_dict)
             
-        return {"data": data}
+        return sync_payload(data, token, since_dt, deleted)
         
     except mysql.Error as e:
         logger.error(f"Get customer data DB error (manager: {manager}, role: {role}): {e}")
@@ -207,9 +219,11 @@ def add_customer(payload: dict):
             premium_str, biz_type_str, contact_str,
             real_dep_mon, last_contact, memo_json_str, manager
         ))
-        conn.commit()
         id_val = cur.lastrowid
+        rematch_customers(cur, [id_val]) # 매칭 테이블 갱신 (같은 트랜잭션)
+        conn.commit()
         logger.info(f"Added new customer (ID: {id_val}) by manager: {manager}")
+        publish_change("customer", ids=[id_val], action="insert", manager=manager)
         return {"status": "success", "id_val": id_val}
         
     except mysql.Error as e:
@@ -227,6 +241,9 @@ def add_customer(payload: dict):
 @router.post("/update_customer_sheet")
 async def update_customer_sheet(request: Request):
     data = await request.json()
+    return await get_db_executor().run(_update_customer_sheet, data)
+
+def _update_customer_sheet(data):
     cust_id       = data.get("id")
     manager       = data.get("manager")
     gu_list       = data.get("gu_list", [])
@@ -277,8 +294,12 @@ async def update_customer_sheet(request: Request):
         )
         cursor.execute(sql, params)
         affected_rows = cursor.rowcount
+        if affected_rows > 0:
+            rematch_customers(cursor, [cust_id]) # 매칭 테이블 갱신 (같은 트랜잭션)
         conn.commit()
         logger.info(f"Updated customer sheet (ID: {cust_id}) by manager: {manager}. Affected rows: {affected_rows}")
+        if affected_rows > 0:
+            publish_change("customer", ids=[cust_id], manager=manager)
         return {"status": "ok", "affected_rows": affected_rows}
 
     except mysql.Error as e:
@@ -296,6 +317,9 @@ async def update_customer_sheet(request: Request):
 @router.post("/create_blank_customer")
 async def create_blank_customer(request: Request):
     data = await request.json()
+    return await get_db_executor().run(_create_blank_customer, data)
+
+def _create_blank_customer(data):
     manager = data.get("manager", "")
     if not manager:
         raise HTTPException(status_code=400, detail="manager는 필수입니다.")
@@ -328,9 +352,11 @@ async def create_blank_customer(request: Request):
             "", "", "", manager
         )
         cursor.execute(sql, params)
-        conn.commit()
         new_id = cursor.lastrowid
+        rematch_customers(cursor, [new_id]) # 매칭 테이블 갱신 (같은 트랜잭션)
+        conn.commit()
         logger.info(f"Created blank customer (ID: {new_id}) for manager: {manager}")
+        publish_change("customer", ids=[new_id], action="insert", manager=manager)
         return {"status": "ok", "new_id": new_id}
 
     except mysql.Error as e:
@@ -348,6 +374,9 @@ async def create_blank_customer(request: Request):
 @router.post("/delete_customer_row")
 async def delete_customer_row(request: Request):
     data = await request.json()
+    return await get_db_executor().run(_delete_customer_row, data)
+
+def _delete_customer_row(data):
     cust_id = data.get("id")
     if not cust_id:
         raise HTTPException(status_code=400, detail="id가 제공되지 않았습니다.")
@@ -362,9 +391,11 @@ async def delete_customer_row(request: Request):
         sql = "DELETE FROM `customer` WHERE id=%s"
         cursor.execute(sql, (cust_id,))
         affected_rows = cursor.rowcount
+        remove_customer_matches(cursor, [cust_id]) # 매칭 테이블 정리 (같은 트랜잭션)
         conn.commit()
         if affected_rows > 0:
              logger.info(f"Deleted customer row (ID: {cust_id}). Affected rows: {affected_rows}")
+             publish_change("customer", ids=[cust_id], action="delete")
              return {"status": "ok", "deleted_count": affected_rows}
         else:
              logger.warning(f"Attempted to delete customer row (ID: {cust_id}), but no row was found.")
@@ -386,6 +417,9 @@ async def delete_customer_row(request: Request):
 
 @router.post("/delete_customer_data_bulk")
 async def delete_customer_data_bulk(data: dict):
+    return await get_db_executor().run(_delete_customer_data_bulk, data)
+
+def _delete_customer_data_bulk(data):
     manager = data.get("manager")
     role    = data.get("role", "manager")
     ids = data.get("ids", [])
@@ -421,8 +455,11 @@ async def delete_customer_data_bulk(data: dict):
         
         cursor.execute(sql, params)
         deleted_count = cursor.rowcount
+        remove_customer_matches(cursor, valid_ids) # 매칭 테이블 정리 (같은 트랜잭션)
         conn.commit()
         logger.info(f"Bulk deleted {deleted_count} customer(s) (IDs: {valid_ids}) by manager: {manager_log_info}")
+        if deleted_count > 0:
+            publish_change("customer", ids=valid_ids, action="delete", manager=None if role == "admin" else manager)
         return {"status": "success", "deleted_count": deleted_count}
 
     except mysql.Error as e:
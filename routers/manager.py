@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Query
 import mysql.connector as mysql
-from settings import get_db_connection, logger
+from settings import get_db_connection, get_db_executor, logger
 
 router = APIRouter()
 
@@ -31,6 +31,9 @@ def get_managers():
 
 @router.post("/add_manager")
 async def add_manager(data: dict):
+    return await get_db_executor().run(_add_manager, data)
+
+def _add_manager(data):
     # 회원가입 API(/signup)와 기능이 중복되므로, 
     # 이 API를 유지할지, signup API를 사용할지 결정 필요.
     # 여기서는 일단 유지하되, signup처럼 password, role, contact도 받도록 확장 가능.
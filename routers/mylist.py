@@ -1,13 +1,178 @@
 from fastapi import APIRouter, HTTPException, Query, Body, Request
 import mysql.connector as mysql
-from settings import get_db_connection, get_supabase_client, logger
+from settings import get_db_connection, get_address_cache, get_db_executor, get_supabase_client, logger, SUPABASE_BATCH_SIZE
+from address_key import addr_key_in_clause
+from fast_response import FastJSONResponse, parse_fields, select_list, table_columns
+from bulk_write import delete_rows, insert_rows, manager_guard, update_rows, update_values
+from change_tracking import begin_sync, deleted_ids, delta_condition, parse_since, sync_payload
 from models import CopyToMyListPayload # models.py에서 관련 모델 임포트
+from routers.websocket import publish_change
+from single_flight import addresses_key, single_flight
+from supabase_fetch import fetch_all, fetch_many, filter_value
 from typing import List
 import os
 from datetime import datetime, date
 
 router = APIRouter()
 
+# 지원하는 출처 테이블 정의
+COPY_SOURCE_TABLE_MAP = {
+    "원룸": "serve_oneroom_data",
+    "상가": "serve_shop_data",
+    "확인": "naver_shop_check_confirm",
+    "추천": "recommend_data",
+    "네이버": "naver_shop"
+}
+# 대상 테이블 정의
+COPY_TARGET_TABLE_MAP = {
+    "원룸": "mylist_oneroom",
+    "상가": "mylist_shop",
+    "확인": "mylist_shop",
+    "추천": "mylist_shop",
+    "네이버": "mylist_shop"
+}
+# 네이버 또는 추천 출처일 경우 채워 넣는 mylist_shop 컬럼
+COPY_SHOP_COLUMNS = [
+    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor",
+    "deposit", "monthly", "manage_fee", "premium", "current_use",
+    "area", "rooms", "baths", "building_usage", "parking",
+    "naver_property_no", "serve_property_no", "approval_date",
+    "memo", "manager", "photo_path", "owner_name", "owner_relation",
+    "owner_phone", "lessee_phone", "ad_start_date", "ad_end_date",
+    "lat", "lng", "status_cd", "re_ad_yn", "type", "verification_method"
+]
+
+
+def _mylist_insert_data(row, s_, manager, row_memo):
+    """출처 원본 행 → 마이리스트 대상 테이블 INSERT 데이터"""
+    target_table = COPY_TARGET_TABLE_MAP[s_]
+    insert_data = dict(row) # 원본 복사
+    insert_data['manager'] = manager # 담당자 덮어쓰기
+    insert_data['memo'] = row_memo # 메모 덮어쓰기
+    insert_data.pop('id', None) # 원본 id 제거
+
+    # 추천 데이터일 경우 mylist_shop 테이블에 없는 필드들 제거
+    if s_ == "추천":
+        for field in ("property_id", "check_memo", "matching_biz", "source", "recommend_date"):
+            insert_data.pop(field, None)
+
+    # 테이블별 특수 처리
+    if target_table == 'mylist_shop':
+        insert_data['re_ad_yn'] = "Y" if s_ == "상가" else "N"
+        if s_ in ("네이버", "추천"):
+            for col in COPY_SHOP_COLUMNS:
+                 if col not in insert_data:
+                     # 타입에 따른 기본값 설정
+                     if col in ["curr_floor", "total_floor", "deposit", "monthly"]:
+                         insert_data[col] = 0
+                     elif col in ["area", "lat", "lng"]:
+                          insert_data[col] = 0.0
+                     elif col in ["approval_date", "ad_start_date", "ad_end_date"]:
+                          insert_data[col] = None
+                     else:
+                          insert_data[col] = ""  # type, verification_method 포함
+
+    # INSERT 전 None 값 처리
+    if target_table == 'mylist_shop':
+        if insert_data.get("naver_property_no") is None:
+            insert_data["naver_property_no"] = ""
+        if insert_data.get("serve_property_no") is None:
+            insert_data["serve_property_no"] = ""
+        # 값이 NULL이거나 빈 문자열인 경우에만 기본값으로 대체
+        if "manage_fee" in insert_data and (insert_data["manage_fee"] is None or insert_data["manage_fee"] == ""):
+            insert_data["manage_fee"] = "0"  # Supabase에서는 문자열로
+        if "premium" in insert_data and (insert_data["premium"] is None or insert_data["premium"] == ""):
+            insert_data["premium"] = "0"
+    elif target_table == 'mylist_oneroom':
+        if "manage_fee" in insert_data and (insert_data["manage_fee"] is None or insert_data["manage_fee"] == ""):
+            insert_data["manage_fee"] = "0"
+        if "password" in insert_data and (insert_data["password"] is None or insert_data["password"] == ""):
+            insert_data["password"] = "0"
+    return insert_data
+
+
+def copy_items_to_mylist(supabase, items, manager):
+    """
+    출처별로 묶어 in_('id', ...) 한 번으로 원본을 읽고, 대상 테이블/컬럼 구성별로 묶어 한 번에 insert한다.
+    (SUPABASE_BATCH_SIZE 단위로 나눔. 200건 복사가 ~400번 왕복 → 출처/대상 조합당 몇 번)
+    한 묶음 insert가 실패하면 그 묶음만 한 건씩 다시 넣어 항목별 오류를 남긴다.
+    supabase는 postgrest 쿼리 빌더(table/select/in_/insert/execute)를 가진 클라이언트.
+    반환: (inserted_list, errors) - 요청 items 순서
+    """
+    inserted = []  # (요청 순번, (sid, 출처, new_id))
+    failed = []    # (요청 순번, 메시지)
+
+    by_source = {}
+    for idx, obj in enumerate(items):
+        if obj.source not in COPY_SOURCE_TABLE_MAP:
+            failed.append((idx, f"ID={obj.id} => 지원하지 않는 출처 '{obj.source}'"))
+            continue
+        by_source.setdefault(obj.source, []).append((idx, obj))
+
+    # 1. 출처별 원본 일괄 조회 → 2. 변환 후 (대상 테이블, 컬럼 구성)별로 모음
+    by_target = {}
+    for s_, group in by_source.items():
+        source_table = COPY_SOURCE_TABLE_MAP[s_]
+        ids = list(dict.fromkeys(obj.id for _, obj in group))
+        rows_by_id = {}
+        fetch_errors = {}  # 조회 자체가 실패한 id → 예외
+        for start in range(0, len(ids), SUPABASE_BATCH_SIZE):
+            chunk = ids[start:start + SUPABASE_BATCH_SIZE]
+            try:
+                result = supabase.table(source_table).select("*").in_("id", chunk).execute()
+            except Exception as ex2:
+                logger.error(f"Copy to mylist fetch error ({source_table}, {len(chunk)} ids): {ex2}", exc_info=True)
+                fetch_errors.update(dict.fromkeys(chunk, ex2))
+                continue
+            for row in result.data or []:
+                rows_by_id[row.get("id")] = row
+
+        for idx, obj in group:
+            row = rows_by_id.get(obj.id)
+            if row is None:
+                if obj.id in fetch_errors:
+                    failed.append((idx, f"ID={obj.id}, 출처 '{s_}' 처리 중 예외 발생: {fetch_errors[obj.id]}"))
+                else:
+                    failed.append((idx, f"ID={obj.id}, 출처 '{s_}' 원본 없음"))
+                continue
+            try:
+                insert_data = _mylist_insert_data(row, s_, manager, obj.memo or "")
+            except Exception as ex2:
+                failed.append((idx, f"ID={obj.id}, 출처 '{s_}' 처리 중 예외 발생: {ex2}"))
+                continue
+            # PostgREST 다중 insert는 모든 객체의 키가 같아야 한다
+            key = (COPY_TARGET_TABLE_MAP[s_], tuple(sorted(insert_data)))
+            by_target.setdefault(key, []).append((idx, obj, insert_data))
+
+    # 3. 대상 테이블 일괄 insert
+    for (target_table, _), entries in by_target.items():
+        for start in range(0, len(entries), SUPABASE_BATCH_SIZE):
+            chunk = entries[start:start + SUPABASE_BATCH_SIZE]
+            try:
+                result = supabase.table(target_table).insert([data for _, _, data in chunk]).execute()
+                new_rows = result.data or []
+                if len(new_rows) != len(chunk):
+                    raise RuntimeError(f"insert 결과 건수 불일치: {len(new_rows)} != {len(chunk)}")
+                pairs = zip(chunk, new_rows)
+            except Exception as ex2:
+                logger.warning(f"Copy to mylist bulk insert into {target_table} failed ({len(chunk)} rows), retrying one by one: {ex2}")
+                pairs = []
+                for entry in chunk:
+                    idx, obj, data = entry
+                    try:
+                        pairs.append((entry, supabase.table(target_table).insert(data).execute().data[0]))
+                    except Exception as ex3:
+                        failed.append((idx, f"ID={obj.id}, 출처 '{obj.source}' 처리 중 예외 발생: {ex3}"))
+                        logger.error(f"Copy to mylist item error: {ex3}", exc_info=True)
+            for (idx, obj, _), new_row in pairs:
+                inserted.append((idx, (obj.id, obj.source, new_row['id'])))
+        logger.debug(f"Copied {len(entries)} item(s) to {target_table} for manager '{manager}'")
+
+    inserted.sort(key=lambda t: t[0])
+    failed.sort(key=lambda t: t[0])
+    return [v for _, v in inserted], [msg for _, msg in failed]
+
+
 @router.post("/copy_to_mylist")
 def copy_to_mylist(payload: CopyToMyListPayload):
     items = payload.items
@@ -15,123 +180,16 @@ def copy_to_mylist(payload: CopyToMyListPayload):
     if not items:
         raise HTTPException(status_code=400, detail="items가 비어있습니다.")
 
-    # 지원하는 출처 테이블 정의
-    source_table_map = {
-        "원룸": "serve_oneroom_data",
-        "상가": "serve_shop_data",
-        "확인": "naver_shop_check_confirm",
-        "추천": "recommend_data",
-        "네이버": "naver_shop"
-    }
-    # 대상 테이블 정의
-    target_table_map = {
-        "원룸": "mylist_oneroom",
-        "상가": "mylist_shop",
-        "확인": "mylist_shop",
-        "추천": "mylist_shop",
-        "네이버": "mylist_shop"
-    }
-
-    inserted_list = []
-    errors = []
-
     try:
         supabase = get_supabase_client()
-
-        for obj in items:
-            sid = obj.id
-            s_ = obj.source
-            row_memo = obj.memo or ""
-
-            if s_ not in source_table_map:
-                errors.append(f"ID={sid} => 지원하지 않는 출처 '{s_}'")
-                continue
-
-            source_table = source_table_map[s_]
-            target_table = target_table_map[s_]
-
-            try:
-                # 1. 원본 데이터 조회
-                result = supabase.table(source_table).select("*").eq("id", sid).execute()
-                if not result.data:
-                    errors.append(f"ID={sid}, 출처 '{s_}' 원본 없음")
-                    continue
-                
-                row = result.data[0]
-                
-                # 2. 대상 테이블에 맞게 데이터 준비
-                insert_data = dict(row) # 원본 복사
-                insert_data['manager'] = manager # 담당자 덮어쓰기
-                insert_data['memo'] = row_memo # 메모 덮어쓰기
-                insert_data.pop('id', None) # 원본 id 제거
-                
-                # 추천 데이터일 경우 mylist_shop 테이블에 없는 필드들 제거
-                if s_ == "추천":
-                    # 제거할 필드 목록
-                    fields_to_remove = ["property_id", "check_memo", "matching_biz", "source", "recommend_date"]
-                    for field in fields_to_remove:
-                        if field in insert_data:
-                            logger.debug(f"추천 매물 처리: {field} 필드 제거 (ID={sid})")
-                            insert_data.pop(field, None)
-
-                # 테이블별 특수 처리
-                if target_table == 'mylist_shop':
-                    insert_data['re_ad_yn'] = "Y" if s_ == "상가" else "N"
-                    # 네이버 또는 추천 출처일 경우 없는 컬럼 기본값 처리
-                    if s_ in ("네이버", "추천"):
-                        shop_cols = [
-                            "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", 
-                            "deposit", "monthly", "manage_fee", "premium", "current_use", 
-                            "area", "rooms", "baths", "building_usage", "parking", 
-                            "naver_property_no", "serve_property_no", "approval_date", 
-                            "memo", "manager", "photo_path", "owner_name", "owner_relation", 
-                            "owner_phone", "lessee_phone", "ad_start_date", "ad_end_date", 
-                            "lat", "lng", "status_cd", "re_ad_yn", "type", "verification_method"
-                        ]
-                        for col in shop_cols:
-                             if col not in insert_data:
-                                 # 타입에 따른 기본값 설정 (예시)
-                                 if col in ["curr_floor", "total_floor", "deposit", "monthly"]:
-                                     insert_data[col] = 0
-                                 elif col in ["area", "lat", "lng"]:
-                                      insert_data[col] = 0.0
-                                 elif col in ["approval_date", "ad_start_date", "ad_end_date"]:
-                                      insert_data[col] = None
-                                 elif col in ["type", "verification_method"]:
-                                      insert_data[col] = ""  # Supabase에서는 이 컬럼들이 존재
-                                 else:
-                                      insert_data[col] = ""
-                                      
-                # 3. 대상 테이블에 INSERT 전 None 값 처리 추가
-                if target_table == 'mylist_shop':
-                    if insert_data.get("naver_property_no") is None:
-                        insert_data["naver_property_no"] = ""
-                    if insert_data.get("serve_property_no") is None:
-                        insert_data["serve_property_no"] = ""
-                    # 값이 NULL이거나 빈 문자열인 경우에만 기본값으로 대체
-                    if "manage_fee" in insert_data and (insert_data["manage_fee"] is None or insert_data["manage_fee"] == ""):
-                        insert_data["manage_fee"] = "0"  # Supabase에서는 문자열로
-                    if "premium" in insert_data and (insert_data["premium"] is None or insert_data["premium"] == ""):
-                        insert_data["premium"] = "0"
-                # 원룸 테이블에도 관련 필드가 있으면 처리
-                elif target_table == 'mylist_oneroom':
-                    # 원룸 테이블에서는 manage_fee와 password(권리금) 필드가 있다면 null로 설정
-                    if "manage_fee" in insert_data and (insert_data["manage_fee"] is None or insert_data["manage_fee"] == ""):
-                        insert_data["manage_fee"] = "0"
-                    if "password" in insert_data and (insert_data["password"] is None or insert_data["password"] == ""):
-                        insert_data["password"] = "0"
-
-                # 4. Supabase에 INSERT
-                insert_result = supabase.table(target_table).insert(insert_data).execute()
-                new_id = insert_result.data[0]['id']
-                inserted_list.append((sid, s_, new_id))
-                logger.debug(f"Copied item from {s_}(ID:{sid}) to {target_table}(ID:{new_id}) for manager '{manager}'")
-
-            except Exception as ex2:
-                errors.append(f"ID={sid}, 출처 '{s_}' 처리 중 예외 발생: {ex2}")
-                logger.error(f"Copy to mylist item error: {ex2}", exc_info=True)
+        inserted_list, errors = copy_items_to_mylist(supabase, items, manager)
 
         logger.info(f"Copy to mylist completed for manager '{manager}'. Inserted: {len(inserted_list)}, Errors: {len(errors)}")
+        new_ids_by_table = {}
+        for _, s_, new_id in inserted_list:
+            new_ids_by_table.setdefault(COPY_TARGET_TABLE_MAP[s_], []).append(new_id)
+        for target_table, new_ids in new_ids_by_table.items():
+            publish_change(target_table, ids=new_ids, action="insert", manager=manager)
         return {
             "status": "ok",
             "inserted_list": inserted_list,
@@ -146,7 +204,9 @@ def copy_to_mylist(payload: CopyToMyListPayload):
 @router.get("/get_all_mylist_shop_data")
 def get_all_mylist_shop_data(
     manager: str = Query("", description="매니저명"),
-    role: str = Query("manager", description="admin 또는 manager")
+    role: str = Query("manager", description="admin 또는 manager"),
+    fields: str = Query("", description="반환할 컬럼 (쉼표 구분, 비우면 전체)"),
+    since: str = Query("", description="이전 응답의 token (주면 그 이후 변경분만 반환)")
 ):
     # 환경변수로 MySQL vs Supabase 선택
     use_supabase = os.environ.get("USE_SUPABASE_MYLIST_SHOP", "false").lower() == "true"
@@ -156,35 +216,55 @@ def get_all_mylist_shop_data(
     
     if use_supabase:
         logger.info("Supabase 경로로 실행")
-        return get_all_mylist_shop_data_supabase(manager, role)
+        return get_all_mylist_shop_data_supabase(manager, role, fields)
     else:
         logger.info("MySQL 경로로 실행")
-        return get_all_mylist_shop_data_mysql(manager, role)
+        return FastJSONResponse(get_all_mylist_shop_data_mysql(manager, role, fields, since))
 
+# 합쳐진 요청끼리 결과를 공유하므로 Response가 아닌 dict를 돌려준다 (응답 객체는 호출마다 생성)
+@single_flight("get_all_mylist_shop_data")
 def get_all_mylist_shop_data_mysql(
     manager: str = "",
-    role: str = "manager"
+    role: str = "manager",
+    fields: str = "",
+    since: str = ""
 ):
+    since_dt = parse_since(since)
     conn = None
+    cursor = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
         
-        sql = "SELECT * FROM mylist_shop"
+        columns = select_list(fields, table_columns(cursor, "mylist_shop")) if fields else "*"
+        sql = f"SELECT {columns} FROM mylist_shop"
+        where = []
         params = []
         
-        if role.lower() != "admin":
+        is_admin = role.lower() == "admin"
+        if not is_admin:
             if not manager:
                 return {"status": "ok", "data": []}
-            sql += " WHERE manager = %s"
+            where.append("manager = %s")
             params.append(manager)
+
+        token, since_dt = begin_sync(cursor, since_dt)
+        if since_dt:
+            cond, cond_params = delta_condition(since_dt)
+            where.append(cond)
+            params.extend(cond_params)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
             
         sql += " ORDER BY id ASC"
         cursor.execute(sql, tuple(params))
         rows = cursor.fetchall()
-        logger.debug(f"Fetched {len(rows)} mylist_shop items for manager '{manager if role != 'admin' else '(Admin)'}'")
-        return {"status": "ok", "data": rows}
+        deleted = deleted_ids(cursor, "mylist_shop", since_dt, None if is_admin else manager, rows) if since_dt else []
+        logger.debug(f"Fetched {len(rows)} mylist_shop items (deleted {len(deleted)}, delta={since_dt is not None}) for manager '{manager if role != 'admin' else '(Admin)'}'")
+        return sync_payload(rows, token, since_dt, deleted)
 
+    except HTTPException:
+        raise
     except mysql.Error as e:
         logger.error(f"Get all mylist_shop data DB error (manager: {manager}, role: {role}): {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -213,19 +293,31 @@ async def get_mylist_shop_data(request: Request):
 
 async def get_mylist_shop_data_mysql_post(request: Request):
     body = await request.json()
+    return await get_db_executor().run(_get_mylist_shop_data_mysql_post, body)
+
+@single_flight(key=addresses_key)
+def _get_mylist_shop_data_mysql_post(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok", "data": []}
         
     conn = None
+    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        placeholders = ",".join(["%s"] * len(address_list))
-        sql = f"SELECT * FROM mylist_shop WHERE CONCAT(dong, ' ', jibun) IN ({placeholders}) ORDER BY id ASC"
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            
+            addr_where, addr_keys = addr_key_in_clause(addresses)
+            sql = f"SELECT * FROM mylist_shop WHERE {addr_where} ORDER BY id ASC"
+            cursor.execute(sql, tuple(addr_keys))
+            return cursor.fetchall()
+
+        rows = get_address_cache().fetch(
+            "mylist_shop", address_list, load,
+            order_rows=lambda rs: rs.sort(key=lambda r: r["id"]),
+        )
         logger.debug(f"Fetched {len(rows)} mylist_shop items for {len(address_list)} addresses")
         return {"status": "ok", "data": rows}
 
@@ -242,7 +334,8 @@ async def get_mylist_shop_data_mysql_post(request: Request):
 @router.get("/get_mylist_oneroom_data")
 def get_mylist_oneroom_data(
     manager: str = Query("", description="매니저명"),
-    role: str = Query("manager", description="admin 또는 manager")
+    role: str = Query("manager", description="admin 또는 manager"),
+    since: str = Query("", description="이전 응답의 token (주면 그 이후 변경분만 반환)")
 ):
     # 환경변수로 MySQL vs Supabase 선택
     use_supabase = os.environ.get("USE_SUPABASE_MYLIST_ONEROOM", "false").lower() == "true"
@@ -255,30 +348,45 @@ def get_mylist_oneroom_data(
         return get_mylist_oneroom_data_supabase(manager, role)
     else:
         logger.info("MySQL 경로로 실행")
-        return get_mylist_oneroom_data_mysql(manager, role)
+        return get_mylist_oneroom_data_mysql(manager, role, since)
 
+@single_flight("get_mylist_oneroom_data")
 def get_mylist_oneroom_data_mysql(
     manager: str = "",
-    role: str = "manager"
+    role: str = "manager",
+    since: str = ""
 ):
+    since_dt = parse_since(since)
     conn = None
+    cursor = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
         sql = "SELECT * FROM mylist_oneroom"
+        where = []
         params = []
         
-        if role.lower() != "admin":
+        is_admin = role.lower() == "admin"
+        if not is_admin:
             if not manager:
                  return {"status":"ok","data":[]}
-            sql += " WHERE manager = %s"
+            where.append("manager = %s")
             params.append(manager)
+
+        token, since_dt = begin_sync(cursor, since_dt)
+        if since_dt:
+            cond, cond_params = delta_condition(since_dt)
+            where.append(cond)
+            params.extend(cond_params)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
             
         sql += " ORDER BY id ASC"
         cursor.execute(sql, tuple(params))
         rows = cursor.fetchall()
-        logger.debug(f"Fetched {len(rows)} mylist_oneroom items for manager '{manager if role != 'admin' else '(Admin)'}'")
-        return {"status":"ok","data":rows}
+        deleted = deleted_ids(cursor, "mylist_oneroom", since_dt, None if is_admin else manager, rows) if since_dt else []
+        logger.debug(f"Fetched {len(rows)} mylist_oneroom items (deleted {len(deleted)}, delta={since_dt is not None}) for manager '{manager if role != 'admin' else '(Admin)'}'")
+        return sync_payload(rows, token, since_dt, deleted)
 
     except mysql.Error as e:
         logger.error(f"Get mylist_oneroom data DB error (manager: {manager}, role: {role}): {e}")
@@ -293,6 +401,42 @@ def get_mylist_oneroom_data_mysql(
 # update_mylist_oneroom_items 와 update_mylist_shop_items 는 
 # payload 구조가 복잡하고 역할(role) 기반 처리가 필요하므로 여기에 포함합니다.
 
+ONEROOM_INSERT_COLUMNS = (
+    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly", "manage_fee",
+    "in_date", "password", "rooms", "baths", "options", "owner_phone", "building_usage",
+    "naver_property_no", "serve_property_no", "approval_date", "memo", "manager",
+    "photo_path", "owner_name", "owner_relation", "ad_end_date", "lat", "lng",
+    "parking", "area", "status_cd", "type", "verification_method",
+)
+ONEROOM_UPDATABLE_COLUMNS = [
+    "gu","dong","jibun","ho","curr_floor","total_floor","deposit","monthly","manage_fee",
+    "in_date","password","rooms","baths","options","owner_phone","building_usage",
+    "naver_property_no","serve_property_no","approval_date","memo","photo_path",
+    "owner_name","owner_relation","ad_end_date","lat","lng","parking","area","status_cd",
+    "type","verification_method"
+]
+
+
+def _oneroom_insert_values(row_, manager):
+    gu_val=row_.get("gu","");dong=row_.get("dong","");jibun=row_.get("jibun","");ho=row_.get("ho","");
+    mf=row_.get("manage_fee","");ind=row_.get("in_date","");pwd=row_.get("password","");rms=row_.get("rooms","");bth=row_.get("baths","");
+    opts=row_.get("options","");oph=row_.get("owner_phone","");bus=row_.get("building_usage","");nav=row_.get("naver_property_no","");
+    srv=row_.get("serve_property_no","");memo=row_.get("memo","");pp=row_.get("photo_path","");onm=row_.get("owner_name","");
+    orel=row_.get("owner_relation","");pk=row_.get("parking","");scd=row_.get("status_cd","");
+    cf=int(row_.get("curr_floor",0));tf=int(row_.get("total_floor",0));dep=int(row_.get("deposit",0));mon=int(row_.get("monthly",0));
+    lat=float(row_.get("lat",0.0));lng=float(row_.get("lng",0.0));area=float(row_.get("area",0.0));
+    adp=row_.get("approval_date","").strip();adp_d=adp if adp else None;
+    ade=row_.get("ad_end_date","").strip();ade_d=ade if ade else None;
+
+    type_val = row_.get("type", "")
+    verification_method_val = row_.get("verification_method", "")
+
+    return (
+        gu_val,dong,jibun,ho,cf,tf,dep,mon,mf,ind,pwd,rms,bth,opts,oph,bus,nav,srv,
+        adp_d,memo,manager,pp,onm,orel,ade_d,lat,lng,pk,area,scd,type_val,verification_method_val
+    )
+
+
 @router.post("/update_mylist_oneroom_items")
 def update_mylist_oneroom_items(payload: dict = Body(...)):
     manager = payload.get("manager", "")
@@ -309,108 +453,55 @@ def update_mylist_oneroom_items(payload: dict = Body(...)):
     inserted_map = {}
     deleted_count = 0
     updated_count = 0
+    guard_sql, guard_params = manager_guard(role, manager)
 
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # (A) added 처리 (manager 필드 사용)
-        if added_list:
-            sql_insert = """
-            INSERT INTO mylist_oneroom (
-              gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly, manage_fee,
-              in_date, `password`, rooms, baths, `options`, owner_phone, building_usage,
-              naver_property_no, serve_property_no, approval_date, memo, manager,
-              photo_path, owner_name, owner_relation, ad_end_date, lat, lng,
-              parking, area, status_cd, type, verification_method
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """
-            for row_ in added_list:
-                temp_id = row_.get("temp_id")
-                if temp_id is None: continue
-                # ... (기존 값 추출 및 타입 변환 로직) ...
-                gu_val=row_.get("gu","");dong=row_.get("dong","");jibun=row_.get("jibun","");ho=row_.get("ho","");
-                mf=row_.get("manage_fee","");ind=row_.get("in_date","");pwd=row_.get("password","");rms=row_.get("rooms","");bth=row_.get("baths","");
-                opts=row_.get("options","");oph=row_.get("owner_phone","");bus=row_.get("building_usage","");nav=row_.get("naver_property_no","");
-                srv=row_.get("serve_property_no","");memo=row_.get("memo","");pp=row_.get("photo_path","");onm=row_.get("owner_name","");
-                orel=row_.get("owner_relation","");pk=row_.get("parking","");scd=row_.get("status_cd","");
-                cf=int(row_.get("curr_floor",0));tf=int(row_.get("total_floor",0));dep=int(row_.get("deposit",0));mon=int(row_.get("monthly",0));
-                lat=float(row_.get("lat",0.0));lng=float(row_.get("lng",0.0));area=float(row_.get("area",0.0));
-                adp=row_.get("approval_date","").strip();adp_d=adp if adp else None;
-                ade=row_.get("ad_end_date","").strip();ade_d=ade if ade else None;
-                
-                type_val = row_.get("type", "")
-                verification_method_val = row_.get("verification_method", "")
-                
-                vals = (
-                    gu_val,dong,jibun,ho,cf,tf,dep,mon,mf,ind,pwd,rms,bth,opts,oph,bus,nav,srv,
-                    adp_d,memo,manager,pp,onm,orel,ade_d,lat,lng,pk,area,scd,type_val,verification_method_val
-                )
-                try:
-                    cursor.execute(sql_insert, vals)
-                    new_id = cursor.lastrowid
-                    inserted_map[str(temp_id)] = new_id
-                except mysql.Error as insert_err:
-                     logger.error(f"Error inserting added mylist_oneroom (temp_id={temp_id}): {insert_err}")
-                     conn.rollback()
-                     raise HTTPException(status_code=500, detail=f"추가 중 오류: {insert_err}")
+        # (A) added 처리 (manager 필드 사용) - 다중 행 INSERT
+        added_rows = [r for r in added_list if r.get("temp_id") is not None]
+        if added_rows:
+            values = [_oneroom_insert_values(r, manager) for r in added_rows]
+            try:
+                new_ids = insert_rows(cursor, "mylist_oneroom", ONEROOM_INSERT_COLUMNS, values)
+            except (mysql.Error, RuntimeError) as insert_err:
+                 logger.error(f"Error inserting added mylist_oneroom ({len(values)} rows): {insert_err}")
+                 conn.rollback()
+                 raise HTTPException(status_code=500, detail=f"추가 중 오류: {insert_err}")
+            for row_, new_id in zip(added_rows, new_ids):
+                inserted_map[str(row_.get("temp_id"))] = new_id
 
         # (B) deleted 처리 (역할 기반)
         if deleted_list:
             real_ids = [d for d in deleted_list if isinstance(d, int) and d > 0]
-            if real_ids:
-                placeholders = ",".join(["%s"] * len(real_ids))
-                sql_del = f"DELETE FROM mylist_oneroom WHERE id IN ({placeholders})"
-                params = list(real_ids)
-                if role != 'admin':
-                    sql_del += " AND manager = %s"
-                    params.append(manager)
-                try:
-                    cursor.execute(sql_del, tuple(params))
-                    deleted_count = cursor.rowcount
-                except mysql.Error as del_err:
-                     logger.error(f"Error deleting mylist_oneroom items (role={role}, manager={manager}): {del_err}")
-                     conn.rollback()
-                     raise HTTPException(status_code=500, detail=f"삭제 중 오류: {del_err}")
+            try:
+                deleted_count = delete_rows(cursor, "mylist_oneroom", real_ids, guard_sql, guard_params)
+            except mysql.Error as del_err:
+                 logger.error(f"Error deleting mylist_oneroom items (role={role}, manager={manager}): {del_err}")
+                 conn.rollback()
+                 raise HTTPException(status_code=500, detail=f"삭제 중 오류: {del_err}")
 
-        # (C) updated 처리 (역할 기반)
+        # (C) updated 처리 (역할 기반) - 컬럼 조합별 CASE UPDATE
         if updated_list:
-            updatable_cols = [
-                "gu","dong","jibun","ho","curr_floor","total_floor","deposit","monthly","manage_fee",
-                "in_date","password","rooms","baths","options","owner_phone","building_usage",
-                "naver_property_no","serve_property_no","approval_date","memo","photo_path",
-                "owner_name","owner_relation","ad_end_date","lat","lng","parking","area","status_cd",
-                "type","verification_method"
+            updates = [
+                (upd["id"], update_values(upd, ONEROOM_UPDATABLE_COLUMNS))
+                for upd in updated_list
+                if isinstance(upd.get("id"), int) and upd.get("id") > 0
             ]
-            for upd in updated_list:
-                row_id = upd.get("id")
-                if not row_id or not isinstance(row_id, int) or row_id <= 0: continue
-                set_clauses = []
-                set_values  = []
-                for col in updatable_cols:
-                    if col in upd:
-                        val = upd[col]
-                        final_val = str(val).strip() if col in ["approval_date", "ad_end_date"] else val
-                        set_clauses.append(f"`{col}`=%s")
-                        set_values.append(None if final_val == '' and col in ["approval_date", "ad_end_date"] else final_val)
-                if not set_clauses: continue
-
-                sql_update = f"UPDATE mylist_oneroom SET {','.join(set_clauses)} WHERE id=%s"
-                params = list(set_values) + [row_id]
-                if role != 'admin':
-                    sql_update += " AND manager = %s"
-                    params.append(manager)
-                
-                try:
-                    cursor.execute(sql_update, tuple(params))
-                    if cursor.rowcount > 0: updated_count += 1
-                except mysql.Error as upd_err:
-                     logger.error(f"Error updating mylist_oneroom item ID={row_id} (role={role}, manager={manager}): {upd_err}")
-                     conn.rollback()
-                     raise HTTPException(status_code=500, detail=f"수정 중 오류: {upd_err}")
+            try:
+                updated_count = update_rows(cursor, "mylist_oneroom", updates, guard_sql, guard_params)
+            except mysql.Error as upd_err:
+                 logger.error(f"Error updating mylist_oneroom items ({len(updates)} rows, role={role}, manager={manager}): {upd_err}")
+                 conn.rollback()
+                 raise HTTPException(status_code=500, detail=f"수정 중 오류: {upd_err}")
 
         conn.commit()
         logger.info(f"Updated mylist_oneroom: Inserted={len(inserted_map)}, Deleted={deleted_count}, Updated={updated_count} by Manager='{manager}' (Role: {role})")
+        changed_ids = list(inserted_map.values()) + [d for d in deleted_list if isinstance(d, int) and d > 0]
+        changed_ids += [u.get("id") for u in updated_list if isinstance(u.get("id"), int) and u.get("id") > 0]
+        if changed_ids:
+            publish_change("mylist_oneroom", ids=changed_ids, manager=manager or None)
         return {
             "status": "ok",
             "inserted_map": inserted_map,
@@ -427,6 +518,43 @@ def update_mylist_oneroom_items(payload: dict = Body(...)):
         if conn: conn.close()
 
 
+SHOP_INSERT_COLUMNS = (
+    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly", "manage_fee",
+    "premium", "current_use", "area", "rooms", "baths", "building_usage", "parking",
+    "naver_property_no", "serve_property_no", "approval_date", "memo", "manager",
+    "photo_path", "owner_name", "owner_relation", "owner_phone", "lessee_phone",
+    "ad_end_date", "lat", "lng", "status_cd", "re_ad_yn", "type", "verification_method",
+)
+SHOP_UPDATABLE_COLUMNS = [
+    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly", "manage_fee",
+    "premium", "current_use", "area", "rooms", "baths", "building_usage", "parking",
+    "naver_property_no", "serve_property_no", "approval_date", "memo", "photo_path",
+    "owner_name", "owner_relation", "owner_phone", "lessee_phone", "ad_end_date",
+    "lat", "lng", "status_cd", "re_ad_yn", "manager", "type", "verification_method"
+]
+
+
+def _shop_insert_values(row_, manager):
+    gu=row_.get("gu","");dn=row_.get("dong","");jb=row_.get("jibun","");ho=row_.get("ho","");
+    cf=int(row_.get("curr_floor",0));tf=int(row_.get("total_floor",0));dp=int(row_.get("deposit",0));mn=int(row_.get("monthly",0));
+    mf=row_.get("manage_fee","");pm=row_.get("premium","");cu=row_.get("current_use","");ar=float(row_.get("area",0.0));
+    rms=row_.get("rooms","");bts=row_.get("baths","");bu=row_.get("building_usage","");pk=row_.get("parking","");
+    nav=row_.get("naver_property_no","");srv=row_.get("serve_property_no","");mm=row_.get("memo","");
+    pp=row_.get("photo_path","");onm=row_.get("owner_name","");orl=row_.get("owner_relation","");oph=row_.get("owner_phone","");
+    lph=row_.get("lessee_phone","");lat=float(row_.get("lat",0.0));lng=float(row_.get("lng",0.0));
+    scd=row_.get("status_cd","");ryn=row_.get("re_ad_yn","");
+    apd_s=row_.get("approval_date","").strip();apd=apd_s if apd_s else None;
+    ade_s=row_.get("ad_end_date","").strip();ade=ade_s if ade_s else None;
+
+    type_val = row_.get("type", "")
+    verification_method_val = row_.get("verification_method", "")
+
+    return (
+        gu,dn,jb,ho,cf,tf,dp,mn,mf,pm,cu,ar,rms,bts,bu,pk,nav,srv,apd,mm,manager,pp,
+        onm,orl,oph,lph,ade,lat,lng,scd,ryn,type_val,verification_method_val
+    )
+
+
 @router.post("/update_mylist_shop_items")
 def update_mylist_shop_items(payload: dict = Body(...)):
     manager    = payload.get("manager","")
@@ -445,77 +573,52 @@ def update_mylist_shop_items(payload: dict = Body(...)):
     deleted_count = 0
     updated_count = 0
     operation_successful = True
+    guard_sql, guard_params = manager_guard(role, manager)
 
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
         logger.debug(f"Start update_mylist_shop - Manager: '{manager}', Role: '{role}', Added: {len(added_list)}, Deleted: {len(deleted_list)}, Updated: {len(updated_list)}")
 
-        # (A) added 처리
+        # 주소 캐시 무효화 대상: 추가 행 주소 + 삭제/수정 대상의 기존 주소 + 수정 후 주소
+        touched_addresses = [f"{r.get('dong','')} {r.get('jibun','')}" for r in added_list]
+        touched_ids = [r for r in deleted_list if isinstance(r, int) and r > 0]
+        touched_ids += [r.get("id") for r in updated_list if isinstance(r.get("id"), int) and r.get("id") > 0]
+        if touched_ids:
+            cursor.execute(
+                f"SELECT id, dong, jibun FROM mylist_shop WHERE id IN ({','.join(['%s'] * len(touched_ids))})",
+                tuple(touched_ids),
+            )
+            prev_addr = {rid: (dn, jb) for rid, dn, jb in cursor.fetchall()}
+            touched_addresses += [f"{dn} {jb}" for dn, jb in prev_addr.values()]
+            for r in updated_list:
+                if "dong" in r or "jibun" in r:
+                    dn, jb = prev_addr.get(r.get("id"), ("", ""))
+                    touched_addresses.append(f"{r.get('dong', dn)} {r.get('jibun', jb)}")
+
+        # (A) added 처리 - 다중 행 INSERT, 첫 insert id로 temp_id 매핑
         if added_list:
-            sql_insert = """
-            INSERT INTO mylist_shop (
-              gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly, manage_fee,
-              premium, current_use, area, rooms, baths, building_usage, parking,
-              naver_property_no, serve_property_no, approval_date, memo, manager,
-              photo_path, owner_name, owner_relation, owner_phone, lessee_phone,
-              ad_end_date, lat, lng, status_cd, re_ad_yn, type, verification_method
-            ) VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-            """
-            for row_ in added_list:
-                temp_id = row_.get("temp_id", -99)
-                gu=row_.get("gu","");dn=row_.get("dong","");jb=row_.get("jibun","");ho=row_.get("ho","");
-                cf=int(row_.get("curr_floor",0));tf=int(row_.get("total_floor",0));dp=int(row_.get("deposit",0));mn=int(row_.get("monthly",0));
-                mf=row_.get("manage_fee","");pm=row_.get("premium","");cu=row_.get("current_use","");ar=float(row_.get("area",0.0));
-                rms=row_.get("rooms","");bts=row_.get("baths","");bu=row_.get("building_usage","");pk=row_.get("parking","");
-                nav=row_.get("naver_property_no","");srv=row_.get("serve_property_no","");mm=row_.get("memo","");
-                pp=row_.get("photo_path","");onm=row_.get("owner_name","");orl=row_.get("owner_relation","");oph=row_.get("owner_phone","");
-                lph=row_.get("lessee_phone","");lat=float(row_.get("lat",0.0));lng=float(row_.get("lng",0.0));
-                scd=row_.get("status_cd","");ryn=row_.get("re_ad_yn","");
-                apd_s=row_.get("approval_date","").strip();apd=apd_s if apd_s else None;
-                ade_s=row_.get("ad_end_date","").strip();ade=ade_s if ade_s else None;
-                
-                type_val = row_.get("type", "")
-                verification_method_val = row_.get("verification_method", "")
-                
-                vals = (
-                    gu,dn,jb,ho,cf,tf,dp,mn,mf,pm,cu,ar,rms,bts,bu,pk,nav,srv,apd,mm,manager,pp,
-                    onm,orl,oph,lph,ade,lat,lng,scd,ryn,type_val,verification_method_val
-                )
-                try:
-                    cursor.execute(sql_insert, vals)
-                    new_id = cursor.lastrowid
-                    inserted_map[str(temp_id)] = new_id
-                    logger.debug(f"Inserted mylist_shop temp_id={temp_id} as new_id={new_id}")
-                except mysql.Error as insert_err:
-                     logger.error(f"Error inserting added mylist_shop (temp_id={temp_id}): {insert_err}")
-                     operation_successful = False
-                     conn.rollback()
-                     break
-                except Exception as insert_ex:
-                    logger.error(f"Unexpected error inserting added mylist_shop (temp_id={temp_id}): {insert_ex}", exc_info=True)
-                    operation_successful = False
-                    conn.rollback()
-                    break
+            try:
+                values = [_shop_insert_values(r, manager) for r in added_list]
+                new_ids = insert_rows(cursor, "mylist_shop", SHOP_INSERT_COLUMNS, values)
+                for row_, new_id in zip(added_list, new_ids):
+                    inserted_map[str(row_.get("temp_id", -99))] = new_id
+                logger.debug(f"Inserted {len(new_ids)} mylist_shop rows: {inserted_map}")
+            except mysql.Error as insert_err:
+                 logger.error(f"Error inserting added mylist_shop ({len(added_list)} rows): {insert_err}")
+                 operation_successful = False
+                 conn.rollback()
+            except Exception as insert_ex:
+                logger.error(f"Unexpected error inserting added mylist_shop ({len(added_list)} rows): {insert_ex}", exc_info=True)
+                operation_successful = False
+                conn.rollback()
 
         # (B) deleted 처리 (역할 기반)
         if deleted_list and operation_successful:
             real_ids = [r for r in deleted_list if isinstance(r, int) and r > 0]
             if real_ids:
-                placeholders = ",".join(["%s"] * len(real_ids))
-                sql_del = f"DELETE FROM mylist_shop WHERE id IN ({placeholders})"
-                params = list(real_ids)
-                if role != 'admin':
-                    sql_del += " AND manager = %s"
-                    params.append(manager)
-                    logger.debug(f"Preparing DELETE query (manager check): {sql_del}, Params: {params}")
-                else:
-                    logger.debug(f"Preparing DELETE query (admin): {sql_del}, Params: {params}")
-
                 try:
-                    logger.debug(f"Executing DELETE query...")
-                    cursor.execute(sql_del, tuple(params))
-                    deleted_count = cursor.rowcount
+                    deleted_count = delete_rows(cursor, "mylist_shop", real_ids, guard_sql, guard_params)
                     logger.info(f"Executed DELETE on mylist_shop (role={role}, manager={manager or '(Admin)'}) for IDs: {real_ids}. Affected rows: {deleted_count}")
                 except mysql.Error as del_err:
                      logger.error(f"Error deleting mylist_shop items (role={role}, manager={manager}): {del_err}")
@@ -526,54 +629,33 @@ def update_mylist_shop_items(payload: dict = Body(...)):
                     operation_successful = False
                     conn.rollback()
 
-        # (C) updated 처리 (역할 기반)
+        # (C) updated 처리 (역할 기반) - 컬럼 조합별 CASE UPDATE
         if updated_list and operation_successful:
-            updatable_cols = [
-                "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly", "manage_fee",
-                "premium", "current_use", "area", "rooms", "baths", "building_usage", "parking",
-                "naver_property_no", "serve_property_no", "approval_date", "memo", "photo_path",
-                "owner_name", "owner_relation", "owner_phone", "lessee_phone", "ad_end_date",
-                "lat", "lng", "status_cd", "re_ad_yn", "manager", "type", "verification_method"
+            updates = [
+                (row_["id"], update_values(row_, SHOP_UPDATABLE_COLUMNS))
+                for row_ in updated_list
+                if isinstance(row_.get("id"), int) and row_.get("id") > 0
             ]
-            for row_ in updated_list:
-                rid = row_.get("id")
-                if not rid or not isinstance(rid, int) or rid <= 0: continue
-                set_clauses = []
-                set_vals    = []
-                for c_ in updatable_cols:
-                    if c_ in row_:
-                        val = row_[c_]
-                        final_val = str(val).strip() if c_ in ["approval_date", "ad_end_date"] else val
-                        set_clauses.append(f"`{c_}`=%s")
-                        set_vals.append(None if final_val == '' and c_ in ["approval_date", "ad_end_date"] else final_val)
-                if not set_clauses: continue
-
-                sql_up = f"UPDATE mylist_shop SET {','.join(set_clauses)} WHERE id=%s"
-                params = list(set_vals) + [rid]
-                if role != 'admin':
-                    sql_up += " AND manager = %s"
-                    params.append(manager)
-                
-                try:
-                    cursor.execute(sql_up, tuple(params))
-                    if cursor.rowcount > 0:
-                        updated_count += 1
-                        logger.debug(f"Updated mylist_shop ID={rid} (role={role}, manager={manager or '(Admin)'}). Affected: {cursor.rowcount}")
-                except mysql.Error as upd_err:
-                     logger.error(f"Error updating mylist_shop item ID={rid} (role={role}, manager={manager}): {upd_err}")
-                     operation_successful = False
-                     conn.rollback()
-                     break
-                except Exception as upd_ex:
-                    logger.error(f"Unexpected error updating mylist_shop item ID={rid} (role={role}, manager={manager}): {upd_ex}", exc_info=True)
-                    operation_successful = False
-                    conn.rollback()
-                    break
+            try:
+                updated_count = update_rows(cursor, "mylist_shop", updates, guard_sql, guard_params)
+                logger.debug(f"Updated mylist_shop {updated_count}/{len(updates)} rows (role={role}, manager={manager or '(Admin)'})")
+            except mysql.Error as upd_err:
+                 logger.error(f"Error updating mylist_shop items ({len(updates)} rows, role={role}, manager={manager}): {upd_err}")
+                 operation_successful = False
+                 conn.rollback()
+            except Exception as upd_ex:
+                logger.error(f"Unexpected error updating mylist_shop items ({len(updates)} rows, role={role}, manager={manager}): {upd_ex}", exc_info=True)
+                operation_successful = False
+                conn.rollback()
 
         # --- 최종 커밋 또는 롤백 ---
         if operation_successful:
             logger.info(f"All operations successful for Manager='{manager}'. Attempting commit.")
             conn.commit()
+            get_address_cache().invalidate("mylist_shop", touched_addresses)
+            changed_ids = touched_ids + list(inserted_map.values())
+            if changed_ids:
+                publish_change("mylist_shop", ids=changed_ids, addresses=touched_addresses, manager=manager or None)
             logger.info(f"Finished update_mylist_shop (Success): Inserted={len(inserted_map)}, Deleted={deleted_count}, Updated={updated_count} by Manager='{manager}' (Role: {role})")
             return {
                 "status": "ok",
@@ -602,39 +684,82 @@ def update_mylist_shop_items(payload: dict = Body(...)):
         raise HTTPException(status_code=500, detail=f"Unexpected server error: {ex}")
     finally:
         if cursor: cursor.close()
-        if conn and conn.is_connected():
+        if conn:
+            # 끊긴 커넥션도 close()해야 풀 슬롯이 반납된다 (release가 죽은 커넥션은 폐기)
             logger.debug("Closing DB connection.")
-            conn.close() 
+            conn.close()
 
 # ==== SUPABASE 버전 함수들 ====
 
+def _fetch_mylist_shop_by_addresses(supabase, addresses):
+    """
+    "동 지번"(지번 없으면 동 전체) 주소 목록의 mylist_shop 행 (id 순, 중복 제거).
+    주소를 SUPABASE_BATCH_SIZE개씩 or_ 조건으로 묶어 fetch_many로 동시에 조회한다.
+    묶음 조회가 실패하면 주소별로 다시 조회해 실패한 주소만 건너뛴다 (기존 주소별 조회와 같은 동작).
+    """
+    conditions = {}  # 조건 → 주소 (실패 시 로그용)
+    for addr in addresses:
+        parts = (addr or "").strip().split(' ', 1)
+        if not parts[0]:
+            continue
+        if len(parts) >= 2:
+            cond = f"and(dong.eq.{filter_value(parts[0])},jibun.eq.{filter_value(parts[1].strip())})"
+        else:
+            cond = f"dong.eq.{filter_value(parts[0])}"
+        conditions.setdefault(cond, addr)
+    columns = """
+        *,
+        type,
+        verification_method
+    """
+
+    def or_filter(chunk):
+        return lambda q: q.or_(','.join(chunk))
+
+    keys = list(conditions)
+    wheres = [or_filter(keys[i:i + SUPABASE_BATCH_SIZE]) for i in range(0, len(keys), SUPABASE_BATCH_SIZE)]
+    try:
+        rows = fetch_many('mylist_shop', columns, wheres, order='id', client=supabase)
+    except Exception as e:
+        logger.warning(f"mylist_shop 주소 묶음 조회 실패, 주소별로 다시 조회: {e}")
+        rows = []
+        for cond, addr in conditions.items():
+            try:
+                rows.extend(fetch_all('mylist_shop', columns, where=or_filter([cond]), order='id', client=supabase))
+            except Exception as addr_e:
+                logger.warning(f"주소 '{addr}' 처리 중 오류: {addr_e}")
+
+    # ID로 정렬하여 중복 제거 (주소 묶음 사이에 겹치는 행)
+    unique = {}
+    for item in rows:
+        unique.setdefault(item['id'], item)
+    return [unique[k] for k in sorted(unique)]
+
 def get_mylist_oneroom_data_supabase(manager: str = "", role: str = "manager"):
     """Supabase 버전: 원룸 마이리스트 데이터 조회"""
     try:
         supabase = get_supabase_client()
         
         # 기본 쿼리 - 새로운 컬럼 포함
-        query = supabase.table('mylist_oneroom').select("""
+        columns = """
             *,
             type,
             verification_method
-        """)
+        """
         
         # 권한 확인: admin이 아니면 manager 필터 적용
+        manager_filter = None
         if role.lower() != "admin":
             if not manager:
                 logger.info("비 admin 사용자이지만 manager가 없어 빈 데이터 반환")
                 return {"status": "ok", "data": []}
-            query = query.eq('manager', manager)
+            manager_filter = lambda q: q.eq('manager', manager)
         
-        # 정렬: ID 순
-        query = query.order('id', desc=False)
+        # 쿼리 실행 (정렬: ID 순, range 페이지 병렬 조회)
+        rows = fetch_all('mylist_oneroom', columns, where=manager_filter, order='id', client=supabase)
         
-        # 쿼리 실행
-        result = query.execute()
-        
-        logger.debug(f"Supabase에서 {len(result.data)}개 mylist_oneroom 항목 조회 완료 (manager: '{manager if role != 'admin' else '(Admin)'}')")
-        return {"status": "ok", "data": result.data}
+        logger.debug(f"Supabase에서 {len(rows)}개 mylist_oneroom 항목 조회 완료 (manager: '{manager if role != 'admin' else '(Admin)'}')")
+        return {"status": "ok", "data": rows}
         
     except Exception as e:
         logger.error(f"Supabase mylist_oneroom 데이터 조회 오류 (manager: {manager}, role: {role}): {e}", exc_info=True)
@@ -648,60 +773,42 @@ def get_mylist_shop_data_supabase(addresses: list = None):
         if not addresses:
             return {"status": "ok", "data": []}
         
-        # 주소별 필터링을 위한 조건 생성 - 새로운 컬럼 포함
-        query = supabase.table('mylist_shop').select("""
-            *,
-            type,
-            verification_method
-        """)
-        
-        # CONCAT(dong, ' ', jibun) IN (addresses) 와 동일한 필터링
-        # Supabase에서는 여러 조건을 OR로 연결
-        address_conditions = []
-        for addr in addresses:
-            # "동 지번" 형태로 검색
-            query = query.or_(f"dong.eq.{addr.split()[0]},jibun.eq.{' '.join(addr.split()[1:])}")
+        # CONCAT(dong, ' ', jibun) IN (addresses) 와 동일한 필터링 - 새로운 컬럼 포함
+        rows = _fetch_mylist_shop_by_addresses(supabase, addresses)
         
-        # 정렬: ID 순
-        query = query.order('id', desc=False)
-        
-        # 쿼리 실행
-        result = query.execute()
-        
-        logger.debug(f"Supabase에서 {len(result.data)}개 mylist_shop 항목 조회 완료 ({len(addresses)}개 주소)")
-        return {"status": "ok", "data": result.data}
+        logger.debug(f"Supabase에서 {len(rows)}개 mylist_shop 항목 조회 완료 ({len(addresses)}개 주소)")
+        return {"status": "ok", "data": rows}
         
     except Exception as e:
         logger.error(f"Supabase mylist_shop 데이터 조회 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Supabase error: {e}")
 
-def get_all_mylist_shop_data_supabase(manager: str = "", role: str = "manager"):
+def get_all_mylist_shop_data_supabase(manager: str = "", role: str = "manager", fields: str = ""):
     """Supabase 버전: 전체 상가 마이리스트 데이터 조회"""
+    names = parse_fields(fields)
     try:
         supabase = get_supabase_client()
         
-        # 기본 쿼리 - 새로운 컬럼 포함
-        query = supabase.table('mylist_shop').select("""
+        # 기본 쿼리 - 새로운 컬럼 포함 (fields 지정 시 해당 컬럼만)
+        columns = ",".join(dict.fromkeys(["id"] + names)) if names else """
             *,
             type,
             verification_method
-        """)
+        """
         
         # 권한 확인: admin이 아니면 manager 필터 적용
+        manager_filter = None
         if role.lower() != "admin":
             if not manager:
                 logger.info("비 admin 사용자이지만 manager가 없어 빈 데이터 반환")
                 return {"status": "ok", "data": []}
-            query = query.eq('manager', manager)
-        
-        # 정렬: ID 순
-        query = query.order('id', desc=False)
+            manager_filter = lambda q: q.eq('manager', manager)
         
-        # 쿼리 실행
-        result = query.execute()
+        # 쿼리 실행 (정렬: ID 순, range 페이지 병렬 조회)
+        rows = fetch_all('mylist_shop', columns, where=manager_filter, order='id', client=supabase)
         
-        logger.debug(f"Supabase에서 {len(result.data)}개 mylist_shop 항목 조회 완료 (manager: '{manager if role != 'admin' else '(Admin)'}')")
-        return {"status": "ok", "data": result.data}
+        logger.debug(f"Supabase에서 {len(rows)}개 mylist_shop 항목 조회 완료 (manager: '{manager if role != 'admin' else '(Admin)'}')")
+        return {"status": "ok", "data": rows}
         
     except Exception as e:
         logger.error(f"Supabase 전체 mylist_shop 데이터 조회 오류 (manager: {manager}, role: {role}): {e}", exc_info=True)
@@ -718,49 +825,8 @@ async def get_mylist_shop_data_supabase_post(request: Request):
         
         supabase = get_supabase_client()
         
-        # 주소별 필터링 - 동과 지번 조합으로 검색
-        all_results = []
-        
-        for addr in address_list:
-            try:
-                # "동 지번" 형태를 분리
-                parts = addr.split(' ', 1)
-                if len(parts) >= 2:
-                    dong = parts[0]
-                    jibun = parts[1]
-                    
-                    # 동과 지번이 모두 일치하는 것을 찾기 - 새로운 컬럼 포함
-                    query = supabase.table('mylist_shop').select("""
-                        *,
-                        type,
-                        verification_method
-                    """).eq('dong', dong).eq('jibun', jibun)
-                    result = query.execute()
-                    all_results.extend(result.data)
-                else:
-                    # 동만 있는 경우 - 새로운 컬럼 포함
-                    query = supabase.table('mylist_shop').select("""
-                        *,
-                        type,
-                        verification_method
-                    """).eq('dong', addr)
-                    result = query.execute()
-                    all_results.extend(result.data)
-                    
-            except Exception as addr_e:
-                logger.warning(f"주소 '{addr}' 처리 중 오류: {addr_e}")
-                continue
-        
-        # ID로 정렬하여 중복 제거
-        unique_results = []
-        seen_ids = set()
-        for item in all_results:
-            if item['id'] not in seen_ids:
-                unique_results.append(item)
-                seen_ids.add(item['id'])
-        
-        # ID 순으로 정렬
-        unique_results.sort(key=lambda x: x['id'])
+        # 주소별 필터링 - 동과 지번 조합으로 검색 (주소 묶음별 조회를 공유 실행기에서 동시에)
+        unique_results = await get_db_executor().run(_fetch_mylist_shop_by_addresses, supabase, address_list)
         
         logger.debug(f"Supabase에서 {len(unique_results)}개 mylist_shop 항목 조회 완료 ({len(address_list)}개 주소)")
         return {"status": "ok", "data": unique_results}
@@ -1,7 +1,12 @@
 from fastapi import APIRouter, HTTPException, Request, Body, Query
 import mysql.connector as mysql
-from datetime import datetime, date
-from settings import get_db_connection, logger
+from datetime import datetime
+from settings import get_db_connection, get_address_cache, get_db_executor, logger
+from address_cache import nulls_low
+from address_key import addr_key_in_clause
+from fast_response import FastJSONResponse
+from routers.websocket import publish_change
+from single_flight import addresses_key, single_flight
 # models.py 등 다른 모듈 import 필요시 추가
 
 router = APIRouter()
@@ -9,32 +14,37 @@ router = APIRouter()
 @router.post("/get_recommend_data")
 async def get_recommend_data(request: Request):
     body = await request.json()
+    return FastJSONResponse(await get_db_executor().run(_get_recommend_data, body))
+
+@single_flight(key=addresses_key)
+def _get_recommend_data(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok", "data": []}
         
     logger.info(f"Fetching recommend_data for {len(address_list)} addresses")
     conn = None 
+    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
 
-        placeholders = ",".join(["%s"] * len(address_list))
-        sql = f"SELECT * FROM recommend_data WHERE CONCAT(dong, ' ', jibun) IN ({placeholders}) ORDER BY recommend_date DESC, id DESC"
-        logger.debug(f"Executing SQL: {sql}")
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
-        logger.info(f"Fetched {len(rows)} rows from recommend_data.") 
+            addr_where, addr_keys = addr_key_in_clause(addresses)
+            sql = f"SELECT * FROM recommend_data WHERE {addr_where} ORDER BY recommend_date DESC, id DESC"
+            logger.debug(f"Executing SQL: {sql}")
+            cursor.execute(sql, tuple(addr_keys))
+            loaded = cursor.fetchall()
+            logger.info(f"Fetched {len(loaded)} rows from recommend_data.") 
+            # 날짜/시간은 그대로 캐시하고 응답 직렬화(FastJSONResponse)에서 ISO 문자열로 바뀐다
+            return loaded
 
-        # 날짜/시간 객체를 ISO 형식 문자열로 변환
-        for row in rows:
-            for key, value in row.items():
-                if isinstance(value, (datetime, date)) and not isinstance(value, str):
-                    try:
-                        row[key] = value.isoformat()
-                    except Exception as fmt_err:
-                        logger.warning(f"Could not format date/time field '{key}' with value '{value}': {fmt_err}. Using str().")
-                        row[key] = str(value) 
+        # ORDER BY recommend_date DESC, id DESC
+        rows = get_address_cache().fetch(
+            "recommend_data", address_list, load,
+            order_rows=lambda rs: rs.sort(key=lambda r: (nulls_low(r["recommend_date"]), r["id"]), reverse=True),
+        )
 
         logger.debug(f"Returning {len(rows)} recommend_data rows.") 
         return {"status": "ok", "data": rows}
@@ -142,6 +152,9 @@ def register_recommend_property(data: dict = Body(...)):
         cursor.execute(sql_insert, tuple(vals))
         conn.commit()
         insert_id = cursor.lastrowid
+        recommend_address = f"{recommend_data['dong']} {recommend_data['jibun']}"
+        get_address_cache().invalidate("recommend_data", [recommend_address])
+        publish_change("recommend_data", ids=[insert_id], addresses=[recommend_address], action="insert", manager=dialog_manager or None)
         logger.info(f"Registered recommend property. Source: {source_table}(ID:{source_id}) -> recommend_data (ID:{insert_id})")
         return {"status": "ok", "message": "추천매물 등록 완료", "insert_id": insert_id}
 
@@ -160,6 +173,7 @@ def register_recommend_property(data: dict = Body(...)):
         if conn: conn.close()
 
 @router.get("/get_addresses_by_biz_manager")
+@single_flight()
 def get_addresses_by_biz_manager(
     biz: str,
     manager: str,
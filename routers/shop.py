@@ -1,15 +1,74 @@
 from fastapi import APIRouter, HTTPException, Request, Query, Body
+from fastapi.responses import StreamingResponse
 import json
 import os
 import mysql.connector as mysql
 from datetime import datetime, date, timedelta
 from typing import List # List 임포트 추가
-from settings import get_db_connection, logger, get_supabase_client # settings.py에서 임포트
+from settings import get_db_connection, get_address_cache, get_db_executor, logger, get_supabase_client, get_count_cache, USE_MATERIALIZED_MATCH, SEARCH_RESULT_LIMIT, STREAM_PAGE_MAX_LIMIT # settings.py에서 임포트
 from models import SearchFilter # models.py에서 임포트 (필요시)
+from listing_matcher import ListingMatcher, parse_rectangles
+from spatial_index import GridIndex, bounding_box, drop_contained_rects
+from address_cache import nulls_low
+from address_key import addr_key_in_clause
+from search_index import SEARCH_TYPES, build_search_query, match_rank, normalize_keyword
+from fast_response import FastJSONResponse, parse_fields, select_list
+from routers.websocket import publish_change
+from single_flight import addresses_key, default_key, single_flight
+from supabase_fetch import fetch_all, fetch_in, iter_rows
+from bulk_write import delete_rows, upsert_rows
+from keyset_page import NDJSON_MEDIA_TYPE, keyset_clause, ndjson_line, stream_keyset_page
+from listing_match_store import (
+    load_materialized_results, refresh_listing_matches, reset_listing_matches, sync_listing_matches,
+    sync_listing_matches_if_changed,
+)
 # server_utils 에서 필요한 함수가 있다면 임포트
 
 router = APIRouter()
 
+# get_naver_shop 전체 목록 컬럼 (fields= 로 일부만 요청 가능)
+NAVER_SHOP_LIST_COLUMNS = (
+    "id", "type", "verification_method",
+    "gu", "dong", "jibun", "ho", "curr_floor", "total_floor", "deposit", "monthly",
+    "manage_fee", "premium", "current_use", "area", "rooms", "baths", "building_usage",
+    "lat", "lng", "naver_property_no", "serve_property_no", "approval_date", "memo",
+    "manager", "photo_path", "owner_name", "owner_relation", "owner_phone",
+    "lessee_phone", "ad_start_date", "ad_end_date", "parking", "status_cd",
+)
+
+# search_naver_shop(_stream) 조회 컬럼 (naver_shop n)
+NAVER_SEARCH_COLUMNS = """
+  n.id, n.type, n.verification_method,
+  n.gu, n.dong, n.jibun, n.ho, n.curr_floor, n.total_floor,
+  n.deposit, n.monthly, n.manage_fee, n.premium, n.current_use, n.area,
+  n.rooms, n.baths, n.building_usage, n.naver_property_no, n.serve_property_no,
+  n.approval_date, n.memo, n.photo_path, n.owner_name, n.owner_relation,
+  n.owner_phone, n.lessee_phone, n.ad_start_date, n.ad_end_date,
+  n.lat, n.lng, n.parking, n.manager
+"""
+
+# search_manager_data 매칭용 naver_shop 조회 (check_memo LEFT JOIN 포함)
+NAVER_SHOP_MATCH_SQL = """
+SELECT
+  n.id AS shop_id,
+  n.type, n.verification_method,
+  n.gu, n.dong, n.jibun, n.ho,
+  n.curr_floor, n.total_floor,
+  n.deposit, n.monthly,
+  n.manage_fee, n.premium, n.current_use, n.area,
+  n.rooms, n.baths, n.building_usage,
+  n.naver_property_no, n.serve_property_no,
+  n.approval_date, n.memo, n.manager,
+  n.photo_path, n.owner_name, n.owner_relation,
+  n.owner_phone, n.lessee_phone,
+  n.ad_start_date, n.ad_end_date,
+  n.lat, n.lng, n.parking,
+  c.check_memo AS check_memo
+FROM naver_shop n
+LEFT JOIN naver_shop_check_confirm c ON n.id = c.property_id
+WHERE 1=1
+"""
+
 @router.get("/search_manager_data")
 def search_manager_data(
     # 라우팅 경로에서 manager/role 제거됨. 쿼리 파라미터는 유지 (하지만 사용 안 함)
@@ -32,13 +91,22 @@ def search_manager_data(
         logger.info("MySQL 경로로 실행")
         return search_manager_data_mysql(manager, role, ad_date, last_id)
 
+def _search_manager_key(manager="", role="manager", ad_date="", last_id=0):
+    # manager/role은 필터에 쓰이지 않으므로 키에서 뺀다 (담당자가 달라도 같은 결과)
+    return default_key(ad_date, last_id)
+
+@single_flight("search_manager_data", key=_search_manager_key)
 def search_manager_data_mysql(
     manager: str = "",
     role: str = "manager",
     ad_date: str = "",
     last_id: int = 0
 ):
-    """MySQL 버전 - 기존 로직"""
+    """
+    MySQL 버전
+    - USE_MATERIALIZED_MATCH: customer_listing_match 테이블에서 조회 (변경분만 증분 갱신)
+    - 그 외: 매물을 한 번만 읽고 ListingMatcher로 전체 고객을 일괄 매칭
+    """
     
     # (1) ad_date 쉼표 분할
     splitted_dates = []
@@ -50,134 +118,51 @@ def search_manager_data_mysql(
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
 
-        # (2) 모든 customer 전부 SELECT (manager/role 필터링 없음)
-        logger.info("Fetching ALL customer data for shop search (ignoring manager/role)")
-        sql_all_customer = """
-        SELECT
-        id AS customer_id,
-        manager,
-        deposit_min, deposit_max,
-        monthly_min, monthly_max,
-        area_min, area_max,
-        floor_min, floor_max,
-        is_top_floor,
-        dong,  -- e.g. "가양동, 대동"
-        rectangles, -- JSON : [[swLng, swLat, neLng, neLat], ...]
-        biz_type
-        FROM customer
-        """
-        cursor.execute(sql_all_customer)
-        customers = cursor.fetchall()
-        logger.info(f"Found {len(customers)} customers to process for shop search.")
-
-        by_naver_id = {}  # { shop_id: { naver_shop행..., biz_manager_list: [] } }
-
-        for cust in customers:
-            if not cust: continue
-            cust_manager_name = cust.get("manager", "")
-            deposit_min = cust.get("deposit_min", 0)
-            deposit_max = cust.get("deposit_max", 99999999)
-            monthly_min = cust.get("monthly_min", 0)
-            monthly_max = cust.get("monthly_max", 99999999)
-            area_min  = float(cust.get("area_min", 0.0))
-            area_max  = float(cust.get("area_max", 99999999.0))
-            floor_min = cust.get("floor_min", -999)
-            floor_max = cust.get("floor_max", 9999)
-            is_top_floor = cust.get("is_top_floor", 0)
-            dong_str = cust.get("dong", "")
-            rect_json = cust.get("rectangles", "[]")
-            biz_type_cust = cust.get("biz_type","")
-            
-            biz_manager_list = []
-            if biz_type_cust:
-                # 구분자를 쉼표(,) 대신 파이프(|)로 변경
-                splitted_biz = [b.strip() for b in biz_type_cust.split("|") if b.strip()]
-                for individual_biz in splitted_biz:
-                    biz_manager_list.append({"biz": individual_biz, "manager": cust_manager_name})
-
-            area_min_m2 = area_min * 3.3058
-            area_max_m2 = area_max * 3.3058
-            dong_list = [x.strip() for x in dong_str.split(",") if x.strip()]
-            try:
-                rects = json.loads(rect_json)
-            except: rects = []
-
-            base_sql = """
+        if USE_MATERIALIZED_MATCH:
+            # (2) 물리화된 매칭 테이블: naver_shop이 바뀐 경우에만 변경분 반영 후 인덱스 조회
+            sync_listing_matches_if_changed(conn)
+            all_results = load_materialized_results(cursor, NAVER_SHOP_MATCH_SQL, last_id)
+            logger.info(f"Loaded {len(all_results)} matched listings from customer_listing_match.")
+        else:
+            # (2) 모든 customer 전부 SELECT (manager/role 필터링 없음)
+            logger.info("Fetching ALL customer data for shop search (ignoring manager/role)")
+            sql_all_customer = """
             SELECT
-              n.id AS shop_id,
-              n.type, n.verification_method,
-              n.gu, n.dong, n.jibun, n.ho,
-              n.curr_floor, n.total_floor,
-              n.deposit, n.monthly,
-              n.manage_fee, n.premium, n.current_use, n.area,
-              n.rooms, n.baths, n.building_usage,
-              n.naver_property_no, n.serve_property_no,
-              n.approval_date, n.memo, n.manager,
-              n.photo_path, n.owner_name, n.owner_relation,
-              n.owner_phone, n.lessee_phone,
-              n.ad_start_date, n.ad_end_date,
-              n.lat, n.lng, n.parking,     
-              c.check_memo AS check_memo 
-            FROM naver_shop n
-            LEFT JOIN naver_shop_check_confirm c ON n.id = c.property_id
-            WHERE 1=1
+            id AS customer_id,
+            manager,
+            deposit_min, deposit_max,
+            monthly_min, monthly_max,
+            area_min, area_max,
+            floor_min, floor_max,
+            is_top_floor,
+            dong,  -- e.g. "가양동, 대동"
+            rectangles, -- JSON : [[swLng, swLat, neLng, neLat], ...]
+            biz_type
+            FROM customer
             """
-            wheres = []
-            params_ = []
-
-            wheres.append("n.deposit BETWEEN %s AND %s")
-            params_.extend([deposit_min, deposit_max])
-            wheres.append("n.monthly BETWEEN %s AND %s")
-            params_.extend([monthly_min, monthly_max])
-            wheres.append("n.area BETWEEN %s AND %s")
-            params_.extend([area_min_m2, area_max_m2])
-            wheres.append("(n.curr_floor BETWEEN %s AND %s)")
-            params_.extend([floor_min, floor_max])
-            if is_top_floor == 1:
-                wheres.append("n.curr_floor = n.total_floor")
-
-            or_clauses = []
-            or_params = []
-            if dong_list:
-                placeholders = ",".join(["%s"]*len(dong_list))
-                or_clauses.append(f"n.dong IN ({placeholders})")
-                or_params.extend(dong_list)
-            rect_subs = []
-            for rect in rects:
-                if len(rect)==4:
-                    swLng, swLat, neLng, neLat = rect
-                    rect_subs.append("(n.lng BETWEEN %s AND %s AND n.lat BETWEEN %s AND %s)")
-                    or_params.extend([swLng, neLng, swLat, neLat])
-            if rect_subs:
-                or_clauses.append(" OR ".join(rect_subs))
-            if or_clauses:
-                wheres.append("( " + " OR ".join(or_clauses) + " )")
-            params_.extend(or_params)
-            
-            # last_id 조건 추가
-            if last_id > 0:
-                 wheres.append("n.id > %s")
-                 params_.append(last_id)
-                 
-            if wheres:
-                base_sql += " AND " + " AND ".join(wheres)
-            
-            # 페이징 없이 일단 조회 (나중에 필요하면 추가)
-            # base_sql += " ORDER BY n.id ASC LIMIT 1000" # 예시
-            
-            cursor.execute(base_sql, tuple(params_))
-            matched_rows = cursor.fetchall()
-
-            for row_ in matched_rows:
-                sid = row_["shop_id"]
-                if sid not in by_naver_id:
-                    by_naver_id[sid] = dict(row_)
-                    by_naver_id[sid]["biz_manager_list"] = []
-                for b_item in biz_manager_list: # 여기서 biz_manager_list 사용
-                    by_naver_id[sid]["biz_manager_list"].append(b_item)
+            cursor.execute(sql_all_customer)
+            customers = cursor.fetchall()
+            logger.info(f"Found {len(customers)} customers to process for shop search.")
 
-        # [C] 최종 결과 all_results (구조 변경 적용)
-        all_results = list(by_naver_id.values()) # 바로 리스트로 변환
+            # (3) naver_shop 매물을 한 번만 id 순으로 읽어 컬럼형 매칭 엔진 구성
+            listing_sql = NAVER_SHOP_MATCH_SQL
+            listing_params = []
+            if last_id > 0:
+                listing_sql += " AND n.id > %s"
+                listing_params.append(last_id)
+            listing_sql += " ORDER BY n.id ASC"
+            cursor.execute(listing_sql, tuple(listing_params))
+            listing_rows = []
+            while True:
+                chunk = cursor.fetchmany(5000)
+                if not chunk:
+                    break
+                listing_rows.extend(chunk)
+            matcher = ListingMatcher(listing_rows, id_key="shop_id")
+            logger.info(f"Loaded {len(matcher)} naver_shop listings into matcher.")
+
+            # [C] 모든 고객 조건을 한 번에 평가 → 매물별 biz_manager_list 구성
+            all_results = matcher.build_manager_results(customers, last_id=last_id)
 
         # [D] 추가 필터(ad_date)
         filtered = []
@@ -240,6 +225,38 @@ def search_manager_data_mysql(
         if cursor: cursor.close()
         if conn: conn.close()
 
+@router.post("/refresh_listing_matches")
+def refresh_listing_matches_api(payload: dict = Body(default={})):
+    """
+    customer_listing_match 강제 갱신
+    - {"ids": [매물 id, ...]}: 해당 매물만 전체 고객과 재매칭 (수집기에서 변경 직후 호출)
+    - {"full": true}: 매칭 테이블을 비우고 전체 재구축
+    - 빈 payload: naver_shop 변경분만 동기화 (변경 추적이 없으면 시그니처 전체 스캔, 수집기 쓰기 훅)
+    """
+    conn = None
+    try:
+        conn = get_db_connection()
+        if payload.get("full"):
+            reset_listing_matches(conn)
+            result = sync_listing_matches(conn)
+        elif payload.get("ids"):
+            pairs = refresh_listing_matches(conn, payload.get("ids"))
+            result = {"changed": len(payload.get("ids")), "removed": 0, "pairs": pairs}
+        else:
+            result = sync_listing_matches(conn)
+        return {"status": "ok", "data": result}
+
+    except mysql.Error as e:
+        logger.exception(f"Refresh listing matches DB error: {e}")
+        if conn: conn.rollback()
+        raise HTTPException(status_code=500, detail="데이터베이스 오류 발생")
+    except Exception as e:
+        logger.exception(f"Refresh listing matches unexpected error: {e}")
+        if conn: conn.rollback()
+        raise HTTPException(status_code=500, detail="서버 내부 오류 발생")
+    finally:
+        if conn: conn.close()
+
 def search_manager_data_supabase(
     manager: str = "",
     role: str = "manager", 
@@ -283,120 +300,49 @@ def search_manager_data_supabase(
             if cursor: cursor.close()
             if conn: conn.close()
 
-        by_naver_id = {}
-
-        for cust in customers:
-            if not cust: continue
-            cust_manager_name = cust.get("manager", "")
-            deposit_min = cust.get("deposit_min", 0)
-            deposit_max = cust.get("deposit_max", 99999999)
-            monthly_min = cust.get("monthly_min", 0)
-            monthly_max = cust.get("monthly_max", 99999999)
-            area_min  = float(cust.get("area_min", 0.0))
-            area_max  = float(cust.get("area_max", 99999999.0))
-            floor_min = cust.get("floor_min", -999)
-            floor_max = cust.get("floor_max", 9999)
-            is_top_floor = cust.get("is_top_floor", 0)
-            dong_str = cust.get("dong", "")
-            rect_json = cust.get("rectangles", "[]")
-            biz_type_cust = cust.get("biz_type","")
-            
-            biz_manager_list = []
-            if biz_type_cust:
-                splitted_biz = [b.strip() for b in biz_type_cust.split("|") if b.strip()]
-                for individual_biz in splitted_biz:
-                    biz_manager_list.append({"biz": individual_biz, "manager": cust_manager_name})
-
-            area_min_m2 = area_min * 3.3058
-            area_max_m2 = area_max * 3.3058
-            dong_list = [x.strip() for x in dong_str.split(",") if x.strip()]
-            try:
-                rects = json.loads(rect_json)
-            except: rects = []
-
-            # Supabase에서 naver_shop 조회 (조인 없이)
-            query = supabase.table('naver_shop').select("""
-                id,
-                type, verification_method,
-                gu, dong, jibun, ho,
-                curr_floor, total_floor,
-                deposit, monthly,
-                manage_fee, premium, current_use, area,
-                rooms, baths, building_usage,
-                naver_property_no, serve_property_no,
-                approval_date, memo, manager,
-                photo_path, owner_name, owner_relation,
-                owner_phone, lessee_phone,
-                ad_start_date, ad_end_date,
-                lat, lng, parking
-            """)
-            
-            # 필터 조건들 적용
-            query = query.gte('deposit', deposit_min).lte('deposit', deposit_max)
-            query = query.gte('monthly', monthly_min).lte('monthly', monthly_max)
-            query = query.gte('area', area_min_m2).lte('area', area_max_m2)
-            query = query.gte('curr_floor', floor_min).lte('curr_floor', floor_max)
-            
-            if is_top_floor == 1:
-                # Supabase에서는 컬럼 간 비교가 제한적이므로 클라이언트에서 필터링
-                pass
-            
-            if dong_list:
-                query = query.in_('dong', dong_list)
-            
-            if last_id > 0:
-                query = query.gt('id', last_id)
-            
-            # 위도/경도 범위 필터링은 복잡하므로 일단 모든 데이터 가져온 후 클라이언트에서 필터링
-            result = query.execute()
-            
-            for row_ in result.data:
-                # 최상층 필터 적용
-                if is_top_floor == 1 and row_.get('curr_floor') != row_.get('total_floor'):
-                    continue
-                
-                # 위도/경도 범위 체크
-                lat = row_.get('lat')
-                lng = row_.get('lng')
-                if lat and lng and rects:
-                    in_rect = False
-                    for rect in rects:
-                        if len(rect) == 4:
-                            swLng, swLat, neLng, neLat = rect
-                            if swLng <= lng <= neLng and swLat <= lat <= neLat:
-                                in_rect = True
-                                break
-                    if not in_rect:
-                        continue
-                
-                sid = row_["id"]
-                if sid not in by_naver_id:
-                    # 데이터 구조 조정
-                    shop_data = dict(row_)
-                    shop_data["shop_id"] = sid
-                    shop_data["check_memo"] = ""  # 기본값으로 빈 문자열 설정
-                    
-                    by_naver_id[sid] = shop_data
-                    by_naver_id[sid]["biz_manager_list"] = []
-                
-                for b_item in biz_manager_list:
-                    by_naver_id[sid]["biz_manager_list"].append(b_item)
+        # (3) naver_shop 매물을 한 번만 조회하여 컬럼형 매칭 엔진 구성 (range 페이지 병렬 조회, 잘림 없이 전체)
+        naver_columns = """
+            id,
+            type, verification_method,
+            gu, dong, jibun, ho,
+            curr_floor, total_floor,
+            deposit, monthly,
+            manage_fee, premium, current_use, area,
+            rooms, baths, building_usage,
+            naver_property_no, serve_property_no,
+            approval_date, memo, manager,
+            photo_path, owner_name, owner_relation,
+            owner_phone, lessee_phone,
+            ad_start_date, ad_end_date,
+            lat, lng, parking
+        """
+        after_last_id = (lambda q: q.gt('id', last_id)) if last_id > 0 else None
+
+        listing_rows = []
+        for row_ in iter_rows('naver_shop', naver_columns, where=after_last_id, order='id', client=supabase):
+            shop_data = dict(row_)
+            shop_data["shop_id"] = row_["id"]
+            shop_data["check_memo"] = ""  # 기본값으로 빈 문자열 설정
+            listing_rows.append(shop_data)
+        matcher = ListingMatcher(listing_rows, id_key="shop_id")
+        logger.info(f"Loaded {len(matcher)} naver_shop listings into matcher (Supabase).")
+
+        # 모든 고객 조건을 한 번에 평가 (MySQL 경로와 동일한 매칭 규칙)
+        all_results = matcher.build_manager_results(customers, last_id=last_id)
+        by_naver_id = {row_["shop_id"]: row_ for row_ in all_results}
 
         # check_memo 별도 조회 및 매핑
         if by_naver_id:
             property_ids = list(by_naver_id.keys())
-            check_query = supabase.table('naver_shop_check_confirm').select('property_id, check_memo').in_('property_id', property_ids)
-            check_result = check_query.execute()
+            check_rows = fetch_in('naver_shop_check_confirm', 'property_id, check_memo', 'property_id', property_ids,
+                                  client=supabase)
             
             # check_memo 매핑
-            for check_row in check_result.data:
+            for check_row in check_rows:
                 prop_id = check_row.get('property_id')
                 if prop_id in by_naver_id:
                     by_naver_id[prop_id]["check_memo"] = check_row.get('check_memo', '')
 
-        # 최종 결과
-        all_results = list(by_naver_id.values())
-
         # ad_date 필터
         filtered = []
         if splitted_dates:
@@ -463,6 +409,10 @@ async def get_serve_shop_data(request: Request):
 async def get_serve_shop_data_supabase(request: Request):
     """Supabase 버전: serve_shop_data 조회"""
     body = await request.json()
+    return await get_db_executor().run(_get_serve_shop_data_supabase, body)
+
+@single_flight(key=addresses_key)
+def _get_serve_shop_data_supabase(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok", "data": []}
@@ -477,15 +427,16 @@ async def get_serve_shop_data_supabase(request: Request):
                 dong, jibun = addr.split(' ', 1)
                 or_conditions.append(f"and(dong.eq.{dong},jibun.eq.{jibun})")
         
-        # 쿼리 실행
-        query = supabase.table('serve_shop_data').select('*')
-        if or_conditions:
-            query = query.or_(','.join(or_conditions))
-        
-        response = query.order('id', desc=False).execute()
+        if not or_conditions:
+            # "동 지번" 형태의 주소가 없으면 조건 없이 테이블 전체를 받게 되므로 빈 결과
+            return {"status": "ok", "data": []}
+
+        # 쿼리 실행 (range 페이지 병렬 조회)
+        rows = fetch_all('serve_shop_data', '*', where=lambda q: q.or_(','.join(or_conditions)),
+                         order='id', client=supabase)
         
-        logger.info(f"Supabase serve_shop_data query result: {len(response.data)} rows")
-        return {"status": "ok", "data": response.data}
+        logger.info(f"Supabase serve_shop_data query result: {len(rows)} rows")
+        return {"status": "ok", "data": rows}
         
     except Exception as e:
         logger.error(f"Get serve shop data Supabase error: {e}")
@@ -494,28 +445,41 @@ async def get_serve_shop_data_supabase(request: Request):
 async def get_serve_shop_data_mysql(request: Request):
     """기존 MySQL 버전: serve_shop_data 조회"""
     body = await request.json()
+    return await get_db_executor().run(_get_serve_shop_data_mysql, body)
+
+@single_flight(key=addresses_key)
+def _get_serve_shop_data_mysql(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok","data":[]}
         
     conn = None
+    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        placeholders = ",".join(["%s"] * len(address_list))
-        sql = f"""
-        SELECT
-          id, gu, dong, jibun, ho, curr_floor, total_floor,
-          deposit, monthly, manage_fee, premium, current_use, area,
-          owner_phone, naver_property_no, serve_property_no, manager,
-          memo, status_cd, parking, building_usage, approval_date,
-          rooms, baths, ad_end_date, photo_path, owner_name, owner_relation
-        FROM serve_shop_data
-        WHERE CONCAT(dong, ' ', jibun) IN ({placeholders})
-        ORDER BY id ASC
-        """
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            addr_where, addr_keys = addr_key_in_clause(addresses)
+            sql = f"""
+            SELECT
+              id, gu, dong, jibun, ho, curr_floor, total_floor,
+              deposit, monthly, manage_fee, premium, current_use, area,
+              owner_phone, naver_property_no, serve_property_no, manager,
+              memo, status_cd, parking, building_usage, approval_date,
+              rooms, baths, ad_end_date, photo_path, owner_name, owner_relation
+            FROM serve_shop_data
+            WHERE {addr_where}
+            ORDER BY id ASC
+            """
+            cursor.execute(sql, tuple(addr_keys))
+            return cursor.fetchall()
+
+        # 주소별 캐시에 없는 주소만 DB 조회
+        rows = get_address_cache().fetch(
+            "serve_shop_data", address_list, load,
+            order_rows=lambda rs: rs.sort(key=lambda r: r["id"]),
+        )
         logger.info(f"MySQL serve_shop_data query result: {len(rows)} rows")
         return {"status": "ok", "data": rows}
 
@@ -542,6 +506,10 @@ async def get_serve_oneroom_data(request: Request):
 async def get_serve_oneroom_data_mysql(request: Request):
     """MySQL 버전 - 기존 로직"""
     body = await request.json()
+    return await get_db_executor().run(_get_serve_oneroom_data_mysql, body)
+
+@single_flight(key=addresses_key)
+def _get_serve_oneroom_data_mysql(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status":"ok","data":[]}
@@ -549,22 +517,30 @@ async def get_serve_oneroom_data_mysql(request: Request):
     conn = None
     cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        placeholders = ",".join(["%s"]*len(address_list))
-        sql = f"""
-        SELECT
-          id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
-          manage_fee, in_date, status_cd, `password`, rooms, baths,
-          owner_phone, naver_property_no, serve_property_no, manager, memo,
-          `options`, parking, building_usage, approval_date, area, ad_end_date,
-          photo_path, owner_name, owner_relation, lat, lng
-        FROM serve_oneroom_data
-        WHERE CONCAT(dong, ' ', jibun) IN ({placeholders})
-        ORDER BY id ASC
-        """
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            addr_where, addr_keys = addr_key_in_clause(addresses)
+            sql = f"""
+            SELECT
+              id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
+              manage_fee, in_date, status_cd, `password`, rooms, baths,
+              owner_phone, naver_property_no, serve_property_no, manager, memo,
+              `options`, parking, building_usage, approval_date, area, ad_end_date,
+              photo_path, owner_name, owner_relation, lat, lng
+            FROM serve_oneroom_data
+            WHERE {addr_where}
+            ORDER BY id ASC
+            """
+            cursor.execute(sql, tuple(addr_keys))
+            return cursor.fetchall()
+
+        # 주소별 캐시에 없는 주소만 DB 조회
+        rows = get_address_cache().fetch(
+            "serve_oneroom_data", address_list, load,
+            order_rows=lambda rs: rs.sort(key=lambda r: r["id"]),
+        )
         logger.info(f"MySQL serve_oneroom_data query result: {len(rows)} rows")
         return {"status":"ok","data":rows}
 
@@ -580,16 +556,20 @@ async def get_serve_oneroom_data_mysql(request: Request):
 
 async def get_serve_oneroom_data_supabase(request: Request):
     """Supabase 버전 - 새로운 로직"""
+    body = await request.json()
+    # 블로킹 HTTP 호출(페이지 병렬 조회)은 공유 실행기에서
+    return await get_db_executor().run(_get_serve_oneroom_data_supabase, body)
+
+def _get_serve_oneroom_data_supabase(body):
+    address_list = body.get("addresses", [])
+    if not address_list:
+        return {"status":"ok","data":[]}
+
     try:
-        body = await request.json()
-        address_list = body.get("addresses", [])
-        if not address_list:
-            return {"status":"ok","data":[]}
-        
         supabase = get_supabase_client()
         if not supabase:
             logger.error("Supabase client not available, falling back to MySQL")
-            return await get_serve_oneroom_data_mysql(request)
+            return _get_serve_oneroom_data_mysql(body)
         
         # Supabase 쿼리 - PostgreSQL CONCAT 함수 사용
         conditions = []
@@ -598,52 +578,77 @@ async def get_serve_oneroom_data_supabase(request: Request):
         
         where_clause = " OR ".join(conditions)
         
-        response = supabase.table('serve_oneroom_data').select(
+        columns = (
             'id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly, '
             'manage_fee, in_date, status_cd, password, rooms, baths, '
             'owner_phone, naver_property_no, serve_property_no, manager, memo, '
             'options, parking, building_usage, approval_date, area, ad_end_date, '
             'photo_path, owner_name, owner_relation, lat, lng'
-        ).or_(where_clause).order('id', desc=False).execute()
-        
-        rows = response.data if response.data else []
+        )
+        rows = fetch_all('serve_oneroom_data', columns, lambda q: q.or_(where_clause), 'id', client=supabase)
         logger.info(f"Supabase serve_oneroom_data query result: {len(rows)} rows")
         return {"status":"ok","data":rows}
         
     except Exception as e:
         logger.error(f"Supabase serve_oneroom_data error: {e}")
         logger.info("Falling back to MySQL")
-        return await get_serve_oneroom_data_mysql(request)
+        return _get_serve_oneroom_data_mysql(body)
+
+def serve_shop_rows(body):
+    """POST /get_serve_shop_data와 같은 결과 (USE_SUPABASE_SHOP에 따라 Supabase/MySQL). 배치 조회에서도 사용"""
+    from settings import USE_SUPABASE_SHOP
+    return _get_serve_shop_data_supabase(body) if USE_SUPABASE_SHOP else _get_serve_shop_data_mysql(body)
+
+def serve_oneroom_rows(body):
+    """POST /get_serve_oneroom_data와 같은 결과 (USE_SUPABASE_ONEROOM에 따라 Supabase/MySQL)"""
+    if os.environ.get("USE_SUPABASE_ONEROOM", "false").lower() == "true":
+        return _get_serve_oneroom_data_supabase(body)
+    return _get_serve_oneroom_data_mysql(body)
 
 @router.post("/get_all_confirm_with_items")
 async def get_all_confirm_with_items(request: Request):
     body = await request.json()
+    return await get_db_executor().run(_get_all_confirm_with_items, body)
+
+@single_flight(key=addresses_key)
+def _get_all_confirm_with_items(body):
     address_list = body.get("addresses", [])
     if not address_list:
         return {"status": "ok", "data": []}
         
     conn = None
+    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        placeholders = ",".join(["%s"] * len(address_list))
-        sql = f"""
-        SELECT
-          c.id AS confirm_id, c.property_id AS property_id,
-          c.gu, c.dong, c.jibun, c.ho, c.curr_floor, c.total_floor,
-          c.deposit, c.monthly, c.manage_fee, c.premium, c.current_use,
-          c.area, c.rooms, c.baths, c.building_usage, c.lat, c.lng,
-          c.naver_property_no, c.serve_property_no, c.approval_date, c.memo, c.manager,
-          c.photo_path, c.owner_name, c.owner_relation, c.owner_phone, c.lessee_phone,
-          c.ad_start_date, c.ad_end_date, c.parking, c.status_cd, # status_cd 추가
-          i.id AS item_id, i.matching_biz_type, i.check_memo
-        FROM naver_shop_check_confirm c
-        LEFT JOIN naver_shop_check_items i ON i.check_confirm_id = c.id
-        WHERE CONCAT(c.dong, ' ', c.jibun) IN ({placeholders})
-        ORDER BY c.ad_end_date DESC, c.id ASC, i.id ASC
-        """
-        cursor.execute(sql, tuple(address_list))
-        rows = cursor.fetchall()
+        def load(addresses):
+            nonlocal conn, cursor
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            addr_where, addr_keys = addr_key_in_clause(addresses, alias="c")
+            sql = f"""
+            SELECT
+              c.id AS confirm_id, c.property_id AS property_id,
+              c.gu, c.dong, c.jibun, c.ho, c.curr_floor, c.total_floor,
+              c.deposit, c.monthly, c.manage_fee, c.premium, c.current_use,
+              c.area, c.rooms, c.baths, c.building_usage, c.lat, c.lng,
+              c.naver_property_no, c.serve_property_no, c.approval_date, c.memo, c.manager,
+              c.photo_path, c.owner_name, c.owner_relation, c.owner_phone, c.lessee_phone,
+              c.ad_start_date, c.ad_end_date, c.parking, c.status_cd, # status_cd 추가
+              i.id AS item_id, i.matching_biz_type, i.check_memo
+            FROM naver_shop_check_confirm c
+            LEFT JOIN naver_shop_check_items i ON i.check_confirm_id = c.id
+            WHERE {addr_where}
+            ORDER BY c.ad_end_date DESC, c.id ASC, i.id ASC
+            """
+            cursor.execute(sql, tuple(addr_keys))
+            return cursor.fetchall()
+
+        def order_rows(rs):
+            # ORDER BY c.ad_end_date DESC, c.id ASC, i.id ASC (안정 정렬을 뒤 키부터 적용)
+            rs.sort(key=lambda r: nulls_low(r["item_id"]))
+            rs.sort(key=lambda r: r["confirm_id"])
+            rs.sort(key=lambda r: nulls_low(r["ad_end_date"]), reverse=True)
+
+        rows = get_address_cache().fetch("naver_shop_check_confirm", address_list, load, order_rows=order_rows)
         return {"status": "ok", "data": rows}
 
     except mysql.Error as e:
@@ -656,80 +661,97 @@ async def get_all_confirm_with_items(request: Request):
         if cursor: cursor.close()
         if conn: conn.close()
 
+# batch_update_naver_shop_extra: naver_shop에서 가져오는 기본 컬럼 / 확인 매물 나머지 컬럼
+CONFIRM_BASE_COLUMNS = (
+    "gu", "dong", "jibun", "curr_floor", "total_floor", "deposit", "monthly", "area",
+    "memo", "naver_property_no", "ad_start_date", "lat", "lng",
+)
+CONFIRM_EXTRA_COLUMNS = (
+    "manager","building_usage","approval_date","ho",
+    "owner_phone","premium","current_use","manage_fee","parking",
+    "ad_end_date","photo_path","owner_name","owner_relation","lessee_phone",
+    "rooms","baths","check_memo","serve_property_no","status_cd"
+)
+
+
+def _confirm_base_fields(property_id, row_shop, changed_vals):
+    """naver_shop 행 + 변경 값 → naver_shop_check_confirm 기본 필드 (manager/check_memo는 그룹별로 채움)"""
+    def strval(x): return str(x) if x is not None else ""
+
+    base_fields = {"property_id": property_id} # 정수형 유지
+    for c_ in CONFIRM_BASE_COLUMNS:
+        if c_ in ("ad_start_date", "lat", "lng"):
+            base_fields[c_] = row_shop.get(c_) # 날짜 객체 / 숫자 유지
+        else:
+            base_fields[c_] = strval(row_shop.get(c_))
+
+    # 나머지 컬럼 기본값
+    for c_ in CONFIRM_EXTRA_COLUMNS:
+        if c_ not in base_fields:
+            base_fields[c_] = "" if c_ != "approval_date" and c_ != "ad_end_date" else None
+
+    # 변경 값 적용
+    for key, new_val in changed_vals.items():
+        new_val_str = str(new_val).strip()
+        if not new_val_str: continue
+        if key == "price" and "/" in new_val_str:
+            dep_s, mon_s = new_val_str.split("/", 1)
+            base_fields["deposit"] = dep_s.strip()
+            base_fields["monthly"] = mon_s.strip()
+        elif key == "floor" and "/" in new_val_str:
+            cf_s, tf_s = new_val_str.split("/", 1)
+            base_fields["curr_floor"] = cf_s.strip()
+            base_fields["total_floor"] = tf_s.strip()
+        elif key in base_fields:
+             base_fields[key] = new_val_str
+    return base_fields
+
+
 @router.post("/batch_update_naver_shop_extra")
 def batch_update_naver_shop_extra(payload: dict):
+    """
+    확인 매물 일괄 저장 - 매물 수와 관계없이 몇 번의 왕복으로 처리한다.
+    naver_shop 조회(IN) → confirm 다중 행 Upsert(컬럼 조합별) → confirm_id 조회(IN)
+    → check_items DELETE(IN) + 다중 행 INSERT → 한 번 커밋
+    """
     updates = payload.get("updates", [])
     if not updates:
         raise HTTPException(status_code=400, detail="updates 목록이 비어있습니다.")
 
     conn = None
+    cursor = None
     processed_managers = set()
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-
+        parsed = []
         for upd in updates:
             str_id = upd.get("id", "")
             try: property_id = int(str_id)
             except ValueError: continue
-            changed_vals = upd.get("values", {})
-            logger.debug(f"Processing shop extra update for property_id={property_id}, changed_vals={changed_vals}")
-
-            # naver_shop에서 기본 정보 조회
-            cursor.execute("""
-                SELECT gu, dong, jibun, curr_floor, total_floor, deposit, monthly, area, 
-                       memo, naver_property_no, ad_start_date, lat, lng
-                FROM naver_shop WHERE id=%s
-            """, (property_id,))
-            row_shop = cursor.fetchone()
+            parsed.append((property_id, upd.get("values", {})))
+        if not parsed:
+            return {"status":"ok","message":"batch multi-manager done"}
+
+        conn = get_db_connection()
+        cursor = conn.cursor(dictionary=True)
+
+        # naver_shop 기본 정보 한 번에 조회
+        property_ids = list(dict.fromkeys(pid for pid, _ in parsed))
+        id_marks = ",".join(["%s"] * len(property_ids))
+        cursor.execute(f"""
+            SELECT id, {", ".join(CONFIRM_BASE_COLUMNS)}
+            FROM naver_shop WHERE id IN ({id_marks})
+        """, tuple(property_ids))
+        shop_rows = {r["id"]: r for r in cursor.fetchall()}
+
+        # (property_id, manager) → (confirm 필드, 항목 목록). 같은 매물이 여러 번 오면 나중 값이 남는다.
+        confirm_rows = {}
+        new_addresses = []
+        for property_id, changed_vals in parsed:
+            row_shop = shop_rows.get(property_id)
             if not row_shop:
                 logger.warning(f"No naver_shop row found for property_id={property_id}, skipping.")
                 continue
-
-            def strval(x): return str(x) if x is not None else ""
-
-            base_fields = {
-                "property_id": property_id, # 정수형 유지
-                "gu": strval(row_shop.get("gu")),
-                "dong": strval(row_shop.get("dong")),
-                "jibun": strval(row_shop.get("jibun")),
-                "curr_floor": strval(row_shop.get("curr_floor")),
-                "total_floor": strval(row_shop.get("total_floor")),
-                "deposit": strval(row_shop.get("deposit")),
-                "monthly": strval(row_shop.get("monthly")),
-                "area": strval(row_shop.get("area")),
-                "memo": strval(row_shop.get("memo")),
-                "naver_property_no": strval(row_shop.get("naver_property_no")),
-                "ad_start_date": row_shop.get("ad_start_date"), # 날짜 객체 유지
-                "lat": row_shop.get("lat"), # 숫자 유지
-                "lng": row_shop.get("lng") # 숫자 유지
-            }
-
-            # 나머지 컬럼 기본값
-            extra_cols = [
-                "manager","building_usage","approval_date","ho",
-                "owner_phone","premium","current_use","manage_fee","parking",
-                "ad_end_date","photo_path","owner_name","owner_relation","lessee_phone",
-                "rooms","baths","check_memo","serve_property_no","status_cd"
-            ]
-            for c_ in extra_cols:
-                if c_ not in base_fields:
-                    base_fields[c_] = "" if c_ != "approval_date" and c_ != "ad_end_date" else None
-
-            # 변경 값 적용
-            for key, new_val in changed_vals.items():
-                new_val_str = str(new_val).strip()
-                if not new_val_str: continue
-                if key == "price" and "/" in new_val_str:
-                    dep_s, mon_s = new_val_str.split("/", 1)
-                    base_fields["deposit"] = dep_s.strip()
-                    base_fields["monthly"] = mon_s.strip()
-                elif key == "floor" and "/" in new_val_str:
-                    cf_s, tf_s = new_val_str.split("/", 1)
-                    base_fields["curr_floor"] = cf_s.strip()
-                    base_fields["total_floor"] = tf_s.strip()
-                elif key in base_fields:
-                     base_fields[key] = new_val_str
+            base_fields = _confirm_base_fields(property_id, row_shop, changed_vals)
 
             # check_memo 파싱 및 필터링
             raw_memo = base_fields.get("check_memo","").strip()
@@ -745,70 +767,57 @@ def batch_update_naver_shop_extra(payload: dict):
             # manager별 그룹화
             groups = {}
             for item in filtered_memo_items:
-                mgr_name = item["manager"]
-                groups.setdefault(mgr_name, []).append(item)
-                processed_managers.add(mgr_name)
-
-            # manager별 Upsert
+                groups.setdefault(item["manager"], []).append(item)
             for mgr_name, item_list in groups.items():
                 bf_copy = dict(base_fields)
                 bf_copy["manager"] = mgr_name
-                cm_list = [{"biz": sub["biz"], "memo": sub["memo"] } for sub in item_list]
-                bf_copy["check_memo"] = json.dumps(cm_list, ensure_ascii=False)
-
-                # Upsert 로직
-                insert_cols = []
-                insert_vals = []
-                update_pairs = []
-                
-                # 컬럼과 값 준비 (None 아닌 것만)
-                for c_, v_ in bf_copy.items():
-                    # property_id는 항상 포함
-                    if c_ == "property_id" or v_ is not None:
-                        insert_cols.append(f"`{c_}`")
-                        insert_vals.append(v_)
-                        if c_ != "property_id": # id는 update 대상에서 제외
-                            update_pairs.append(f"`{c_}`=VALUES(`{c_}`)")
-                            
-                if not insert_cols:
-                     logger.warning(f"No columns to insert/update for property_id={property_id}, manager={mgr_name}")
-                     continue
-
-                sql_upsert = f"""
-                INSERT INTO naver_shop_check_confirm ({ ",".join(insert_cols) })
-                VALUES ({ ",".join(['%s']*len(insert_vals)) })
-                ON DUPLICATE KEY UPDATE { ",".join(update_pairs) }
-                """
-                
-                try:
-                    cursor.execute(sql_upsert, tuple(insert_vals))
-                    # confirm_id 찾기
-                    cursor.execute("SELECT id FROM naver_shop_check_confirm WHERE property_id=%s AND manager=%s", (property_id, mgr_name))
-                    row_cc = cursor.fetchone()
-                    if not row_cc:
-                        logger.error(f"Failed to find confirm_id after upsert for property_id={property_id}, manager={mgr_name}")
-                        continue
-                    confirm_id = row_cc["id"]
-                    
-                    # check_items 삭제 후 재삽입
-                    cursor.execute("DELETE FROM naver_shop_check_items WHERE check_confirm_id=%s", (confirm_id,))
-                    sql_item_ins = "INSERT INTO naver_shop_check_items (check_confirm_id, matching_biz_type, check_memo, manager) VALUES (%s, %s, %s, %s)"
-                    items_to_insert = []
-                    for sub2 in item_list:
-                         items_to_insert.append((confirm_id, sub2["biz"], sub2["memo"], sub2["manager"]))
-                    if items_to_insert:
-                         cursor.executemany(sql_item_ins, items_to_insert)
-                    logger.info(f"Upserted confirm/items for manager={mgr_name}, confirm_id={confirm_id}, items={len(item_list)}")
-                    
-                except mysql.Error as upsert_err:
-                     logger.error(f"Error during confirm/items upsert for property_id={property_id}, manager={mgr_name}: {upsert_err}")
-                     conn.rollback() # 개별 매니저 처리 중 오류 시 롤백 후 다음 매니저 시도 (선택적)
-                     continue # 다음 매니저 처리
-            
-            logger.info(f"Finished processing property_id={property_id}. Handled {len(groups)} manager group(s).")
-            conn.commit() # 각 property_id 처리 후 커밋
-
-        logger.info(f"Batch shop extra update completed. Processed managers: {processed_managers}")
+                bf_copy["check_memo"] = json.dumps([{"biz": sub["biz"], "memo": sub["memo"]} for sub in item_list], ensure_ascii=False)
+                confirm_rows[(property_id, mgr_name)] = (bf_copy, item_list)
+                processed_managers.add(mgr_name)
+            new_addresses.append(f"{base_fields.get('dong')} {base_fields.get('jibun')}")
+
+        if not confirm_rows:
+            logger.info("Batch shop extra update: no confirm rows to write.")
+            return {"status":"ok","message":"batch multi-manager done"}
+
+        # 기존 확인 매물 주소 (주소 캐시 무효화용)
+        confirm_pids = list(dict.fromkeys(pid for pid, _ in confirm_rows))
+        pid_marks = ",".join(["%s"] * len(confirm_pids))
+        cursor.execute(f"SELECT DISTINCT dong, jibun FROM naver_shop_check_confirm WHERE property_id IN ({pid_marks})", tuple(confirm_pids))
+        prev_addresses = [f"{r['dong']} {r['jibun']}" for r in cursor.fetchall()]
+
+        # confirm Upsert: None 아닌 컬럼만 넣으므로(property_id는 항상 포함) 컬럼 조합별로 다중 행 문장 하나
+        upsert_groups = {}
+        for bf_copy, _ in confirm_rows.values():
+            cols = tuple(c_ for c_, v_ in bf_copy.items() if c_ == "property_id" or v_ is not None)
+            upsert_groups.setdefault(cols, []).append(tuple(bf_copy[c_] for c_ in cols))
+        for cols, rows in upsert_groups.items():
+            upsert_rows(cursor, "naver_shop_check_confirm", cols, rows, update_columns=[c_ for c_ in cols if c_ != "property_id"])
+
+        # confirm_id 한 번에 조회
+        cursor.execute(f"SELECT id, property_id, manager FROM naver_shop_check_confirm WHERE property_id IN ({pid_marks})", tuple(confirm_pids))
+        confirm_ids = {(r["property_id"], r["manager"]): r["id"] for r in cursor.fetchall()}
+        missing = [key for key in confirm_rows if key not in confirm_ids]
+        if missing:
+            logger.error(f"Failed to find confirm_id after upsert for (property_id, manager)={missing}")
+
+        # check_items 일괄 교체
+        item_rows = []
+        target_confirm_ids = []
+        for key, (_, item_list) in confirm_rows.items():
+            confirm_id = confirm_ids.get(key)
+            if confirm_id is None: continue
+            target_confirm_ids.append(confirm_id)
+            item_rows += [(confirm_id, sub2["biz"], sub2["memo"], sub2["manager"]) for sub2 in item_list]
+        delete_rows(cursor, "naver_shop_check_items", target_confirm_ids, column="check_confirm_id")
+        upsert_rows(cursor, "naver_shop_check_items", ("check_confirm_id", "matching_biz_type", "check_memo", "manager"), item_rows)
+
+        conn.commit()
+        # 확인 매물 주소 캐시 무효화 (dong/jibun이 변경된 경우 이전 주소 포함)
+        get_address_cache().invalidate("naver_shop_check_confirm", prev_addresses + new_addresses)
+        publish_change("naver_shop_check_confirm", ids=target_confirm_ids, addresses=prev_addresses + new_addresses)
+
+        logger.info(f"Batch shop extra update completed. Properties={len(confirm_pids)}, confirm rows={len(confirm_rows)}, items={len(item_rows)}, managers: {processed_managers}")
         return {"status":"ok","message":"batch multi-manager done"}
 
     except mysql.Error as e:
@@ -826,7 +835,7 @@ def batch_update_naver_shop_extra(payload: dict):
         if conn: conn.close()
 
 @router.get("/get_naver_shop")
-def get_naver_shop():
+def get_naver_shop(fields: str = Query("", description="반환할 컬럼 (쉼표 구분, 비우면 전체)")):
     # 환경변수로 MySQL vs Supabase 선택
     use_supabase = os.environ.get("USE_SUPABASE_NAVER", "false").lower() == "true"
     
@@ -835,33 +844,30 @@ def get_naver_shop():
     
     if use_supabase:
         logger.info("Supabase 경로로 실행")
-        return get_naver_shop_supabase()
+        return get_naver_shop_supabase(fields)
     else:
         logger.info("MySQL 경로로 실행")
-        return get_naver_shop_mysql()
+        return get_naver_shop_mysql(fields)
 
-def get_naver_shop_mysql():
+def get_naver_shop_mysql(fields: str = ""):
     """MySQL 버전 - 기존 로직"""
     conn = None
+    cur = None
     try:
         conn = get_db_connection()
         cur = conn.cursor(dictionary=True)
-        # 컬럼 목록 명시적 지정 권장
-        sql = """
-        SELECT
-          id, type, verification_method,
-          gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
-          manage_fee, premium, current_use, area, rooms, baths, building_usage, 
-          lat, lng, naver_property_no, serve_property_no, approval_date, memo, 
-          manager, photo_path, owner_name, owner_relation, owner_phone, 
-          lessee_phone, ad_start_date, ad_end_date, parking, status_cd # type, verification_method 추가
+        # 컬럼 목록 명시적 지정 (fields가 있으면 그 중 요청 컬럼만)
+        sql = f"""
+        SELECT {select_list(fields, NAVER_SHOP_LIST_COLUMNS)}
         FROM naver_shop
         ORDER BY id ASC
         """
         cur.execute(sql)
         rows = cur.fetchall()
-        return {"data": rows}
+        return FastJSONResponse({"data": rows})
 
+    except HTTPException:
+        raise
     except mysql.Error as e:
         logger.error(f"Get naver_shop DB error: {e}")
         raise HTTPException(status_code=500, detail="데이터베이스 오류 발생")
@@ -872,16 +878,18 @@ def get_naver_shop_mysql():
         if cur: cur.close()
         if conn: conn.close()
 
-def get_naver_shop_supabase():
+def get_naver_shop_supabase(fields: str = ""):
     """Supabase 버전: naver_shop 전체 조회"""
+    names = parse_fields(fields)
     try:
         supabase = get_supabase_client()
         
-        # 간단한 전체 데이터 조회
-        result = supabase.table('naver_shop').select('*').execute()
+        # 간단한 전체 데이터 조회 (fields 지정 시 해당 컬럼만)
+        columns = ",".join(c for c in dict.fromkeys(["id"] + names) if c in NAVER_SHOP_LIST_COLUMNS) if names else '*'
+        rows = fetch_all('naver_shop', columns, order='id', client=supabase)
         
-        logger.info(f"Supabase naver_shop 조회 성공: {len(result.data)}개")
-        return {"data": result.data}
+        logger.info(f"Supabase naver_shop 조회 성공: {len(rows)}개")
+        return {"data": rows}
         
     except Exception as e:
         logger.error(f"Supabase naver_shop 조회 오류: {e}")
@@ -922,6 +930,108 @@ def search_naver_shop(
                                       area_min, area_max, floor_min, floor_max, 
                                       is_top_floor, dong_list, rectangles, offset, limit)
 
+def _naver_search_filters(
+    deposit_min, deposit_max, monthly_min, monthly_max, area_min, area_max,
+    floor_min, floor_max, is_top_floor, dong_list, rectangles,
+):
+    """search_naver_shop 필터 → (naver_shop n 기준 WHERE 절 목록, 파라미터)"""
+    where_clauses = []
+    params = []
+
+    where_clauses.append("n.deposit BETWEEN %s AND %s")
+    params.extend([deposit_min, deposit_max])
+    where_clauses.append("n.monthly BETWEEN %s AND %s")
+    params.extend([monthly_min, monthly_max])
+    where_clauses.append("n.area BETWEEN %s AND %s")
+    params.extend([area_min, area_max]) # area는 m2 단위로 가정
+    where_clauses.append("(n.curr_floor BETWEEN %s AND %s)")
+    params.extend([floor_min, floor_max])
+    if is_top_floor:
+        where_clauses.append("n.curr_floor = n.total_floor")
+
+    if dong_list.strip():
+        splitted = [x.strip() for x in dong_list.split(",") if x.strip()]
+        if splitted:
+            placeholders = ",".join(["%s"] * len(splitted))
+            where_clauses.append(f"n.dong IN ({placeholders})")
+            params.extend(splitted)
+
+    if rectangles.strip():
+        try:
+            rect_arr = parse_rectangles(json.loads(rectangles))
+            # 다른 사각형에 포함된 사각형은 제거하고, 전체 외곽 범위(bbox)를 먼저 걸어 lat/lng 인덱스를 탈 수 있게 함
+            rect_list = drop_contained_rects(rect_arr)
+            if rect_list:
+                bbox = bounding_box(rect_list)
+                where_clauses.append("n.lng BETWEEN %s AND %s AND n.lat BETWEEN %s AND %s")
+                params.extend([bbox[0], bbox[2], bbox[1], bbox[3]])
+                if len(rect_list) > 1: # 사각형이 하나면 bbox 조건과 동일
+                    rect_subs = []
+                    for swLng, swLat, neLng, neLat in rect_list:
+                        rect_subs.append("(n.lng BETWEEN %s AND %s AND n.lat BETWEEN %s AND %s)")
+                        params.extend([swLng, neLng, swLat, neLat])
+                    where_clauses.append("( " + " OR ".join(rect_subs) + " )")
+            elif rect_arr:
+                where_clauses.append("1=0") # 유효한 범위가 하나도 없으면 매칭 없음 (역순 범위 등)
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON format for rectangles: {rectangles}")
+        except Exception as e:
+             logger.error(f"Error processing rectangles: {e}")
+
+    return where_clauses, params
+
+def _naver_count_sql(where_clauses, params, alias="n"):
+    """WHERE 절 목록 → (naver_shop COUNT(*) 쿼리, 파라미터)"""
+    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+    return f"SELECT COUNT(*) AS cnt FROM naver_shop {alias} WHERE {where_sql}", list(params)
+
+def _search_count_fn(kind, count_sql, params, compute=True):
+    """
+    총 건수 계산 함수(cursor -> int | None). 캐시에 있으면 재사용하고,
+    compute=False(키셋 다음 페이지)면 캐시에 없을 때 COUNT를 돌리지 않고 None을 돌려준다.
+    """
+    cache = get_count_cache()
+    key = cache.make_key(kind, count_sql, params)
+
+    def count_fn(cursor):
+        cached = cache.get(key)
+        if cached is not None or not compute:
+            return cached
+        cursor.execute(count_sql, tuple(params))
+        row = cursor.fetchone()
+        total = row["cnt"] if row else 0
+        cache.put(key, total)
+        return total
+
+    return count_fn
+
+def _stream_page_args(cursor, limit, alias):
+    """(커서 토큰, limit) 검증 → (키셋 WHERE 절 또는 None, 파라미터, 보정된 limit). 잘못된 커서는 400"""
+    try:
+        keyset_sql, keyset_params = keyset_clause(cursor, alias=alias)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"잘못된 커서: {cursor}")
+    return keyset_sql, keyset_params, max(1, min(limit, STREAM_PAGE_MAX_LIMIT))
+
+def _stream_offset_result(result, cursor, limit):
+    """Supabase 경로: 기존 offset 조회 결과를 같은 NDJSON 형식으로 내보낸다 (커서는 "@offset")"""
+    rows = result.get("data", [])
+    next_cursor = f"@{_offset_cursor(cursor) + limit}" if rows and limit else None
+
+    def gen():
+        yield ndjson_line({"type": "meta", "total_count": None, "limit": limit})
+        for row in rows:
+            yield ndjson_line({"type": "row", "data": row})
+        yield ndjson_line({"type": "end", "count": len(rows), "next_cursor": next_cursor})
+
+    return StreamingResponse(gen(), media_type=NDJSON_MEDIA_TYPE)
+
+def _offset_cursor(cursor):
+    try:
+        return max(0, int(cursor[1:])) if cursor.startswith("@") else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"잘못된 커서: {cursor}")
+
 def search_naver_shop_mysql(
     deposit_min: int = 0,
     deposit_max: int = 99999999,
@@ -939,6 +1049,7 @@ def search_naver_shop_mysql(
 ):
     """MySQL 버전 - 기존 로직"""
     conn = None
+    cursor = None
     try:
         conn = get_db_connection()
         cursor = conn.cursor(dictionary=True)
@@ -957,58 +1068,18 @@ def search_naver_shop_mysql(
         LEFT JOIN naver_shop_check_confirm c ON n.id = c.property_id
         WHERE 1=1
         """
-        where_clauses = []
-        params = []
-
-        where_clauses.append("n.deposit BETWEEN %s AND %s")
-        params.extend([deposit_min, deposit_max])
-        where_clauses.append("n.monthly BETWEEN %s AND %s")
-        params.extend([monthly_min, monthly_max])
-        where_clauses.append("n.area BETWEEN %s AND %s")
-        params.extend([area_min, area_max]) # area는 m2 단위로 가정
-        where_clauses.append("(n.curr_floor BETWEEN %s AND %s)")
-        params.extend([floor_min, floor_max])
-        if is_top_floor:
-            where_clauses.append("n.curr_floor = n.total_floor")
-
-        if dong_list.strip():
-            splitted = [x.strip() for x in dong_list.split(",") if x.strip()]
-            if splitted:
-                placeholders = ",".join(["%s"] * len(splitted))
-                where_clauses.append(f"n.dong IN ({placeholders})")
-                params.extend(splitted)
-
-        if rectangles.strip():
-            try:
-                rect_arr = json.loads(rectangles)
-                rect_subs = []
-                rect_params = []
-                for r_ in rect_arr:
-                    if isinstance(r_, list) and len(r_)==4:
-                        swLng, swLat, neLng, neLat = r_
-                        # 경도/위도 유효성 검사 추가 가능
-                        sub = "(n.lng BETWEEN %s AND %s AND n.lat BETWEEN %s AND %s)"
-                        rect_subs.append(sub)
-                        rect_params.extend([swLng, neLng, swLat, neLat])
-                if rect_subs:
-                    where_clauses.append("( " + " OR ".join(rect_subs) + " )")
-                    params.extend(rect_params)
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON format for rectangles: {rectangles}")
-            except Exception as e:
-                 logger.error(f"Error processing rectangles: {e}")
+        where_clauses, params = _naver_search_filters(
+            deposit_min, deposit_max, monthly_min, monthly_max, area_min, area_max,
+            floor_min, floor_max, is_top_floor, dong_list, rectangles,
+        )
 
         final_sql = base_sql
         if where_clauses:
             final_sql += " AND " + " AND ".join(where_clauses)
 
-        # Total count 쿼리
-        count_sql = f"SELECT COUNT(*) AS cnt FROM ({final_sql.replace('LEFT JOIN naver_shop_check_confirm c ON n.id = c.property_id', '').replace('c.check_memo','NULL as check_memo')}) AS sub"
-        # COUNT 쿼리에서는 JOIN 제거 및 c.check_memo 제거 (성능 개선)
-        # 파라미터는 동일하게 사용
-        cursor.execute(count_sql, tuple(params))
-        row_cnt = cursor.fetchone()
-        total_count = row_cnt["cnt"] if row_cnt else 0
+        # Total count 쿼리 - JOIN 없이 naver_shop만 세고, 같은 조건은 TTL 동안 캐시 재사용
+        count_sql, count_params = _naver_count_sql(where_clauses, params)
+        total_count = _search_count_fn("naver_shop", count_sql, count_params)(cursor)
 
         # Paging 쿼리
         final_sql += " ORDER BY n.ad_start_date DESC, n.id DESC LIMIT %s OFFSET %s"
@@ -1060,7 +1131,7 @@ def search_naver_shop_supabase(
         supabase = get_supabase_client()
         
         # 기본 쿼리 - naver_shop (조인 없이)
-        query = supabase.table('naver_shop').select("""
+        columns = """
             id, type, verification_method,
             gu, dong, jibun, ho, curr_floor, total_floor,
             deposit, monthly, manage_fee, premium, current_use, area,
@@ -1068,54 +1139,52 @@ def search_naver_shop_supabase(
             approval_date, memo, photo_path, owner_name, owner_relation,
             owner_phone, lessee_phone, ad_start_date, ad_end_date,
             lat, lng, parking, manager
-        """)
-        
-        # 필터 조건들 적용
-        query = query.gte('deposit', deposit_min).lte('deposit', deposit_max)
-        query = query.gte('monthly', monthly_min).lte('monthly', monthly_max)
-        query = query.gte('area', area_min).lte('area', area_max)
-        query = query.gte('curr_floor', floor_min).lte('curr_floor', floor_max)
+        """
+        dong_list_parsed = [x.strip() for x in dong_list.split(",") if x.strip()]
         
-        # 동 목록 필터
-        if dong_list.strip():
-            dong_list_parsed = [x.strip() for x in dong_list.split(",") if x.strip()]
+        def apply_filters(query):
+            # 필터 조건들 적용
+            query = query.gte('deposit', deposit_min).lte('deposit', deposit_max)
+            query = query.gte('monthly', monthly_min).lte('monthly', monthly_max)
+            query = query.gte('area', area_min).lte('area', area_max)
+            query = query.gte('curr_floor', floor_min).lte('curr_floor', floor_max)
+            # 동 목록 필터
             if dong_list_parsed:
                 query = query.in_('dong', dong_list_parsed)
+            return query
         
-        # 정렬 및 페이징
-        query = query.order('ad_start_date', desc=True).order('id', desc=True)
-        query = query.range(offset, offset + limit - 1)
-        
-        result = query.execute()
+        # 정렬 및 페이징 (limit이 서버 max-rows보다 커도 range 페이지로 나눠 모두 받음)
+        result_rows = fetch_all(
+            'naver_shop', columns, where=apply_filters,
+            order=[('ad_start_date', True), ('id', True)], offset=offset, limit=limit, client=supabase,
+        )
         
         # 결과 후처리
         processed_rows = []
         property_ids = []
         
-        for row in result.data:
+        # 위도/경도 범위 체크: 조회 결과를 격자 인덱스로 한 번 묶어 사각형별 후보 셀만 검사
+        in_rect_mask = None
+        if rectangles.strip():
+            try:
+                rect_arr = json.loads(rectangles)
+                if rect_arr:
+                    grid = GridIndex(
+                        [row.get('lat') if row.get('lat') else None for row in result_rows],
+                        [row.get('lng') if row.get('lng') else None for row in result_rows],
+                    )
+                    in_rect_mask = grid.mask_rects(parse_rectangles(rect_arr))
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"Rectangle filter error: {e}")
+
+        for i, row in enumerate(result_rows):
             # 최상층 필터 적용
             if is_top_floor and row.get('curr_floor') != row.get('total_floor'):
                 continue
             
-            # 위도/경도 범위 체크
-            if rectangles.strip():
-                try:
-                    rect_arr = json.loads(rectangles)
-                    lat = row.get('lat')
-                    lng = row.get('lng')
-                    
-                    if lat and lng and rect_arr:
-                        in_rect = False
-                        for rect in rect_arr:
-                            if isinstance(rect, list) and len(rect) == 4:
-                                swLng, swLat, neLng, neLat = rect
-                                if swLng <= lng <= neLng and swLat <= lat <= neLat:
-                                    in_rect = True
-                                    break
-                        if not in_rect:
-                            continue
-                except (json.JSONDecodeError, Exception) as e:
-                    logger.warning(f"Rectangle filter error: {e}")
+            # 위경도가 없는 매물은 기존과 동일하게 범위 체크 없이 통과
+            if in_rect_mask is not None and row.get('lat') and row.get('lng') and not in_rect_mask[i]:
+                continue
             
             # 데이터 구조 정리
             processed_row = dict(row)
@@ -1125,12 +1194,12 @@ def search_naver_shop_supabase(
         
         # check_memo 별도 조회 및 매핑
         if property_ids:
-            check_query = supabase.table('naver_shop_check_confirm').select('property_id, check_memo').in_('property_id', property_ids)
-            check_result = check_query.execute()
+            check_rows = fetch_in('naver_shop_check_confirm', 'property_id, check_memo', 'property_id', property_ids,
+                                  client=supabase)
             
             # check_memo 매핑
             check_memo_dict = {}
-            for check_row in check_result.data:
+            for check_row in check_rows:
                 check_memo_dict[check_row.get('property_id')] = check_row.get('check_memo', '')
             
             # processed_rows에 check_memo 추가
@@ -1153,6 +1222,64 @@ def search_naver_shop_supabase(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Supabase 오류: {str(e)}")
 
+@router.get("/search_naver_shop_stream")
+def search_naver_shop_stream(
+    deposit_min: int = 0,
+    deposit_max: int = 99999999,
+    monthly_min: int = 0,
+    monthly_max: int = 99999999,
+    area_min: float = 0.0,
+    area_max: float = 99999999.0,
+    floor_min: int = -999,
+    floor_max: int = 9999,
+    is_top_floor: bool = False,
+    dong_list: str = Query("", description="동 목록 (쉼표 구분)"),
+    rectangles: str = Query("", description="지도 범위 JSON 문자열 e.g., \"[[lng1,lat1,lng2,lat2],...]\""),
+    cursor: str = Query("", description='이전 페이지 end 줄의 next_cursor (첫 페이지는 빈 값)'),
+    limit: int = 100,
+    with_count: bool = Query(True, description="첫 페이지에서 총 건수 계산 (다음 페이지는 캐시된 값만)"),
+):
+    """
+    search_naver_shop의 키셋 페이지네이션 + NDJSON 스트리밍 버전
+    (ad_start_date DESC, id DESC) 커서로 다음 페이지를 찾으므로 페이지가 깊어져도 앞 행을 다시 읽지 않는다.
+    """
+    use_supabase = os.environ.get("USE_SUPABASE_NAVER", "false").lower() == "true"
+    if use_supabase:
+        # Supabase 경로는 키셋 대신 기존 offset 조회를 같은 형식으로 감싼다
+        limit = max(1, min(limit, STREAM_PAGE_MAX_LIMIT))
+        result = search_naver_shop_supabase(deposit_min, deposit_max, monthly_min, monthly_max,
+                                            area_min, area_max, floor_min, floor_max,
+                                            is_top_floor, dong_list, rectangles, _offset_cursor(cursor), limit)
+        return _stream_offset_result(result, cursor, limit)
+
+    keyset_sql, keyset_params, limit = _stream_page_args(cursor, limit, alias="n")
+    where_clauses, params = _naver_search_filters(
+        deposit_min, deposit_max, monthly_min, monthly_max, area_min, area_max,
+        floor_min, floor_max, is_top_floor, dong_list, rectangles,
+    )
+    count_sql, count_params = _naver_count_sql(where_clauses, params)
+    count_fn = _search_count_fn("naver_shop", count_sql, count_params, compute=with_count and not cursor)
+
+    page_where = where_clauses + ([keyset_sql] if keyset_sql else [])
+    # naver_shop에서 한 페이지(id 기준 limit개)를 먼저 자른 뒤 check_memo를 붙인다
+    page_sql = f"""
+    SELECT p.*, COALESCE(c.check_memo, '') AS check_memo
+    FROM (
+        SELECT {NAVER_SEARCH_COLUMNS}
+        FROM naver_shop n
+        WHERE {" AND ".join(page_where) if page_where else "1=1"}
+        ORDER BY n.ad_start_date DESC, n.id DESC
+        LIMIT %s
+    ) p
+    LEFT JOIN naver_shop_check_confirm c ON p.id = c.property_id
+    ORDER BY p.ad_start_date DESC, p.id DESC
+    """
+    page_params = params + keyset_params + [limit]
+    return StreamingResponse(
+        stream_keyset_page(get_db_connection, page_sql, page_params, limit, count_fn=count_fn),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
 # search_in_all_data 내부에 있던 함수들을 라우터 레벨로 이동 (필요시 server_utils.py로 이동)
 def _decide_status(row_dict: dict) -> str:
     from datetime import datetime, date, timedelta
@@ -1327,68 +1454,61 @@ def _unify_completed_deal(row):
 @router.post("/search_in_all_data")
 def search_in_all_data(payload: dict = Body(...)):
     search_type = payload.get("search_type","").strip()
-    keyword = payload.get("keyword","").strip()
-    if not search_type or not keyword:
+    keyword = normalize_keyword(search_type, payload.get("keyword",""))
+    if not search_type or not keyword or search_type not in SEARCH_TYPES:
         return {"status":"ok","data":[]}
+    try:
+        limit = max(1, min(int(payload.get("limit", SEARCH_RESULT_LIMIT)), SEARCH_RESULT_LIMIT))
+    except (TypeError, ValueError):
+        limit = SEARCH_RESULT_LIMIT
+
+    search_config = {
+        "serve_oneroom_data": _unify_oneroom,
+        "serve_shop_data": _unify_shop,
+        "naver_shop_check_confirm": _unify_confirm,
+        "recommend_data": _unify_recommend,
+        "mylist_shop": _unify_mylist_shop,  # _unify_shop 에서 _unify_mylist_shop 으로 변경
+        "completed_deals": _unify_completed_deal  # _unify_completed_deal 추가
+    }
+
+    def search_table(table):
+        # 테이블별로 풀 커넥션을 하나씩 대여해 동시에 조회
+        sql, params = build_search_query(table, search_type, keyword, limit)
+        conn = None
+        cursor = None
+        try:
+            conn = get_db_connection()
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(sql, tuple(params))
+            return cursor.fetchall()
+        except mysql.Error as e:
+            logger.error(f"Error querying table `{table}` for search type '{search_type}': {e}")
+            return []
+        finally:
+            if cursor: cursor.close()
+            if conn: conn.close()
 
-    conn = None
-    cursor = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(dictionary=True)
-        
-        all_results = []
-        like_keyword = f"%{keyword}%"
-        
-        search_config = {
-            "serve_oneroom_data": _unify_oneroom,
-            "serve_shop_data": _unify_shop,
-            "naver_shop_check_confirm": _unify_confirm,
-            "recommend_data": _unify_recommend,
-            "mylist_shop": _unify_mylist_shop,  # _unify_shop 에서 _unify_mylist_shop 으로 변경
-            "completed_deal": _unify_completed_deal  # _unify_completed_deal 추가
-        }
-        
-        for table, unify_func in search_config.items():
-            sql = f"SELECT * FROM `{table}` WHERE "
-            params = []
-            if search_type == "주소":
-                sql += "CONCAT(REPLACE(dong,' ',''), REPLACE(jibun,' ','')) LIKE %s"
-                params.append(like_keyword)
-            elif search_type == "연락처":
-                sql += "(owner_phone LIKE %s OR lessee_phone LIKE %s)"
-                params.extend([like_keyword, like_keyword])
-            elif search_type == "매물번호":
-                sql += "(naver_property_no = %s OR serve_property_no = %s)"
-                params.extend([keyword, keyword])
-            elif search_type == "성함":
-                sql += "owner_name LIKE %s"
-                params.append(like_keyword)
-            else:
-                continue
-                
-            try:
-                cursor.execute(sql, tuple(params))
-                rows = cursor.fetchall()
-                for row in rows:
-                    all_results.append(unify_func(row))
-            except mysql.Error as e:
-                 logger.error(f"Error querying table `{table}` for search type '{search_type}': {e}")
-            
-        logger.info(f"Search in all data completed for type '{search_type}' keyword '{keyword}'. Found {len(all_results)} items.")
-        return {"status":"ok","data": all_results}
+        executor = get_db_executor()
+        futures = {table: executor.submit(search_table, table) for table in search_config}
+
+        # (일치 등급, FULLTEXT 점수, 최신 id) 순으로 정렬 후 상위 limit건만 반환
+        ranked = []
+        for order, (table, unify_func) in enumerate(search_config.items()):
+            for row in futures[table].result():
+                rank = match_rank(search_type, keyword, row)
+                ranked.append((-rank, -float(row.pop("_score", 0) or 0), order, -(row.get("id") or 0), row, unify_func))
+        ranked.sort(key=lambda x: x[:4])
+        all_results = [unify_func(row) for *_, row, unify_func in ranked[:limit]]
+
+        logger.info(f"Search in all data completed for type '{search_type}' keyword '{keyword}'. Found {len(ranked)} items, returning {len(all_results)}.")
+        return {"status":"ok","data": all_results, "truncated": len(ranked) > limit}
 
-    except mysql.Error as e:
-        logger.error(f"Search in all data DB connection or cursor error: {e}")
-        raise HTTPException(status_code=500, detail="데이터베이스 연결 또는 커서 오류 발생")
     except Exception as ex:
         logger.error(f"Search in all data unexpected error: {ex}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail="서버 내부 오류 발생")
-    finally:
-        if cursor: cursor.close()
-        if conn: conn.close()
 
 @router.get("/search_naver_shop_simple")
 def search_naver_shop_simple(
@@ -1409,6 +1529,31 @@ def search_naver_shop_simple(
         logger.info("MySQL 경로로 실행")
         return search_naver_shop_simple_mysql(search_type, keyword, within_1month)
 
+def _naver_simple_filters(search_type, keyword, within_1month):
+    """search_naver_shop_simple 조건 → (WHERE 절 목록, 파라미터)"""
+    wheres = []
+    params = []
+
+    if keyword.strip():
+        kw = keyword.strip()
+        if search_type == "주소":
+            wheres.append("CONCAT(dong, jibun) LIKE %s")
+            params.append(f"%{kw}%")
+        elif search_type == "매물번호":
+            wheres.append("`naver_property_no` = %s")
+            params.append(kw)
+        else: # "전체"
+            wheres.append("(CONCAT(dong,jibun) LIKE %s OR `naver_property_no`=%s)")
+            params.append(f"%{kw}%")
+            params.append(kw)
+
+    if within_1month == "1":
+        month_ago = (datetime.today() - timedelta(days=30)).date()
+        wheres.append("`ad_start_date` >= %s")
+        params.append(month_ago)
+
+    return wheres, params
+
 def search_naver_shop_simple_mysql(
     search_type: str = "전체",
     keyword: str = "",
@@ -1425,26 +1570,7 @@ def search_naver_shop_simple_mysql(
                area, naver_property_no, ad_start_date
         FROM `naver_shop` WHERE 1=1 
         """
-        wheres = []
-        params = []
-
-        if keyword.strip():
-            kw = keyword.strip()
-            if search_type == "주소":
-                wheres.append("CONCAT(dong, jibun) LIKE %s")
-                params.append(f"%{kw}%")
-            elif search_type == "매물번호":
-                wheres.append("`naver_property_no` = %s")
-                params.append(kw)
-            else: # "전체"
-                wheres.append("(CONCAT(dong,jibun) LIKE %s OR `naver_property_no`=%s)")
-                params.append(f"%{kw}%")
-                params.append(kw)
-
-        if within_1month == "1":
-            month_ago = (datetime.today() - timedelta(days=30)).date()
-            wheres.append("`ad_start_date` >= %s")
-            params.append(month_ago)
+        wheres, params = _naver_simple_filters(search_type, keyword, within_1month)
 
         if wheres:
             base_sql += " AND " + " AND ".join(wheres)
@@ -1476,37 +1602,38 @@ def search_naver_shop_simple_supabase(
         supabase = get_supabase_client()
         
         # 기본 쿼리
-        query = supabase.table('naver_shop').select("""
+        columns = """
             id, gu, dong, jibun, ho, curr_floor, total_floor, 
             deposit, monthly, area, naver_property_no, ad_start_date
-        """)
-        
-        # 키워드 검색 조건
-        if keyword.strip():
-            kw = keyword.strip()
-            if search_type == "주소":
-                # 주소 검색: dong + jibun 연결하여 검색
-                # Supabase에서는 CONCAT이 제한적이므로 클라이언트에서 필터링
-                pass  # 일단 모든 데이터를 가져온 후 클라이언트에서 필터링
-            elif search_type == "매물번호":
-                query = query.eq('naver_property_no', kw)
-            else:  # "전체"
-                # 전체 검색도 클라이언트에서 필터링
-                pass
+        """
         
-        # 1달 이내 필터
-        if within_1month == "1":
-            month_ago = (datetime.today() - timedelta(days=30)).date()
-            query = query.gte('ad_start_date', month_ago.isoformat())
+        def apply_filters(query):
+            # 키워드 검색 조건
+            if keyword.strip():
+                kw = keyword.strip()
+                if search_type == "주소":
+                    # 주소 검색: dong + jibun 연결하여 검색
+                    # Supabase에서는 CONCAT이 제한적이므로 클라이언트에서 필터링
+                    pass  # 일단 모든 데이터를 가져온 후 클라이언트에서 필터링
+                elif search_type == "매물번호":
+                    query = query.eq('naver_property_no', kw)
+                else:  # "전체"
+                    # 전체 검색도 클라이언트에서 필터링
+                    pass
+            
+            # 1달 이내 필터
+            if within_1month == "1":
+                month_ago = (datetime.today() - timedelta(days=30)).date()
+                query = query.gte('ad_start_date', month_ago.isoformat())
+            return query
         
         # 정렬 및 제한
-        query = query.order('ad_start_date', desc=True).order('id', desc=True).limit(300)
-        
-        result = query.execute()
+        rows = fetch_all('naver_shop', columns, where=apply_filters,
+                         order=[('ad_start_date', True), ('id', True)], limit=300, client=supabase)
         
         # 클라이언트 사이드 필터링 (주소 검색용)
         filtered_rows = []
-        for row in result.data:
+        for row in rows:
             # 키워드 필터링
             if keyword.strip() and search_type in ["주소", "전체"]:
                 kw = keyword.strip()
@@ -1531,4 +1658,43 @@ def search_naver_shop_simple_supabase(
         logger.error(f"Supabase search_naver_shop_simple 조회 오류: {e}")
         import traceback
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Supabase 오류: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Supabase 오류: {str(e)}")
+
+@router.get("/search_naver_shop_simple_stream")
+def search_naver_shop_simple_stream(
+    search_type: str = Query("전체", description='검색 타입: "전체", "주소", "매물번호"'),
+    keyword: str = Query("", description="검색어"),
+    within_1month: str = Query("0", description='최근 1달 이내 등록 매물만 보기 ("1" 또는 "0")'),
+    cursor: str = Query("", description='이전 페이지 end 줄의 next_cursor (첫 페이지는 빈 값)'),
+    limit: int = 100,
+    with_count: bool = Query(True, description="첫 페이지에서 총 건수 계산 (다음 페이지는 캐시된 값만)"),
+):
+    """
+    search_naver_shop_simple의 키셋 페이지네이션 + NDJSON 스트리밍 버전 (NaverShopSearchDialog 사용)
+    300건 고정 상한 대신 limit 단위로 끊어 받고, next_cursor로 이어서 요청한다.
+    """
+    use_supabase = os.environ.get("USE_SUPABASE_NAVER", "false").lower() == "true"
+    if use_supabase:
+        # Supabase 경로는 기존 조회(최대 300건)를 한 페이지로 내보낸다
+        result = search_naver_shop_simple_supabase(search_type, keyword, within_1month)
+        return _stream_offset_result(result, cursor, 0)
+
+    keyset_sql, keyset_params, limit = _stream_page_args(cursor, limit, alias="")
+    wheres, params = _naver_simple_filters(search_type, keyword, within_1month)
+    count_sql, count_params = _naver_count_sql(wheres, params, alias="")
+    count_fn = _search_count_fn("naver_shop_simple", count_sql, count_params, compute=with_count and not cursor)
+
+    page_where = wheres + ([keyset_sql] if keyset_sql else [])
+    page_sql = f"""
+    SELECT id, gu, dong, jibun, ho, curr_floor, total_floor, deposit, monthly,
+           area, naver_property_no, ad_start_date
+    FROM `naver_shop`
+    WHERE {" AND ".join(page_where) if page_where else "1=1"}
+    ORDER BY `ad_start_date` DESC, `id` DESC
+    LIMIT %s
+    """
+    page_params = params + keyset_params + [limit]
+    return StreamingResponse(
+        stream_keyset_page(get_db_connection, page_sql, page_params, limit, count_fn=count_fn),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from settings import get_address_cache, get_count_cache, get_db_executor, get_db_pool
+from single_flight import single_flight_stats
+
+router = APIRouter()
+
+@router.get("/db_pool")
+def get_db_pool_stats():
+    """MySQL 커넥션 풀 통계 (in_use, 대기 횟수, 획득 지연 등)"""
+    return {"status": "ok", "data": get_db_pool().stats()}
+
+@router.get("/db_executor")
+def get_db_executor_stats():
+    """공유 DB 작업 스레드 풀 통계 (실행 중/대기 작업 수, 대기·실행 시간)"""
+    return {"status": "ok", "data": get_db_executor().stats()}
+
+@router.get("/address_cache")
+def get_address_cache_stats():
+    """(테이블, 주소) 조회 결과 캐시 통계 (hit/miss, 무효화, 테이블별 항목 수)"""
+    return {"status": "ok", "data": get_address_cache().stats()}
+
+@router.get("/count_cache")
+def get_count_cache_stats():
+    """키셋 스트리밍 검색 총 건수 캐시 통계 (hit/miss, 항목 수)"""
+    return {"status": "ok", "data": get_count_cache().stats()}
+
+@router.get("/single_flight")
+def get_single_flight_stats():
+    """동일 조회 합치기 통계 (이름별 호출/실제 실행/절약 횟수)"""
+    return {"status": "ok", "data": single_flight_stats()}
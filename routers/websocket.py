@@ -1,45 +1,84 @@
+import asyncio
+import itertools
 import json
+import threading
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List
 
-connected_clients: List[WebSocket] = []
+from settings import logger
+from ws_hub import BroadcastHub
+
+# 연결별 큐/토픽/하트비트는 ws_hub.BroadcastHub가 관리한다
+hub = BroadcastHub()
+
+# 변경 알림: 쓰기 엔드포인트(동기 함수 → 스레드풀)에서 publish_change를 호출하면
+# 허브 이벤트 루프로 넘겨 {"type":"change", table, action, ids, addresses, manager, version}을 보낸다.
+# version은 프로세스 단위 일련번호 (정렬/로그용). 놓친 알림은 프레임의 dropped로 알린다.
+_version_lock = threading.Lock()
+_versions = itertools.count(1)
+
 
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    connected_clients.append(websocket)
+    conn = hub.register(websocket)
     try:
         while True:
-            # 클라이언트로부터 메시지를 받을 필요가 없다면 receive 부분을 제거하거나 주석 처리할 수 있습니다.
-            await websocket.receive_text()
+            # subscribe / pong 등 클라이언트 메시지 (수신 자체가 하트비트 역할)
+            hub.on_message(conn, await websocket.receive_text())
     except WebSocketDisconnect:
-        connected_clients.remove(websocket)
+        pass
     except Exception as e:
         # 필요하다면 다른 예외 처리 추가
         print(f"WebSocket error: {e}")
-        if websocket in connected_clients:
-            connected_clients.remove(websocket)
+    finally:
+        await hub.unregister(conn)
 
 async def broadcast_update():
     """
     데이터 변경 시 WebSocket 통해 모든 클라이언트에 reload 요청
     """
-    message = json.dumps({"type": "reload"}, ensure_ascii=False)
-    # 연결이 끊어진 클라이언트가 있을 수 있으므로 반복 중 예외 처리
-    disconnected_clients = []
-    for client in connected_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            # 전송 실패 시 해당 클라이언트를 제거 목록에 추가
-            disconnected_clients.append(client)
-    
-    # 연결 끊어진 클라이언트 제거
-    for client in disconnected_clients:
-        if client in connected_clients:
-            connected_clients.remove(client)
+    hub.publish({"type": "reload"})
+
+def _clean_addresses(addresses):
+    return sorted({(a or "").strip() for a in addresses if a and (a or "").strip()})
+
+def publish_change(table, ids=(), addresses=(), action="update", manager=None):
+    """
+    커밋이 끝난 쓰기 경로에서 호출. 어느 스레드에서 불러도 되고, 연결된 클라이언트가 없으면 아무것도 하지 않는다.
+    ids: 바뀐 행 id, addresses: 바뀐 행의 "동 지번" (수정 전/후 모두), manager: 행 담당자(알 수 있으면)
+    """
+    loop = hub.loop
+    if loop is None or loop.is_closed() or not hub.connections:
+        return None
+    with _version_lock:
+        version = next(_versions)
+    event = {
+        "type": "change",
+        "table": table,
+        "action": action,
+        "ids": sorted({i for i in ids if i is not None}),
+        "addresses": _clean_addresses(addresses),
+        "manager": manager,
+        "version": version,
+    }
+    message = json.dumps(event, ensure_ascii=False, default=str)
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        hub.publish(message, table, manager, event["addresses"])
+    elif not hub.publish_threadsafe(message, table, manager, event["addresses"]):
+        logger.warning(f"변경 알림 전송 실패 ({table}): 이벤트 루프 종료")
+        return None
+    return event
 
 # WebSocket 라우터를 위한 APIRouter 인스턴스 생성 (server.py에서 include_router)
 from fastapi import APIRouter
 router = APIRouter()
 
-router.add_websocket_route("/ws", websocket_endpoint) 
\ No newline at end of file
+router.add_websocket_route("/ws", websocket_endpoint)
+
+@router.get("/ws/stats")
+async def get_ws_stats():
+    """변경 알림 허브 상태 (연결 수, 대기/버린 메시지, 끊은 연결 수)"""
+    return {"status": "ok", "data": hub.snapshot()}
@@ -0,0 +1,126 @@
+"""
+통합검색(/shop/search_in_all_data)용 검색 조건 / 순위 계산
+
+주소·연락처·소유자명 검색은 LIKE '%kw%'라 테이블마다 풀스캔이었다.
+MySQL ngram FULLTEXT 인덱스(migrate_search_index.py로 생성)가 있으면 MATCH ... AGAINST
+구문 검색(phrase)으로 조회하고, 없으면(USE_SEARCH_FULLTEXT=false) 기존과 같은 LIKE로 조회한다.
+
+- 주소: addr_key(공백 없는 동+지번) 컬럼
+- 연락처: phone_digits(owner_phone/lessee_phone에서 '-', ' ', '.' 제거) 컬럼 → "010-1234"도 "0101234"로 검색
+- 성함: owner_name 컬럼
+- ngram 토큰(기본 2글자)보다 짧은 검색어는 FULLTEXT로 찾을 수 없으므로 LIKE로 조회한다.
+- 결과 순위: 완전일치 > 앞부분 일치 > 부분 일치, 같은 등급은 FULLTEXT 점수 → 최신 id 순
+"""
+from address_key import addr_key_expr, addr_key_from_address, escape_like, make_addr_key
+from settings import NGRAM_TOKEN_SIZE, USE_SEARCH_FULLTEXT
+
+# (테이블, 전화번호 컬럼들) - serve_oneroom_data에는 lessee_phone이 없다
+SEARCH_TABLE_PHONE_COLUMNS = {
+    "serve_oneroom_data": ("owner_phone",),
+    "serve_shop_data": ("owner_phone", "lessee_phone"),
+    "naver_shop_check_confirm": ("owner_phone", "lessee_phone"),
+    "recommend_data": ("owner_phone", "lessee_phone"),
+    "mylist_shop": ("owner_phone", "lessee_phone"),
+    "completed_deals": ("owner_phone", "lessee_phone"),
+}
+PHONE_DIGITS_COLUMN = "phone_digits"
+FULLTEXT_INDEXES = {
+    # 인덱스명: 컬럼
+    "ft_search_addr": "addr_key",
+    "ft_search_phone": PHONE_DIGITS_COLUMN,
+    "ft_search_owner": "owner_name",
+}
+SEARCH_TYPES = ("주소", "연락처", "성함", "매물번호")
+
+
+def phone_digits(value):
+    """전화번호 → 구분자 제거 (phone_digits 생성 컬럼과 동일 규칙)"""
+    return str(value or "").replace("-", "").replace(" ", "").replace(".", "")
+
+
+def phone_digits_sql(table):
+    """phone_digits 생성 컬럼 식"""
+    parts = [
+        f"REPLACE(REPLACE(REPLACE(IFNULL({col},''),'-',''),' ',''),'.','')"
+        for col in SEARCH_TABLE_PHONE_COLUMNS[table]
+    ]
+    return parts[0] if len(parts) == 1 else f"CONCAT_WS(' ', {', '.join(parts)})"
+
+
+def normalize_keyword(search_type, keyword):
+    """검색 타입별 검색어 정규화 (주소: 공백 제거, 연락처: 구분자 제거)"""
+    keyword = (keyword or "").strip()
+    if search_type == "주소":
+        return addr_key_from_address(keyword)
+    if search_type == "연락처":
+        return phone_digits(keyword)
+    return keyword
+
+
+def _fulltext_phrase(keyword):
+    # BOOLEAN MODE 구문 검색: 큰따옴표는 구문 구분자이므로 제거
+    return '"' + keyword.replace('"', "") + '"'
+
+
+def build_search_query(table, search_type, keyword, limit):
+    """
+    (sql, params) 반환. keyword는 normalize_keyword 결과.
+    FULLTEXT 사용 시 relevance 컬럼(_score)을 함께 조회한다.
+    """
+    use_fulltext = USE_SEARCH_FULLTEXT and len(keyword) >= NGRAM_TOKEN_SIZE
+    like_kw = f"%{escape_like(keyword)}%"
+    score_sql = "0"
+    params = []
+
+    if search_type == "주소":
+        if use_fulltext:
+            score_sql = "MATCH(addr_key) AGAINST (%s IN BOOLEAN MODE)"
+            where = score_sql
+            params = [_fulltext_phrase(keyword), _fulltext_phrase(keyword)]
+        else:
+            where = f"{addr_key_expr()} LIKE %s"
+            params = [like_kw]
+    elif search_type == "연락처":
+        if use_fulltext:
+            score_sql = f"MATCH({PHONE_DIGITS_COLUMN}) AGAINST (%s IN BOOLEAN MODE)"
+            where = score_sql
+            params = [_fulltext_phrase(keyword), _fulltext_phrase(keyword)]
+        else:
+            where = f"{phone_digits_sql(table)} LIKE %s"
+            params = [like_kw]
+    elif search_type == "성함":
+        if use_fulltext:
+            score_sql = "MATCH(owner_name) AGAINST (%s IN BOOLEAN MODE)"
+            where = score_sql
+            params = [_fulltext_phrase(keyword), _fulltext_phrase(keyword)]
+        else:
+            where = "owner_name LIKE %s"
+            params = [like_kw]
+    elif search_type == "매물번호":
+        where = "(naver_property_no = %s OR serve_property_no = %s)"
+        params = [keyword, keyword]
+    else:
+        return None, None
+
+    sql = f"SELECT *, {score_sql} AS _score FROM `{table}` WHERE {where} ORDER BY _score DESC, id DESC LIMIT %s"
+    params.append(int(limit))
+    return sql, params
+
+
+def match_rank(search_type, keyword, row):
+    """일치 등급 (3: 완전일치, 2: 앞부분/뒷자리 일치, 1: 부분 일치)"""
+    if search_type == "주소":
+        values = [make_addr_key(row.get("dong"), row.get("jibun")) or ""]
+    elif search_type == "연락처":
+        values = [phone_digits(row.get(col)) for col in ("owner_phone", "lessee_phone")]
+    elif search_type == "성함":
+        values = [str(row.get("owner_name") or "").strip()]
+    else:
+        return 3
+    best = 1
+    for value in values:
+        if value == keyword:
+            return 3
+        if value.startswith(keyword) or (search_type == "연락처" and value.endswith(keyword)):
+            best = 2
+    return best
@@ -1,13 +1,15 @@
 # serve_oneroom_tab.py
-import requests
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import pyqtSignal, QObject
 from PyQt5.QtWidgets import (
     QTableView, QAbstractItemView, QHeaderView, QMenu, QWidget, QVBoxLayout, QMessageBox
 )
 # Import moved utility functions
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from columnar_table_model import ColumnarTableModel, Column, field, pair, address_text, property_numbers
 from dialogs import StatusChangeDialog, RecommendDialog, BizSelectDialog
+from address_data_store import get_address_store, row_address, BATCH_SOURCES
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
 
 # Inherit from QObject
 class ServeOneroomTab(QObject):
@@ -22,7 +24,7 @@ class ServeOneroomTab(QObject):
 
         self.serve_oneroom_model = None
         self.serve_oneroom_view = None
-        self.serve_oneroom_dict = {} # Cache for oneroom data by address
+        self.serve_oneroom_dict = get_address_store().view("serve_oneroom") # 탭 공용 주소 캐시(address_data_store)의 써브원룸 뷰
         self.oneroom_timer = None
         self.is_shutting_down = False  # 종료 상태 플래그 추가
 
@@ -33,10 +35,7 @@ class ServeOneroomTab(QObject):
         container = QtWidgets.QWidget()
         vlay = QtWidgets.QVBoxLayout(container)
 
-        self.serve_oneroom_model = QtGui.QStandardItemModel()
-        headers = self._get_headers()
-        self.serve_oneroom_model.setColumnCount(len(headers))
-        self.serve_oneroom_model.setHorizontalHeaderLabels(headers)
+        self.serve_oneroom_model = ColumnarTableModel(self._build_columns())
 
         self.serve_oneroom_view = QTableView()
         self.serve_oneroom_view.setModel(self.serve_oneroom_model)
@@ -113,73 +112,7 @@ class ServeOneroomTab(QObject):
             return
             
         try:
-            m = self.serve_oneroom_model
-            m.setRowCount(0)
-            if not rows: return
-
-            headers = self._get_headers()
-            m.setColumnCount(len(headers))
-            m.setHorizontalHeaderLabels(headers)
-            m.setRowCount(len(rows))
-
-            for i, r in enumerate(rows):
-                # 0) 주소 + UserData
-                addr_ = (r.get("dong", "") + " " + r.get("jibun", "")).strip()
-                item = QtGui.QStandardItem(addr_)
-                item.setData("원룸", QtCore.Qt.UserRole + 2) # Source identifier
-                item.setData(r.get("id", 0), QtCore.Qt.UserRole + 3) # Primary Key
-                item.setData(r.get("status_cd", ""), QtCore.Qt.UserRole + 1) # Status code
-                m.setItem(i, 0, item)
-
-                # 1) 호
-                m.setItem(i, 1, QtGui.QStandardItem(str(r.get("ho", ""))))
-                # 2) 층
-                cf = r.get("curr_floor", 0)
-                tf = r.get("total_floor", 0)
-                m.setItem(i, 2, QtGui.QStandardItem(f"{cf}/{tf}"))
-                # 3) 보증금/월세
-                dp = r.get("deposit", 0)
-                mn = r.get("monthly", 0)
-                m.setItem(i, 3, QtGui.QStandardItem(f"{dp}/{mn}"))
-                # 4) 관리비
-                m.setItem(i, 4, QtGui.QStandardItem(str(r.get("manage_fee", ""))))
-                # 5) 입주가능일
-                m.setItem(i, 5, QtGui.QStandardItem(r.get("in_date", "")))
-                # 6) 비밀번호
-                m.setItem(i, 6, QtGui.QStandardItem(r.get("password", "")))
-                # 7) 방/화장실
-                ro_ = r.get("rooms", "")
-                ba_ = r.get("baths", "")
-                m.setItem(i, 7, QtGui.QStandardItem(f"{ro_}/{ba_}"))
-                # 8) 연락처
-                m.setItem(i, 8, QtGui.QStandardItem(r.get("owner_phone", "")))
-                # 9) 매물번호
-                nav = r.get("naver_property_no", "")
-                srv = r.get("serve_property_no", "")
-                mm_ = f"{nav}/{srv}" if (nav or srv) else ""
-                m.setItem(i, 9, QtGui.QStandardItem(mm_))
-                # 10) 옵션
-                m.setItem(i, 10, QtGui.QStandardItem(r.get("options", "")))
-                # 11) 담당자
-                m.setItem(i, 11, QtGui.QStandardItem(r.get("manager", "")))
-                # 12) 메모
-                m.setItem(i, 12, QtGui.QStandardItem(r.get("memo", "")))
-                # 13) 주차
-                m.setItem(i, 13, QtGui.QStandardItem(str(r.get("parking", ""))))
-                # 14) 용도
-                m.setItem(i, 14, QtGui.QStandardItem(r.get("building_usage", "")))
-                # 15) 사용승인일
-                m.setItem(i, 15, QtGui.QStandardItem(str(r.get("approval_date", ""))))
-                # 16) 평수
-                m.setItem(i, 16, QtGui.QStandardItem(str(r.get("area", ""))))
-                # 17) 광고종료일
-                m.setItem(i, 17, QtGui.QStandardItem(str(r.get("ad_end_date", ""))))
-                # 18) 사진경로
-                m.setItem(i, 18, QtGui.QStandardItem(r.get("photo_path", "")))
-                # 19) 소유자명
-                m.setItem(i, 19, QtGui.QStandardItem(r.get("owner_name", "")))
-                # 20) 관계
-                m.setItem(i, 20, QtGui.QStandardItem(r.get("owner_relation", "")))
+            self.serve_oneroom_model.set_rows(rows or [])
         except Exception as e:
             print(f"[ERROR] ServeOneroomTab: 테이블 채우기 중 오류 발생: {e}")
 
@@ -209,11 +142,8 @@ class ServeOneroomTab(QObject):
         if not all_new_addresses:
             return
 
-        # Check local cache and filter out addresses that are already loaded
-        addresses_to_check = [
-            addr for addr in all_new_addresses
-            if addr not in self.serve_oneroom_dict or not self.serve_oneroom_dict[addr] # Check if key exists and has data
-        ]
+        # Check the shared store and filter out addresses that are already loaded
+        addresses_to_check = get_address_store().missing("serve_oneroom", all_new_addresses)
 
         if not addresses_to_check:
             return
@@ -239,30 +169,14 @@ class ServeOneroomTab(QObject):
             print(f"[ERROR] ServeOneroomTab: 데이터 로드 중 예외 발생: {e}")
 
     def _bg_load_oneroom_data_with_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) Fetches serve_oneroom data ONLY for the given uncached addresses, using the original endpoint. """
+        """ (Background Thread) Fills the shared address store for the given uncached addresses (one batch request for all tabs). """
         if not addresses_to_fetch:
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        # --- Change prefix from /serve to /shop ---
-        url = f"http://{self.server_host}:{self.server_port}/shop/get_serve_oneroom_data" # Use /shop prefix
-        payload = {"addresses": addresses_to_fetch}
-        try:
-            # Keep using POST
-            resp = requests.post(url, json=payload, timeout=20) # Increased timeout, use POST
-            resp.raise_for_status()
-            j = resp.json()
-            if j.get("status") == "ok":
-                # Return fetched data AND the list of addresses that were requested
-                return {"status": "ok", "data": j.get("data", []), "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] ServeOneroomTab _bg_load_oneroom_data: Server error: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] ServeOneroomTab _bg_load_oneroom_data: Request failed: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-             print(f"[ERROR] ServeOneroomTab _bg_load_oneroom_data: Unexpected error: {ex}")
-             return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "serve_oneroom", addresses_to_fetch)
+        if result["status"] != "ok":
+            print(f"[ERROR] ServeOneroomTab _bg_load_oneroom_data: {result.get('message')}")
+        return result
 
 
     def _on_oneroom_data_fetched(self, future):
@@ -296,22 +210,13 @@ class ServeOneroomTab(QObject):
         elif st == "empty" or (st == "ok" and not new_rows):
              print(f"[INFO] ServeOneroomTab: Auto-refresh completed for {len(fetched_addresses)} addresses, but no new data returned from server.")
 
-        addresses_actually_updated = set()
-
         # 앱이 종료 중인지 다시 확인
         if self.is_shutting_down or (hasattr(self.parent_app, 'terminating') and self.parent_app.terminating):
             print("[INFO] ServeOneroomTab: Application is now terminating, skipping cache update")
             return
             
-        # Update cache incrementally
-        for row in new_rows:
-            addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-            if addr_str:
-                self.serve_oneroom_dict.setdefault(addr_str, []).append(row)
-                addresses_actually_updated.add(addr_str)
-        
-        # Log cache status after update
-        cached_addr_count = len(self.serve_oneroom_dict)
+        # 행은 이미 공용 store에 들어 있다 (fetch_for_tab) - 데이터가 온 주소만 알림
+        addresses_actually_updated = {row_address(row) for row in new_rows} - {""}
         
         # --- Remove successfully processed addresses from parent's set ---
         if fetched_addresses and hasattr(self.parent_app, 'new_addresses'):
@@ -358,6 +263,7 @@ class ServeOneroomTab(QObject):
             target_addresses = [self.parent_app.last_selected_address]
         
         if not target_addresses:
+            get_fetch_scheduler(self.parent_app).cancel("serve_oneroom")
             # No address selected, show empty table
             print("[INFO] ServeOneroomTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
             if not self.is_shutting_down:
@@ -369,43 +275,24 @@ class ServeOneroomTab(QObject):
         
         # 백그라운드에서 API 호출
         if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-            future = self.parent_app.executor.submit(
-                self._bg_load_oneroom_data_for_addresses,
-                target_addresses
-            )
-            future.add_done_callback(self._on_filter_data_loaded)
+            get_fetch_scheduler(self.parent_app).request(
+                "serve_oneroom", target_addresses, self._bg_load_oneroom_data_for_addresses, self._on_filter_data_loaded,
+                sources=BATCH_SOURCES, visible=widget_visible(self.serve_oneroom_view))
         else:
             print("[ERROR] ServeOneroomTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_oneroom_data_for_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 서빙 원룸 데이터를 실시간 로드합니다. """
+        """ (Background Thread) 지정된 주소들의 서빙 원룸 데이터를 공용 store에서 읽고, 없는 주소만 배치 API로 받습니다. """
         if not addresses_to_fetch:
             print("[WARN] ServeOneroomTab _bg_load_oneroom_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/shop/get_serve_oneroom_data"
-        payload = {"addresses": addresses_to_fetch}
-        
-        try:
-            print(f"[DEBUG] ServeOneroomTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}")
-            resp = requests.post(url, json=payload, timeout=20)
-            resp.raise_for_status()
-            j = resp.json()
-            
-            if j.get("status") == "ok":
-                data = j.get("data", [])
-                print(f"[INFO] ServeOneroomTab: API 응답 성공 - {len(data)}개 항목")
-                return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] ServeOneroomTab API 응답 오류: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-                
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] ServeOneroomTab API 요청 실패: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] ServeOneroomTab 예상치 못한 오류: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "serve_oneroom", addresses_to_fetch)
+        if result["status"] == "ok":
+            print(f"[INFO] ServeOneroomTab: 데이터 준비 완료 - {len(result['data'])}개 항목")
+        else:
+            print(f"[ERROR] ServeOneroomTab 데이터 로드 실패: {result.get('message')}")
+        return result
 
     def _on_filter_data_loaded(self, future):
         """ (Main Thread) API 쿼리 결과를 처리하고 테이블을 업데이트합니다. """
@@ -434,15 +321,7 @@ class ServeOneroomTab(QObject):
         if status == "ok":
             print(f"[INFO] ServeOneroomTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
             if not self.is_shutting_down:
-                # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-                for row in data:
-                    addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                    if addr_str:
-                        # 기존 데이터를 새 데이터로 교체
-                        self.serve_oneroom_dict[addr_str] = self.serve_oneroom_dict.get(addr_str, [])
-                        if row not in self.serve_oneroom_dict[addr_str]:  # 중복 방지
-                            self.serve_oneroom_dict[addr_str].append(row)
-                
+                # 행은 공용 store에 이미 있으므로 AllTab도 get_data_for_address로 같은 데이터를 본다
                 self.populate_serve_oneroom_table(data)
                 # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
                 for addr in fetched_addresses:
@@ -497,7 +376,7 @@ class ServeOneroomTab(QObject):
             self.filter_and_populate() # 이 함수 내부에서 캐시를 읽고 테이블을 채움
 
     def get_data_for_address(self, addr_str: str) -> list:
-        """ Returns the list of oneroom items for the given address from the local cache. """
+        """ Returns the list of oneroom items for the given address from the shared address store. """
         # 종료 상태 확인
         if self.is_shutting_down:
             print(f"[INFO] ServeOneroomTab: 종료 중이므로 주소 '{addr_str}'에 대한 데이터 요청을 건너뜁니다.")
@@ -586,6 +465,25 @@ class ServeOneroomTab(QObject):
         else:
             print(f"[⚠️ WARNING] ServeOneroomTab: update_selection_from_manager_check not available or empty address")
 
+    def _build_columns(self):
+        """ _get_headers() 순서의 컬럼 정의 """
+        texts = {
+            "호": field("ho"), "층": pair("curr_floor", "total_floor"),
+            "보증금/월세": pair("deposit", "monthly"), "관리비": field("manage_fee"),
+            "입주가능일": field("in_date"), "비밀번호": field("password"),
+            "방/화장실": pair("rooms", "baths", default=""), "연락처": field("owner_phone"),
+            "매물번호": property_numbers, "옵션": field("options"), "담당자": field("manager"),
+            "메모": field("memo"), "주차": field("parking"), "용도": field("building_usage"),
+            "사용승인일": field("approval_date"), "평수": field("area"), "광고종료일": field("ad_end_date"),
+            "사진경로": field("photo_path"), "소유자명": field("owner_name"), "관계": field("owner_relation"),
+        }
+        address = Column("주소", address_text, roles={
+            QtCore.Qt.UserRole + 2: lambda r: "원룸", # Source identifier
+            QtCore.Qt.UserRole + 3: lambda r: r.get("id", 0), # Primary Key
+            QtCore.Qt.UserRole + 1: lambda r: r.get("status_cd", ""), # Status code
+        })
+        return [address if h == "주소" else Column(h, texts[h]) for h in self._get_headers()]
+
     def _get_headers(self):
         """ Returns the list of headers for the serve_oneroom tab. """
         return [
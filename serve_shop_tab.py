@@ -1,8 +1,7 @@
 # serve_shop_tab.py
 import os
 import glob
-import requests
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtWidgets import (
     QTableView, QAbstractItemView, QHeaderView, QWidget, 
     QVBoxLayout, QMenu, QMessageBox
@@ -11,6 +10,10 @@ from PyQt5.QtCore import Qt, pyqtSignal, QObject
 from dialogs import ImageSlideshowWindow, StatusChangeDialog, RecommendDialog, BizSelectDialog
 # Import moved utility functions
 from ui_utils import restore_qtableview_column_widths, save_qtableview_column_widths
+from thumbnail_service import get_thumbnail_service
+from address_data_store import get_address_store, row_address, BATCH_SOURCES
+from address_fetch_scheduler import get_fetch_scheduler, widget_visible
+from columnar_table_model import ColumnarTableModel, Column, field, pair, address_text, property_numbers
 
 # Inherit from QObject
 class ServeShopTab(QObject):
@@ -25,7 +28,7 @@ class ServeShopTab(QObject):
 
         self.serve_shop_model = None
         self.serve_shop_view = None
-        self.serve_shop_dict = {} # Cache for serve_shop data by address
+        self.serve_shop_dict = get_address_store().view("serve_shop") # 탭 공용 주소 캐시(address_data_store)의 써브상가 뷰
         self.serve_shop_timer = None
         self.slider_window = None # Keep track of the slideshow window
         self.is_shutting_down = False  # 종료 상태 플래그 추가
@@ -37,10 +40,8 @@ class ServeShopTab(QObject):
         container = QtWidgets.QWidget()
         vlay = QtWidgets.QVBoxLayout(container)
 
-        self.serve_shop_model = QtGui.QStandardItemModel()
-        headers = self._get_headers()
-        self.serve_shop_model.setColumnCount(len(headers))
-        self.serve_shop_model.setHorizontalHeaderLabels(headers)
+        self.serve_shop_model = ColumnarTableModel(self._build_columns())
+        get_thumbnail_service().attach(self.serve_shop_model, 0)
 
         self.serve_shop_view = QtWidgets.QTableView()
         self.serve_shop_view.setModel(self.serve_shop_model)
@@ -174,77 +175,8 @@ class ServeShopTab(QObject):
             print("[INFO] ServeShopTab: Model not available, skipping populate_serve_shop_table")
             return
             
-        m = self.serve_shop_model
-        m.setRowCount(0)
-        if not rows: return
-
-        headers = self._get_headers() # Ensure headers are correct
-        m.setColumnCount(len(headers))
-        m.setHorizontalHeaderLabels(headers)
-        m.setRowCount(len(rows))
-
-        for i, r in enumerate(rows):
-            # 0) 주소 + 아이콘 + 툴팁 + UserData
-            addr_ = (r.get("dong", "") + " " + r.get("jibun", "")).strip()
-            folder_path = r.get("photo_path", "") or ""
-            rep_img_path = ""
-            if os.path.isdir(folder_path):
-                files = [f for f in os.listdir(folder_path)
-                         if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif'))]
-                if files:
-                    rep_img_path = os.path.join(folder_path, files[0])
-
-            item = QtGui.QStandardItem(addr_)
-            if rep_img_path and os.path.isfile(rep_img_path):
-                pixmap = QtGui.QPixmap(rep_img_path).scaled(
-                    24, 24, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
-                )
-                icon = QtGui.QIcon(pixmap)
-                item.setIcon(icon)
-                file_url = QtCore.QUrl.fromLocalFile(rep_img_path).toString()
-                html_tooltip = f'<img src="{file_url}" width="200">'
-                item.setToolTip(html_tooltip)
-            else:
-                item.setToolTip("")
-
-            # Store data in UserRole
-            item.setData(folder_path, QtCore.Qt.UserRole + 10) # Folder path
-            item.setData(rep_img_path, QtCore.Qt.UserRole + 11) # Representative image path
-            item.setData("상가", QtCore.Qt.UserRole + 2) # Source identifier
-            item.setData(r.get("id", 0), QtCore.Qt.UserRole + 3) # Primary Key (DB ID)
-            item.setData(r.get("status_cd", ""), QtCore.Qt.UserRole + 1) # Status code
-
-            m.setItem(i, 0, item)
-
-            # Populate other columns based on headers
-            m.setItem(i, 1, QtGui.QStandardItem(str(r.get("ho", "")))) # 호
-            cf = r.get("curr_floor", 0)
-            tf = r.get("total_floor", 0)
-            m.setItem(i, 2, QtGui.QStandardItem(f"{cf}/{tf}")) # 층
-            dp = r.get("deposit", 0)
-            mn = r.get("monthly", 0)
-            m.setItem(i, 3, QtGui.QStandardItem(f"{dp}/{mn}")) # 보증금/월세
-            m.setItem(i, 4, QtGui.QStandardItem(str(r.get("manage_fee", "")))) # 관리비
-            m.setItem(i, 5, QtGui.QStandardItem(str(r.get("premium", "")))) # 권리금
-            m.setItem(i, 6, QtGui.QStandardItem(r.get("current_use", ""))) # 현업종
-            m.setItem(i, 7, QtGui.QStandardItem(str(r.get("area", "")))) # 평수
-            m.setItem(i, 8, QtGui.QStandardItem(r.get("owner_phone", ""))) # 연락처
-            nav = r.get("naver_property_no", "")
-            srv = r.get("serve_property_no", "")
-            mm_ = f"{nav}/{srv}" if (nav or srv) else ""
-            m.setItem(i, 9, QtGui.QStandardItem(mm_)) # 매물번호
-            m.setItem(i, 10, QtGui.QStandardItem(r.get("manager", ""))) # 담당자
-            m.setItem(i, 11, QtGui.QStandardItem(r.get("memo", ""))) # 메모
-            m.setItem(i, 12, QtGui.QStandardItem(str(r.get("parking", "")))) # 주차
-            m.setItem(i, 13, QtGui.QStandardItem(r.get("building_usage", ""))) # 용도
-            m.setItem(i, 14, QtGui.QStandardItem(str(r.get("approval_date", "")))) # 사용승인일
-            rm_ = r.get("rooms", 0)
-            bt_ = r.get("baths", 0)
-            m.setItem(i, 15, QtGui.QStandardItem(f"{rm_}/{bt_}")) # 방/화장실
-            m.setItem(i, 16, QtGui.QStandardItem(str(r.get("ad_end_date", "")))) # 광고종료일
-            m.setItem(i, 17, QtGui.QStandardItem(r.get("photo_path", ""))) # 사진경로
-            m.setItem(i, 18, QtGui.QStandardItem(r.get("owner_name", ""))) # 소유자명
-            m.setItem(i, 19, QtGui.QStandardItem(r.get("owner_relation", ""))) # 관계
+        # 칸별 QStandardItem 대신 원본 행만 넘긴다 (표시값/아이콘은 보이는 행만 계산)
+        self.serve_shop_model.set_rows(rows or [])
 
     def filter_serve_shop_by_address(self, address_str):
         """ Filters the table to show only rows matching the address_str. """
@@ -297,11 +229,8 @@ class ServeShopTab(QObject):
         if not all_new_addresses:
             return
 
-        # Check local cache and filter out addresses that are already loaded
-        addresses_to_check = [
-            addr for addr in all_new_addresses
-            if addr not in self.serve_shop_dict or not self.serve_shop_dict[addr] # Check if key exists and has data
-        ]
+        # Check the shared store and filter out addresses that are already loaded
+        addresses_to_check = get_address_store().missing("serve_shop", all_new_addresses)
 
         if not addresses_to_check:
             return
@@ -315,30 +244,15 @@ class ServeShopTab(QObject):
         future.add_done_callback(self._on_shop_data_fetched)
 
     def _bg_load_shop_data_with_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) Fetches serve_shop data ONLY for the given uncached addresses, using the original endpoint. """
+        """ (Background Thread) Fills the shared address store for the given uncached addresses (one batch request for all tabs). """
         if not addresses_to_fetch: # Should not happen due to check in auto_reload, but as safety
             print("[WARN] ServeShopTab _bg_load: Received empty list of addresses to fetch.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/shop/get_serve_shop_data" # Changed prefix from /serve to /shop
-        payload = {"addresses": addresses_to_fetch}
-        try:
-            # Keep using POST as it likely expects a list of addresses in the body
-            resp = requests.post(url, json=payload, timeout=20) # Increased timeout, use POST
-            resp.raise_for_status()
-            j = resp.json()
-            if j.get("status") == "ok":
-                # Return fetched data AND the list of addresses that were requested
-                return {"status": "ok", "data": j.get("data", []), "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] ServeShopTab _bg_load_shop_data: Server error: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] ServeShopTab _bg_load_shop_data: Request failed: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] ServeShopTab _bg_load_shop_data: Unexpected error: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "serve_shop", addresses_to_fetch)
+        if result["status"] != "ok":
+            print(f"[ERROR] ServeShopTab _bg_load_shop_data: {result.get('message')}")
+        return result
 
 
     def _on_shop_data_fetched(self, future):
@@ -373,18 +287,8 @@ class ServeShopTab(QObject):
         elif st == "empty" or (st == "ok" and not new_rows):
              print(f"[INFO] ServeShopTab: Auto-refresh completed for {len(fetched_addresses)} addresses, but no new data returned from server.")
         
-        addresses_actually_updated = set() # Track addresses for which we received data
-
-        # Update cache incrementally using the new_rows data
-        for row in new_rows:
-            addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-            if addr_str:
-                # If address not in dict or needs replacement, add/update it
-                self.serve_shop_dict.setdefault(addr_str, []).append(row)
-                addresses_actually_updated.add(addr_str)
-
-        # Log cache status after update
-        cached_addr_count = len(self.serve_shop_dict)
+        # 행은 이미 공용 store에 들어 있다 (fetch_for_tab) - 데이터가 온 주소만 알림
+        addresses_actually_updated = {row_address(row) for row in new_rows} - {""}
 
         # --- Remove successfully processed addresses from parent's set ---
         if fetched_addresses and hasattr(self.parent_app, 'new_addresses'):
@@ -427,6 +331,7 @@ class ServeShopTab(QObject):
             target_addresses = [self.parent_app.last_selected_address]
         
         if not target_addresses:
+            get_fetch_scheduler(self.parent_app).cancel("serve_shop")  # 이전 선택의 응답이 빈 테이블을 덮지 않도록
             # No address selected, show empty table
             print("[INFO] ServeShopTab: 선택된 주소가 없으므로 빈 테이블을 표시합니다.")
             if not self.is_shutting_down:
@@ -438,43 +343,25 @@ class ServeShopTab(QObject):
         
         # 백그라운드에서 API 호출
         if hasattr(self.parent_app, 'executor') and self.parent_app.executor:
-            future = self.parent_app.executor.submit(
-                self._bg_load_shop_data_for_addresses,
-                target_addresses
-            )
-            future.add_done_callback(self._on_filter_data_loaded)
+            # 같은 창(FETCH_COALESCE_MS) 안의 다른 탭 요청과 합쳐 보내고, 다음 선택이 오면 이 요청의 결과는 버린다
+            get_fetch_scheduler(self.parent_app).request(
+                "serve_shop", target_addresses, self._bg_load_shop_data_for_addresses, self._on_filter_data_loaded,
+                sources=BATCH_SOURCES, visible=widget_visible(self.serve_shop_view))
         else:
             print("[ERROR] ServeShopTab: 백그라운드 executor를 찾을 수 없습니다.")
 
     def _bg_load_shop_data_for_addresses(self, addresses_to_fetch: list):
-        """ (Background Thread) API 쿼리로 지정된 주소들의 서빙 상가 데이터를 실시간 로드합니다. """
+        """ (Background Thread) 지정된 주소들의 서빙 상가 데이터를 공용 store에서 읽고, 없는 주소만 배치 API로 받습니다. """
         if not addresses_to_fetch:
             print("[WARN] ServeShopTab _bg_load_shop_data_for_addresses: 빈 주소 리스트를 받았습니다.")
             return {"status": "empty", "data": [], "fetched_addresses": []}
 
-        url = f"http://{self.server_host}:{self.server_port}/shop/get_serve_shop_data"
-        payload = {"addresses": addresses_to_fetch}
-        
-        try:
-            print(f"[DEBUG] ServeShopTab: API 요청 시작 - {url}, 주소: {addresses_to_fetch}")
-            resp = requests.post(url, json=payload, timeout=20)
-            resp.raise_for_status()
-            j = resp.json()
-            
-            if j.get("status") == "ok":
-                data = j.get("data", [])
-                print(f"[INFO] ServeShopTab: API 응답 성공 - {len(data)}개 항목")
-                return {"status": "ok", "data": data, "fetched_addresses": addresses_to_fetch}
-            else:
-                print(f"[ERROR] ServeShopTab API 응답 오류: {j}")
-                return {"status": "error", "data": [], "message": j.get("message", "Unknown server error"), "fetched_addresses": []}
-                
-        except requests.exceptions.RequestException as ex:
-            print(f"[ERROR] ServeShopTab API 요청 실패: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
-        except Exception as ex:
-            print(f"[ERROR] ServeShopTab 예상치 못한 오류: {ex}")
-            return {"status": "exception", "message": str(ex), "data": [], "fetched_addresses": []}
+        result = get_address_store().fetch_for_tab(self.server_host, self.server_port, "serve_shop", addresses_to_fetch)
+        if result["status"] == "ok":
+            print(f"[INFO] ServeShopTab: 데이터 준비 완료 - {len(result['data'])}개 항목")
+        else:
+            print(f"[ERROR] ServeShopTab 데이터 로드 실패: {result.get('message')}")
+        return result
 
     def _on_filter_data_loaded(self, future):
         """ (Main Thread) API 쿼리 결과를 처리하고 테이블을 업데이트합니다. """
@@ -503,15 +390,7 @@ class ServeShopTab(QObject):
         if status == "ok":
             print(f"[INFO] ServeShopTab: 데이터 로드 완료 - {len(data)}개 항목, 주소: {fetched_addresses}")
             if not self.is_shutting_down:
-                # 딕셔너리 업데이트 - AllTab에서 데이터를 가져갈 수 있도록
-                for row in data:
-                    addr_str = (row.get("dong", "") + " " + row.get("jibun", "")).strip()
-                    if addr_str:
-                        # 기존 데이터를 새 데이터로 교체
-                        self.serve_shop_dict[addr_str] = self.serve_shop_dict.get(addr_str, [])
-                        if row not in self.serve_shop_dict[addr_str]:  # 중복 방지
-                            self.serve_shop_dict[addr_str].append(row)
-                
+                # 행은 공용 store에 이미 있으므로 AllTab도 get_data_for_address로 같은 데이터를 본다
                 self.populate_serve_shop_table(data)
                 # 시그널 보내기 - AllTab에서 데이터 로드 완료를 감지할 수 있도록
                 for addr in fetched_addresses:
@@ -547,7 +426,7 @@ class ServeShopTab(QObject):
             self.filter_and_populate() # 이 함수 내부에서 캐시를 읽고 테이블을 채움
 
     def get_data_for_address(self, addr_str: str) -> list:
-        """ Returns the list of serve shop items for the given address from the local cache. """
+        """ Returns the list of serve shop items for the given address from the shared address store. """
         # 종료 상태 확인
         if self.is_shutting_down:
             print(f"[INFO] ServeShopTab: 종료 중이므로 주소 '{addr_str}'에 대한 데이터 요청을 건너뜁니다.")
@@ -555,6 +434,30 @@ class ServeShopTab(QObject):
             
         return self.serve_shop_dict.get(addr_str, [])
         
+    def _build_columns(self):
+        """ _get_headers() 순서의 컬럼 정의 (주소 칸: 사진 아이콘/툴팁(썸네일 서비스) + UserRole 값) """
+        def folder_path(r):
+            return r.get("photo_path", "") or ""
+
+        address = Column("주소", address_text, roles={
+            **get_thumbnail_service().photo_roles(folder_path), # 아이콘/툴팁/대표 이미지 경로 (백그라운드로 준비)
+            QtCore.Qt.UserRole + 10: folder_path, # Folder path
+            QtCore.Qt.UserRole + 2: lambda r: "상가", # Source identifier
+            QtCore.Qt.UserRole + 3: lambda r: r.get("id", 0), # Primary Key (DB ID)
+            QtCore.Qt.UserRole + 1: lambda r: r.get("status_cd", ""), # Status code
+        })
+        texts = {
+            "주소": None, "호": field("ho"), "층": pair("curr_floor", "total_floor"),
+            "보증금/월세": pair("deposit", "monthly"), "관리비": field("manage_fee"),
+            "권리금": field("premium"), "현업종": field("current_use"), "평수": field("area"),
+            "연락처": field("owner_phone"), "매물번호": property_numbers,
+            "담당자": field("manager"), "메모": field("memo"), "주차": field("parking"),
+            "용도": field("building_usage"), "사용승인일": field("approval_date"),
+            "방/화장실": pair("rooms", "baths"), "광고종료일": field("ad_end_date"),
+            "사진경로": field("photo_path"), "소유자명": field("owner_name"), "관계": field("owner_relation"),
+        }
+        return [address if h == "주소" else Column(h, texts[h]) for h in self._get_headers()]
+
     def _get_headers(self):
         """ Returns the list of headers for the serve_shop tab. """
         return [
@@ -46,7 +46,8 @@ else:
 
 # 설정 및 유틸리티 임포트
 # settings.py에서 필요한 설정값과 로거를 가져옵니다.
-from settings import SERVER_HOST_DEFAULT, SERVER_PORT_DEFAULT, logger
+from settings import SERVER_HOST_DEFAULT, SERVER_PORT_DEFAULT, RESPONSE_COMPRESSION, RESPONSE_COMPRESS_MIN_SIZE, logger
+from fast_response import CompressionMiddleware, brotli, orjson
 # server_utils.py에서 resource_path 함수를 가져옵니다.
 # resource_path 사용 여부는 static_dir 설정 방식에 따라 결정됩니다.
 # from server_utils import resource_path
@@ -55,7 +56,8 @@ from settings import SERVER_HOST_DEFAULT, SERVER_PORT_DEFAULT, logger
 # routers 패키지 내의 각 모듈에서 APIRouter 인스턴스를 가져옵니다.
 from routers import (
     auth_router, customer_router, shop_router, recommend_router,
-    mylist_router, completed_router, manager_router, websocket_router
+    mylist_router, completed_router, manager_router, websocket_router,
+    stats_router
 )
 # 배치 처리 라우터 추가
 from routers.batch import router as batch_router
@@ -102,6 +104,11 @@ app.add_middleware(
 logger.info(f"Added CORS middleware with allowed origins: {origins}")
 # --- CORS 미들웨어 추가 완료 ---
 
+# --- 응답 압축 (Accept-Encoding 협상: br > gzip) ---
+if RESPONSE_COMPRESSION:
+    app.add_middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESS_MIN_SIZE)
+    logger.info(f"Added compression middleware (min_size={RESPONSE_COMPRESS_MIN_SIZE}, brotli={'on' if brotli else 'off'}, orjson={'on' if orjson else 'off'})")
+
 # --- 정적 파일 마운트 (resource_path 사용) ---
 try:
     static_dir = resource_path("static") 
@@ -128,7 +135,30 @@ app.include_router(completed_router, prefix="/completed", tags=["Completed Deals
 app.include_router(manager_router, prefix="/manager", tags=["Manager Info"])
 app.include_router(websocket_router) # WebSocket은 일반적으로 prefix 없이 사용
 app.include_router(batch_router, prefix="/batch", tags=["Batch Operations"])
+app.include_router(stats_router, prefix="/stats", tags=["Server Stats"])
 logger.info("Included all routers.")
+
+@app.on_event("startup")
+def prepare_listing_match_tables():
+    # 매칭 테이블 DDL(암묵적 커밋)을 요청 트랜잭션 안에서 실행하지 않도록 시작 시 한 번 만든다
+    from settings import USE_MATERIALIZED_MATCH, get_db_connection
+    if not USE_MATERIALIZED_MATCH:
+        return
+    try:
+        from listing_match_store import ensure_match_tables
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            ensure_match_tables(cursor)
+            cursor.close()
+    except Exception as e:
+        logger.error(f"Failed to prepare listing match tables (첫 조회 때 다시 시도): {e}")
+
+@app.on_event("shutdown")
+def close_db_pool():
+    # 서버 종료 시 DB 작업 스레드를 정리한 뒤 풀의 유휴 커넥션 정리
+    from settings import get_db_executor, get_db_pool
+    get_db_executor().shutdown(wait=True)
+    get_db_pool().close_all()
 # --- 서버 준비 완료 로그 추가 ---
 logger.info("--- Server Ready ---")
 # --- 서버 준비 완료 로그 추가 ---
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 from dotenv import load_dotenv
 # server_utils에서 함수 임포트
 from server_utils import resource_path, is_pyinstaller_exe
@@ -50,10 +51,74 @@ DB_PASSWORD = os.environ.get("DB_PASSWORD", "a13030z0!!")
 DB_NAME = os.environ.get("DB_NAME", "mydb")
 DB_CHARSET = os.environ.get("DB_CHARSET", "utf8mb4")
 
+# --- MySQL 커넥션 풀 설정 ---
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_POOL_MAX_LIFETIME = float(os.environ.get("DB_POOL_MAX_LIFETIME", "1800"))        # 초
+DB_POOL_ACQUIRE_TIMEOUT = float(os.environ.get("DB_POOL_ACQUIRE_TIMEOUT", "10"))    # 초
+DB_POOL_HEALTH_CHECK_INTERVAL = float(os.environ.get("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))  # 초
+# async 엔드포인트의 DB 작업을 실행하는 공유 스레드 수 (커넥션 풀 크기 이하 권장)
+DB_EXECUTOR_WORKERS = int(os.environ.get("DB_EXECUTOR_WORKERS", str(DB_POOL_SIZE)))
+
+# --- 매니저 체크 매칭 물리화 테이블(customer_listing_match) 사용 여부 ---
+USE_MATERIALIZED_MATCH = os.environ.get("USE_MATERIALIZED_MATCH", "true").lower() == "true"
+# 변경 추적이 없을 때 조회 경로가 naver_shop 시그니처를 전체 스캔하는 최소 간격 (수집기는 /shop/refresh_listing_matches로 즉시 반영)
+LISTING_MATCH_SYNC_INTERVAL = float(os.environ.get("LISTING_MATCH_SYNC_INTERVAL", "300"))  # 초
+
+# --- 주소 정규화 키 생성 컬럼(addr_key) 사용 여부 (migrate_addr_key.py 실행 후 true) ---
+USE_ADDR_KEY_COLUMN = os.environ.get("USE_ADDR_KEY_COLUMN", "false").lower() == "true"
+
+# --- 통합검색 ngram FULLTEXT 인덱스 사용 여부 (migrate_search_index.py 실행 후 true) ---
+USE_SEARCH_FULLTEXT = os.environ.get("USE_SEARCH_FULLTEXT", "false").lower() == "true"
+NGRAM_TOKEN_SIZE = int(os.environ.get("NGRAM_TOKEN_SIZE", "2"))        # MySQL ngram_token_size와 동일하게
+SEARCH_RESULT_LIMIT = int(os.environ.get("SEARCH_RESULT_LIMIT", "300"))  # 통합검색 최대 반환 건수
+
+# --- 네이버 매물 키셋 스트리밍 검색 (총 건수 캐시 / 페이지 크기 상한) ---
+SEARCH_COUNT_CACHE_TTL = float(os.environ.get("SEARCH_COUNT_CACHE_TTL", "60"))  # 초
+STREAM_PAGE_MAX_LIMIT = int(os.environ.get("STREAM_PAGE_MAX_LIMIT", "1000"))
+
+# --- 마이리스트 일괄 저장: 다중 행 INSERT / CASE UPDATE / DELETE IN 한 문장당 최대 행 수 ---
+BULK_WRITE_CHUNK_SIZE = int(os.environ.get("BULK_WRITE_CHUNK_SIZE", "500"))
+
+# --- 행 변경 추적 / 델타 동기화 (migrate_change_tracking.py 실행 후 true) ---
+USE_CHANGE_TRACKING = os.environ.get("USE_CHANGE_TRACKING", "false").lower() == "true"
+DELTA_SYNC_OVERLAP = float(os.environ.get("DELTA_SYNC_OVERLAP", "10"))                  # 초, 커밋 지연 여유
+DELTA_TOMBSTONE_RETENTION_DAYS = int(os.environ.get("DELTA_TOMBSTONE_RETENTION_DAYS", "7"))
+
+# --- WebSocket 변경 알림 허브 (ws_hub.BroadcastHub) ---
+WS_QUEUE_SIZE = int(os.environ.get("WS_QUEUE_SIZE", "256"))                  # 연결당 대기 메시지 수
+WS_DROP_POLICY = os.environ.get("WS_DROP_POLICY", "drop_oldest")             # drop_oldest / drop_newest / disconnect
+WS_SEND_TIMEOUT = float(os.environ.get("WS_SEND_TIMEOUT", "10"))             # 초, 한 프레임 전송 제한
+WS_BATCH_MAX = int(os.environ.get("WS_BATCH_MAX", "100"))                    # 프레임당 최대 이벤트 수
+WS_BATCH_LINGER = float(os.environ.get("WS_BATCH_LINGER", "0.02"))           # 초, 첫 이벤트 후 모으는 시간
+WS_HEARTBEAT_INTERVAL = float(os.environ.get("WS_HEARTBEAT_INTERVAL", "20"))  # 초
+WS_HEARTBEAT_TIMEOUT = float(os.environ.get("WS_HEARTBEAT_TIMEOUT", "60"))    # 초, 이 시간 동안 수신 없으면 끊음
+
+# --- 응답 압축 (fast_response.CompressionMiddleware) ---
+RESPONSE_COMPRESSION = os.environ.get("RESPONSE_COMPRESSION", "true").lower() == "true"
+RESPONSE_COMPRESS_MIN_SIZE = int(os.environ.get("RESPONSE_COMPRESS_MIN_SIZE", "1024"))  # 바이트
+
+# --- (테이블, 주소) 조회 결과 캐시 설정 ---
+ADDRESS_CACHE_ENABLED = os.environ.get("ADDRESS_CACHE_ENABLED", "true").lower() == "true"
+ADDRESS_CACHE_TTL = float(os.environ.get("ADDRESS_CACHE_TTL", "60"))                  # 초
+ADDRESS_CACHE_MAX_ENTRIES = int(os.environ.get("ADDRESS_CACHE_MAX_ENTRIES", "20000"))
+
+# --- 동일 조회 동시 요청 합치기 (single_flight.py) ---
+SINGLE_FLIGHT_ENABLED = os.environ.get("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
 # --- Supabase 설정 (새로 추가) ---
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
 SUPABASE_ANON_KEY = os.environ.get("SUPABASE_ANON_KEY", "")
 USE_SUPABASE_SHOP = os.environ.get("USE_SUPABASE_SHOP", "false").lower() == "true"
+# in_('id', ...) 조회 / 다중 insert 한 번에 보내는 최대 건수 (URL 길이, 요청 크기 제한)
+SUPABASE_BATCH_SIZE = int(os.environ.get("SUPABASE_BATCH_SIZE", "100"))
+# range() 페이지 병렬 조회 (supabase_fetch.py)
+SUPABASE_PAGE_SIZE = int(os.environ.get("SUPABASE_PAGE_SIZE", "1000"))              # PostgREST max-rows 이하로
+SUPABASE_FETCH_CONCURRENCY = int(os.environ.get("SUPABASE_FETCH_CONCURRENCY", "4"))  # 프로세스 전체 동시 페이지 요청 수
+SUPABASE_COUNT_MODE = os.environ.get("SUPABASE_COUNT_MODE", "exact")                # exact / planned / estimated
+# 공유 HTTP 클라이언트 연결 풀 (keep-alive)
+SUPABASE_HTTP_MAX_CONNECTIONS = int(os.environ.get("SUPABASE_HTTP_MAX_CONNECTIONS", "20"))
+SUPABASE_HTTP_KEEPALIVE = float(os.environ.get("SUPABASE_HTTP_KEEPALIVE", "30"))    # 초, 유휴 연결 유지 시간
+SUPABASE_HTTP_TIMEOUT = float(os.environ.get("SUPABASE_HTTP_TIMEOUT", "30"))        # 초
 
 # Supabase 클라이언트 초기화
 supabase_client = None
@@ -63,16 +128,25 @@ if SUPABASE_URL and SUPABASE_ANON_KEY:
         import httpx
         
         # HTTP/2 오류 해결을 위해 HTTP/1.1 사용
-        transport = httpx.HTTPTransport(http2=False)
-        client = httpx.Client(transport=transport)
+        # 페이지 병렬 조회가 같은 클라이언트를 여러 스레드에서 쓰므로 keep-alive 연결 수를 풀 크기에 맞춘다
+        limits = httpx.Limits(
+            max_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=SUPABASE_HTTP_KEEPALIVE,
+        )
+        transport = httpx.HTTPTransport(http2=False, limits=limits)
+        client = httpx.Client(transport=transport, timeout=SUPABASE_HTTP_TIMEOUT)
         
-        # 커스텀 HTTP 클라이언트로 Supabase 클라이언트 생성
+        # 커스텀 HTTP 클라이언트로 Supabase 클라이언트 생성 (ClientOptions가 없는 버전은 dict)
+        try:
+            from supabase import ClientOptions
+            options = ClientOptions(httpx_client=client)
+        except (ImportError, TypeError):
+            options = {"httpx_client": client}
         supabase_client: Client = create_client(
             supabase_url=SUPABASE_URL, 
             supabase_key=SUPABASE_ANON_KEY,
-            options={
-                "httpx_client": client
-            }
+            options=options
         )
         logger.info("Supabase client initialized successfully with HTTP/1.1")
     except ImportError:
@@ -93,19 +167,103 @@ if SUPABASE_URL and SUPABASE_ANON_KEY:
 else:
     logger.warning("Supabase credentials not found in environment variables")
 
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def get_db_pool():
+    """프로세스 전역 MySQL 커넥션 풀 (최초 호출 시 생성)"""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                from db_pool import MySQLConnectionPool
+                _db_pool = MySQLConnectionPool(
+                    connect_kwargs=dict(
+                        host=DB_HOST,
+                        user=DB_USER,
+                        password=DB_PASSWORD,
+                        database=DB_NAME,
+                        charset=DB_CHARSET,
+                        use_unicode=True
+                    ),
+                    pool_size=DB_POOL_SIZE,
+                    max_lifetime=DB_POOL_MAX_LIFETIME,
+                    acquire_timeout=DB_POOL_ACQUIRE_TIMEOUT,
+                    health_check_interval=DB_POOL_HEALTH_CHECK_INTERVAL,
+                )
+                logger.info(f"MySQL connection pool created (size={DB_POOL_SIZE}, max_lifetime={DB_POOL_MAX_LIFETIME}s, acquire_timeout={DB_POOL_ACQUIRE_TIMEOUT}s)")
+    return _db_pool
+
+_db_executor = None
+_db_executor_lock = threading.Lock()
+
+def get_db_executor():
+    """프로세스 전역 DB 작업 스레드 풀 (async 핸들러에서 `await get_db_executor().run(fn, ...)`)"""
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                from db_executor import DBExecutor
+                _db_executor = DBExecutor(max_workers=DB_EXECUTOR_WORKERS)
+                logger.info(f"DB executor created (workers={DB_EXECUTOR_WORKERS})")
+    return _db_executor
+
+_supabase_fetch_pool = None
+_supabase_fetch_pool_lock = threading.Lock()
+
+def get_supabase_fetch_pool():
+    """Supabase range() 페이지 요청용 스레드 풀 (워커 수 = 프로세스 전체 동시 페이지 요청 상한)"""
+    global _supabase_fetch_pool
+    if _supabase_fetch_pool is None:
+        with _supabase_fetch_pool_lock:
+            if _supabase_fetch_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _supabase_fetch_pool = ThreadPoolExecutor(
+                    max_workers=max(1, SUPABASE_FETCH_CONCURRENCY), thread_name_prefix="supabase-page"
+                )
+                logger.info(f"Supabase fetch pool created (workers={SUPABASE_FETCH_CONCURRENCY})")
+    return _supabase_fetch_pool
+
+_address_cache = None
+_address_cache_lock = threading.Lock()
+
+def get_address_cache():
+    """프로세스 전역 (테이블, 주소) 조회 결과 캐시 (최초 호출 시 생성)"""
+    global _address_cache
+    if _address_cache is None:
+        with _address_cache_lock:
+            if _address_cache is None:
+                from address_cache import AddressCache
+                _address_cache = AddressCache(
+                    max_entries=ADDRESS_CACHE_MAX_ENTRIES,
+                    ttl=ADDRESS_CACHE_TTL,
+                    enabled=ADDRESS_CACHE_ENABLED,
+                )
+                logger.info(f"Address cache created (enabled={ADDRESS_CACHE_ENABLED}, ttl={ADDRESS_CACHE_TTL}s, max_entries={ADDRESS_CACHE_MAX_ENTRIES})")
+    return _address_cache
+
+_count_cache = None
+_count_cache_lock = threading.Lock()
+
+def get_count_cache():
+    """프로세스 전역 검색 총 건수 캐시 (키셋 스트리밍 검색의 total_count)"""
+    global _count_cache
+    if _count_cache is None:
+        with _count_cache_lock:
+            if _count_cache is None:
+                from keyset_page import CountCache
+                _count_cache = CountCache(ttl=SEARCH_COUNT_CACHE_TTL)
+                logger.info(f"Search count cache created (ttl={SEARCH_COUNT_CACHE_TTL}s)")
+    return _count_cache
+
 def get_db_connection():
-    """기존 MySQL 연결 함수 (하위 호환성 유지)"""
+    """
+    풀에서 MySQL 커넥션 대여 (하위 호환성 유지)
+    - conn.close() 또는 `with get_db_connection() as conn:` 종료 시 풀에 반납됩니다.
+    """
     import mysql.connector as mysql
     try:
-        conn = mysql.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME,
-            charset=DB_CHARSET,
-            use_unicode=True
-        )
-        return conn
+        return get_db_pool().acquire()
     except mysql.Error as e:
         # logger.error(f"Database connection error: {e}")
         logger.exception(f"Database connection mysql.Error: {e}") # 스택 트레이스 포함 로깅
@@ -0,0 +1,166 @@
+"""
+동일 조회 동시 요청 합치기 (single-flight)
+
+여러 담당자가 같은 주소를 누르거나 탭들의 auto_reload_*가 한꺼번에 돌면 같은 조회
+(search_manager_data, 같은 주소 목록의 get_serve_shop_data 등)가 동시에 수십 번 실행된다.
+@single_flight를 붙인 함수는 "이름 + 정규화한 인자" 키가 같은 호출이 이미 실행 중이면 새로 실행하지 않고
+그 실행의 결과(또는 예외)를 함께 받는다. 실행이 끝나면 키를 비우므로 결과를 캐시하지는 않는다.
+
+- 동기 호출(FastAPI def 라우터 스레드): 선행 호출이 끝날 때까지 블로킹 대기
+- get_db_executor().run(fn, ...)으로 넘긴 경우: DBExecutor가 @single_flight 함수를 알아보고
+  같은 키 작업이 있으면 워커를 새로 잡지 않고 그 Future를 await 한다 (대기 중인 요청이 DB 워커를 차지하지 않음)
+- 두 경로는 같은 in-flight 표(concurrent.futures.Future)를 공유한다.
+- 결과 객체는 합쳐진 요청들이 공유하므로 호출 측에서 수정하지 않는다. (AddressCache 행과 같은 규칙)
+- 키: 기본은 인자 전체를 정렬된 JSON으로. key=로 응답에 영향 없는 인자를 빼거나 순서를 정규화한다.
+  (예: addresses_key - 결과가 SQL ORDER BY로 정렬되는 주소 목록 조회는 주소 순서/중복/표기 차이 무시)
+- SINGLE_FLIGHT_ENABLED=false면 그대로 실행만 하고 호출 수만 센다. 통계는 /stats/single_flight
+"""
+import asyncio
+import functools
+import json
+import threading
+from concurrent.futures import Future
+
+from address_cache import normalize_address
+from settings import SINGLE_FLIGHT_ENABLED
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def default_key(*args, **kwargs):
+    return json.dumps([args, kwargs], sort_keys=True, ensure_ascii=False, default=str, separators=(",", ":"))
+
+
+def addresses_key(body, *args, **kwargs):
+    """요청 body의 addresses를 정규화 주소 집합(정렬)으로 바꾼 키"""
+    if isinstance(body, dict) and isinstance(body.get("addresses"), list):
+        body = dict(body, addresses=sorted({normalize_address(a) for a in body["addresses"] if isinstance(a, str)}))
+    return default_key(body, *args, **kwargs)
+
+
+class SingleFlight:
+    """키별 실행 중 Future 표 + 통계"""
+
+    def __init__(self, name, enabled=True):
+        self.name = name
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> concurrent.futures.Future
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+        self.failed = 0
+        self.max_inflight = 0
+
+    def _join(self, key, start=None):
+        """(future, leader). leader면 새 Future를 등록 (start가 있으면 start()가 돌려준 Future)"""
+        with self._lock:
+            self.calls += 1
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.shared += 1
+                return fut, False
+            self.executions += 1
+            fut = start() if start is not None else Future()
+            self._inflight[key] = fut
+            if len(self._inflight) > self.max_inflight:
+                self.max_inflight = len(self._inflight)
+            return fut, True
+
+    def _finish(self, key, fut):
+        with self._lock:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+            if fut.cancelled() or fut.exception() is not None:
+                self.failed += 1
+
+    def call(self, key, fn, *args, **kwargs):
+        """동기 실행. 같은 키가 실행 중이면 그 결과를 기다린다"""
+        if not self.enabled:
+            with self._lock:
+                self.calls += 1
+                self.executions += 1
+            return fn(*args, **kwargs)
+        fut, leader = self._join(key)
+        if not leader:
+            return fut.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            # 키를 먼저 비워야 예외를 받은 뒤 재시도하는 호출이 새로 실행된다
+            fut.set_exception(e)
+            self._finish(key, fut)
+            raise
+        fut.set_result(result)
+        self._finish(key, fut)
+        return result
+
+    async def run(self, executor, key, fn, *args, **kwargs):
+        """executor(DBExecutor)에서 실행. 같은 키가 실행 중이면 워커를 잡지 않고 그 Future를 await"""
+        if not self.enabled:
+            with self._lock:
+                self.calls += 1
+                self.executions += 1
+            return await asyncio.wrap_future(executor.submit(fn, *args, **kwargs))
+        fut, leader = self._join(key, start=lambda: executor.submit(fn, *args, **kwargs))
+        if leader:
+            fut.add_done_callback(lambda f: self._finish(key, f))
+        # 요청 하나가 취소(클라이언트 끊김)되어도 공유 실행은 취소하지 않는다
+        return await asyncio.shield(asyncio.wrap_future(fut))
+
+    def stats(self):
+        with self._lock:
+            return {
+                "name": self.name,
+                "calls": self.calls,
+                "executions": self.executions,
+                "saved": self.shared,
+                "saved_ratio": round(self.shared / self.calls, 4) if self.calls else 0.0,
+                "failed": self.failed,
+                "inflight": len(self._inflight),
+                "max_inflight": self.max_inflight,
+            }
+
+
+def get_flight(name):
+    with _flights_lock:
+        flight = _flights.get(name)
+        if flight is None:
+            flight = _flights[name] = SingleFlight(name, enabled=SINGLE_FLIGHT_ENABLED)
+        return flight
+
+
+def single_flight(name=None, key=None):
+    """
+    데코레이터. name은 통계/키 구분용 (기본: 함수 이름), key(*args, **kwargs)는 키 정규화 함수.
+    DBExecutor.run은 wrapper.single_flight / wrapper.flight_key를 보고 비동기 경로로 합친다.
+    """
+    def decorator(fn):
+        flight = get_flight(name or fn.__name__)
+        make_key = key or default_key
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return flight.call(make_key(*args, **kwargs), fn, *args, **kwargs)
+
+        wrapper.single_flight = flight
+        wrapper.flight_key = make_key
+        return wrapper
+    return decorator
+
+
+def single_flight_stats():
+    with _flights_lock:
+        flights = list(_flights.values())
+    rows = [f.stats() for f in flights]
+    calls = sum(r["calls"] for r in rows)
+    saved = sum(r["saved"] for r in rows)
+    return {
+        "enabled": SINGLE_FLIGHT_ENABLED,
+        "calls": calls,
+        "executions": sum(r["executions"] for r in rows),
+        "saved": saved,
+        "saved_ratio": round(saved / calls, 4) if calls else 0.0,
+        "by_name": {r["name"]: r for r in rows},
+    }
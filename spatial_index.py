@@ -0,0 +1,113 @@
+"""
+위경도 균일 격자(grid) 공간 인덱스
+
+고객 rectangles([swLng, swLat, neLng, neLat] 목록) 매칭 시 사각형마다 전체 매물을
+비교하지 않도록, 매물을 한 번 격자 셀 단위로 묶어 두고 사각형이 걸치는 셀의 매물만 검사한다.
+
+- 셀 키는 행 우선(row-major: cy * nx + cx)으로 정렬되어 있어, 한 사각형이 덮는 셀들은
+  셀 행(row)마다 정렬 배열의 연속 구간 하나가 된다 → 행 수만큼 searchsorted 두 번.
+- 경계는 SQL BETWEEN과 동일하게 양끝 포함. 위경도가 NULL(NaN)인 매물은 인덱스에서 제외된다.
+"""
+import math
+
+import numpy as np
+
+DEFAULT_CELL_SIZE = 0.005  # 도(degree) 단위, 대전 기준 약 450m x 550m
+
+
+class GridIndex:
+    def __init__(self, lat, lng, cell_size=DEFAULT_CELL_SIZE):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lng = np.asarray(lng, dtype=np.float64)
+        self.cell_size = float(cell_size)
+
+        valid = np.flatnonzero(~(np.isnan(self.lat) | np.isnan(self.lng)))
+        if len(valid) == 0:
+            self.lng0 = self.lat0 = 0.0
+            self.nx = self.ny = 1
+            self._keys = np.empty(0, dtype=np.int64)
+            self._order = np.empty(0, dtype=np.int64)
+            return
+
+        self.lng0 = float(self.lng[valid].min())
+        self.lat0 = float(self.lat[valid].min())
+        cx = self._cell_x(self.lng[valid])
+        cy = self._cell_y(self.lat[valid])
+        self.nx = int(cx.max()) + 1
+        self.ny = int(cy.max()) + 1
+        keys = cy * self.nx + cx
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._order = valid[order]
+
+    def __len__(self):
+        return len(self._order)
+
+    def _cell_x(self, lng):
+        return np.floor((np.asarray(lng) - self.lng0) / self.cell_size).astype(np.int64)
+
+    def _cell_y(self, lat):
+        return np.floor((np.asarray(lat) - self.lat0) / self.cell_size).astype(np.int64)
+
+    def _candidates(self, sw_lng, sw_lat, ne_lng, ne_lat):
+        # 스칼라 셀 좌표는 math.floor로 계산 (사각형마다 numpy 호출 오버헤드 제거)
+        size = self.cell_size
+        cx0 = max(math.floor((sw_lng - self.lng0) / size), 0)
+        cx1 = min(math.floor((ne_lng - self.lng0) / size), self.nx - 1)
+        cy0 = max(math.floor((sw_lat - self.lat0) / size), 0)
+        cy1 = min(math.floor((ne_lat - self.lat0) / size), self.ny - 1)
+        if cx0 > cx1 or cy0 > cy1:
+            return []
+        rows = np.arange(cy0, cy1 + 1, dtype=np.int64) * self.nx
+        starts = np.searchsorted(self._keys, rows + cx0, side="left")
+        ends = np.searchsorted(self._keys, rows + cx1, side="right")
+        return [self._order[s:e] for s, e in zip(starts.tolist(), ends.tolist()) if s < e]
+
+    def query_rect(self, sw_lng, sw_lat, ne_lng, ne_lat):
+        """사각형 안(경계 포함)의 원본 인덱스 배열 (정렬되지 않음)"""
+        if len(self._order) == 0:
+            return np.empty(0, dtype=np.int64)
+        chunks = self._candidates(sw_lng, sw_lat, ne_lng, ne_lat)
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        cand = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        lat = self.lat[cand]
+        lng = self.lng[cand]
+        inside = (lng >= sw_lng) & (lng <= ne_lng) & (lat >= sw_lat) & (lat <= ne_lat)
+        return cand[inside]
+
+    def query_rects(self, rects):
+        """여러 사각형의 합집합 → 원본 인덱스 배열 (오름차순, 중복 제거)"""
+        # np.unique(concatenate)보다 bool 마스크에 표시 후 flatnonzero가 빠르다
+        return np.flatnonzero(self.mask_rects(rects))
+
+    def mask_rects(self, rects):
+        """여러 사각형의 합집합 → 원본 길이의 bool 마스크"""
+        mask = np.zeros(len(self.lat), dtype=bool)
+        for rect in rects:
+            mask[self.query_rect(*rect)] = True
+        return mask
+
+
+def bounding_box(rects):
+    """사각형 목록 전체를 감싸는 (sw_lng, sw_lat, ne_lng, ne_lat), 비어 있으면 None"""
+    if not rects:
+        return None
+    return (
+        min(r[0] for r in rects), min(r[1] for r in rects),
+        max(r[2] for r in rects), max(r[3] for r in rects),
+    )
+
+
+def drop_contained_rects(rects):
+    """다른 사각형에 완전히 포함되는(또는 중복된) 사각형 제거 - 합집합 결과는 동일"""
+    kept = []
+    # 넓은 사각형부터 검사해야 포함 관계를 한 번에 걸러낼 수 있다
+    for rect in sorted(rects, key=lambda r: (r[2] - r[0]) * (r[3] - r[1]), reverse=True):
+        sw_lng, sw_lat, ne_lng, ne_lat = rect
+        if sw_lng > ne_lng or sw_lat > ne_lat:
+            continue  # BETWEEN 역순 범위는 아무 것도 매칭되지 않음
+        if any(k[0] <= sw_lng and k[1] <= sw_lat and ne_lng <= k[2] and ne_lat <= k[3] for k in kept):
+            continue
+        kept.append(rect)
+    return kept
@@ -0,0 +1,194 @@
+"""
+Supabase(PostgREST) 조회를 range() 페이지로 나눠 병렬로 가져오기
+
+PostgREST는 한 응답에 max-rows(Supabase 기본 1000)까지만 돌려주므로 .execute() 한 번으로는
+큰 테이블이 조용히 잘린다. 여기서는
+- 첫 페이지를 count 헤더(SUPABASE_COUNT_MODE)와 함께 받아 전체 건수를 알아내고
+- 나머지 페이지를 공유 스레드 풀(get_supabase_fetch_pool, SUPABASE_FETCH_CONCURRENCY)에서 동시에 받아
+- 페이지 순서대로 행을 yield 한다 (iter_rows). 다 모은 리스트가 필요하면 fetch_all.
+HTTP는 settings의 공유 supabase 클라이언트(keep-alive 연결 풀)를 그대로 쓴다.
+
+- 서버 max-rows가 SUPABASE_PAGE_SIZE보다 작으면 첫 페이지 건수에 맞춰 페이지 크기를 줄인다.
+- count를 못 받거나(planned/estimated 추정치 포함) 마지막 페이지가 꽉 차 있으면 짧은 페이지가 나올 때까지 순차로 더 읽는다.
+- 페이지 경계가 흔들리지 않도록 order의 마지막 컬럼은 유일해야 한다 (기본 id).
+- in_()처럼 조건을 나눠야 하는 조회는 fetch_many / fetch_in (조건 묶음별 첫 페이지를 동시에)
+- or_() 문자열에 사용자 값을 넣을 때는 filter_value()로 감싼다 (, ( ) 가 조건 구분자로 해석되지 않도록)
+"""
+import itertools
+from collections import deque
+
+from settings import (
+    SUPABASE_BATCH_SIZE, SUPABASE_COUNT_MODE, SUPABASE_FETCH_CONCURRENCY, SUPABASE_PAGE_SIZE,
+    get_supabase_client, get_supabase_fetch_pool, logger,
+)
+
+
+def filter_value(value):
+    """PostgREST 논리 필터(or_/and_) 안에 넣을 값: 큰따옴표로 감싸고 \\ 와 " 를 이스케이프"""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _orders(order):
+    """"id" / ("id", True) / [("ad_start_date", True), ("id", True)] → [(컬럼, desc)]"""
+    if not order:
+        return []
+    if isinstance(order, str):
+        return [(order, False)]
+    if isinstance(order, tuple) and len(order) == 2 and isinstance(order[1], bool):
+        return [order]
+    return [(o, False) if isinstance(o, str) else tuple(o) for o in order]
+
+
+def _has_more(got, requested, total):
+    """첫 페이지로 got건(요청 requested건)을 받았을 때 뒤에 행이 더 있을 수 있는지"""
+    if not got:
+        return False
+    if total is not None and SUPABASE_COUNT_MODE == "exact":
+        return got < total
+    return got >= requested or (total is not None and got < total)
+
+
+class _PageQuery:
+    """같은 조건의 페이지 요청을 만든다 (쿼리 빌더는 스레드 간 공유하지 않고 페이지마다 새로)"""
+
+    def __init__(self, client, table, columns, where, order):
+        self.client = client
+        self.table = table
+        self.columns = columns
+        self.where = where
+        self.orders = _orders(order)
+
+    def fetch(self, start, end, count=None):
+        """[start, end] (양 끝 포함) 구간 응답"""
+        if count:
+            query = self.client.table(self.table).select(self.columns, count=count)
+        else:
+            query = self.client.table(self.table).select(self.columns)
+        if self.where is not None:
+            query = self.where(query)
+        for column, desc in self.orders:
+            query = query.order(column, desc=desc)
+        return query.range(start, end).execute()
+
+
+def _iter_pages(page, offset, stop, page_size, concurrency):
+    """page.fetch로 [offset, stop) 구간(stop=None이면 끝까지)의 행 리스트를 페이지 순서대로 yield"""
+    first_end = offset + page_size if stop is None else min(offset + page_size, stop)
+    if first_end <= offset:
+        return
+    first = page.fetch(offset, first_end - 1, count=SUPABASE_COUNT_MODE or None)
+    rows = first.data or []
+    yield rows
+    start = offset + len(rows)
+    total = getattr(first, "count", None)
+    if len(rows) < first_end - offset:
+        # 요청보다 적게 왔다: 끝이거나 서버 max-rows에 잘림 → 그 크기로 페이지를 나눈다
+        if not rows or total is None or start >= total:
+            return
+        page_size = len(rows)
+
+    end = total if stop is None else (stop if total is None else min(total, stop))
+    if end is not None and start < end:
+        pool = get_supabase_fetch_pool()
+        starts = iter(range(start, end, page_size))
+
+        def submit(s):
+            e = min(s + page_size, end)
+            return s, e, pool.submit(page.fetch, s, e - 1)
+
+        pending = deque(submit(s) for s in itertools.islice(starts, max(1, concurrency)))
+        last_full = True
+        try:
+            while pending:
+                s, e, future = pending.popleft()
+                rows = future.result().data or []
+                nxt = next(starts, None)
+                if nxt is not None:
+                    pending.append(submit(nxt))
+                last_full = len(rows) >= e - s
+                yield rows
+        finally:
+            for _, _, future in pending:  # 호출 측이 중간에 멈춘 경우
+                future.cancel()
+        if not last_full:
+            return
+        start = end
+    if (stop is not None and start >= stop) or (total is not None and SUPABASE_COUNT_MODE == "exact"):
+        return
+
+    # count가 없거나 추정치였으면 짧은 페이지가 나올 때까지 순차로
+    while stop is None or start < stop:
+        e = start + page_size if stop is None else min(start + page_size, stop)
+        rows = page.fetch(start, e - 1).data or []
+        if rows:
+            yield rows
+        if len(rows) < e - start:
+            return
+        start = e
+
+
+def iter_rows(table, columns="*", where=None, order="id", offset=0, limit=None,
+              page_size=None, concurrency=None, client=None):
+    """
+    table을 페이지 단위로 병렬 조회해 행을 순서대로 yield.
+    where(query) -> query: eq/in_/or_ 등 필터 적용 함수, order: 정렬 (마지막 컬럼은 유일하게)
+    offset/limit: 전체 결과 중 가져올 구간 (limit=None이면 끝까지)
+    """
+    page = _PageQuery(client or get_supabase_client(), table, columns, where, order)
+    stop = None if limit is None else offset + max(0, limit)
+    for rows in _iter_pages(page, max(0, offset), stop, max(1, page_size or SUPABASE_PAGE_SIZE),
+                            concurrency or SUPABASE_FETCH_CONCURRENCY):
+        yield from rows
+
+
+def fetch_all(table, columns="*", where=None, order="id", offset=0, limit=None,
+              page_size=None, concurrency=None, client=None):
+    """iter_rows 결과 리스트"""
+    rows = list(iter_rows(table, columns, where, order, offset, limit, page_size, concurrency, client))
+    logger.debug(f"Supabase {table} 페이지 조회: {len(rows)}행")
+    return rows
+
+
+def fetch_many(table, columns="*", wheres=(), order="id", page_size=None, client=None):
+    """
+    조건(where 함수) 여러 개를 각각 끝까지 조회해 wheres 순서대로 이어 붙인 행 리스트.
+    조건별 첫 페이지(count 포함)는 공유 풀에서 동시에 요청하고, 건수가 남은 조건만 이어서 페이지를 더 읽는다.
+    """
+    wheres = list(wheres)
+    if not wheres:
+        return []
+    client = client or get_supabase_client()
+    page_size = max(1, page_size or SUPABASE_PAGE_SIZE)
+    pool = get_supabase_fetch_pool()
+    pages = [_PageQuery(client, table, columns, where, order) for where in wheres]
+    futures = [pool.submit(page.fetch, 0, page_size - 1, SUPABASE_COUNT_MODE or None) for page in pages]
+    out = []
+    try:
+        for page, future in zip(pages, futures):
+            first = future.result()
+            rows = first.data or []
+            out.extend(rows)
+            total = getattr(first, "count", None)
+            if _has_more(len(rows), page_size, total):
+                for more in _iter_pages(page, len(rows), None, len(rows), SUPABASE_FETCH_CONCURRENCY):
+                    out.extend(more)
+    finally:
+        for future in futures:
+            future.cancel()
+    return out
+
+
+def fetch_in(table, columns, column, values, where=None, order="id", chunk_size=None, client=None):
+    """column IN values 조회. 값 목록을 chunk_size(SUPABASE_BATCH_SIZE)로 나눠 (URL 길이 제한) fetch_many"""
+    values = list(dict.fromkeys(v for v in values if v is not None))
+    size = max(1, chunk_size or SUPABASE_BATCH_SIZE)
+
+    def chunk_where(chunk):
+        def apply(query):
+            query = query.in_(column, chunk)
+            return where(query) if where is not None else query
+        return apply
+
+    wheres = [chunk_where(values[i:i + size]) for i in range(0, len(values), size)]
+    return fetch_many(table, columns, wheres, order=order, client=client)
@@ -0,0 +1,290 @@
+"""
+매물 사진 폴더의 대표 이미지 썸네일 (백그라운드 스캔/디코딩 + 메모리 LRU + 디스크 캐시)
+
+탭을 채울 때 행마다 UI 스레드에서 os.listdir(photo_path) 후 원본 사진을 QPixmap으로 통째로 읽어
+24px로 줄이던 것을 대신한다. 사진 폴더가 네트워크 공유에 있으면 목록 한 번 채우는 동안 창이 멈췄다.
+
+- icon(folder)/tooltip(folder)/image_path(folder)는 막지 않는다: 메모리에 있으면 바로 돌려주고,
+  없으면 작업을 큐에 넣고 None/빈 값을 돌려준다. ColumnarTableModel은 그려지는 행의 data()만 부르므로
+  화면에 들어온 행만 요청된다.
+- 작업 스레드(THUMB_WORKERS)가 폴더를 훑어 대표 이미지(이름순 첫 파일)를 고르고 QImageReader.setScaledSize로
+  툴팁 크기(THUMB_TOOLTIP_WIDTH)까지만 디코딩한 뒤 아이콘(THUMB_ICON_SIZE)으로 한 번 더 줄인다.
+  QPixmap/QIcon은 UI 스레드에서만 만든다.
+- 결과는 THUMB_CACHE_DIR에 (이미지 경로, mtime, 크기) 해시 이름으로 저장해 다음 실행/다른 탭에서 원본을 다시 읽지 않는다.
+  캐시 폴더가 THUMB_CACHE_MAX_MB를 넘으면 시작할 때 오래된 파일부터 지운다.
+- 큐는 최근 요청부터 처리(LIFO)하고 THUMB_QUEUE_LIMIT을 넘으면 오래된 요청을 버린다 (빠르게 스크롤해 지나간 행).
+- 완료된 폴더들은 짧게 모아 thumbnailsReady(list)로 알리고, attach(model, col)로 붙인 모델은 그 컬럼의
+  아이콘/툴팁 역할만 다시 그리게 한다.
+
+    thumbs = get_thumbnail_service()
+    roles = thumbs.photo_roles(lambda r: r.get("photo_path") or "")
+    ...
+    thumbs.attach(model, 0)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtCore import Qt
+from PyQt5 import sip
+
+from ui_utils import representative_image_path
+
+logger = logging.getLogger(__name__)
+
+THUMB_CACHE_DIR = os.environ.get(
+    "THUMB_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "realestate_thumbnails"))
+THUMB_CACHE_MAX_MB = int(os.environ.get("THUMB_CACHE_MAX_MB", "300"))
+THUMB_ICON_SIZE = int(os.environ.get("THUMB_ICON_SIZE", "24"))
+THUMB_TOOLTIP_WIDTH = int(os.environ.get("THUMB_TOOLTIP_WIDTH", "200"))
+THUMB_MEMORY_ITEMS = int(os.environ.get("THUMB_MEMORY_ITEMS", "3000"))
+THUMB_FOLDER_TTL = float(os.environ.get("THUMB_FOLDER_TTL", "600"))  # 초, 지나면 폴더를 다시 훑는다
+THUMB_WORKERS = int(os.environ.get("THUMB_WORKERS", "2"))
+THUMB_QUEUE_LIMIT = int(os.environ.get("THUMB_QUEUE_LIMIT", "300"))
+THUMB_READY_DELAY_MS = 50  # 완료 알림을 모아 보내는 간격
+
+PHOTO_ROLES = (Qt.DecorationRole, Qt.ToolTipRole, Qt.UserRole + 11)
+
+
+class _Entry:
+    __slots__ = ("image_path", "icon", "tooltip_path", "loaded_at")
+
+    def __init__(self, image_path, icon, tooltip_path, loaded_at):
+        self.image_path = image_path
+        self.icon = icon
+        self.tooltip_path = tooltip_path
+        self.loaded_at = loaded_at
+
+
+class ThumbnailService(QtCore.QObject):
+    """폴더 경로 → (대표 이미지, 아이콘, 툴팁 이미지). UI 스레드에서 만들고 UI 스레드에서만 조회한다."""
+    thumbnailsReady = QtCore.pyqtSignal(list)  # 썸네일이 새로 준비된 폴더 경로들
+    _loaded = QtCore.pyqtSignal(str, object)   # 작업 스레드 → UI 스레드 (폴더, (이미지 경로, QImage|None, 툴팁 경로))
+
+    def __init__(self, cache_dir=THUMB_CACHE_DIR, workers=THUMB_WORKERS, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()  # folder -> _Entry (LRU)
+        self._queue = deque()          # 대기 중인 folder (오른쪽이 최근)
+        self._queued = set()           # 큐에 있거나 처리 중인 folder
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._ready = []
+        self._models = []              # [(weakref(model), col)]
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "decoded": 0, "dropped": 0, "failed": 0}
+
+        self._ready_timer = QtCore.QTimer(self)
+        self._ready_timer.setSingleShot(True)
+        self._ready_timer.setInterval(THUMB_READY_DELAY_MS)
+        self._ready_timer.timeout.connect(self._flush_ready)
+        self._loaded.connect(self._on_loaded)  # 다른 스레드에서 emit → QueuedConnection
+
+        self._threads = [threading.Thread(target=self._work, name=f"thumbnail-{i}", daemon=True)
+                         for i in range(max(1, workers))]
+        for t in self._threads:
+            t.start()
+        threading.Thread(target=self._prune_disk, name="thumbnail-prune", daemon=True).start()
+
+    # ---- 조회 (UI 스레드, 막지 않음) ----
+    def _lookup(self, folder):
+        if not folder:
+            return None
+        entry = self._entries.get(folder)
+        if entry is not None:
+            self._entries.move_to_end(folder)
+            self.stats["memory_hits"] += 1
+            if time.monotonic() - entry.loaded_at > THUMB_FOLDER_TTL:
+                self.request(folder)  # 오래된 값은 그대로 쓰면서 다시 훑는다
+            return entry
+        self.request(folder)
+        return None
+
+    def icon(self, folder):
+        """24px 아이콘 (아직 없거나 사진이 없으면 None)"""
+        entry = self._lookup(folder)
+        return entry.icon if entry is not None else None
+
+    def image_path(self, folder):
+        """대표 이미지 경로 (아직 모르거나 없으면 빈 문자열)"""
+        entry = self._lookup(folder)
+        return entry.image_path if entry is not None else ""
+
+    def tooltip(self, folder, fallback=""):
+        """캐시된 툴팁 크기 이미지를 보여 주는 HTML 툴팁"""
+        entry = self._lookup(folder)
+        if entry is None or not entry.tooltip_path:
+            return fallback
+        file_url = QtCore.QUrl.fromLocalFile(entry.tooltip_path).toString()
+        return f'<img src="{file_url}" width="{THUMB_TOOLTIP_WIDTH}">'
+
+    def photo_roles(self, folder_of, tooltip_fallback=None):
+        """
+        Column.roles에 넣을 사진 역할 함수 {DecorationRole, ToolTipRole, UserRole+11}.
+        folder_of(record) -> 사진 폴더 경로, tooltip_fallback(record) -> 사진이 없을 때 툴팁
+        """
+        def tooltip(record):
+            fallback = tooltip_fallback(record) if tooltip_fallback else ""
+            return self.tooltip(folder_of(record), fallback)
+
+        return {
+            Qt.DecorationRole: lambda r: self.icon(folder_of(r)),
+            Qt.ToolTipRole: tooltip,
+            Qt.UserRole + 11: lambda r: self.image_path(folder_of(r)),  # Representative image path
+        }
+
+    def attach(self, model, col):
+        """썸네일이 준비될 때마다 model의 col 컬럼 사진 역할을 다시 그리게 한다 (ColumnarTableModel.refresh_roles)"""
+        self._models = [(ref, c) for ref, c in self._models if ref() is not None and ref() is not model]
+        self._models.append((weakref.ref(model), col))
+
+    # ---- 작업 큐 ----
+    def request(self, folder):
+        """folder 썸네일 작업을 큐 맨 앞(다음 차례)에 넣는다"""
+        if not folder or self._stopped:
+            return
+        with self._cond:
+            if folder in self._queued:
+                return
+            self._queued.add(folder)
+            self._queue.append(folder)
+            while len(self._queue) > THUMB_QUEUE_LIMIT:
+                self._queued.discard(self._queue.popleft())
+                self.stats["dropped"] += 1
+            self._cond.notify()
+
+    def shutdown(self):
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                folder = self._queue.pop()
+            try:
+                result = self._load(folder)
+            except Exception as e:
+                logger.warning(f"썸네일 생성 실패 '{folder}': {e}")
+                self.stats["failed"] += 1
+                result = ("", None, "")
+            if self._stopped:
+                return
+            self._loaded.emit(folder, result)
+
+    # ---- 작업 스레드 ----
+    def _cache_files(self, image_path):
+        st = os.stat(image_path)
+        key = hashlib.sha1(f"{image_path}|{st.st_mtime_ns}|{st.st_size}".encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}_{THUMB_ICON_SIZE}.png", f"{base}_{THUMB_TOOLTIP_WIDTH}.jpg"
+
+    def _load(self, folder):
+        """(대표 이미지 경로, 아이콘 QImage | None, 툴팁 이미지 경로)"""
+        image_path = representative_image_path(folder, sort_files=True)
+        if not image_path:
+            return "", None, ""
+        icon_file, tooltip_file = self._cache_files(image_path)
+        if os.path.isfile(icon_file) and os.path.isfile(tooltip_file):
+            icon = QtGui.QImage(icon_file)
+            if not icon.isNull():
+                self.stats["disk_hits"] += 1
+                return image_path, icon, tooltip_file
+
+        reader = QtGui.QImageReader(image_path)
+        reader.setAutoTransform(True)  # EXIF 회전
+        size = reader.size()
+        if size.isValid() and size.width() > THUMB_TOOLTIP_WIDTH:
+            # JPEG는 디코딩 단계에서 줄여 읽으므로 원본 크기 버퍼를 만들지 않는다
+            height = max(1, size.height() * THUMB_TOOLTIP_WIDTH // size.width())
+            reader.setScaledSize(QtCore.QSize(THUMB_TOOLTIP_WIDTH, height))
+        image = reader.read()
+        if image.isNull():
+            logger.warning(f"썸네일 디코딩 실패 '{image_path}': {reader.errorString()}")
+            self.stats["failed"] += 1
+            return image_path, None, ""
+        self.stats["decoded"] += 1
+        icon = image.scaled(THUMB_ICON_SIZE, THUMB_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            os.makedirs(os.path.dirname(icon_file), exist_ok=True)
+            icon.save(icon_file, "PNG")
+            if not image.save(tooltip_file, "JPG", 85):
+                tooltip_file = image_path
+        except OSError as e:
+            logger.warning(f"썸네일 캐시 저장 실패 '{self.cache_dir}': {e}")
+            tooltip_file = image_path
+        return image_path, icon, tooltip_file
+
+    def _prune_disk(self):
+        """캐시 폴더가 THUMB_CACHE_MAX_MB를 넘으면 오래 안 쓴 파일부터 지운다"""
+        files, total = [], 0
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((st.st_atime, st.st_size, path))
+                total += st.st_size
+        limit = THUMB_CACHE_MAX_MB * 1024 * 1024
+        if total <= limit:
+            return
+        files.sort()
+        for _, size, path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= limit * 0.8:
+                break
+        logger.info(f"썸네일 캐시 정리: {self.cache_dir} → {total / 2**20:.0f}MB")
+
+    # ---- UI 스레드 ----
+    def _on_loaded(self, folder, result):
+        image_path, image, tooltip_path = result
+        icon = QtGui.QIcon(QtGui.QPixmap.fromImage(image)) if image is not None else None
+        self._entries[folder] = _Entry(image_path, icon, tooltip_path, time.monotonic())
+        self._entries.move_to_end(folder)
+        while len(self._entries) > THUMB_MEMORY_ITEMS:
+            self._entries.popitem(last=False)
+        with self._cond:
+            self._queued.discard(folder)
+        self._ready.append(folder)
+        if not self._ready_timer.isActive():
+            self._ready_timer.start()
+
+    def _flush_ready(self):
+        folders, self._ready = self._ready, []
+        if not folders:
+            return
+        live = []
+        for ref, col in self._models:
+            model = ref()
+            if model is None or sip.isdeleted(model):
+                continue
+            live.append((ref, col))
+            model.refresh_roles(col, PHOTO_ROLES)
+        self._models = live
+        self.thumbnailsReady.emit(folders)
+
+
+_service = None
+
+
+def get_thumbnail_service():
+    """앱 전체가 공유하는 ThumbnailService (처음 부를 때 UI 스레드에서 만든다)"""
+    global _service
+    if _service is None:
+        _service = ThumbnailService()
+    return _service
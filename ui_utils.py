@@ -1,6 +1,7 @@
 # ui_utils.py
 
 import json
+import os
 from datetime import datetime, date, timedelta  
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtGui import QColor
@@ -384,4 +385,20 @@ def get_text_by_header_cached(model, row, header_name, default=""):
     item = get_item_by_header_cached(model, row, header_name)
     return item.text() if item else default
 
-# ============== 헤더 기반 헬퍼 함수들 끝 ==============
\ No newline at end of file
+# ============== 헤더 기반 헬퍼 함수들 끝 ==============
+# ============== 사진 폴더 대표 이미지 (thumbnail_service 작업 스레드에서 호출) ==============
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+
+def representative_image_path(folder_path, sort_files=False):
+    """사진 폴더의 대표 이미지 경로 (없거나 폴더가 아니면 빈 문자열)"""
+    if not folder_path or not os.path.isdir(folder_path):
+        return ""
+    try:
+        files = [f for f in os.listdir(folder_path) if f.lower().endswith(IMAGE_EXTENSIONS)]
+    except OSError as e:
+        print(f"[WARN] Cannot access folder path '{folder_path}': {e}")
+        return ""
+    if not files:
+        return ""
+    return os.path.join(folder_path, sorted(files)[0] if sort_files else files[0])
@@ -1,16 +1,35 @@
 import json
-from PyQt5.QtCore import QObject, QUrl, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, QUrl, pyqtSignal
 from PyQt5.QtWebSockets import QWebSocket
 
+# 서버 변경 알림({"type":"change", table, action, ids, addresses, manager, version})을 테이블별로 모아
+# 구독한 탭 콜백에 넘긴다. 콜백 인자:
+#   {"table", "ids": set, "addresses": set, "managers": set, "actions": set, "resync": bool}
+# resync=True 이면 알림을 놓쳤을 수 있으므로(서버 큐에서 버려짐 / 재연결) 탭이 보고 있는 데이터를 다시 받아야 한다.
+# 서버(ws_hub)는 {"type":"batch","dropped":n,"events":[...]} 프레임으로 보내고, 구독 테이블/담당자만 골라 보낸다.
+CHANGE_BATCH_MS = 300
+RECONNECT_MS = 5000
+
+
 class WebSocketManager(QObject):
     messageReceived = pyqtSignal(dict) # Signal to emit parsed JSON messages
+    changeReceived = pyqtSignal(dict)  # 테이블별로 묶인 변경 알림
     connected = pyqtSignal()
     disconnected = pyqtSignal()
 
-    def __init__(self, url: str, parent=None):
+    def __init__(self, url: str, parent=None, auto_reconnect=True):
         super().__init__(parent)
         self.socket = QWebSocket()
         self.url = url
+        self.auto_reconnect = auto_reconnect
+        self._closing = False
+        self._was_connected = False
+        self._topics = {}       # 서버 토픽 필터 (managers / addresses). tables는 구독 테이블로 채움
+        self._subscribers = {}  # table -> [callback]
+        self._pending = {}      # table -> 모으는 중인 변경
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.timeout.connect(self._flush_changes)
 
         self.socket.connected.connect(self._on_connected)
         self.socket.disconnected.connect(self._on_disconnected)
@@ -19,6 +38,7 @@ class WebSocketManager(QObject):
 
     def connect(self):
         print(f"[WebSocket] Connecting to {self.url}...")
+        self._closing = False
         self.socket.open(QUrl(self.url))
 
     def send_message(self, message: dict):
@@ -26,29 +46,152 @@ class WebSocketManager(QObject):
             self.socket.sendTextMessage(json.dumps(message))
         else:
             print("[WebSocket] Cannot send message, socket not valid.")
-            
+
     def close(self):
+         self._closing = True
          if self.socket.isValid():
               print("[WebSocket] Closing connection.")
               self.socket.close()
 
+    def subscribe(self, table: str, callback):
+        """table 변경 알림 구독 (같은 콜백 중복 등록 무시)"""
+        is_new_table = table not in self._subscribers
+        callbacks = self._subscribers.setdefault(table, [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+        if is_new_table:
+            self._send_topics()
+
+    def unsubscribe(self, table: str, callback):
+        callbacks = self._subscribers.get(table, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def set_topics(self, managers=None, addresses=None):
+        """서버 쪽 필터 지정 (예: 일반 담당자는 managers=[본인]). None/빈 목록은 전체"""
+        self._topics = {"managers": list(managers or []), "addresses": list(addresses or [])}
+        self._send_topics()
+
+    def _send_topics(self):
+        if self.socket.isValid():
+            self.send_message(dict(self._topics, type="subscribe", tables=sorted(self._subscribers)))
+
     def _on_connected(self):
         print("[WebSocket] Connected!")
+        self._send_topics()
+        if self._was_connected:
+            # 끊겨 있던 동안의 알림은 받지 못했으므로 모든 구독 탭을 재동기화
+            for table in self._subscribers:
+                self._queue_change(table, resync=True)
+        self._was_connected = True
         self.connected.emit()
 
     def _on_disconnected(self):
         print("[WebSocket] Disconnected.")
         self.disconnected.emit()
-        # Optional: Implement reconnection logic here
-        # QtCore.QTimer.singleShot(5000, self.connect) 
+        if self.auto_reconnect and not self._closing:
+            QTimer.singleShot(RECONNECT_MS, self.connect)
 
     def _on_message_received(self, message: str):
-        print(f"[WebSocket] Message received: {message}")
         try:
             parsed_message = json.loads(message)
-            self.messageReceived.emit(parsed_message)
         except json.JSONDecodeError:
             print(f"[WebSocket] Error decoding JSON: {message}")
-            
+            return
+        if not isinstance(parsed_message, dict):
+            return
+        if parsed_message.get("type") != "batch":
+            self._dispatch(parsed_message)
+            return
+        if parsed_message.get("dropped"):
+            # 서버 큐가 넘쳐 알림 일부가 버려졌다 → 어느 테이블이 바뀌었는지 모르므로 전체 재동기화
+            for subscribed in self._subscribers:
+                self._queue_change(subscribed, resync=True)
+        for event in parsed_message.get("events") or ():
+            if isinstance(event, dict):
+                self._dispatch(event)
+
+    def _dispatch(self, message):
+        message_type = message.get("type")
+        if message_type == "ping":
+            self.send_message({"type": "pong"})  # 서버 하트비트 응답 (응답이 없으면 연결 정리됨)
+            return
+        if message_type == "change":
+            self._handle_change(message)
+        else:
+            print(f"[WebSocket] Message received: {message}")
+        self.messageReceived.emit(message)
+
+    def _handle_change(self, event):
+        table = event.get("table")
+        if not table:
+            return
+        self._queue_change(
+            table,
+            ids=event.get("ids") or (),
+            addresses=event.get("addresses") or (),
+            manager=event.get("manager"),
+            action=event.get("action"),
+        )
+
+    def _queue_change(self, table, ids=(), addresses=(), manager=None, action=None, resync=False):
+        change = self._pending.setdefault(table, {
+            "table": table, "ids": set(), "addresses": set(), "managers": set(), "actions": set(), "resync": False,
+        })
+        change["ids"].update(ids)
+        change["addresses"].update(a.strip() for a in addresses if a and a.strip())
+        if manager:
+            change["managers"].add(manager)
+        if action:
+            change["actions"].add(action)
+        change["resync"] = change["resync"] or resync
+        if not self._batch_timer.isActive():
+            self._batch_timer.start(CHANGE_BATCH_MS)
+
+    def _flush_changes(self):
+        pending, self._pending = self._pending, {}
+        for table, change in pending.items():
+            self.changeReceived.emit(change)
+            for callback in list(self._subscribers.get(table, [])):
+                try:
+                    callback(change)
+                except Exception as e:
+                    print(f"[WebSocket] change handler error ({table}): {e}")
+
     def _on_error(self, error_code):
-         print(f"[WebSocket] Error: {error_code} - {self.socket.errorString()}") 
\ No newline at end of file
+         print(f"[WebSocket] Error: {error_code} - {self.socket.errorString()}")
+
+
+def subscribe_changes(parent_app, table, callback):
+    """parent_app.ws_manager가 있으면 table 변경 알림을 구독하고 True, 없으면 False (기존 주기 새로고침 유지)"""
+    manager = getattr(parent_app, "ws_manager", None)
+    if manager is None:
+        return False
+    manager.subscribe(table, callback)
+    return True
+
+
+def displayed_addresses(parent_app):
+    """지금 주소 기반 탭들이 보여주는 주소 집합 (고객 클릭 시 다중 주소, 아니면 마지막 선택 주소)"""
+    if getattr(parent_app, "from_customer_click", False):
+        return {a.strip() for a in (getattr(parent_app, "selected_addresses", None) or []) if a and a.strip()}
+    last = (getattr(parent_app, "last_selected_address", "") or "").strip()
+    return {last} if last else set()
+
+
+def apply_address_change(parent_app, cache, change, refresh):
+    """
+    주소별 캐시를 가진 탭 공통 처리: 바뀐 주소의 캐시 항목을 버리고,
+    지금 보이는 주소가 포함되면(또는 재동기화면) refresh()로 그 주소들만 다시 받는다.
+    """
+    if change.get("resync"):
+        if cache is not None:
+            cache.clear()
+        refresh()
+        return
+    addresses = change.get("addresses") or set()
+    if cache is not None:
+        for addr in addresses:
+            cache.pop(addr, None)
+    if addresses & displayed_addresses(parent_app):
+        refresh()
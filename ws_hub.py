@@ -0,0 +1,222 @@
+"""
+WebSocket 변경 알림 팬아웃 허브
+
+기존 broadcast_update는 연결 목록을 돌며 send_text를 하나씩 await 했기 때문에
+느리거나 반쯤 끊긴 연결 하나가 모든 클라이언트 알림을 늦췄다.
+
+- 연결마다 크기 제한 큐(WS_QUEUE_SIZE)와 전송 태스크를 둔다. publish는 큐에 넣기만 하므로
+  연결 수에 비례한 put 비용만 들고 어떤 연결도 기다리지 않는다.
+- 큐가 가득 차면 WS_DROP_POLICY에 따라 가장 오래된 메시지(drop_oldest) / 새 메시지(drop_newest)를
+  버리거나 연결을 끊는다(disconnect). 버린 개수는 다음 프레임의 "dropped"로 알려 주고,
+  클라이언트는 이때 구독 탭을 전체 재동기화한다.
+- 한 프레임 전송이 WS_SEND_TIMEOUT을 넘기면 그 연결만 끊는다.
+- 토픽 구독: 클라이언트가 {"type":"subscribe","tables":[..],"managers":[..],"addresses":[..]}를 보내면
+  해당 조건에 맞는 이벤트만 받는다. 빈 목록은 전체, 이벤트에 manager/addresses가 없으면 그 조건은 통과.
+- 하트비트: WS_HEARTBEAT_INTERVAL마다 {"type":"ping"}을 넣고, WS_HEARTBEAT_TIMEOUT 동안 아무것도
+  받지 못한 연결(pong 포함)은 정리한다.
+- 배치: 전송 태스크는 첫 이벤트 후 WS_BATCH_LINGER만큼 모아 큐에 쌓인 이벤트를 한 프레임으로 보낸다.
+  프레임: {"type":"batch","dropped":n,"events":[...]} (이벤트는 publish 시 한 번만 직렬화)
+
+이벤트 루프 안에서만 호출한다. 다른 스레드에서는 publish_threadsafe를 쓴다.
+"""
+import asyncio
+import json
+from collections import deque
+
+from settings import (
+    WS_BATCH_LINGER, WS_BATCH_MAX, WS_DROP_POLICY, WS_HEARTBEAT_INTERVAL, WS_HEARTBEAT_TIMEOUT,
+    WS_QUEUE_SIZE, WS_SEND_TIMEOUT, logger,
+)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+_PING = json.dumps({"type": "ping"})
+
+
+class HubConnection:
+    """허브에 등록된 연결 하나 (큐, 토픽, 하트비트 상태)"""
+
+    __slots__ = (
+        "websocket", "queue", "wakeup", "tables", "managers", "addresses",
+        "dropped", "last_seen", "sender", "closed",
+    )
+
+    def __init__(self, websocket, now):
+        self.websocket = websocket
+        self.queue = deque()
+        self.wakeup = asyncio.Event()
+        self.tables = set()
+        self.managers = set()
+        self.addresses = set()
+        self.dropped = 0
+        self.last_seen = now
+        self.sender = None
+        self.closed = False
+
+    def matches(self, table, manager, addresses):
+        if table is None:  # reload/ping 등 토픽 없는 메시지
+            return True
+        if self.tables and table not in self.tables:
+            return False
+        if self.managers and manager and manager not in self.managers:
+            return False
+        if self.addresses and addresses and not self.addresses.intersection(addresses):
+            return False
+        return True
+
+    def set_topics(self, tables=None, managers=None, addresses=None):
+        self.tables = {t for t in (tables or ()) if t}
+        self.managers = {m for m in (managers or ()) if m}
+        self.addresses = {a.strip() for a in (addresses or ()) if a and a.strip()}
+
+
+class BroadcastHub:
+    def __init__(self, queue_size=WS_QUEUE_SIZE, drop_policy=WS_DROP_POLICY, send_timeout=WS_SEND_TIMEOUT,
+                 batch_max=WS_BATCH_MAX, batch_linger=WS_BATCH_LINGER,
+                 heartbeat_interval=WS_HEARTBEAT_INTERVAL, heartbeat_timeout=WS_HEARTBEAT_TIMEOUT):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"알 수 없는 WS_DROP_POLICY: {drop_policy} (가능: {DROP_POLICIES})")
+        self.queue_size = max(1, queue_size)
+        self.drop_policy = drop_policy
+        self.send_timeout = send_timeout
+        self.batch_max = max(1, batch_max)
+        self.batch_linger = batch_linger
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.connections = set()
+        self.loop = None
+        self._heartbeat_task = None
+        self.stats = {"published": 0, "frames": 0, "dropped": 0, "reaped": 0, "slow_disconnects": 0}
+
+    # --- 연결 관리 ---
+
+    def register(self, websocket):
+        """accept된 websocket 등록 (이벤트 루프 안에서)"""
+        loop = asyncio.get_running_loop()
+        self.loop = loop
+        conn = HubConnection(websocket, loop.time())
+        conn.sender = loop.create_task(self._send_loop(conn))
+        self.connections.add(conn)
+        if self.heartbeat_interval > 0 and (self._heartbeat_task is None or self._heartbeat_task.done()):
+            self._heartbeat_task = loop.create_task(self._heartbeat_loop())
+        return conn
+
+    async def unregister(self, conn):
+        self.connections.discard(conn)
+        conn.closed = True
+        if conn.sender is not None and conn.sender is not asyncio.current_task():
+            conn.sender.cancel()
+            try:
+                await conn.sender
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def on_message(self, conn, text):
+        """클라이언트 수신 메시지 처리 (subscribe / pong 등). 무엇이든 받으면 살아 있는 것으로 본다"""
+        conn.last_seen = self.loop.time() if self.loop else conn.last_seen
+        try:
+            message = json.loads(text)
+        except (TypeError, ValueError):
+            return
+        if isinstance(message, dict) and message.get("type") == "subscribe":
+            conn.set_topics(message.get("tables"), message.get("managers"), message.get("addresses"))
+
+    def _close(self, conn, code, reason):
+        """연결 종료 예약 - 수신 루프가 끊김을 받아 unregister한다"""
+        if conn.closed:
+            return
+        conn.closed = True
+        self.connections.discard(conn)
+        if conn.sender is not None and conn.sender is not asyncio.current_task():
+            conn.sender.cancel()
+        logger.info(f"WebSocket 연결 종료: {reason}")
+
+        async def _do_close():
+            try:
+                await asyncio.wait_for(conn.websocket.close(code=code), self.send_timeout)
+            except Exception:
+                pass
+        self.loop.create_task(_do_close())
+
+    # --- 발행 ---
+
+    def publish(self, message, table=None, manager=None, addresses=()):
+        """message(dict 또는 직렬화된 str)를 토픽이 맞는 연결 큐에 넣는다. 넣은 연결 수 반환"""
+        text = message if isinstance(message, str) else json.dumps(message, ensure_ascii=False, default=str)
+        self.stats["published"] += 1
+        delivered = 0
+        for conn in list(self.connections):
+            if conn.closed or not conn.matches(table, manager, addresses):
+                continue
+            if self._enqueue(conn, text):
+                delivered += 1
+        return delivered
+
+    def publish_threadsafe(self, message, table=None, manager=None, addresses=()):
+        """다른 스레드에서 publish. 루프가 없거나(연결된 적 없음) 닫혔으면 False"""
+        loop = self.loop
+        if loop is None or loop.is_closed() or not self.connections:
+            return False
+        try:
+            loop.call_soon_threadsafe(self.publish, message, table, manager, tuple(addresses))
+        except RuntimeError:  # 종료 중인 루프
+            return False
+        return True
+
+    def _enqueue(self, conn, text):
+        if len(conn.queue) >= self.queue_size:
+            self.stats["dropped"] += 1
+            if self.drop_policy == "disconnect":
+                self.stats["slow_disconnects"] += 1
+                self._close(conn, 1013, "send queue full")
+                return False
+            conn.dropped += 1
+            if self.drop_policy == "drop_newest":
+                return False
+            conn.queue.popleft()
+        conn.queue.append(text)
+        conn.wakeup.set()
+        return True
+
+    # --- 전송 / 하트비트 ---
+
+    async def _send_loop(self, conn):
+        websocket = conn.websocket
+        try:
+            while not conn.closed:
+                await conn.wakeup.wait()
+                if self.batch_linger > 0:
+                    await asyncio.sleep(self.batch_linger)
+                conn.wakeup.clear()
+                while conn.queue and not conn.closed:
+                    count = min(len(conn.queue), self.batch_max)
+                    events = [conn.queue.popleft() for _ in range(count)]
+                    dropped, conn.dropped = conn.dropped, 0
+                    frame = '{"type":"batch","dropped":%d,"events":[%s]}' % (dropped, ",".join(events))
+                    await asyncio.wait_for(websocket.send_text(frame), self.send_timeout)
+                    self.stats["frames"] += 1
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.stats["slow_disconnects"] += 1
+            self._close(conn, 1013, f"send timeout ({self.send_timeout}s)")
+        except Exception as e:
+            self._close(conn, 1011, f"send error: {e}")
+
+    async def _heartbeat_loop(self):
+        while self.connections:
+            await asyncio.sleep(self.heartbeat_interval)
+            now = self.loop.time()
+            for conn in list(self.connections):
+                if now - conn.last_seen > self.heartbeat_timeout:
+                    self.stats["reaped"] += 1
+                    self._close(conn, 1001, f"heartbeat timeout ({self.heartbeat_timeout}s)")
+            self.publish(_PING)
+
+    def snapshot(self):
+        """상태 확인용 통계"""
+        return dict(
+            self.stats,
+            connections=len(self.connections),
+            queued=sum(len(c.queue) for c in self.connections),
+            drop_policy=self.drop_policy,
+        )